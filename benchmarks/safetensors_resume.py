@@ -0,0 +1,154 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark resuming model weights from safetensors shards against torch.load.
+
+Saves one model as a single ``torch.save`` file and as memory-mapped
+safetensors shards, then loads it back in fresh processes and reports the load
+time, the peak RSS and the private (anonymous) memory held once loading is
+done.  The naive path keeps the whole state dict in private memory next to
+the model; ``load_sharded_into`` copies one tensor at a time from the page
+cache, which ranks on one node share.  ``meta`` builds the model on the meta
+device and assigns the loaded tensors, as for evaluation.  Files are read once
+before timing, so all methods start from a warm page cache.
+
+Usage:
+    uv run python benchmarks/safetensors_resume.py --size-mb 1024 --repeats 3
+"""
+
+import argparse
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import torch
+from torch import nn
+
+from hydraxcel.run.sharded_checkpoint import load_sharded_into, save_sharded_state
+
+METHODS: tuple[str, ...] = ("torch.load", "mmap", "meta")
+LAYER_WIDTH: int = 2048
+
+
+def build_model(size_mb: float) -> nn.Sequential:
+    """Return a stack of square linear layers of about *size_mb* float32 MB."""
+    layers: int = max(1, round(size_mb * 1e6 / (4 * LAYER_WIDTH * (LAYER_WIDTH + 1))))
+    return nn.Sequential(*(nn.Linear(LAYER_WIDTH, LAYER_WIDTH) for _ in range(layers)))
+
+
+def private_mb() -> float:
+    """Return the anonymous resident memory of this process in MB."""
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("RssAnon:"):
+            return int(line.split()[1]) / 1e3
+    return float("nan")
+
+
+def load(method: str, directory: Path, size_mb: float) -> None:
+    """Load the checkpoint with *method* and print the measurements."""
+    start: float = time.perf_counter()
+    if method == "meta":
+        with torch.device("meta"):
+            model = build_model(size_mb)
+        load_sharded_into(model, directory / "shards")
+        private: float = private_mb()
+    else:
+        model = build_model(size_mb)
+        start = time.perf_counter()  # Only the load, not the initialisation
+        if method == "mmap":
+            load_sharded_into(model, directory / "shards")
+            private = private_mb()
+        else:
+            state: dict[str, torch.Tensor] = torch.load(directory / "model.bin")
+            model.load_state_dict(state)
+            private = private_mb()
+            del state
+    elapsed: float = time.perf_counter() - start
+    peak: float = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+    print(f"{elapsed} {peak} {private}")
+
+
+def measure(method: str, directory: Path, size_mb: float) -> tuple[float, ...]:
+    """Run one load in a fresh process and return its measurements."""
+    output: str = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            __file__,
+            "--load",
+            method,
+            "--directory",
+            str(directory),
+            "--size-mb",
+            str(size_mb),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return tuple(float(value) for value in output.split()[-3:])
+
+
+def main() -> None:
+    """Save the model in both formats and print the load figures per method."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=512.0)
+    parser.add_argument("--shard-size-mb", type=float, default=256.0)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--load", choices=METHODS, help=argparse.SUPPRESS)
+    parser.add_argument("--directory", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.load:
+        load(args.load, args.directory, args.size_mb)
+        return
+
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = Path(temporary)
+        state: dict[str, torch.Tensor] = build_model(args.size_mb).state_dict()
+        torch.save(state, directory / "model.bin")
+        save_sharded_state(
+            state,
+            directory / "shards",
+            max_shard_size_mb=args.shard_size_mb,
+        )
+        size: float = sum(tensor.nbytes for tensor in state.values()) / 1e6
+        del state
+        for path in directory.rglob("*"):  # Warm the page cache
+            if path.is_file():
+                path.read_bytes()
+
+        print(f"model: {size:.0f} MB, {args.repeats} fresh processes per method")
+        print(f"{'method':<12}{'load s':>10}{'peak RSS MB':>14}{'private MB':>13}")
+        for method in METHODS:
+            runs = [
+                measure(method, directory, args.size_mb) for _ in range(args.repeats)
+            ]
+            elapsed, peak, private = (
+                statistics.median(run) for run in zip(*runs, strict=True)
+            )
+            print(f"{method:<12}{elapsed:>10.3f}{peak:>14.0f}{private:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
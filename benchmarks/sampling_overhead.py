@@ -0,0 +1,90 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the overhead of the HydraXcel stack sampler on a Python-bound loop.
+
+Runs the same pure-Python workload with and without the sampler enabled and
+reports the relative slowdown.  The target is < 2% at 100 Hz.
+
+Usage:
+    uv run python benchmarks/sampling_overhead.py --rate 100 --repeats 5
+"""
+
+import argparse
+import statistics
+import time
+
+from hydraxcel.profiling import StackSampler
+
+
+def workload(iterations: int) -> int:
+    """Pure-Python workload with a moderately deep call stack."""
+
+    def inner(value: int) -> int:
+        return sum(i * value for i in range(50))
+
+    def middle(value: int) -> int:
+        return inner(value) + inner(value + 1)
+
+    return sum(middle(i) for i in range(iterations))
+
+
+def timed(iterations: int, sampler: StackSampler | None) -> float:
+    """Return the wall-clock duration of one workload run."""
+    if sampler is not None:
+        sampler.start()
+    start = time.perf_counter()
+    workload(iterations)
+    duration = time.perf_counter() - start
+    if sampler is not None:
+        sampler.stop()
+    return duration
+
+
+def main() -> None:
+    """Run the benchmark and print baseline, sampled and overhead figures."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=float, default=100.0)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    timed(args.iterations // 10, None)  # Warm-up
+    baseline: list[float] = []
+    sampled: list[float] = []
+    samples: int = 0
+    for _ in range(args.repeats):
+        baseline.append(timed(args.iterations, None))
+        sampler = StackSampler(rate_hz=args.rate)
+        sampled.append(timed(args.iterations, sampler))
+        samples += sampler.num_samples
+
+    base = statistics.median(baseline)
+    with_sampler = statistics.median(sampled)
+    overhead = 100 * (with_sampler - base) / base
+    print(f"rate:        {args.rate:.0f} Hz ({samples} samples)")
+    print(f"baseline:    {base:.3f} s (median of {args.repeats})")
+    print(f"sampled:     {with_sampler:.3f} s (median of {args.repeats})")
+    print(f"overhead:    {overhead:+.2f}%")
+
+
+if __name__ == "__main__":
+    main()
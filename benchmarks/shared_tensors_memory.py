@@ -0,0 +1,141 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark node memory of per-rank tensor copies against shared tensors.
+
+Starts a number of concurrent processes, as the ranks of one node, that each
+hold an embedding table and touch all of it.  ``copy`` has every process build
+its own table, as loading it per rank does; ``shared`` has the processes map
+one table that ``hydraxcel.data.SharedTensors`` wrote to shared memory.  The
+table reports, on top of what each process held before, its private
+(anonymous) memory and the node total as the sum of the proportional set
+sizes (PSS), which split shared pages between the processes mapping them.
+
+Usage:
+    uv run python benchmarks/shared_tensors_memory.py --size-mb 1024 --ranks 8
+    uv run python benchmarks/shared_tensors_memory.py --ranks 8 --methods shared
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import torch
+
+from hydraxcel.data import SharedTensors
+
+METHODS: tuple[str, ...] = ("copy", "shared")
+DIM: int = 1024
+
+
+def memory_mb() -> tuple[float, float]:
+    """Return the anonymous resident memory and PSS of this process in MB."""
+    private: float = float("nan")
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("RssAnon:"):
+            private = int(line.split()[1]) / 1e3
+    pss: float = float("nan")
+    for line in Path("/proc/self/smaps_rollup").read_text().splitlines():
+        if line.startswith("Pss:"):
+            pss = int(line.split()[1]) / 1e3
+    return private, pss
+
+
+def table(size_mb: float) -> torch.Tensor:
+    """Build the embedding table every rank needs."""
+    rows: int = max(1, int(size_mb * 1e6 / (4 * DIM)))
+    return torch.randn(rows, DIM, generator=torch.Generator().manual_seed(0))
+
+
+def hold(method: str, size_mb: float, root: Path, ready: Path) -> None:
+    """Hold the table with *method* until *ready* exists, then print memory."""
+    baseline: tuple[float, float] = memory_mb()  # The interpreter and libraries
+    segment = SharedTensors("embeddings", root)
+    embeddings: torch.Tensor = (
+        table(size_mb) if method == "copy" else segment.attach()["embeddings"]
+    )
+    checksum: float = float(embeddings.sum())  # Touch every page
+    print("attached", flush=True)
+    while not ready.exists():  # Measure while every rank holds the table
+        time.sleep(0.05)
+    private, pss = memory_mb()
+    print(f"{private - baseline[0]} {pss - baseline[1]} {checksum}", flush=True)
+    segment.release()
+
+
+def main() -> None:
+    """Run the ranks per method and print the per-process and node figures."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=512.0)
+    parser.add_argument("--ranks", type=int, default=4)
+    parser.add_argument("--methods", nargs="+", choices=METHODS, default=METHODS)
+    parser.add_argument("--hold", choices=METHODS, help=argparse.SUPPRESS)
+    parser.add_argument("--root", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.hold:
+        hold(args.hold, args.size_mb, args.root, args.root / "ready")
+        return
+
+    print(f"table: {args.size_mb:.0f} MB, {args.ranks} ranks")
+    print(f"{'method':<8}{'private MB':>13}{'node PSS MB':>14}")
+    with tempfile.TemporaryDirectory(dir="/dev/shm") as temporary:
+        root = Path(temporary)
+        segment = SharedTensors("embeddings", root)
+        segment.create(lambda: {"embeddings": table(args.size_mb)})
+        for method in args.methods:
+            (root / "ready").unlink(missing_ok=True)
+            ranks = [
+                subprocess.Popen(  # noqa: S603
+                    [
+                        sys.executable,
+                        __file__,
+                        "--hold",
+                        method,
+                        "--size-mb",
+                        str(args.size_mb),
+                        "--root",
+                        str(root),
+                    ],
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+                for _ in range(args.ranks)
+            ]
+            for rank in ranks:
+                if rank.stdout is not None:  # Always piped
+                    rank.stdout.readline()  # "attached"
+            (root / "ready").touch()
+            runs = [
+                tuple(float(value) for value in rank.communicate()[0].split()[:2])
+                for rank in ranks
+            ]
+            private: float = statistics.median(run[0] for run in runs)
+            pss: float = sum(run[1] for run in runs)
+            print(f"{method:<8}{private:>13.0f}{pss:>14.0f}")
+        segment.release()
+
+
+if __name__ == "__main__":
+    main()
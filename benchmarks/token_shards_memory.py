@@ -0,0 +1,132 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark per-rank memory of memory-mapped token shards against copies.
+
+Writes a token dataset in the ``hydraxcel.data`` shard format, then starts a
+number of concurrent processes, as the ranks of one node, that each iterate
+over every batch once.  ``copy`` loads the shards into process memory, as a
+dataset loaded per rank does; ``mmap`` uses ``TokenBlockDataset`` with
+``token_dataloader``, whose batches are views of the shared page cache.  The
+table reports the epoch time and the private (anonymous) memory each process
+holds once it has touched all the data, in total and on top of what it held
+before reading any.
+
+Usage:
+    uv run python benchmarks/token_shards_memory.py --size-mb 1024 --ranks 4
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from hydraxcel.data import TokenBlockDataset, token_dataloader, write_token_shards
+
+METHODS: tuple[str, ...] = ("copy", "mmap")
+ROW_TOKENS: int = 1024
+BLOCK_SIZE: int = 2049  # A 2048-token context plus the shifted label
+BATCH_SIZE: int = 8
+
+
+def private_mb() -> float:
+    """Return the anonymous resident memory of this process in MB."""
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("RssAnon:"):
+            return int(line.split()[1]) / 1e3
+    return float("nan")
+
+
+def iterate(method: str, directory: Path) -> None:
+    """Read every batch once with *method* and print the measurements."""
+    baseline: float = private_mb()  # The interpreter and imported libraries
+    start: float = time.perf_counter()
+    dataset = TokenBlockDataset(directory, BLOCK_SIZE)
+    if method == "copy":
+        dataset.shards.tokens = [np.array(tokens) for tokens in dataset.shards.tokens]
+    checksum: int = 0
+    for batch in token_dataloader(dataset, BATCH_SIZE, shuffle=True):
+        checksum += int(batch[:, -1].sum())  # Touch the data as training would
+    elapsed: float = time.perf_counter() - start
+    private: float = private_mb()
+    print(f"{elapsed} {private} {private - baseline} {checksum}")
+
+
+def main() -> None:
+    """Write the shards and print the per-process figures per method."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=512.0)
+    parser.add_argument("--ranks", type=int, default=4)
+    parser.add_argument("--iterate", choices=METHODS, help=argparse.SUPPRESS)
+    parser.add_argument("--directory", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.iterate:
+        iterate(args.iterate, args.directory)
+        return
+
+    rng = np.random.default_rng(0)
+    num_rows: int = max(1, int(args.size_mb * 1e6 / (2 * ROW_TOKENS)))
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = Path(temporary)
+        write_token_shards(
+            (rng.integers(0, 50_000, ROW_TOKENS) for _ in range(num_rows)),
+            directory,
+            dtype="uint16",
+            rows_per_shard=65_536,
+        )
+        for path in directory.glob("*.npy"):  # Warm the page cache
+            path.read_bytes()
+
+        print(f"dataset: {num_rows * ROW_TOKENS * 2 / 1e6:.0f} MB, {args.ranks} ranks")
+        print(f"{'method':<8}{'epoch s':>10}{'private MB':>13}{'for data MB':>14}")
+        for method in METHODS:
+            ranks = [
+                subprocess.Popen(  # noqa: S603
+                    [
+                        sys.executable,
+                        __file__,
+                        "--iterate",
+                        method,
+                        "--directory",
+                        str(directory),
+                    ],
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+                for _ in range(args.ranks)
+            ]
+            runs = [
+                tuple(float(value) for value in rank.communicate()[0].split()[-4:-1])
+                for rank in ranks
+            ]
+            elapsed, private, data = (
+                statistics.median(run) for run in zip(*runs, strict=True)
+            )
+            print(f"{method:<8}{elapsed:>10.3f}{private:>13.0f}{data:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,17 +24,29 @@
 from hydraxcel import resolvers  # noqa: F401 # Register resolvers
 from hydraxcel.accelerate import launch, load_accelerate_configs
 from hydraxcel.logging import LoggingPlatform
+from hydraxcel.monitoring import load_monitoring_configs
+from hydraxcel.profiling import load_profile_configs
 from hydraxcel.run import (
+    Pipeline,
+    cache,
     get_logger,
     hydraxcel_main,
+    load_run_configs,
+    mark_step,
     set_seed,
 )
 
 __all__ = [
     "LoggingPlatform",
+    "Pipeline",
+    "cache",
     "get_logger",
     "hydraxcel_main",
     "launch",
     "load_accelerate_configs",
+    "load_monitoring_configs",
+    "load_profile_configs",
+    "load_run_configs",
+    "mark_step",
     "set_seed",
 ]
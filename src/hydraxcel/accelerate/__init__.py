@@ -21,12 +21,22 @@
 # limitations under the License.
 """Accelerate launcher package for HydraXcel.
 
-Exposes ``launch`` for wrapping training scripts with Accelerate, and
+Exposes ``launch`` for wrapping training scripts with Accelerate,
 ``load_accelerate_configs`` for registering hardware/precision/paradigm config
-groups into the Hydra config store.
+groups into the Hydra config store, ``AutotuneTask`` for launch-time
+selection of the fastest compile and mixed-precision variants, and
+``plan_memory`` for estimating the per-rank footprint of each paradigm.
 """
 
+from hydraxcel.accelerate.autotune import AutotuneTask
 from hydraxcel.accelerate.config_registry import load_accelerate_configs
 from hydraxcel.accelerate.launch_tools import launch
+from hydraxcel.accelerate.memory_plan import format_memory_plan, plan_memory
 
-__all__ = ["launch", "load_accelerate_configs"]
+__all__ = [
+    "AutotuneTask",
+    "format_memory_plan",
+    "launch",
+    "load_accelerate_configs",
+    "plan_memory",
+]
@@ -0,0 +1,295 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Launch-time autotuning of the compile and mixed-precision config groups.
+
+With ``autotune=true`` the launcher runs a short, user-provided training step
+under every candidate combination of the ``accelerate/compile`` and
+``accelerate/mixed-precision`` variants, each in a fresh single-device
+subprocess configured exactly like ``accelerate launch`` would configure it.
+Steady-state throughput is measured after warm-up, the fastest combination is
+persisted in a cache keyed by model signature and hardware fingerprint, and
+its settings are applied to the real launch.  Later launches with the same
+model and hardware skip tuning entirely.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing as mp
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from multiprocessing.connection import Connection  # noqa: TC003
+from pathlib import Path  # noqa: TC003
+from typing import Any, Callable
+
+import torch
+from accelerate import Accelerator
+from torch import nn
+
+from hydraxcel.accelerate.config_registry import (
+    COMPILE_VARIANTS,
+    MIXED_PRECISION_VARIANTS,
+)
+
+__all__ = [
+    "AutotuneTask",
+    "autotune_launch",
+    "hardware_fingerprint",
+    "model_signature",
+]
+
+CACHE_FILE_PATTERN: str = "{signature}-{hardware}.json"
+
+logger = logging.getLogger("autotune")
+
+
+@dataclass
+class AutotuneTask:
+    """User-provided model and training step to benchmark candidate configs.
+
+    Both callables must be importable module-level functions, since every
+    trial runs in a spawned subprocess.
+    """
+
+    # Build the model; also called under the meta device to compute its signature
+    build_model: Callable[[], nn.Module]
+    # Prepare model/optimizer/batch with the accelerator and return one step
+    make_step: Callable[[Accelerator, nn.Module], Callable[[], None]]
+
+
+def model_signature(model: nn.Module) -> str:
+    """Hash the class and the parameter/buffer names, shapes and dtypes of *model*."""
+    digest = hashlib.sha256(type(model).__qualname__.encode())
+    for name, tensor in [*model.named_parameters(), *model.named_buffers()]:
+        digest.update(f"{name}:{tuple(tensor.shape)}:{tensor.dtype}".encode())
+    return digest.hexdigest()[:16]
+
+
+def hardware_fingerprint() -> str:
+    """Hash the CPU, accelerator devices and torch/CUDA versions of this host."""
+    parts: list[str] = [
+        platform.machine(),
+        platform.processor(),
+        str(os.cpu_count()),
+        torch.__version__,
+        str(torch.version.cuda),
+    ]
+    if torch.cuda.is_available():
+        parts.extend(
+            torch.cuda.get_device_name(index)
+            for index in range(torch.cuda.device_count())
+        )
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+def _candidates(use_cpu: bool) -> list[tuple[str, str]]:  # noqa: FBT001
+    """List the compile and mixed-precision combinations valid on this host."""
+    skipped: set[str] = {"fp16", "fp8"} if use_cpu else set()
+    if not use_cpu and not torch.cuda.is_bf16_supported():
+        skipped.add("bf16")
+    return [
+        (compile_name, precision_name)
+        for compile_name in COMPILE_VARIANTS
+        for precision_name in MIXED_PRECISION_VARIANTS
+        if precision_name not in skipped
+    ]
+
+
+def _candidate_env(cfg: dict[str, Any]) -> dict[str, str]:
+    """Environment ``accelerate launch`` would set for the compile/precision flags."""
+    return {
+        "ACCELERATE_USE_CPU": str(cfg["cpu"]),
+        "ACCELERATE_MIXED_PRECISION": cfg["mixed_precision"],
+        "ACCELERATE_DYNAMO_BACKEND": cfg["dynamo_backend"].upper(),
+        "ACCELERATE_DYNAMO_MODE": cfg["dynamo_mode"],
+        "ACCELERATE_DYNAMO_USE_FULLGRAPH": str(cfg["dynamo_use_fullgraph"]),
+        "ACCELERATE_DYNAMO_USE_DYNAMIC": str(cfg["dynamo_use_dynamic"]),
+        "ACCELERATE_DYNAMO_USE_REGIONAL_COMPILATION": str(
+            cfg["dynamo_use_regional_compilation"],
+        ),
+    }
+
+
+def _run_trial(
+    task: AutotuneTask,
+    env: dict[str, str],
+    warmup_steps: int,
+    steps: int,
+    connection: Connection,
+) -> None:
+    """Subprocess body: time *steps* steps after warm-up; send steps/s or an error."""
+    try:
+        os.environ.update(env)
+        accelerator = Accelerator()
+        step: Callable[[], None] = task.make_step(accelerator, task.build_model())
+        for _ in range(warmup_steps):
+            step()
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+        start: float = time.perf_counter()
+        for _ in range(steps):
+            step()
+        if torch.cuda.is_available():
+            torch.cuda.synchronize()
+        connection.send(steps / (time.perf_counter() - start))
+    except Exception as error:  # noqa: BLE001 # Report any failure as an unusable candidate
+        connection.send(f"{type(error).__name__}: {error}")
+    finally:
+        connection.close()
+
+
+def _measure(
+    task: AutotuneTask,
+    env: dict[str, str],
+    *,
+    warmup_steps: int,
+    steps: int,
+    timeout: float,
+) -> float | str:
+    """Run one trial in a spawned subprocess; return steps/s or the failure."""
+    context = mp.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_run_trial,
+        args=(task, env, warmup_steps, steps, sender),
+        daemon=True,
+    )
+    process.start()
+    sender.close()
+    result: float | str = f"timed out after {timeout:.0f}s"
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:
+            result = f"trial process exited with code {process.exitcode}"
+    process.join(timeout=10)
+    if process.is_alive():
+        process.kill()
+        process.join()
+    return result
+
+
+def autotune_launch(  # noqa: PLR0913
+    task: AutotuneTask,
+    cfg: dict[str, Any],
+    *,
+    cache_dir: Path,
+    warmup_steps: int = 5,
+    steps: int = 20,
+    timeout: float = 600.0,
+    refresh: bool = False,
+    candidates: list[tuple[str, str]] | None = None,
+) -> dict[str, Any]:
+    """Find (or load) the fastest compile/precision variants and apply them to *cfg*.
+
+    Args:
+        task: The model and training step to benchmark.
+        cfg: The flattened launch configuration; updated in place with the
+            winning variants' fields.
+        cache_dir: Directory holding one JSON result per model and hardware.
+        warmup_steps: Steps run before timing (includes compilation).
+        steps: Timed steps per candidate.
+        timeout: Seconds after which a candidate is abandoned.
+        refresh: Re-tune even if a cached result exists.
+        candidates: ``(compile, mixed_precision)`` variant names to try;
+            defaults to every combination valid on this host.
+
+    Returns:
+        The cached record: the winning variant names, the Hydra overrides that
+        select them, and the throughput (or failure) of every candidate.
+
+    Raises:
+        RuntimeError: If every candidate failed.
+
+    """
+    with torch.device("meta"):
+        signature: str = model_signature(task.build_model())
+    cache_path: Path = cache_dir / CACHE_FILE_PATTERN.format(
+        signature=signature,
+        hardware=hardware_fingerprint(),
+    )
+    record: dict[str, Any]
+    if cache_path.exists() and not refresh:
+        record = json.loads(cache_path.read_text())
+        logger.info(
+            "Using cached autotune result %s: %s",
+            cache_path,
+            " ".join(record["overrides"]),
+        )
+    else:
+        results: dict[str, float | str] = {}
+        for compile_name, precision_name in candidates or _candidates(cfg["cpu"]):
+            trial_cfg: dict[str, Any] = {
+                **cfg,
+                **asdict(COMPILE_VARIANTS[compile_name]),
+                **asdict(MIXED_PRECISION_VARIANTS[precision_name]),
+            }
+            name: str = f"{compile_name}/{precision_name}"
+            results[name] = _measure(
+                task,
+                _candidate_env(trial_cfg),
+                warmup_steps=warmup_steps,
+                steps=steps,
+                timeout=timeout,
+            )
+            logger.info(
+                "Autotune %-20s %s",
+                name,
+                f"{results[name]:.2f} steps/s"
+                if isinstance(results[name], float)
+                else f"failed: {results[name]}",
+            )
+        timings: dict[str, float] = {
+            name: result
+            for name, result in results.items()
+            if isinstance(result, float)
+        }
+        if not timings:
+            msg = f"All autotune candidates failed: {results}"
+            raise RuntimeError(msg)
+        winner: str = max(timings, key=timings.__getitem__)
+        compile_name, precision_name = winner.split("/")
+        record = {
+            "compile": compile_name,
+            "mixed_precision": precision_name,
+            "overrides": [
+                f"accelerate/compile={compile_name}",
+                f"accelerate/mixed-precision={precision_name}",
+            ],
+            "results": results,
+        }
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(record, indent=2))
+        temp_path.replace(cache_path)  # Atomic for concurrent launches
+        logger.info(
+            "Autotune winner %s at %.2f steps/s (cached in %s)",
+            winner,
+            timings[winner],
+            cache_path,
+        )
+
+    cfg.update(asdict(COMPILE_VARIANTS[record["compile"]]))
+    cfg.update(asdict(MIXED_PRECISION_VARIANTS[record["mixed_precision"]]))
+    return record
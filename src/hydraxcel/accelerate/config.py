@@ -40,6 +40,13 @@ class LaunchConfig:
 
     # ---------------------- Allowed value sets (class-level) ------------------
     _MIXED_PRECISION_CHOICES: ClassVar[set[str]] = {"no", "fp16", "bf16", "fp8"}
+    _CPU_AFFINITY_CHOICES: ClassVar[set[str]] = {"manual", "auto"}
+    _MEMORY_OPTIMIZER_CHOICES: ClassVar[set[str]] = {
+        "adamw",
+        "adam",
+        "sgd-momentum",
+        "sgd",
+    }
     _DYNAMO_BACKEND_CHOICES: ClassVar[set[str]] = {
         "no",
         "inductor",
@@ -92,12 +99,29 @@ class LaunchConfig:
     num_machines: int = 1
     num_cpu_threads_per_process: int = 2
     enable_cpu_affinity: bool = False
+    cpu_affinity: str = "manual"  # choices: manual|auto (topology-based plan)
     dynamo_backend: str = "no"
     dynamo_mode: str = "default"
     dynamo_use_fullgraph: bool = False
     dynamo_use_dynamic: bool = False
     dynamo_use_regional_compilation: bool = False
 
+    # Autotuning of the compile and mixed-precision variants
+    autotune: bool = False
+    autotune_warmup_steps: int = 5
+    autotune_steps: int = 20
+    autotune_timeout: float = 600.0
+    autotune_refresh: bool = False
+
+    # Memory planning across the paradigm variants
+    memory_plan: bool = False
+    memory_budget_gb: float | None = None
+    memory_reserve_gb: float = 0.0
+    memory_optimizer: str = "adamw"  # choices: adamw|adam|sgd-momentum|sgd
+
+    # Elastic launch through torchrun with automatic restarts
+    elastic: bool = False
+
     # Paradigm selection
     use_deepspeed: bool = False
     use_fsdp: bool = False
@@ -218,6 +242,10 @@ class LaunchConfig:
         """Validate the configuration after initialization."""
         # Validate fields
         self._validate_mixed_precision()
+        self._validate_cpu_affinity()
+        self._validate_autotune()
+        self._validate_memory_plan()
+        self._validate_elastic()
         self._validate_dynamo_backend()
         self._validate_dynamo_mode()
         self._validate_fsdp_version()
@@ -247,6 +275,53 @@ class LaunchConfig:
             )
             raise ValueError(msg)
 
+    def _validate_cpu_affinity(self) -> None:
+        if self.cpu_affinity not in self._CPU_AFFINITY_CHOICES:
+            msg = (
+                f"cpu_affinity must be one of {self._CPU_AFFINITY_CHOICES}, "
+                f"got {self.cpu_affinity!r}"
+            )
+            raise ValueError(msg)
+
+    def _validate_autotune(self) -> None:
+        if self.autotune_warmup_steps < 0 or self.autotune_steps < 1:
+            msg = (
+                "autotune_warmup_steps must be >= 0 and autotune_steps >= 1, "
+                f"got {self.autotune_warmup_steps} and {self.autotune_steps}"
+            )
+            raise ValueError(msg)
+        if self.autotune_timeout <= 0:
+            msg = f"autotune_timeout must be positive, got {self.autotune_timeout}"
+            raise ValueError(msg)
+
+    def _validate_memory_plan(self) -> None:
+        if self.memory_optimizer not in self._MEMORY_OPTIMIZER_CHOICES:
+            msg = (
+                f"memory_optimizer must be one of {self._MEMORY_OPTIMIZER_CHOICES}, "
+                f"got {self.memory_optimizer!r}"
+            )
+            raise ValueError(msg)
+        if self.memory_budget_gb is not None and self.memory_budget_gb <= 0:
+            msg = f"memory_budget_gb must be positive, got {self.memory_budget_gb}"
+            raise ValueError(msg)
+        if self.memory_reserve_gb < 0:
+            msg = f"memory_reserve_gb must be >= 0, got {self.memory_reserve_gb}"
+            raise ValueError(msg)
+
+    def _validate_elastic(self) -> None:
+        if self.max_restarts < 0:
+            msg = f"max_restarts must be >= 0, got {self.max_restarts}"
+            raise ValueError(msg)
+        if self.monitor_interval <= 0:
+            msg = f"monitor_interval must be positive, got {self.monitor_interval}"
+            raise ValueError(msg)
+        if self.elastic and self.rdzv_backend == "static":
+            msg = "elastic=true needs a dynamic rdzv_backend (e.g. c10d), got 'static'"
+            raise ValueError(msg)
+        if self.elastic and self.tpu:
+            msg = "elastic=true launches through torchrun and does not support TPUs"
+            raise ValueError(msg)
+
     def _validate_dynamo_backend(self) -> None:
         if self.dynamo_backend not in self._DYNAMO_BACKEND_CHOICES:
             msg = (
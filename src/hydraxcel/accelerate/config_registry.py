@@ -30,7 +30,13 @@ from dataclasses import dataclass, field
 
 from hydraxcel.hydra import config_store, hydra_config
 
-__all__ = ["load_accelerate_configs"]
+__all__ = [
+    "COMPILE_VARIANTS",
+    "HARDWARE_VARIANTS",
+    "MIXED_PRECISION_VARIANTS",
+    "PARADIGM_VARIANTS",
+    "load_accelerate_configs",
+]
 
 
 @dataclass
@@ -44,6 +50,7 @@ class HardwareConfig:
     num_machines: int = 1
     num_cpu_threads_per_process: int = 2
     enable_cpu_affinity: bool = False
+    cpu_affinity: str = "manual"  # 'auto': threads and pinning from the CPU topology
 
 
 @dataclass
@@ -139,6 +146,72 @@ class FP8PrecisionConfig:
     fp8_opt_level: str = "O2"
 
 
+@dataclass
+class AutotuneConfig:
+    """Launch Autotuner Configuration."""
+
+    autotune: bool = False  # Benchmark compile x precision variants before launching
+    autotune_warmup_steps: int = 5  # Untimed steps per candidate (covers compilation)
+    autotune_steps: int = 20  # Timed steps per candidate
+    autotune_timeout: float = 600.0  # Seconds before a candidate is abandoned
+    autotune_refresh: bool = False  # Ignore a cached winner and re-tune
+
+
+@dataclass
+class MemoryPlanConfig:
+    """Launch Memory Planner Configuration."""
+
+    memory_plan: bool = False  # Switch to the cheapest paradigm that fits the budget
+    memory_budget_gb: float | None = None  # Per rank; None: smallest GPU (CPU: RAM)
+    memory_reserve_gb: float = 0.0  # Kept free per rank for activations/workspace
+    memory_optimizer: str = "adamw"  # State counted: adamw|adam|sgd-momentum|sgd
+
+
+@dataclass
+class ElasticLaunchConfig:
+    """Elastic Launch Configuration."""
+
+    elastic: bool = False  # torchrun workers, restarted together when a rank fails
+    rdzv_backend: str = "static"  # Restarts need a dynamic rendezvous (c10d)
+    max_restarts: int = 0  # Worker group restarts before the launch fails
+    monitor_interval: float = 0.1  # Seconds between worker health checks
+
+
+# Variants shared by the config store, the launch autotuner and hydraxcel-bench
+HARDWARE_VARIANTS: dict[str, HardwareConfig] = {
+    "cpu": HardwareConfig(cpu=True),
+    "cpu-auto": HardwareConfig(cpu=True, cpu_affinity="auto"),
+    "gpu": HardwareConfig(),
+    "multi-gpu": HardwareConfig(multi_gpu=True, num_processes=2),
+}
+COMPILE_VARIANTS: dict[str, CompileConfig] = {
+    "none": CompileConfig(),
+    "torch": CompileConfig(
+        dynamo_backend="inductor",
+        dynamo_mode="default",
+        dynamo_use_dynamic=True,
+    ),
+    "inductor": CompileConfig(dynamo_backend="inductor"),
+}
+PARADIGM_VARIANTS: dict[str, ParadigmConfig] = {
+    "torch-ddp": ParadigmConfig(),
+    "deepspeed": DeepSpeedConfig(),
+    "deepspeed-zero3": DeepSpeedConfig(
+        zero_stage=3,
+        offload_optimizer_device="cpu",
+        offload_param_device="cpu",
+        zero3_init_flag=True,
+        zero3_save_16bit_model=True,
+    ),
+    "torch-fsdp": TorchFSDPConfig(),
+}
+MIXED_PRECISION_VARIANTS: dict[str, MixedPrecisionConfig | FP8PrecisionConfig] = {
+    "no": MixedPrecisionConfig(),
+    "fp16": MixedPrecisionConfig(mixed_precision="fp16"),
+    "bf16": MixedPrecisionConfig(mixed_precision="bf16"),
+    "fp8": FP8PrecisionConfig(),
+}
+
 AccelerateConfig = hydra_config(
     "AccelerateConfig",
     defaults=[
@@ -146,6 +219,9 @@ AccelerateConfig = hydra_config(
         {"accelerate/compile": "torch"},
         {"accelerate/paradigm": "torch-ddp"},
         {"accelerate/mixed-precision": "bf16"},
+        {"accelerate/autotune": "none"},
+        {"accelerate/memory-plan": "none"},
+        {"accelerate/elastic": "none"},
     ],
     add_training_script_placeholder=True,
 )
@@ -155,90 +231,54 @@ def load_accelerate_configs() -> None:
     """Register all built-in Accelerate config variants into the Hydra config store.
 
     Stores the top-level ``AccelerateConfig`` schema and all hardware, compile,
-    paradigm, and mixed-precision sub-group variants so they can be selected via
-    Hydra's config composition (e.g. ``accelerate/paradigm=deepspeed``).
+    paradigm, mixed-precision, autotune, memory-plan and elastic sub-group
+    variants so they can be selected via Hydra's config composition (e.g.
+    ``accelerate/paradigm=deepspeed``).
     """
     config_store.store(
         name="accelerate",
         node=AccelerateConfig,
     )
-    config_store.store(
-        name="cpu",
-        group="accelerate/hardware",
-        node=HardwareConfig(cpu=True),
-    )
-    config_store.store(
-        name="gpu",
-        group="accelerate/hardware",
-        node=HardwareConfig(),
-    )
-    config_store.store(
-        name="multi-gpu",
-        group="accelerate/hardware",
-        node=HardwareConfig(multi_gpu=True, num_processes=2),
-    )
+    for name, node in HARDWARE_VARIANTS.items():
+        config_store.store(name=name, group="accelerate/hardware", node=node)
+    for name, node in COMPILE_VARIANTS.items():
+        config_store.store(name=name, group="accelerate/compile", node=node)
+    for name, node in PARADIGM_VARIANTS.items():
+        config_store.store(name=name, group="accelerate/paradigm", node=node)
+    for name, node in MIXED_PRECISION_VARIANTS.items():
+        config_store.store(name=name, group="accelerate/mixed-precision", node=node)
     config_store.store(
         name="none",
-        group="accelerate/compile",
-        node=CompileConfig(),
+        group="accelerate/autotune",
+        node=AutotuneConfig(),
     )
     config_store.store(
-        name="torch",
-        group="accelerate/compile",
-        node=CompileConfig(
-            dynamo_backend="inductor",
-            dynamo_mode="default",
-            dynamo_use_dynamic=True,
-        ),
+        name="default",
+        group="accelerate/autotune",
+        node=AutotuneConfig(autotune=True),
     )
     config_store.store(
-        name="inductor",
-        group="accelerate/compile",
-        node=CompileConfig(dynamo_backend="inductor"),
+        name="none",
+        group="accelerate/memory-plan",
+        node=MemoryPlanConfig(),
     )
     config_store.store(
-        name="torch-ddp",
-        group="accelerate/paradigm",
-        node=ParadigmConfig(),
+        name="default",
+        group="accelerate/memory-plan",
+        node=MemoryPlanConfig(memory_plan=True),
     )
     config_store.store(
-        name="deepspeed",
-        group="accelerate/paradigm",
-        node=DeepSpeedConfig(),
+        name="none",
+        group="accelerate/elastic",
+        node=ElasticLaunchConfig(),
     )
     config_store.store(
-        name="deepspeed-zero3",
-        group="accelerate/paradigm",
-        node=DeepSpeedConfig(
-            zero_stage=3,
-            offload_optimizer_device="cpu",
-            offload_param_device="cpu",
-            zero3_init_flag=True,
-            zero3_save_16bit_model=True,
+        name="default",
+        group="accelerate/elastic",
+        node=ElasticLaunchConfig(
+            elastic=True,
+            rdzv_backend="c10d",
+            max_restarts=3,
+            monitor_interval=1.0,
         ),
     )
-    config_store.store(
-        name="torch-fsdp",
-        group="accelerate/paradigm",
-        node=TorchFSDPConfig(),
-    )
-    config_store.store(
-        name="no",
-        group="accelerate/mixed-precision",
-        node=MixedPrecisionConfig(),
-    )
-    config_store.store(
-        name="fp16",
-        group="accelerate/mixed-precision",
-        node=MixedPrecisionConfig(mixed_precision="fp16"),
-    )
-    config_store.store(
-        name="bf16",
-        group="accelerate/mixed-precision",
-        node=MixedPrecisionConfig(mixed_precision="bf16"),
-    )
-    config_store.store(
-        name="fp8",
-        group="accelerate/mixed-precision",
-        node=FP8PrecisionConfig(),
-    )
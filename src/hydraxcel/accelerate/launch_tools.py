@@ -21,8 +21,12 @@
 # limitations under the License.
 """Custom launcher for using accelerate in uv script commands."""
 
+import logging
+import os
 import subprocess
 import sys
+import time
+import uuid
 from argparse import Namespace
 from dataclasses import asdict
 from pathlib import Path
@@ -31,15 +35,196 @@ from typing import Callable
 from accelerate.commands.launch import launch_command
 from hydra import main
 from hydra.core.config_store import ConfigStore
+from torch import nn
 
+from hydraxcel.accelerate.autotune import AutotuneTask, autotune_launch
 from hydraxcel.accelerate.config import LaunchConfig
+from hydraxcel.accelerate.memory_plan import apply_memory_plan
+from hydraxcel.accelerate.topology import (
+    CPU_AFFINITY_ENV,
+    LAUNCH_CPUS_ENV,
+    LOCAL_PROCESSES_ENV,
+    CpuPlan,
+    log_cpu_plan,
+    plan_cpu_affinity,
+    read_cpu_topology,
+)
 from hydraxcel.hydra import flatten_config
+from hydraxcel.run.elastic import ELASTIC_ENV, RUN_TIME_ENV
 from hydraxcel.run.setup import _setup_hydra_config_and_logging
 
-__all__ = ["launch"]
+__all__ = ["build_launch_args", "launch"]
 _config_store = ConfigStore.instance()
 _config_store.store(name="launch_config", node=LaunchConfig)
 
+logger = logging.getLogger("launch")
+
+
+def _configure_auto_cpu_affinity(cfg: dict) -> None:
+    """Size per-process threads from the CPU topology and request pinning.
+
+    Plans the local processes' share of the machine, sets
+    ``num_cpu_threads_per_process`` (and thereby ``OMP_NUM_THREADS``) to match,
+    and exports the plan's size and CPUs so every launched process pins itself
+    to its NUMA-local cores in ``hydraxcel_main``.  Accelerate's own GPU-based
+    ``enable_cpu_affinity`` is disabled to avoid conflicting masks.
+
+    Args:
+        cfg: The flattened launch configuration; updated in place.
+
+    """
+    num_processes: int = max(1, cfg["num_processes"] // max(1, cfg["num_machines"]))
+    topology = read_cpu_topology()
+    plans: list[CpuPlan] = plan_cpu_affinity(topology, num_processes)
+    log_cpu_plan(topology, plans)
+    cfg["num_cpu_threads_per_process"] = min(plan.num_threads for plan in plans)
+    cfg["enable_cpu_affinity"] = False
+    os.environ[CPU_AFFINITY_ENV] = "auto"
+    os.environ[LOCAL_PROCESSES_ENV] = str(num_processes)
+    os.environ[LAUNCH_CPUS_ENV] = ",".join(
+        str(cpu) for cores in topology.nodes.values() for core in cores for cpu in core
+    )
+
+
+def _configure_autotune(cfg: dict, task: AutotuneTask | None) -> None:
+    """Pop the autotune settings from *cfg* and, if enabled, apply the winner.
+
+    Args:
+        cfg: The flattened launch configuration; updated in place.
+        task: The model and training step benchmarked for every candidate.
+
+    Raises:
+        ValueError: If autotuning is enabled but no *task* was given.
+
+    """
+    enabled: bool = cfg.pop("autotune")
+    settings: dict = {
+        key.removeprefix("autotune_"): cfg.pop(key)
+        for key in list(cfg)
+        if key.startswith("autotune_")
+    }
+    if not enabled:
+        return
+    if task is None:
+        msg = "autotune=true requires launch(..., autotune_task=AutotuneTask(...))"
+        raise ValueError(msg)
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    record: dict = autotune_launch(
+        task,
+        cfg,
+        cache_dir=cache_root / "hydraxcel" / "autotune",
+        **settings,
+    )
+    logger.info("Autotune overrides: %s", " ".join(record["overrides"]))
+
+
+def _configure_memory_plan(
+    cfg: dict,
+    model_builder: Callable[[], nn.Module] | None,
+) -> None:
+    """Pop the memory-plan settings from *cfg* and, if enabled, apply the plan.
+
+    Args:
+        cfg: The flattened launch configuration; updated in place.
+        model_builder: Builds the model whose footprint is planned.
+
+    Raises:
+        ValueError: If planning is enabled but no *model_builder* was given.
+
+    """
+    enabled: bool = cfg.pop("memory_plan")
+    settings: dict = {
+        key.removeprefix("memory_"): cfg.pop(key)
+        for key in list(cfg)
+        if key.startswith("memory_")
+    }
+    if not enabled:
+        return
+    if model_builder is None:
+        msg = (
+            "memory_plan=true requires launch(..., memory_plan_model=build_model) "
+            "or an autotune_task"
+        )
+        raise ValueError(msg)
+    apply_memory_plan(model_builder, cfg, settings)
+
+
+def _configure_elastic(cfg: dict) -> None:
+    """Pop the elastic switch from *cfg* and, if set, launch through torchrun.
+
+    The workers run under torchrun's elastic agent (the ``multi_gpu``
+    launcher, which also works on CPU), single-node launches host their own
+    c10d store (``standalone``), and the run timestamp and W&B run id are
+    pinned so that every restart reuses the first attempt's run directory and
+    tracker run.  Multi-node launches must set ``HYDRAXCEL_RUN_TIME`` to the
+    same value on every node.
+
+    Args:
+        cfg: The flattened launch configuration; updated in place.
+
+    """
+    if not cfg.pop("elastic"):
+        return
+    if cfg["cpu"]:
+        # The torchrun launcher drops ``cpu``; the workers read it from here
+        os.environ["ACCELERATE_USE_CPU"] = "true"
+        cfg["cpu"] = False
+    if not cfg["use_deepspeed"]:
+        cfg["multi_gpu"] = True
+    if cfg["num_machines"] <= 1:
+        cfg["standalone"] = True
+    os.environ[ELASTIC_ENV] = "1"
+    # Workers of a restarted group otherwise join the agent's long-lived store
+    # and can read the process-group addresses of the failed attempt
+    os.environ.setdefault("TORCH_DISABLE_SHARE_RDZV_TCP_STORE", "1")
+    os.environ.setdefault(RUN_TIME_ENV, time.strftime("%Y-%m-%d_%H-%M-%S"))
+    os.environ.setdefault("WANDB_RUN_ID", uuid.uuid4().hex[:8])
+    os.environ.setdefault("WANDB_RESUME", "allow")
+    logger.info(
+        "Elastic launch: %s rendezvous, up to %d restarts, health checks every %ss",
+        cfg["rdzv_backend"],
+        cfg["max_restarts"],
+        cfg["monitor_interval"],
+    )
+
+
+def build_launch_args(
+    cfg: dict,
+    *,
+    autotune_task: AutotuneTask | None = None,
+    memory_plan_model: Callable[[], nn.Module] | None = None,
+) -> Namespace:
+    """Validate a flattened launch configuration and resolve the launcher-only keys.
+
+    Args:
+        cfg: The flattened launch configuration.
+        autotune_task: Forwarded to the autotuner when ``autotune`` is set.
+        memory_plan_model: Builds the model for ``memory_plan``; defaults to
+            the autotune task's model.
+
+    Returns:
+        The ``accelerate launch`` arguments.
+
+    """
+    for key in [
+        "deepspeed_fields_from_accelerate_config",
+        "use_cpu",
+        "use_xpu",
+        "nproc_per_node",
+        "master_port",
+    ]:
+        cfg.pop(key, None)
+
+    cfg = asdict(LaunchConfig(**cfg))
+    if cfg.pop("cpu_affinity") == "auto":
+        _configure_auto_cpu_affinity(cfg)
+    _configure_autotune(cfg, autotune_task)
+    if memory_plan_model is None and autotune_task is not None:
+        memory_plan_model = autotune_task.build_model
+    _configure_memory_plan(cfg, memory_plan_model)
+    _configure_elastic(cfg)
+    return Namespace(**cfg)
+
 
 def _format_multirun_launch_args(
     script: str,
@@ -118,12 +303,14 @@ def _extract_pass_through_args() -> list[str]:
     return []
 
 
-def launch(
+def launch(  # noqa: PLR0913
     script_path: Path,
     *,
     hydra_configs_dir: str | None = None,
     config_name: str = "accelerate",
     hydra_base_version: str = "1.4",
+    autotune_task: AutotuneTask | None = None,
+    memory_plan_model: Callable[[], nn.Module] | None = None,
 ) -> Callable[[LaunchConfig], None]:
     """Create a Hydra-based Accelerate launcher for *script_path*.
 
@@ -142,6 +329,11 @@ def launch(
         config_name: Name of the Hydra config node to load (default
             ``"accelerate"``).
         hydra_base_version: Hydra ``version_base`` string (default ``"1.4"``).
+        autotune_task: Model and training step to benchmark when the launch
+            config sets ``autotune=true`` (see ``accelerate/autotune``).
+        memory_plan_model: Builds the model (on the ``meta`` device) whose
+            per-rank footprint selects the paradigm when the launch config
+            sets ``memory_plan=true`` (see ``accelerate/memory-plan``).
 
     Returns:
         A Hydra entry-point callable that accepts no positional arguments and
@@ -179,17 +371,15 @@ def launch(
 
         # Flatten and validate the configuration
         cfg: dict = flatten_config(cfg)  # ty:ignore[invalid-argument-type]
-        for key in [
-            "deepspeed_fields_from_accelerate_config",
-            "use_cpu",
-            "use_xpu",
-            "nproc_per_node",
-            "master_port",
-        ]:
-            cfg.pop(key, None)
-
-        cfg = asdict(LaunchConfig(**cfg))
-        cfg: Namespace = Namespace(**cfg)
+        if "-m" in passthrough_args or "--help" in passthrough_args:
+            # The script runs in this process's environment, not as launched ranks
+            cfg["autotune"] = cfg["memory_plan"] = cfg["elastic"] = False
+            cfg["cpu_affinity"] = "manual"
+        cfg: Namespace = build_launch_args(
+            cfg,
+            autotune_task=autotune_task,
+            memory_plan_model=memory_plan_model,
+        )
 
         # If -m is in the passthrough args, run the script directly
         if "-m" in passthrough_args or "--help" in passthrough_args:
@@ -0,0 +1,518 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Launch-time memory planning across the ``accelerate/paradigm`` variants.
+
+The planner builds the user's model on the ``meta`` device, so no memory is
+allocated, and counts its parameters by dtype.  From these counts it derives
+the per-rank footprint of parameters, gradients, optimizer state and
+transiently gathered shards under every registered paradigm variant for the
+configured number of processes and mixed precision.  The estimate follows the
+ZeRO accounting: fp32 master weights and Adam moments for DeepSpeed, and
+sharded flat parameters plus one gathered unit (prefetched: twice) for ZeRO-3
+and FSDP.  Activations depend on the batch, so they are covered by a
+configurable per-rank reserve instead.
+
+With ``memory_plan=true`` the launcher switches to the cheapest variant that
+fits the budget, or fails before any process is started.  ``hydraxcel-memory-plan``
+prints the same report for a model outside of a launch.
+"""
+
+import argparse
+import importlib
+import logging
+import os
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Self
+
+import torch
+from torch import nn
+
+from hydraxcel.accelerate.config_registry import (
+    MIXED_PRECISION_VARIANTS,
+    PARADIGM_VARIANTS,
+    ParadigmConfig,
+)
+
+__all__ = [
+    "MemoryEstimate",
+    "MemoryPlan",
+    "ModelStats",
+    "estimate_memory",
+    "format_memory_plan",
+    "main",
+    "plan_memory",
+]
+
+GIB: int = 2**30
+# Optimizer state elements kept per trainable parameter
+OPTIMIZER_STATES: dict[str, int] = {"adamw": 2, "adam": 2, "sgd-momentum": 1, "sgd": 0}
+HALF_PRECISIONS: set[str] = {"fp16", "bf16", "fp8"}
+FP32_BYTES: int = 4
+HALF_BYTES: int = 2
+
+logger = logging.getLogger("memory_plan")
+
+
+@dataclass
+class ModelStats:
+    """Parameter counts of a model, gathered without allocating it."""
+
+    numel: int  # All parameters
+    trainable_numel: int
+    bytes_by_dtype: dict[str, int]  # Parameter storage per dtype
+    trainable_bytes: int
+    largest_leaf_numel: int  # Largest parameter set owned by a single module
+    module_numels: list[int] = field(repr=False)  # Recursive numel per module
+
+    @classmethod
+    def from_module(cls, model: nn.Module) -> Self:
+        """Count the parameters of *model* (typically built on the meta device)."""
+        bytes_by_dtype: Counter[str] = Counter()
+        for parameter in model.parameters():
+            bytes_by_dtype[str(parameter.dtype).removeprefix("torch.")] += (
+                parameter.numel() * parameter.element_size()
+            )
+        trainable: list[nn.Parameter] = [
+            parameter for parameter in model.parameters() if parameter.requires_grad
+        ]
+        return cls(
+            numel=sum(parameter.numel() for parameter in model.parameters()),
+            trainable_numel=sum(parameter.numel() for parameter in trainable),
+            bytes_by_dtype=dict(bytes_by_dtype),
+            trainable_bytes=sum(
+                parameter.numel() * parameter.element_size() for parameter in trainable
+            ),
+            largest_leaf_numel=max(
+                (
+                    sum(
+                        parameter.numel()
+                        for parameter in module.parameters(recurse=False)
+                    )
+                    for module in model.modules()
+                ),
+                default=0,
+            ),
+            module_numels=[
+                sum(parameter.numel() for parameter in module.parameters())
+                for module in model.modules()
+            ],
+        )
+
+    @property
+    def bytes(self) -> int:
+        """Total parameter storage in bytes."""
+        return sum(self.bytes_by_dtype.values())
+
+    def largest_unit_numel(self, min_num_params: float) -> int:
+        """Largest FSDP auto-wrap unit for a ``min_num_params`` size policy.
+
+        Modules are wrapped once they reach the threshold, so a unit holds at
+        most the largest module still below it (or the whole model).
+        """
+        below: list[int] = [
+            numel for numel in self.module_numels if numel < min_num_params
+        ]
+        return max([*below, self.largest_leaf_numel]) if below else self.numel
+
+
+@dataclass
+class MemoryEstimate:
+    """Per-rank memory estimate of one paradigm variant."""
+
+    paradigm: str
+    device: dict[str, int]  # Bytes per component on the accelerator
+    host: dict[str, int]  # Bytes per component offloaded to CPU memory
+    cost: tuple[int, int, int]  # (offloads, shards params, shards grads/states)
+
+    @property
+    def device_bytes(self) -> int:
+        """Total accelerator bytes."""
+        return sum(self.device.values())
+
+    @property
+    def host_bytes(self) -> int:
+        """Total offloaded host bytes."""
+        return sum(self.host.values())
+
+
+@dataclass
+class MemoryPlan:
+    """Estimates of all candidate variants and the chosen one."""
+
+    stats: ModelStats
+    estimates: list[MemoryEstimate]
+    device_budget: int
+    host_budget: int
+    reserve: int
+    chosen: str | None
+
+
+def _compute_bytes(stats: ModelStats, *, half: bool) -> int:
+    """Bytes per element of the parameters as used in forward and backward."""
+    return HALF_BYTES if half else stats.bytes // max(1, stats.numel)
+
+
+def _fsdp_estimate(
+    stats: ModelStats,
+    config: ParadigmConfig,
+    *,
+    num_processes: int,
+    optimizer_states: int,
+    half: bool,
+) -> tuple[dict[str, int], dict[str, int], tuple[int, int, int]]:
+    """Place FSDP parameters, gradients and states (params keep their dtype)."""
+    strategy: str = getattr(config, "fsdp_sharding_strategy", "FULL_SHARD")
+    shard_params: bool = strategy == "FULL_SHARD"
+    shard_states: bool = strategy != "NO_SHARD"
+    offload: bool = getattr(config, "fsdp_offload_params", "false") == "true"
+    compute_bytes: int = _compute_bytes(stats, half=half)
+    state_bytes: int = optimizer_states * stats.trainable_bytes
+    unit: int = stats.largest_unit_numel(getattr(config, "fsdp_min_num_params", 1e8))
+    states: dict[str, int] = {
+        "params": stats.bytes // (num_processes if shard_params else 1),
+        "grads": stats.trainable_bytes // (num_processes if shard_states else 1),
+        "optimizer": state_bytes // (num_processes if shard_states else 1),
+    }
+    device: dict[str, int] = {} if offload else states
+    host: dict[str, int] = states if offload else {}
+    if (shard_params and num_processes > 1) or offload:
+        device["gathered"] = 2 * unit * compute_bytes  # Current and prefetched unit
+    return device, host, (int(offload), int(shard_params), int(shard_states))
+
+
+def _deepspeed_estimate(
+    stats: ModelStats,
+    config: ParadigmConfig,
+    *,
+    num_processes: int,
+    optimizer_states: int,
+    half: bool,
+) -> tuple[dict[str, int], dict[str, int], tuple[int, int, int]]:
+    """Place ZeRO partitions: fp32 master weights and moments, half params and grads."""
+    compute_bytes: int = _compute_bytes(stats, half=half)
+    stage: int = getattr(config, "zero_stage", 0) or 0
+    offload_optimizer: bool = getattr(config, "offload_optimizer_device", None) == "cpu"
+    offload_params: bool = getattr(config, "offload_param_device", None) == "cpu"
+
+    def shard(value: int, min_stage: int) -> int:
+        return value // num_processes if stage >= min_stage else value
+
+    optimizer: dict[str, int] = {
+        "master": shard(stats.trainable_numel * FP32_BYTES, 1) if half else 0,
+        "optimizer": shard(stats.trainable_numel * FP32_BYTES * optimizer_states, 1),
+    }
+    grads: int = shard(stats.trainable_numel * compute_bytes, 2)
+    params: int = shard(stats.numel * compute_bytes, 3)
+    device: dict[str, int] = {}
+    host: dict[str, int] = {}
+    (host if offload_optimizer else device).update(optimizer)
+    (host if offload_optimizer and stage >= 2 else device)["grads"] = grads  # noqa: PLR2004
+    (host if offload_params and stage >= 3 else device)["params"] = params  # noqa: PLR2004
+    if stage >= 3:  # noqa: PLR2004
+        device["gathered"] = 2 * stats.largest_leaf_numel * compute_bytes
+    offloads: int = int(offload_optimizer or offload_params)
+    return device, host, (offloads, int(stage >= 3), int(stage >= 1))  # noqa: PLR2004
+
+
+def estimate_memory(
+    stats: ModelStats,
+    paradigm: str,
+    *,
+    num_processes: int,
+    mixed_precision: str = "no",
+    optimizer: str = "adamw",
+) -> MemoryEstimate:
+    """Estimate the per-rank footprint of *paradigm* (a ``PARADIGM_VARIANTS`` name).
+
+    Args:
+        stats: Parameter counts of the model.
+        paradigm: Name of the ``accelerate/paradigm`` variant.
+        num_processes: Total number of processes the model is sharded over.
+        mixed_precision: Name of the ``accelerate/mixed-precision`` variant.
+        optimizer: Optimizer whose state is counted (see ``OPTIMIZER_STATES``).
+
+    Returns:
+        The device and host bytes per component.
+
+    """
+    config: ParadigmConfig = PARADIGM_VARIANTS[paradigm]
+    half: bool = mixed_precision in HALF_PRECISIONS
+    if config.use_deepspeed:
+        device, host, cost = _deepspeed_estimate(
+            stats,
+            config,
+            num_processes=num_processes,
+            optimizer_states=OPTIMIZER_STATES[optimizer],
+            half=half,
+        )
+    elif config.use_fsdp:
+        device, host, cost = _fsdp_estimate(
+            stats,
+            config,
+            num_processes=num_processes,
+            optimizer_states=OPTIMIZER_STATES[optimizer],
+            half=half,
+        )
+    else:  # DDP: full replica plus gradient buckets of the same size
+        device = {
+            "params": stats.bytes,
+            "grads": stats.trainable_bytes,
+            "buckets": stats.trainable_bytes if num_processes > 1 else 0,
+            "optimizer": OPTIMIZER_STATES[optimizer] * stats.trainable_bytes,
+        }
+        host, cost = {}, (0, 0, 0)
+    return MemoryEstimate(paradigm=paradigm, device=device, host=host, cost=cost)
+
+
+def _default_budgets(*, cpu: bool, local_processes: int) -> tuple[int, int]:
+    """Smallest visible GPU and this host's RAM share per local process."""
+    host: int = (
+        os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // local_processes
+    )
+    if cpu or not torch.cuda.is_available():
+        return host, host
+    device: int = min(
+        torch.cuda.get_device_properties(index).total_memory
+        for index in range(torch.cuda.device_count())
+    )
+    return device, host
+
+
+def plan_memory(  # noqa: PLR0913
+    model_builder: Callable[[], nn.Module],
+    *,
+    num_processes: int,
+    num_machines: int = 1,
+    mixed_precision: str = "no",
+    optimizer: str = "adamw",
+    cpu: bool = False,
+    budget_gb: float | None = None,
+    reserve_gb: float = 0.0,
+    paradigms: list[str] | None = None,
+) -> MemoryPlan:
+    """Estimate every candidate variant and choose the cheapest that fits.
+
+    Variants are ranked by cost: no host offload before offload, replicated
+    parameters before sharded ones, and replicated gradients and optimizer
+    state before sharded ones.
+
+    Args:
+        model_builder: Builds the model; called under the ``meta`` device.
+        num_processes: Total number of processes.
+        num_machines: Number of machines (splits the host memory budget).
+        mixed_precision: Name of the ``accelerate/mixed-precision`` variant.
+        optimizer: Optimizer whose state is counted.
+        cpu: Whether training runs on CPU (device and host memory coincide,
+            and DeepSpeed variants are not considered).
+        budget_gb: Per-rank accelerator budget; defaults to the smallest GPU
+            (or the RAM share of each local process on CPU).
+        reserve_gb: Per-rank memory kept free for activations and workspace.
+        paradigms: Candidate variant names; defaults to all registered ones.
+
+    Returns:
+        The plan; ``chosen`` is ``None`` when no variant fits.
+
+    Raises:
+        ValueError: If the optimizer, mixed precision or a paradigm is unknown.
+
+    """
+    if optimizer not in OPTIMIZER_STATES:
+        msg = f"optimizer must be one of {sorted(OPTIMIZER_STATES)}, got {optimizer!r}"
+        raise ValueError(msg)
+    if mixed_precision not in MIXED_PRECISION_VARIANTS:
+        msg = f"Unknown mixed precision {mixed_precision!r}"
+        raise ValueError(msg)
+    candidates: list[str] = paradigms or list(PARADIGM_VARIANTS)
+    if unknown := sorted(set(candidates) - set(PARADIGM_VARIANTS)):
+        msg = f"Unknown paradigm variant(s) {unknown}"
+        raise ValueError(msg)
+    if cpu:
+        candidates = [
+            name for name in candidates if not PARADIGM_VARIANTS[name].use_deepspeed
+        ]
+
+    with torch.device("meta"):
+        stats = ModelStats.from_module(model_builder())
+    local_processes: int = max(1, num_processes // max(1, num_machines))
+    device_budget, host_budget = _default_budgets(
+        cpu=cpu,
+        local_processes=local_processes,
+    )
+    if budget_gb is not None:
+        device_budget = int(budget_gb * GIB)
+    reserve: int = int(reserve_gb * GIB)
+
+    estimates: list[MemoryEstimate] = sorted(
+        (
+            estimate_memory(
+                stats,
+                name,
+                num_processes=num_processes,
+                mixed_precision=mixed_precision,
+                optimizer=optimizer,
+            )
+            for name in candidates
+        ),
+        key=lambda estimate: estimate.cost,
+    )
+
+    def fits(estimate: MemoryEstimate) -> bool:
+        if cpu:  # Offloading does not free anything on a CPU-only run
+            total: int = estimate.device_bytes + estimate.host_bytes + reserve
+            return total <= device_budget
+        return (
+            estimate.device_bytes + reserve <= device_budget
+            and estimate.host_bytes <= host_budget
+        )
+
+    chosen: str | None = next(
+        (estimate.paradigm for estimate in estimates if fits(estimate)),
+        None,
+    )
+    return MemoryPlan(
+        stats=stats,
+        estimates=estimates,
+        device_budget=device_budget,
+        host_budget=host_budget,
+        reserve=reserve,
+        chosen=chosen,
+    )
+
+
+def format_memory_plan(plan: MemoryPlan) -> str:
+    """Render the plan as a per-rank table in GiB."""
+    stats: ModelStats = plan.stats
+    dtypes: str = ", ".join(
+        f"{dtype} {size / GIB:.2f} GiB" for dtype, size in stats.bytes_by_dtype.items()
+    )
+    components: list[str] = [
+        "params",
+        "grads",
+        "buckets",
+        "master",
+        "optimizer",
+        "gathered",
+    ]
+    budget: str = (
+        f"{plan.device_budget / GIB:.2f} GiB device "
+        f"(reserve {plan.reserve / GIB:.2f} GiB), {plan.host_budget / GIB:.2f} GiB host"
+    )
+    lines: list[str] = [
+        f"Parameters: {stats.numel:,} ({stats.trainable_numel:,} trainable; {dtypes})",
+        f"Per-rank budget: {budget}",
+        f"{'paradigm':<18}"
+        + "".join(f"{name:>11}" for name in components)
+        + f"{'device':>11}{'host':>11}",
+    ]
+    for estimate in plan.estimates:
+        marker: str = " <- chosen" if estimate.paradigm == plan.chosen else ""
+        sizes: list[int] = [
+            estimate.device.get(name, 0) + estimate.host.get(name, 0)
+            for name in components
+        ]
+        lines.append(
+            f"{estimate.paradigm:<18}"
+            + "".join(f"{size / GIB:>11.2f}" for size in sizes)
+            + f"{estimate.device_bytes / GIB:>11.2f}{estimate.host_bytes / GIB:>11.2f}"
+            + marker,
+        )
+    if plan.chosen is None:
+        lines.append("No paradigm variant fits the budget.")
+    return "\n".join(lines)
+
+
+def apply_memory_plan(
+    model_builder: Callable[[], nn.Module],
+    cfg: dict[str, Any],
+    settings: dict[str, Any],
+) -> MemoryPlan:
+    """Plan for the flattened launch *cfg* and switch it to the chosen paradigm.
+
+    Args:
+        model_builder: Builds the model; called under the ``meta`` device.
+        cfg: The flattened launch configuration; updated in place.
+        settings: The ``memory_*`` launch settings without their prefix.
+
+    Returns:
+        The plan.
+
+    Raises:
+        RuntimeError: If no variant fits the budget.
+
+    """
+    plan: MemoryPlan = plan_memory(
+        model_builder,
+        num_processes=cfg["num_processes"],
+        num_machines=cfg["num_machines"],
+        mixed_precision=cfg["mixed_precision"],
+        cpu=cfg["cpu"],
+        **settings,
+    )
+    logger.info("Memory plan:\n%s", format_memory_plan(plan))
+    if plan.chosen is None:
+        msg = "No accelerate/paradigm variant fits the memory budget (see the plan)"
+        raise RuntimeError(msg)
+    cfg.update(asdict(PARADIGM_VARIANTS[plan.chosen]))
+    logger.info("Memory plan override: accelerate/paradigm=%s", plan.chosen)
+    return plan
+
+
+def _import_builder(path: str) -> Callable[[], nn.Module]:
+    """Resolve a ``package.module:function`` model builder."""
+    module_name, _, attribute = path.partition(":")
+    if not attribute:
+        msg = f"--model must look like 'package.module:build_model', got {path!r}"
+        raise ValueError(msg)
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print the memory plan of a model (``hydraxcel-memory-plan``)."""
+    parser = argparse.ArgumentParser(prog="hydraxcel-memory-plan", description=__doc__)
+    parser.add_argument("--model", required=True, help="package.module:build_model")
+    parser.add_argument("--num-processes", type=int, default=1)
+    parser.add_argument("--num-machines", type=int, default=1)
+    parser.add_argument(
+        "--mixed-precision",
+        choices=list(MIXED_PRECISION_VARIANTS),
+        default="no",
+    )
+    parser.add_argument("--optimizer", choices=list(OPTIMIZER_STATES), default="adamw")
+    parser.add_argument("--cpu", action="store_true")
+    parser.add_argument("--budget-gb", type=float, default=None)
+    parser.add_argument("--reserve-gb", type=float, default=0.0)
+    parser.add_argument("--paradigm", nargs="+", default=None)
+    args = parser.parse_args(argv)
+
+    plan: MemoryPlan = plan_memory(
+        _import_builder(args.model),
+        num_processes=args.num_processes,
+        num_machines=args.num_machines,
+        mixed_precision=args.mixed_precision,
+        optimizer=args.optimizer,
+        cpu=args.cpu,
+        budget_gb=args.budget_gb,
+        reserve_gb=args.reserve_gb,
+        paradigms=args.paradigm,
+    )
+    print(format_memory_plan(plan))
@@ -0,0 +1,349 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""CPU topology discovery and per-rank affinity/thread planning.
+
+Reads ``/sys/devices/system/cpu`` and ``/sys/devices/system/node`` to find the
+usable logical CPUs, their physical cores (SMT siblings) and NUMA nodes, then
+splits them evenly across the local processes: each rank is pinned to a
+NUMA-local set of whole cores and runs one OpenMP/MKL/torch intra-op thread per
+physical core.  The launcher plans with ``cpu_affinity="auto"`` and every
+launched process applies its own share via ``apply_cpu_affinity``.
+"""
+
+import logging
+import os
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import torch
+
+__all__ = [
+    "CPU_AFFINITY_ENV",
+    "LAUNCH_CPUS_ENV",
+    "LOCAL_PROCESSES_ENV",
+    "CpuPlan",
+    "CpuTopology",
+    "apply_cpu_affinity",
+    "apply_launch_cpu_affinity",
+    "log_cpu_plan",
+    "plan_cpu_affinity",
+    "read_cpu_topology",
+]
+
+# Set by the launcher so launched processes apply their share of the plan
+CPU_AFFINITY_ENV: str = "HYDRAXCEL_CPU_AFFINITY"
+LOCAL_PROCESSES_ENV: str = "HYDRAXCEL_LOCAL_PROCESSES"
+LAUNCH_CPUS_ENV: str = "HYDRAXCEL_LAUNCH_CPUS"  # The CPUs the launcher planned over
+SYS_ROOT: Path = Path("/sys/devices/system")
+THREAD_ENV_VARS: tuple[str, ...] = ("OMP_NUM_THREADS", "MKL_NUM_THREADS")
+
+logger = logging.getLogger("topology")
+
+
+@dataclass
+class CpuTopology:
+    """Usable logical CPUs grouped by NUMA node and physical core."""
+
+    # NUMA node -> physical cores -> logical CPUs (SMT siblings) of the core
+    nodes: dict[int, list[list[int]]] = field(default_factory=dict)
+
+    @property
+    def num_cores(self) -> int:
+        """Number of physical cores across all nodes."""
+        return sum(len(cores) for cores in self.nodes.values())
+
+    @property
+    def num_cpus(self) -> int:
+        """Number of logical CPUs across all nodes."""
+        return sum(len(core) for cores in self.nodes.values() for core in cores)
+
+
+@dataclass
+class CpuPlan:
+    """CPU share of one local rank."""
+
+    local_rank: int
+    numa_node: int
+    cpus: list[int]
+    num_threads: int
+    num_interop_threads: int
+
+
+def _parse_cpu_list(text: str) -> list[int]:
+    """Parse a kernel CPU list such as ``0-3,8,10-11``."""
+    cpus: list[int] = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def read_cpu_topology(
+    sys_root: Path = SYS_ROOT,
+    allowed_cpus: set[int] | None = None,
+) -> CpuTopology:
+    """Discover NUMA nodes, physical cores and SMT siblings from sysfs.
+
+    Args:
+        sys_root: The ``/sys/devices/system`` directory to read.
+        allowed_cpus: Logical CPUs this process may use; defaults to the
+            current affinity mask, which respects container cpusets.
+
+    Returns:
+        The usable CPUs grouped by NUMA node and physical core.  Without NUMA
+        or core information every CPU forms its own core on node 0.
+
+    """
+    if allowed_cpus is None:
+        allowed_cpus = (
+            os.sched_getaffinity(0)
+            if hasattr(os, "sched_getaffinity")
+            else set(range(os.cpu_count() or 1))
+        )
+    cpu_root: Path = sys_root / "cpu"
+    online_path: Path = cpu_root / "online"
+    online: list[int] = (
+        _parse_cpu_list(online_path.read_text())
+        if online_path.exists()
+        else sorted(allowed_cpus)
+    )
+    usable: list[int] = [cpu for cpu in online if cpu in allowed_cpus]
+
+    node_of: dict[int, int] = {}
+    for node_path in sorted((sys_root / "node").glob("node[0-9]*")):
+        for cpu in _parse_cpu_list((node_path / "cpulist").read_text()):
+            node_of[cpu] = int(node_path.name.removeprefix("node"))
+
+    cores: dict[tuple[int, int, int], list[int]] = {}
+    for cpu in usable:
+        topology_path: Path = cpu_root / f"cpu{cpu}" / "topology"
+        core_key: tuple[int, int, int] = (node_of.get(cpu, 0), -1, cpu)
+        with suppress(OSError, ValueError):
+            core_key = (
+                node_of.get(cpu, 0),
+                int((topology_path / "physical_package_id").read_text()),
+                int((topology_path / "core_id").read_text()),
+            )
+        cores.setdefault(core_key, []).append(cpu)
+
+    topology = CpuTopology()
+    for (node, _package, _core), cpus in sorted(
+        cores.items(),
+        key=lambda item: item[1][0],
+    ):
+        topology.nodes.setdefault(node, []).append(cpus)
+    return topology
+
+
+def _split(items: list[list[int]], parts: int) -> list[list[list[int]]]:
+    """Split *items* into *parts* contiguous chunks whose sizes differ by <= 1."""
+    size, remainder = divmod(len(items), parts)
+    chunks: list[list[list[int]]] = []
+    start: int = 0
+    for part in range(parts):
+        end: int = start + size + (part < remainder)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def plan_cpu_affinity(topology: CpuTopology, num_processes: int) -> list[CpuPlan]:
+    """Split the topology evenly across *num_processes* local ranks.
+
+    Ranks are distributed over NUMA nodes in proportion to their core counts,
+    and the ranks on a node share its physical cores; with fewer ranks than
+    nodes each rank spans whole nodes instead.  Each rank is pinned to
+    all logical CPUs of its cores and runs one intra-op thread per core.  With
+    more ranks than cores the logical CPUs are shared instead.
+
+    Args:
+        topology: The discovered CPU topology.
+        num_processes: Number of processes on this machine.
+
+    Returns:
+        One ``CpuPlan`` per local rank.
+
+    Raises:
+        ValueError: If *num_processes* is not positive or no CPUs are usable.
+
+    """
+    if num_processes < 1:
+        msg = "num_processes must be >= 1"
+        raise ValueError(msg)
+    if not topology.nodes:
+        msg = "No usable CPUs found"
+        raise ValueError(msg)
+
+    if num_processes > topology.num_cores:
+        # Oversubscribed: hand out logical CPUs (round-robin if still short)
+        cpus: list[int] = sorted(
+            cpu for cores in topology.nodes.values() for core in cores for cpu in core
+        )
+        node_of: dict[int, int] = {
+            cpu: node
+            for node, cores in topology.nodes.items()
+            for core in cores
+            for cpu in core
+        }
+        shares: list[list[list[int]]] = (
+            _split([[cpu] for cpu in cpus], num_processes)
+            if num_processes <= len(cpus)
+            else [[[cpus[rank % len(cpus)]]] for rank in range(num_processes)]
+        )
+        return [
+            CpuPlan(
+                local_rank=rank,
+                numa_node=node_of[share[0][0]],
+                cpus=[cpu for core in share for cpu in core],
+                num_threads=len(share),
+                num_interop_threads=1,
+            )
+            for rank, share in enumerate(shares)
+        ]
+
+    nodes: list[int] = sorted(topology.nodes)
+    if num_processes <= len(nodes):
+        # Fewer ranks than nodes: each rank spans whole nodes
+        plans: list[CpuPlan] = []
+        for rank, node_group in enumerate(
+            _split([[node] for node in nodes], num_processes),
+        ):
+            group_nodes: list[int] = [node for (node,) in node_group]
+            group_cores: list[list[int]] = [
+                core for node in group_nodes for core in topology.nodes[node]
+            ]
+            plans.append(
+                CpuPlan(
+                    local_rank=rank,
+                    numa_node=group_nodes[0],
+                    cpus=sorted(cpu for core in group_cores for cpu in core),
+                    num_threads=len(group_cores),
+                    num_interop_threads=min(2, len(group_cores)),
+                ),
+            )
+        return plans
+
+    # Ranks per node proportional to its cores
+    ranks_per_node: dict[int, int] = {
+        node: len(topology.nodes[node]) * num_processes // topology.num_cores
+        for node in nodes
+    }
+    for node in sorted(
+        nodes,
+        key=lambda node: len(topology.nodes[node]) / (ranks_per_node[node] + 1),
+        reverse=True,
+    )[: num_processes - sum(ranks_per_node.values())]:
+        ranks_per_node[node] += 1
+
+    plans = []
+    for node in nodes:
+        if not ranks_per_node[node]:
+            continue
+        for share in _split(topology.nodes[node], ranks_per_node[node]):
+            plans.append(
+                CpuPlan(
+                    local_rank=len(plans),
+                    numa_node=node,
+                    cpus=sorted(cpu for core in share for cpu in core),
+                    num_threads=len(share),
+                    num_interop_threads=min(2, len(share)),
+                ),
+            )
+    return plans
+
+
+def apply_cpu_affinity(plan: CpuPlan) -> None:
+    """Pin this process to the plan's CPUs and size its thread pools.
+
+    Exports ``OMP_NUM_THREADS``/``MKL_NUM_THREADS`` for libraries and child
+    processes initialised later, and sets torch's intra- and inter-op threads.
+
+    Args:
+        plan: This rank's share of the CPU plan.
+
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, plan.cpus)
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(plan.num_threads)
+    torch.set_num_threads(plan.num_threads)
+    # Fails once inter-op work has started; the launcher env still applies
+    with suppress(RuntimeError):
+        torch.set_num_interop_threads(plan.num_interop_threads)
+    logger.info(
+        "Local rank %d pinned to NUMA node %d CPUs %s with %d threads (%d inter-op)",
+        plan.local_rank,
+        plan.numa_node,
+        plan.cpus,
+        plan.num_threads,
+        plan.num_interop_threads,
+    )
+
+
+def log_cpu_plan(topology: CpuTopology, plans: list[CpuPlan]) -> None:
+    """Log the discovered topology and the per-rank CPU plan."""
+    logger.info(
+        "CPU topology: %d NUMA nodes, %d physical cores, %d logical CPUs",
+        len(topology.nodes),
+        topology.num_cores,
+        topology.num_cpus,
+    )
+    for plan in plans:
+        logger.info(
+            "Local rank %d -> NUMA node %d, CPUs %s, %d threads",
+            plan.local_rank,
+            plan.numa_node,
+            plan.cpus,
+            plan.num_threads,
+        )
+
+
+def apply_launch_cpu_affinity() -> CpuPlan | None:
+    """Apply this process's share of the launcher's ``auto`` CPU plan.
+
+    Every launched process re-reads the topology over the CPUs the launcher
+    planned with, so all ranks derive the same plan, and applies the entry of
+    its ``LOCAL_RANK``.  Planning from the launcher's CPUs rather than the
+    current affinity mask keeps the plan stable for processes that apply it
+    more than once, such as successive jobs of an in-process sweep.
+
+    Returns:
+        The applied plan, or ``None`` unless launched with
+        ``cpu_affinity="auto"``.
+
+    """
+    if os.environ.get(CPU_AFFINITY_ENV) != "auto":
+        return None
+    num_processes: int = int(
+        os.environ.get("LOCAL_WORLD_SIZE") or os.environ.get(LOCAL_PROCESSES_ENV, "1"),
+    )
+    local_rank: int = int(os.environ.get("LOCAL_RANK", "0"))
+    launch_cpus: str | None = os.environ.get(LAUNCH_CPUS_ENV)
+    topology: CpuTopology = read_cpu_topology(
+        allowed_cpus=set(_parse_cpu_list(launch_cpus)) if launch_cpus else None,
+    )
+    plan: CpuPlan = plan_cpu_affinity(topology, num_processes)[local_rank]
+    apply_cpu_affinity(plan)
+    return plan
@@ -0,0 +1,46 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmarks of HydraXcel's Accelerate config variants.
+
+Exposes ``main`` for the ``hydraxcel-bench`` entry point, which runs synthetic
+workloads across the cartesian product of the registered config group
+variants, ``run_comm_benchmark`` behind ``hydraxcel-bench-comm``, which times
+the collectives between launched ranks, and the helpers they are built from.
+"""
+
+from hydraxcel.bench.comm import (
+    format_comm_table,
+    message_sizes,
+    run_comm_benchmark,
+)
+from hydraxcel.bench.matrix import BenchCell, format_table, main, plan_cells, run_cell
+
+__all__ = [
+    "BenchCell",
+    "format_comm_table",
+    "format_table",
+    "main",
+    "message_sizes",
+    "plan_cells",
+    "run_cell",
+    "run_comm_benchmark",
+]
@@ -0,0 +1,210 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Collective-communication micro-benchmark (``hydraxcel-bench-comm``).
+
+Starts ``--num-processes`` ranks through ``LaunchConfig`` and
+``accelerate launch``, which uses torchrun, so multi-node runs take the usual
+``--num-machines``, ``--machine-rank`` and ``--main-process-ip`` flags.  The
+ranks then time all-reduce, all-gather, broadcast and reduce-scatter over a
+sweep of message sizes (see ``hydraxcel.bench.comm_worker``).  Latency and the
+algorithmic and bus bandwidth are written as a Markdown table and as JSON.
+Bus bandwidth corrects for the data each algorithm must move, so it can be
+compared with the link bandwidth whatever the world size.
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+from accelerate.commands.launch import launch_command
+
+from hydraxcel.accelerate.launch_tools import build_launch_args
+
+__all__ = [
+    "BUS_FACTORS",
+    "format_comm_table",
+    "main",
+    "message_sizes",
+    "run_comm_benchmark",
+]
+
+# Bus bandwidth = algorithmic bandwidth * factor(world size), as in nccl-tests
+BUS_FACTORS: dict[str, Callable[[int], float]] = {
+    "all_reduce": lambda world: 2 * (world - 1) / world,
+    "all_gather": lambda world: (world - 1) / world,
+    "reduce_scatter": lambda world: (world - 1) / world,
+    "broadcast": lambda _world: 1.0,
+}
+
+logger = logging.getLogger("bench_comm")
+
+
+def message_sizes(min_bytes: int, max_bytes: int, factor: int = 2) -> list[int]:
+    """Geometric sweep of message sizes from *min_bytes* to *max_bytes*."""
+    if not 0 < min_bytes <= max_bytes or factor < 2:  # noqa: PLR2004
+        msg = (
+            "Expected 0 < min_bytes <= max_bytes and factor >= 2, got "
+            f"{min_bytes}, {max_bytes} and {factor}"
+        )
+        raise ValueError(msg)
+    sizes: list[int] = [min_bytes]
+    while sizes[-1] * factor <= max_bytes:
+        sizes.append(sizes[-1] * factor)
+    return sizes
+
+
+def _format_bytes(size: int) -> str:
+    """Render *size* with a binary unit (e.g. ``64KiB``)."""
+    for unit in ["B", "KiB", "MiB"]:
+        if size < 1024:  # noqa: PLR2004
+            return f"{size}{unit}"
+        size //= 1024
+    return f"{size}GiB"
+
+
+def format_comm_table(report: dict[str, Any]) -> str:
+    """Render the worker report as a Markdown table, one row per op and size."""
+    lines: list[str] = [
+        f"backend: {report['backend']}, world size: {report['world_size']}",
+        "",
+        "| op | size | time (us) | algbw (GB/s) | busbw (GB/s) |",
+        "|---|---|---|---|---|",
+    ]
+    lines.extend(
+        f"| {row['op']} | {_format_bytes(row['bytes'])} | {row['time_us']:.1f} "
+        f"| {row['algbw_gbps']:.3f} | {row['busbw_gbps']:.3f} |"
+        for row in report["results"]
+    )
+    return "\n".join(lines)
+
+
+def run_comm_benchmark(  # noqa: PLR0913
+    *,
+    num_processes: int,
+    ops: list[str],
+    sizes: list[int],
+    warmup_iters: int = 5,
+    iters: int = 20,
+    backend: str = "auto",
+    launch_overrides: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Launch the collective sweep on *num_processes* ranks and return its report.
+
+    Args:
+        num_processes: Total number of ranks.
+        ops: Collectives to time (keys of ``BUS_FACTORS``).
+        sizes: Message sizes in bytes.
+        warmup_iters: Untimed calls per op and size.
+        iters: Timed calls per op and size.
+        backend: ``auto`` (NCCL when GPUs are visible), ``nccl`` or ``gloo``.
+        launch_overrides: Further ``LaunchConfig`` fields, e.g. the
+            multi-node rendezvous settings.
+
+    Returns:
+        The backend, world size and one result per op and size.
+
+    Raises:
+        ValueError: If an op is unknown.
+
+    """
+    if unknown := sorted(set(ops) - set(BUS_FACTORS)):
+        msg = f"Unknown collective(s) {unknown}; choose from {list(BUS_FACTORS)}"
+        raise ValueError(msg)
+    with tempfile.TemporaryDirectory() as scratch:
+        output: Path = Path(scratch) / "comm.json"
+        cfg: dict[str, Any] = {
+            **(launch_overrides or {}),
+            "multi_gpu": True,  # torchrun launcher; the worker picks gloo without GPUs
+            "num_processes": num_processes,
+            "training_script": "hydraxcel.bench.comm_worker",
+            "module": True,
+            "training_script_args": [
+                "--ops",
+                *ops,
+                "--sizes",
+                *map(str, sizes),
+                f"--warmup-iters={warmup_iters}",
+                f"--iters={iters}",
+                f"--backend={backend}",
+                f"--output={output}",
+            ],
+        }
+        launch_command(build_launch_args(cfg))
+        return json.loads(output.read_text()) if output.exists() else {}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the collective benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="hydraxcel-bench-comm",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--num-processes", type=int, default=2)
+    parser.add_argument(
+        "--ops",
+        nargs="+",
+        choices=list(BUS_FACTORS),
+        default=list(BUS_FACTORS),
+    )
+    parser.add_argument("--min-bytes", type=int, default=2**10)
+    parser.add_argument("--max-bytes", type=int, default=2**26)
+    parser.add_argument("--warmup-iters", type=int, default=5)
+    parser.add_argument("--iters", type=int, default=20)
+    parser.add_argument("--backend", choices=["auto", "nccl", "gloo"], default="auto")
+    parser.add_argument("--num-machines", type=int, default=1)
+    parser.add_argument("--machine-rank", type=int, default=0)
+    parser.add_argument("--main-process-ip", default=None)
+    parser.add_argument("--main-process-port", type=int, default=None)
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("hydraxcel-bench-comm"),
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    report: dict[str, Any] = run_comm_benchmark(
+        num_processes=args.num_processes,
+        ops=args.ops,
+        sizes=message_sizes(args.min_bytes, args.max_bytes),
+        warmup_iters=args.warmup_iters,
+        iters=args.iters,
+        backend=args.backend,
+        launch_overrides={
+            "num_machines": args.num_machines,
+            "machine_rank": args.machine_rank,
+            "main_process_ip": args.main_process_ip,
+            "main_process_port": args.main_process_port,
+        },
+    )
+    if not report:  # Only the machine hosting rank 0 receives the report
+        return
+    table: str = format_comm_table(report)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    (args.output_dir / "results.md").write_text(table + "\n")
+    (args.output_dir / "results.json").write_text(json.dumps(report, indent=2))
+    print(table)
+    logger.info("Results written to %s", args.output_dir)
@@ -0,0 +1,138 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Collective benchmark worker launched by ``hydraxcel-bench-comm``.
+
+Every rank runs each collective over the sweep of message sizes, timing
+``--iters`` back-to-back calls after ``--warmup-iters`` untimed ones.  The
+slowest rank's time counts, as in ``nccl-tests``, and the main process writes
+the results as JSON to ``--output``.  NCCL is used when every rank has a GPU
+and gloo otherwise.
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+import torch
+import torch.distributed as dist
+
+from hydraxcel.bench.comm import BUS_FACTORS
+
+__all__ = ["main"]
+
+
+def _collective(
+    op: str,
+    size: int,
+    world: int,
+    device: torch.device,
+) -> tuple[Callable[[], object], int]:
+    """Return a call of *op* on about *size* bytes and the exact buffer size.
+
+    As in ``nccl-tests``, the size is that of the full buffer: the reduced or
+    broadcast tensor, the gathered output or the scattered input.
+    """
+    numel: int = max(world, size // 4) // world * world  # float32, divisible by world
+    buffer: torch.Tensor = torch.ones(numel, device=device)
+    shard: torch.Tensor = torch.empty(numel // world, device=device)
+    calls: dict[str, Callable[[], object]] = {
+        "all_reduce": lambda: dist.all_reduce(buffer),
+        "all_gather": lambda: dist.all_gather_into_tensor(buffer, shard),
+        "reduce_scatter": lambda: dist.reduce_scatter_tensor(shard, buffer),
+        "broadcast": lambda: dist.broadcast(buffer, src=0),
+    }
+    return calls[op], numel * buffer.element_size()
+
+
+def main() -> None:
+    """Sweep the requested collectives and message sizes."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ops", nargs="+", choices=list(BUS_FACTORS), required=True)
+    parser.add_argument("--sizes", nargs="+", type=int, required=True)
+    parser.add_argument("--warmup-iters", type=int, default=5)
+    parser.add_argument("--iters", type=int, default=20)
+    parser.add_argument("--backend", choices=["auto", "nccl", "gloo"], default="auto")
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    use_nccl: bool = args.backend == "nccl" or (
+        args.backend == "auto" and torch.cuda.is_available()
+    )
+    device = torch.device("cpu")
+    if use_nccl:
+        device = torch.device("cuda", int(os.environ.get("LOCAL_RANK", "0")))
+        torch.cuda.set_device(device)
+    dist.init_process_group("nccl" if use_nccl else "gloo")
+    world: int = dist.get_world_size()
+
+    def synchronize() -> None:
+        if device.type == "cuda":
+            torch.cuda.synchronize(device)
+
+    results: list[dict[str, object]] = []
+    for op in args.ops:
+        for requested in args.sizes:
+            call, size = _collective(op, requested, world, device)
+            for _ in range(args.warmup_iters):
+                call()
+            synchronize()
+            dist.barrier()
+            start: float = time.perf_counter()
+            for _ in range(args.iters):
+                call()
+            synchronize()
+            elapsed = torch.tensor(
+                [(time.perf_counter() - start) / args.iters],
+                dtype=torch.float64,
+                device=device,
+            )
+            dist.all_reduce(elapsed, op=dist.ReduceOp.MAX)
+            seconds: float = elapsed.item()
+            algbw: float = size / seconds / 1e9
+            results.append(
+                {
+                    "op": op,
+                    "bytes": size,
+                    "time_us": seconds * 1e6,
+                    "algbw_gbps": algbw,
+                    "busbw_gbps": algbw * BUS_FACTORS[op](world),
+                },
+            )
+
+    if dist.get_rank() == 0:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "backend": dist.get_backend(),
+                    "world_size": world,
+                    "results": results,
+                },
+            ),
+        )
+    dist.destroy_process_group()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark matrix across the registered Accelerate config variants.
+
+``hydraxcel-bench`` launches ``hydraxcel.bench.worker`` on the synthetic
+workloads of ``hydraxcel.bench.workloads`` through ``accelerate launch``, once
+per cell of the cartesian product of the selected ``accelerate/hardware``,
+``accelerate/compile``, ``accelerate/paradigm`` and
+``accelerate/mixed-precision`` variants.  Cells that cannot run on this host
+(e.g. GPU hardware or fp16 on a CPU-only machine) are skipped with a reason,
+and the measured throughput, peak memory, compile overhead and
+time-to-first-step are written as a Markdown table and as JSON.
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import torch
+from accelerate.commands.launch import launch_command
+
+from hydraxcel.accelerate.config_registry import (
+    COMPILE_VARIANTS,
+    HARDWARE_VARIANTS,
+    MIXED_PRECISION_VARIANTS,
+    PARADIGM_VARIANTS,
+)
+from hydraxcel.accelerate.launch_tools import build_launch_args
+from hydraxcel.bench.workloads import WORKLOADS
+
+__all__ = ["BenchCell", "format_table", "main", "plan_cells", "run_cell"]
+
+FP8_MIN_CAPABILITY: tuple[int, int] = (8, 9)  # Ada/Hopper tensor cores
+COLUMNS: list[tuple[str, str, str]] = [
+    ("samples_per_s", "samples/s", "{:.1f}"),
+    ("step_ms", "step ms", "{:.2f}"),
+    ("compile_s", "compile s", "{:.2f}"),
+    ("time_to_first_step_s", "first step s", "{:.2f}"),
+    ("peak_memory_mb", "peak MiB", "{:.0f}"),
+]
+
+logger = logging.getLogger("bench")
+
+
+@dataclass(frozen=True)
+class BenchCell:
+    """One combination of config group variants and workload."""
+
+    hardware: str
+    compile: str
+    paradigm: str
+    mixed_precision: str
+    workload: str
+
+    @property
+    def name(self) -> str:
+        """Return a filesystem-safe identifier of the cell."""
+        return "-".join(asdict(self).values())
+
+
+def _skip_reason(cell: BenchCell, cuda_devices: int) -> str | None:
+    """Explain why *cell* cannot run on this host, or return ``None``."""
+    hardware = HARDWARE_VARIANTS[cell.hardware]
+    if hardware.cpu:
+        if cell.paradigm != "torch-ddp":
+            return f"{cell.paradigm} needs GPUs"
+        if cell.mixed_precision in {"fp16", "fp8"}:
+            return f"{cell.mixed_precision} is not supported on CPU"
+        return None
+    if cuda_devices < hardware.num_processes:
+        return f"needs {hardware.num_processes} GPU(s), found {cuda_devices}"
+    if (
+        cell.mixed_precision == "fp8"
+        and torch.cuda.get_device_capability() < FP8_MIN_CAPABILITY
+    ):
+        return "fp8 needs compute capability >= 8.9"
+    return None
+
+
+def plan_cells(
+    groups: dict[str, list[str]],
+    workloads: list[str],
+    *,
+    cuda_devices: int | None = None,
+) -> tuple[list[BenchCell], dict[BenchCell, str]]:
+    """Expand the selected variants into the cells runnable on this host.
+
+    Args:
+        groups: Selected variant names per ``BenchCell`` field (``hardware``,
+            ``compile``, ``paradigm``, ``mixed_precision``).
+        workloads: Names of the ``hydraxcel.bench.workloads`` to run.
+        cuda_devices: Number of visible GPUs (detected when ``None``).
+
+    Returns:
+        The runnable cells and the skipped cells with the reason for each.
+
+    Raises:
+        ValueError: If a variant or workload name is unknown.
+
+    """
+    registries: dict[str, dict[str, Any]] = {
+        "hardware": HARDWARE_VARIANTS,
+        "compile": COMPILE_VARIANTS,
+        "paradigm": PARADIGM_VARIANTS,
+        "mixed_precision": MIXED_PRECISION_VARIANTS,
+        "workload": WORKLOADS,
+    }
+    selected: dict[str, list[str]] = {**groups, "workload": workloads}
+    for group, names in selected.items():
+        if unknown := sorted(set(names) - set(registries[group])):
+            msg = (
+                f"Unknown {group} variant(s) {unknown}; "
+                f"choose from {sorted(registries[group])}"
+            )
+            raise ValueError(msg)
+    if cuda_devices is None:
+        cuda_devices = torch.cuda.device_count()
+
+    cells: list[BenchCell] = []
+    skipped: dict[BenchCell, str] = {}
+    for values in itertools.product(*(selected[group] for group in registries)):
+        cell = BenchCell(*values)
+        if reason := _skip_reason(cell, cuda_devices):
+            skipped[cell] = reason
+        else:
+            cells.append(cell)
+    return cells, skipped
+
+
+def run_cell(
+    cell: BenchCell,
+    output_dir: Path,
+    *,
+    batch_size: int,
+    warmup_steps: int,
+    steps: int,
+) -> dict[str, Any]:
+    """Launch the worker for *cell* and return its metrics or its failure.
+
+    Args:
+        cell: The variants and workload to run.
+        output_dir: Directory receiving the worker's JSON result.
+        batch_size: Per-process batch size.
+        warmup_steps: Untimed steps before the steady-state measurement.
+        steps: Timed steps.
+
+    Returns:
+        The worker's metrics, or ``{"error": ...}`` if the launch failed.
+
+    """
+    result_path: Path = output_dir / f"{cell.name}.json"
+    cfg: dict[str, Any] = {
+        **asdict(HARDWARE_VARIANTS[cell.hardware]),
+        **asdict(COMPILE_VARIANTS[cell.compile]),
+        **asdict(PARADIGM_VARIANTS[cell.paradigm]),
+        **asdict(MIXED_PRECISION_VARIANTS[cell.mixed_precision]),
+        "training_script": "hydraxcel.bench.worker",
+        "module": True,
+        "training_script_args": [
+            f"--workload={cell.workload}",
+            f"--batch-size={batch_size}",
+            f"--warmup-steps={warmup_steps}",
+            f"--steps={steps}",
+            f"--output={result_path}",
+        ],
+    }
+    environ: dict[str, str] = dict(os.environ)
+    try:
+        launch_command(build_launch_args(cfg))
+        return json.loads(result_path.read_text())
+    except Exception as error:  # noqa: BLE001 # Record the failure and continue the matrix
+        return {"error": f"{type(error).__name__}: {error}"}
+    finally:
+        # Launch-time settings (e.g. cpu_affinity=auto) must not leak into later cells
+        os.environ.clear()
+        os.environ.update(environ)
+
+
+def format_table(results: dict[BenchCell, dict[str, Any]]) -> str:
+    """Render the results as a Markdown table, one row per cell."""
+    fields: list[str] = list(BenchCell.__dataclass_fields__)
+    header: list[str] = [*fields, *(title for _, title, _ in COLUMNS)]
+    lines: list[str] = [
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join("---" for _ in header) + "|",
+    ]
+    for cell, metrics in results.items():
+        values: list[str] = list(asdict(cell).values())
+        if "error" in metrics or "skipped" in metrics:
+            reason: str = metrics.get("error") or f"skipped: {metrics['skipped']}"
+            values.extend([reason, *[""] * (len(COLUMNS) - 1)])
+        else:
+            values.extend(fmt.format(metrics[key]) for key, _, fmt in COLUMNS)
+        lines.append("| " + " | ".join(values) + " |")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark matrix from the command line (``hydraxcel-bench``)."""
+    parser = argparse.ArgumentParser(
+        prog="hydraxcel-bench",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--hardware", nargs="+", default=list(HARDWARE_VARIANTS))
+    parser.add_argument("--compile", nargs="+", default=list(COMPILE_VARIANTS))
+    parser.add_argument("--paradigm", nargs="+", default=["torch-ddp"])
+    parser.add_argument(
+        "--mixed-precision",
+        nargs="+",
+        default=list(MIXED_PRECISION_VARIANTS),
+    )
+    parser.add_argument("--workload", nargs="+", default=list(WORKLOADS))
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--warmup-steps", type=int, default=3)
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--output-dir", type=Path, default=Path("hydraxcel-bench"))
+    parser.add_argument(
+        "--show-skipped",
+        action="store_true",
+        help="List the cells that cannot run on this host in the table",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    cells, skipped = plan_cells(
+        {
+            "hardware": args.hardware,
+            "compile": args.compile,
+            "paradigm": args.paradigm,
+            "mixed_precision": args.mixed_precision,
+        },
+        args.workload,
+    )
+    logger.info("Running %d cell(s), skipping %d", len(cells), len(skipped))
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    results: dict[BenchCell, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as scratch:
+        for index, cell in enumerate(cells, start=1):
+            logger.info("[%d/%d] %s", index, len(cells), cell.name)
+            results[cell] = run_cell(
+                cell,
+                Path(scratch),
+                batch_size=args.batch_size,
+                warmup_steps=args.warmup_steps,
+                steps=args.steps,
+            )
+    if args.show_skipped:
+        results.update({cell: {"skipped": reason} for cell, reason in skipped.items()})
+
+    table: str = format_table(results)
+    (args.output_dir / "results.md").write_text(table + "\n")
+    rows: list[dict[str, Any]] = [
+        {**asdict(cell), **metrics} for cell, metrics in results.items()
+    ]
+    (args.output_dir / "results.json").write_text(json.dumps(rows, indent=2))
+    print(table)
+    logger.info("Results written to %s", args.output_dir)
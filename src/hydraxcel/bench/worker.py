@@ -0,0 +1,101 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark worker launched by ``hydraxcel-bench`` for one matrix cell.
+
+Runs under ``accelerate launch``, so the compile, precision and paradigm
+settings of the cell arrive through Accelerate's environment variables.  The
+main process writes the measured metrics as JSON to ``--output``.
+"""
+
+import argparse
+import json
+import resource
+import statistics
+import time
+from pathlib import Path
+
+import torch
+from accelerate import Accelerator
+
+from hydraxcel.bench.workloads import WORKLOADS
+
+__all__ = ["main"]
+
+
+def _peak_memory_mb(device: torch.device) -> float:
+    """Peak allocated device memory, or the peak RSS of this process on CPU."""
+    if device.type == "cuda":
+        return torch.cuda.max_memory_allocated(device) / 2**20
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10  # KiB on Linux
+
+
+def main() -> None:
+    """Time the requested workload and write its metrics."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), required=True)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--warmup-steps", type=int, default=3)
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    start: float = time.perf_counter()
+    accelerator = Accelerator()
+    model, loss_fn = WORKLOADS[args.workload](args.batch_size)
+    optimizer = torch.optim.AdamW(model.parameters(), lr=1e-4)
+    model, optimizer = accelerator.prepare(model, optimizer)
+
+    def synchronize() -> None:
+        if accelerator.device.type == "cuda":
+            torch.cuda.synchronize(accelerator.device)
+
+    step_times: list[float] = []
+    time_to_first_step: float = 0.0
+    for _ in range(args.warmup_steps + args.steps):
+        step_start: float = time.perf_counter()
+        optimizer.zero_grad()
+        accelerator.backward(loss_fn(model))
+        optimizer.step()
+        synchronize()
+        step_times.append(time.perf_counter() - step_start)
+        time_to_first_step = time_to_first_step or time.perf_counter() - start
+
+    step_time: float = statistics.median(step_times[args.warmup_steps :])
+    if accelerator.is_main_process:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "samples_per_s": args.batch_size
+                    * accelerator.num_processes
+                    / step_time,
+                    "step_ms": step_time * 1e3,
+                    "compile_s": max(0.0, step_times[0] - step_time),
+                    "time_to_first_step_s": time_to_first_step,
+                    "peak_memory_mb": _peak_memory_mb(accelerator.device),
+                },
+            ),
+        )
+    accelerator.end_training()
+
+
+if __name__ == "__main__":
+    main()
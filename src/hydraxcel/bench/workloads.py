@@ -0,0 +1,82 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Synthetic workloads timed by ``hydraxcel-bench``.
+
+Each workload builds a randomly initialised model and a loss over one fixed
+random batch, so runs measure the training step rather than data loading.
+"""
+
+from typing import Callable
+
+import torch
+from torch import nn
+from transformers import LlamaConfig, LlamaForCausalLM
+
+__all__ = ["WORKLOADS", "Workload"]
+
+# Build a model and a loss over one fixed random batch of the given size
+Workload = Callable[[int], tuple[nn.Module, Callable[[nn.Module], torch.Tensor]]]
+
+
+def _mlp(batch_size: int) -> tuple[nn.Module, Callable[[nn.Module], torch.Tensor]]:
+    """Return a 3-layer MLP regressing a random batch onto zeros."""
+    model = nn.Sequential(
+        nn.Linear(512, 2048),
+        nn.GELU(),
+        nn.Linear(2048, 2048),
+        nn.GELU(),
+        nn.Linear(2048, 512),
+    )
+    inputs: torch.Tensor = torch.randn(batch_size, 512)
+
+    def loss(prepared: nn.Module) -> torch.Tensor:
+        device: torch.device = next(prepared.parameters()).device
+        return prepared(inputs.to(device)).float().pow(2).mean()
+
+    return model, loss
+
+
+def _transformer(
+    batch_size: int,
+) -> tuple[nn.Module, Callable[[nn.Module], torch.Tensor]]:
+    """Return a randomly initialised 4-layer Llama on random 128-token sequences."""
+    config = LlamaConfig(
+        vocab_size=4096,
+        hidden_size=256,
+        intermediate_size=688,
+        num_hidden_layers=4,
+        num_attention_heads=4,
+        num_key_value_heads=4,
+        max_position_embeddings=128,
+    )
+    model = LlamaForCausalLM(config)
+    input_ids: torch.Tensor = torch.randint(config.vocab_size, (batch_size, 128))
+
+    def loss(prepared: nn.Module) -> torch.Tensor:
+        device: torch.device = next(prepared.parameters()).device
+        tokens: torch.Tensor = input_ids.to(device)
+        return prepared(input_ids=tokens, labels=tokens).loss
+
+    return model, loss
+
+
+WORKLOADS: dict[str, Workload] = {"mlp": _mlp, "transformer": _transformer}
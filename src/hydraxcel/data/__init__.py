@@ -0,0 +1,51 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Data loading package for HydraXcel.
+
+Exposes ``pretokenize``, which tokenises a text dataset once per tokenizer
+and preprocessing config into memory-mapped shards shared by later jobs,
+``write_token_shards`` for data that is already tokenised, ``TokenShards`` for
+reading the shards, and ``TokenBlockDataset`` with ``token_dataloader`` for
+zero-copy, rank-sharded batches of packed sequences.  ``share_tensors``
+loads named tensors once per node into shared memory for every local rank.
+"""
+
+from hydraxcel.data.dataset import (
+    TokenBatchSampler,
+    TokenBlockDataset,
+    token_dataloader,
+)
+from hydraxcel.data.pretokenize import pretokenize, tokenizer_fingerprint
+from hydraxcel.data.shards import TokenShards, write_token_shards
+from hydraxcel.data.shared_memory import SharedTensors, share_tensors
+
+__all__ = [
+    "SharedTensors",
+    "TokenBatchSampler",
+    "TokenBlockDataset",
+    "TokenShards",
+    "pretokenize",
+    "share_tensors",
+    "token_dataloader",
+    "tokenizer_fingerprint",
+    "write_token_shards",
+]
@@ -0,0 +1,269 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Zero-copy, rank-sharded batches of packed token sequences.
+
+``TokenBlockDataset`` packs the token stream of every shard into fixed-size
+blocks, as is usual for language-model pre-training, and
+``TokenBatchSampler`` batches runs of consecutive blocks.  A batch is then a
+single reshaped view of the memory-mapped shard, so producing it copies
+nothing and the data stays in the page cache that all ranks on a node share.
+The sampler shuffles batches deterministically by seed and epoch and gives
+every rank the same number of batches, so ranks never wait on each other at
+the end of an epoch.
+"""
+
+import math
+import warnings
+from collections.abc import Iterator, Sequence  # noqa: TC003
+from pathlib import Path  # noqa: TC003
+
+import numpy as np
+import torch
+from accelerate import Accelerator
+from torch.utils.data import DataLoader, Dataset, Sampler
+
+from hydraxcel.data.shards import TokenShards
+
+__all__ = ["TokenBatchSampler", "TokenBlockDataset", "token_dataloader"]
+
+
+class TokenBlockDataset(Dataset):
+    """Fixed-size blocks of consecutive tokens cut from each shard.
+
+    Rows are packed back to back, so a block can span several rows; add an
+    end-of-sequence token to every row (e.g. through the tokenizer's special
+    tokens) to keep them apart.  Blocks do not cross shard boundaries, and
+    the tokens after a shard's last full block are dropped.  For next-token
+    prediction, use ``block_size = seq_len + 1`` and slice the inputs and
+    labels from the same block.
+    """
+
+    def __init__(self, shards: TokenShards | str | Path, block_size: int) -> None:
+        """Index the blocks of *shards*; no token data is read.
+
+        Args:
+            shards: Token shards, or the directory holding them.
+            block_size: Tokens per block.
+
+        Raises:
+            ValueError: If *block_size* is not positive.
+
+        """
+        if block_size <= 0:
+            msg = f"block_size must be positive, got {block_size}"
+            raise ValueError(msg)
+        self.shards: TokenShards = (
+            shards if isinstance(shards, TokenShards) else TokenShards(shards)
+        )
+        self.block_size: int = block_size
+        # Global index of the first block of every shard, and the end of the last
+        self.shard_starts: np.ndarray = np.cumsum(
+            [0] + [len(tokens) // block_size for tokens in self.shards.tokens],
+        )
+
+    def __len__(self) -> int:
+        """Return the number of blocks."""
+        return int(self.shard_starts[-1])
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Return the shard of block *index* and its offset in tokens."""
+        if not 0 <= index < len(self):
+            msg = f"Block {index} out of range for {len(self)} blocks"
+            raise IndexError(msg)
+        shard: int = int(np.searchsorted(self.shard_starts, index, side="right")) - 1
+        return shard, (index - int(self.shard_starts[shard])) * self.block_size
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        """Return block *index* as a view of the mapped shard."""
+        shard, start = self._locate(index)
+        return self.shards.tokens[shard][start : start + self.block_size]
+
+    def __getitems__(self, indices: Sequence[int]) -> np.ndarray:
+        """Return the blocks at *indices* as one ``(len(indices), block_size)`` array.
+
+        Consecutive blocks of one shard, as ``TokenBatchSampler`` produces,
+        are returned as a view; other index lists are copied.
+        """
+        first_shard, start = self._locate(indices[0])
+        last_shard, _ = self._locate(indices[-1])
+        if first_shard == last_shard and list(indices) == list(
+            range(indices[0], indices[0] + len(indices)),
+        ):
+            tokens: np.ndarray = self.shards.tokens[first_shard]
+            return tokens[start : start + len(indices) * self.block_size].reshape(
+                len(indices),
+                self.block_size,
+            )
+        return np.stack([self[index] for index in indices])
+
+
+class TokenBatchSampler(Sampler[list[int]]):
+    """Batches of consecutive blocks, shuffled by epoch and split across ranks.
+
+    Batches never cross shard boundaries, so a shard's last batch can be
+    smaller unless *drop_last* drops it.  Every rank receives the same number
+    of batches: with *drop_last* the batches that do not divide evenly are
+    dropped, otherwise the first batches are repeated.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        dataset: TokenBlockDataset,
+        batch_size: int,
+        *,
+        num_replicas: int = 1,
+        rank: int = 0,
+        shuffle: bool = True,
+        seed: int = 0,
+        drop_last: bool = True,
+    ) -> None:
+        """Split the blocks of *dataset* into batches.
+
+        Args:
+            dataset: The dataset to sample from.
+            batch_size: Blocks per batch.
+            num_replicas: Number of ranks sharing the dataset.
+            rank: This rank, in ``range(num_replicas)``.
+            shuffle: Shuffle the order of the batches every epoch.
+            seed: Seed of the shuffle, which must be equal on all ranks.
+            drop_last: Drop partial batches and the batches left over after
+                an even split across ranks.
+
+        Raises:
+            ValueError: If *batch_size* is not positive or *rank* is not
+                below *num_replicas*.
+
+        """
+        if batch_size <= 0:
+            msg = f"batch_size must be positive, got {batch_size}"
+            raise ValueError(msg)
+        if not 0 <= rank < num_replicas:
+            msg = f"rank must be in [0, {num_replicas}), got {rank}"
+            raise ValueError(msg)
+        self.num_replicas: int = num_replicas
+        self.rank: int = rank
+        self.shuffle: bool = shuffle
+        self.seed: int = seed
+        self.epoch: int = 0
+        starts: list[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+        ends: list[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+        for first, end in zip(
+            dataset.shard_starts[:-1],
+            dataset.shard_starts[1:],
+            strict=True,
+        ):
+            shard_starts: np.ndarray = np.arange(
+                first,
+                end - batch_size + 1 if drop_last else end,
+                batch_size,
+            )
+            starts.append(shard_starts)
+            ends.append(np.minimum(shard_starts + batch_size, end))
+        # First block and end of every batch
+        self.starts: np.ndarray = np.concatenate(starts)
+        self.ends: np.ndarray = np.concatenate(ends)
+        self.num_batches: int = (
+            len(self.starts) // num_replicas
+            if drop_last
+            else math.ceil(len(self.starts) / num_replicas)
+        )
+
+    def set_epoch(self, epoch: int) -> None:
+        """Reshuffle for *epoch*; call on every rank before iterating."""
+        self.epoch = epoch
+
+    def __len__(self) -> int:
+        """Return the number of batches of this rank."""
+        return self.num_batches
+
+    def __iter__(self) -> Iterator[list[int]]:
+        """Yield the block indices of this rank's batches."""
+        order: np.ndarray = (
+            np.random.default_rng((self.seed, self.epoch)).permutation(len(self.starts))
+            if self.shuffle
+            else np.arange(len(self.starts))
+        )
+        total: int = self.num_batches * self.num_replicas
+        order = np.resize(order, total)  # Repeats the first batches to fill up
+        for batch in order[self.rank : total : self.num_replicas]:
+            yield list(range(self.starts[batch], self.ends[batch]))
+
+
+def _as_tensor(batch: np.ndarray) -> torch.Tensor:
+    """Wrap a batch view as a tensor without copying it."""
+    with warnings.catch_warnings():
+        # The mapping is read-only; batches are only read or moved to a device
+        warnings.filterwarnings("ignore", message="The given NumPy array is not")
+        return torch.from_numpy(batch)
+
+
+def token_dataloader(  # noqa: PLR0913
+    dataset: TokenBlockDataset,
+    batch_size: int,
+    *,
+    accelerator: Accelerator | None = None,
+    shuffle: bool = True,
+    seed: int = 0,
+    drop_last: bool = True,
+    num_workers: int = 0,
+) -> DataLoader:
+    """Build a data loader of this rank's zero-copy batches of *dataset*.
+
+    Batches are ``(batch_size, block_size)`` tensors in the shard dtype that
+    share the read-only mapping: move them to the device, e.g. with
+    ``.to(accelerator.device).long()``, rather than modifying them in place.
+    The loader already holds only this rank's batches, so do not pass it to
+    ``accelerator.prepare``; call ``loader.batch_sampler.set_epoch`` every
+    epoch instead.
+
+    Args:
+        dataset: The blocks to batch.
+        batch_size: Blocks per batch.
+        accelerator: Splits the batches across its processes; ``None`` keeps
+            them all.
+        shuffle: Shuffle the order of the batches every epoch.
+        seed: Seed of the shuffle, which must be equal on all ranks.
+        drop_last: Drop partial and uneven batches, see ``TokenBatchSampler``.
+        num_workers: Loader worker processes.  Slicing a view is cheap, and
+            workers copy every batch through shared memory, so the default
+            produces batches in this process.
+
+    Returns:
+        The data loader.
+
+    """
+    sampler = TokenBatchSampler(
+        dataset,
+        batch_size,
+        num_replicas=accelerator.num_processes if accelerator is not None else 1,
+        rank=accelerator.process_index if accelerator is not None else 0,
+        shuffle=shuffle,
+        seed=seed,
+        drop_last=drop_last,
+    )
+    return DataLoader(
+        dataset,
+        batch_sampler=sampler,
+        # ``__getitems__`` hands the whole batch over as one array, not a list
+        collate_fn=_as_tensor,  # ty:ignore[invalid-argument-type]
+        num_workers=num_workers,
+    )
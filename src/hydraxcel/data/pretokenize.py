@@ -0,0 +1,346 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Parallel pre-tokenisation into memory-mapped shards shared across jobs.
+
+``pretokenize`` tokenises a text dataset once per tokenizer and
+preprocessing config.  The rows are split into fixed-size shards that the
+Accelerate ranks build concurrently, each with a process pool over its local
+cores.  The shards use the ``hydraxcel.data.shards`` format, which later jobs
+memory-map instead of tokenising again.  The cache directory is keyed by a
+fingerprint of the tokenizer (vocabulary, normalisation and special tokens),
+a digest of the texts and the preprocessing config.
+
+A per-shard file lock lets concurrent builders, from other ranks or other
+sweep jobs, split the work: every builder starts with its own shards and then
+takes over shards nobody has claimed.  Shards are written atomically, so an
+interrupted build resumes from the shards that completed, and ``meta.json``
+marks a complete cache.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Mapping, Sequence  # noqa: TC003
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor
+from concurrent.futures import wait as wait_futures
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+from accelerate import Accelerator
+from filelock import FileLock, Timeout
+from omegaconf import DictConfig, OmegaConf
+from transformers import PreTrainedTokenizerBase
+
+from hydraxcel.accelerate.topology import CPU_AFFINITY_ENV
+from hydraxcel.data.shards import (
+    META_FILE_NAME,
+    TokenShards,
+    is_shard_built,
+    save_shard,
+    write_meta,
+)
+
+__all__ = ["pretokenize", "tokenizer_fingerprint"]
+
+LOCKS_DIR_NAME: str = "locks"
+ENCODE_BATCH_SIZE: int = 1000  # Rows passed to the tokenizer at once
+# Keyword arguments that only say where the tokenizer was loaded from
+_LOCATION_KWARGS: frozenset[str] = frozenset(
+    {"name_or_path", "tokenizer_file", "vocab_file", "merges_file", "cache_dir"},
+)
+
+logger = logging.getLogger("pretokenize")
+
+
+def tokenizer_fingerprint(tokenizer: PreTrainedTokenizerBase) -> str:
+    """Hash everything about *tokenizer* that changes the token ids it produces.
+
+    Fast tokenizers are fingerprinted by their serialised pipeline
+    (normaliser, pre-tokeniser, model and post-processor), other tokenizers
+    by their vocabulary; both include the special tokens and the init
+    arguments, except those that only say where the tokenizer was loaded from.
+
+    Args:
+        tokenizer: A Hugging Face tokenizer.
+
+    Returns:
+        A hex digest.
+
+    """
+    backend: Any = getattr(tokenizer, "backend_tokenizer", None)
+    description: dict[str, Any] = {
+        "class": type(tokenizer).__name__,
+        "pipeline": (
+            backend.to_str()
+            if backend is not None
+            else sorted(tokenizer.get_vocab().items())
+        ),
+        "special_tokens": tokenizer.special_tokens_map,
+        "added_tokens": sorted(
+            (index, str(token))
+            for index, token in tokenizer.added_tokens_decoder.items()
+        ),
+        "init_kwargs": {
+            name: value
+            for name, value in tokenizer.init_kwargs.items()
+            if name not in _LOCATION_KWARGS
+        },
+    }
+    encoded: bytes = json.dumps(description, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _content_digest(texts: Sequence[str]) -> str:
+    """Hash the rows of *texts* in order, reading them in batches."""
+    digest = hashlib.sha256()
+    for start in range(0, len(texts), ENCODE_BATCH_SIZE):
+        for text in texts[start : start + ENCODE_BATCH_SIZE]:
+            encoded: bytes = text.encode()
+            # The length prefix keeps row boundaries part of the digest
+            digest.update(len(encoded).to_bytes(8, "little"))
+            digest.update(encoded)
+    return digest.hexdigest()
+
+
+def _init_worker() -> None:
+    """Leave the cores to the pool instead of the tokenizer's own threads."""
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+
+
+def _build_shard(  # noqa: PLR0913
+    texts: list[str],
+    tokenizer: PreTrainedTokenizerBase,
+    directory: Path,
+    index: int,
+    dtype: str,
+    *,
+    add_special_tokens: bool,
+    wait: bool,
+) -> str:
+    """Tokenise shard *index* unless another builder holds or has built it.
+
+    Runs in the process pool.  Without *wait*, a shard that another builder
+    holds is skipped; with it, this builder waits and builds the shard if
+    the other builder died before finishing.
+
+    Returns:
+        ``"built"`` if this call built the shard, ``"done"`` if another
+        builder did, or ``"held"`` if another builder is still building it.
+
+    """
+    lock = FileLock(directory / LOCKS_DIR_NAME / f"shard-{index:05d}.lock")
+    try:
+        lock.acquire(timeout=-1 if wait else 0)
+    except Timeout:
+        return "held"
+    try:
+        if is_shard_built(directory, index):
+            return "done"
+        encoded: list[list[int]] = []
+        for start in range(0, len(texts), ENCODE_BATCH_SIZE):
+            encoded.extend(
+                tokenizer(
+                    texts[start : start + ENCODE_BATCH_SIZE],
+                    add_special_tokens=add_special_tokens,
+                    return_attention_mask=False,
+                )["input_ids"],
+            )
+        save_shard(directory, index, encoded, dtype)
+        return "built"
+    finally:
+        lock.release()
+
+
+def _build_shards(
+    submit: Callable[..., Future],
+    directory: Path,
+    indices: list[int],
+    *,
+    max_pending: int,
+    wait: bool,
+) -> dict[int, str]:
+    """Build the shards *indices* that are missing, submitting them lazily.
+
+    At most *max_pending* shards are queued or building at a time, so only
+    their rows are copied into memory.
+
+    Returns:
+        The ``_build_shard`` status of every shard, ``"done"`` if it was
+        already built.
+
+    """
+    statuses: dict[int, str] = {}
+    pending: dict[Future, int] = {}
+    for index in indices:
+        if len(pending) >= max_pending:
+            done, _ = wait_futures(pending, return_when=FIRST_COMPLETED)
+            statuses.update({pending.pop(future): future.result() for future in done})
+        if is_shard_built(directory, index):
+            statuses[index] = "done"
+        else:
+            pending[submit(index, wait=wait)] = index
+    statuses.update({index: future.result() for future, index in pending.items()})
+    return statuses
+
+
+def _default_workers() -> int:
+    """Return this process's share of the local cores."""
+    cpus: int = (
+        len(os.sched_getaffinity(0))
+        if hasattr(os, "sched_getaffinity")
+        else os.cpu_count() or 1
+    )
+    if os.environ.get(CPU_AFFINITY_ENV) == "auto":
+        return cpus  # The launcher already gave every rank its own cores
+    return max(1, cpus // int(os.environ.get("LOCAL_WORLD_SIZE", "1")))
+
+
+def pretokenize(  # noqa: PLR0913
+    texts: Sequence[str],
+    tokenizer: PreTrainedTokenizerBase,
+    root_dir: str | Path,
+    *,
+    config: DictConfig | Mapping[str, Any] | None = None,
+    accelerator: Accelerator | None = None,
+    rows_per_shard: int = 50_000,
+    add_special_tokens: bool = True,
+    num_workers: int | None = None,
+    mp_context: str = "spawn",
+) -> TokenShards:
+    """Tokenise *texts* into memory-mapped shards, reusing an earlier build.
+
+    Every rank of *accelerator* calls this with the same arguments; the
+    shards are split between the ranks, and between the worker processes of
+    each rank.  Each call reads every row once to hash the texts into the key.
+    Only the shards that are being built are held in memory.
+
+    Args:
+        texts: The rows to tokenise, e.g. a list or a ``datasets`` column.
+        tokenizer: Hugging Face tokenizer; its fingerprint is part of the key.
+        root_dir: Directory holding one cache directory per key, shared by
+            the jobs that should reuse each other's builds.
+        config: Preprocessing config that describes how the dataset was
+            prepared (e.g. its name, split and filters); part of the key.
+        accelerator: Splits the shards across ranks; ``None`` builds them all
+            in this process's pool.
+        rows_per_shard: Rows per shard, the unit of work and of resumption.
+        add_special_tokens: Passed to the tokenizer; part of the key.
+        num_workers: Worker processes per rank; ``None`` uses the rank's share
+            of the local cores.
+        mp_context: Start method of the worker processes.
+
+    Returns:
+        The memory-mapped token ids.
+
+    Raises:
+        ValueError: If *rows_per_shard* is not positive.
+
+    """
+    if rows_per_shard <= 0:
+        msg = f"rows_per_shard must be positive, got {rows_per_shard}"
+        raise ValueError(msg)
+    description: dict[str, Any] = {
+        "tokenizer": tokenizer_fingerprint(tokenizer),
+        "config": OmegaConf.to_container(config, resolve=True)
+        if isinstance(config, DictConfig)
+        else config,
+        "texts": _content_digest(texts),
+        "rows": len(texts),
+        "rows_per_shard": rows_per_shard,
+        "add_special_tokens": add_special_tokens,
+        # Every id fits in the dtype, so the vocabulary size decides it
+        "dtype": "uint16"
+        if len(tokenizer) <= np.iinfo(np.uint16).max + 1
+        else "uint32",
+    }
+    key: str = hashlib.sha256(
+        json.dumps(description, sort_keys=True, default=str).encode(),
+    ).hexdigest()
+    directory: Path = Path(root_dir).expanduser().absolute() / key
+    if (directory / META_FILE_NAME).is_file():
+        shards = TokenShards(directory)
+        logger.info(
+            "Token cache hit %s: %d rows, %d tokens",
+            key[:12],
+            len(shards),
+            shards.num_tokens,
+        )
+        return shards
+
+    start: float = time.perf_counter()
+    (directory / LOCKS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+    num_shards: int = max(1, math.ceil(len(texts) / rows_per_shard))
+    rank: int = accelerator.process_index if accelerator is not None else 0
+    world: int = accelerator.num_processes if accelerator is not None else 1
+    # This rank's shards first, then the others in case their rank is slower
+    order: list[int] = sorted(range(num_shards), key=lambda i: ((i - rank) % world, i))
+    workers: int = num_workers or _default_workers()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context(mp_context),
+        initializer=_init_worker,
+    ) as pool:
+
+        def submit(index: int, *, wait: bool) -> Future:
+            return pool.submit(
+                _build_shard,
+                list(texts[index * rows_per_shard : (index + 1) * rows_per_shard]),
+                tokenizer,
+                directory,
+                index,
+                description["dtype"],
+                add_special_tokens=add_special_tokens,
+                wait=wait,
+            )
+
+        statuses: dict[int, str] = _build_shards(
+            submit,
+            directory,
+            order,
+            max_pending=2 * workers,
+            wait=False,
+        )
+        held: list[int] = [i for i, status in statuses.items() if status == "held"]
+        statuses.update(
+            _build_shards(submit, directory, held, max_pending=2 * workers, wait=True),
+        )
+    if accelerator is not None:
+        accelerator.wait_for_everyone()
+    if accelerator is None or accelerator.is_main_process:
+        write_meta(directory, num_shards, description)
+    if accelerator is not None:
+        accelerator.wait_for_everyone()
+    shards = TokenShards(directory)
+    logger.info(
+        "Tokenised %d rows into %d tokens in %d shards (%d built here) in %.1fs",
+        len(shards),
+        shards.num_tokens,
+        num_shards,
+        sum(status == "built" for status in statuses.values()),
+        time.perf_counter() - start,
+    )
+    return shards
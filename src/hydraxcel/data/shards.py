@@ -0,0 +1,245 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""On-disk format of memory-mapped token shards.
+
+A shard directory holds ``meta.json`` and, per shard, two ``.npy`` files: the
+token ids of all its rows concatenated in a fixed dtype, and ``rows + 1``
+int64 offsets into them.  Readers memory-map both read-only, so ranks on one
+node share the page cache instead of each holding a copy of the data, and a
+row or a run of tokens is a view into the mapping.  Offsets are written last,
+which marks a shard complete, and ``meta.json`` marks the directory
+complete.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+import numpy as np
+
+__all__ = [
+    "TokenShards",
+    "is_shard_built",
+    "save_shard",
+    "write_meta",
+    "write_token_shards",
+]
+
+META_FILE_NAME: str = "meta.json"
+
+
+def _shard_paths(directory: Path, index: int) -> tuple[Path, Path]:
+    """Return the token and offset files of shard *index*."""
+    return (
+        directory / f"tokens-{index:05d}.npy",
+        directory / f"offsets-{index:05d}.npy",
+    )
+
+
+def is_shard_built(directory: Path, index: int) -> bool:
+    """Return whether shard *index* is complete; its offsets are written last.
+
+    Args:
+        directory: The shard directory.
+        index: Position of the shard.
+
+    Returns:
+        ``True`` if both files of the shard exist.
+
+    """
+    return _shard_paths(directory, index)[1].is_file()
+
+
+def _save(path: Path, array: np.ndarray) -> None:
+    """Write *array* to *path* atomically, leaving no partial file behind."""
+    partial: Path = path.with_name(f".{path.name}.tmp")  # Only one writer per shard
+    with partial.open("wb") as file:
+        np.save(file, array)
+    partial.replace(path)
+
+
+def save_shard(directory: Path, index: int, rows: Sequence[Any], dtype: str) -> None:
+    """Write *rows* of token ids as shard *index*, atomically.
+
+    Args:
+        directory: The shard directory.
+        index: Position of the shard.
+        rows: Token id sequences.
+        dtype: NumPy dtype of the stored token ids.
+
+    """
+    offsets: np.ndarray = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=offsets[1:])
+    tokens: np.ndarray = np.empty(int(offsets[-1]), dtype=dtype)
+    for row, start, end in zip(rows, offsets[:-1], offsets[1:], strict=True):
+        tokens[start:end] = row
+    tokens_path, offsets_path = _shard_paths(directory, index)
+    _save(tokens_path, tokens)
+    _save(offsets_path, offsets)  # Last, marks the shard complete
+
+
+def _map(path: Path) -> np.ndarray:
+    """Memory-map the array at *path*; empty arrays cannot be mapped."""
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        return np.load(path)
+
+
+def write_meta(directory: Path, num_shards: int, description: dict[str, Any]) -> None:
+    """Mark the shards in *directory* complete by writing ``meta.json``.
+
+    Args:
+        directory: The shard directory.
+        num_shards: Number of shards, all of which must be built.
+        description: Stored alongside the row and token counts, e.g. the
+            ``dtype`` and how the tokens were produced.
+
+    """
+    num_rows: int = 0
+    num_tokens: int = 0
+    for index in range(num_shards):
+        offsets: np.ndarray = _map(_shard_paths(directory, index)[1])
+        num_rows += len(offsets) - 1
+        num_tokens += int(offsets[-1])
+    partial: Path = directory / f".{META_FILE_NAME}.{os.getpid()}.tmp"
+    partial.write_text(
+        json.dumps(
+            {
+                **description,
+                "num_shards": num_shards,
+                "num_rows": num_rows,
+                "num_tokens": num_tokens,
+            },
+            indent=2,
+            default=str,
+        ),
+    )
+    partial.replace(directory / META_FILE_NAME)
+
+
+class TokenShards(Sequence[np.ndarray]):
+    """Read-only, memory-mapped rows of token ids.
+
+    Indexing returns a zero-copy view of a row's token ids.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Map the shards of a complete shard directory.
+
+        Args:
+            directory: Directory holding ``meta.json`` and the shard files.
+
+        """
+        self.directory: Path = Path(directory)
+        self.meta: dict[str, Any] = json.loads(
+            (self.directory / META_FILE_NAME).read_text(),
+        )
+        self.tokens: list[np.ndarray] = []
+        self.offsets: list[np.ndarray] = []
+        for index in range(self.meta["num_shards"]):
+            tokens_path, offsets_path = _shard_paths(self.directory, index)
+            self.tokens.append(_map(tokens_path))
+            self.offsets.append(_map(offsets_path))
+        # Global index of the first row of every shard, and the end of the last
+        self.shard_starts: np.ndarray = np.cumsum(
+            [0] + [len(offsets) - 1 for offsets in self.offsets],
+        )
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return int(self.shard_starts[-1])
+
+    @overload
+    def __getitem__(self, index: int) -> np.ndarray: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[np.ndarray]: ...
+
+    def __getitem__(self, index: int | slice) -> np.ndarray | list[np.ndarray]:
+        """Return the token ids of row *index*, or a list of rows for a slice."""
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            msg = f"Row {index} out of range for {len(self)} rows"
+            raise IndexError(msg)
+        shard: int = int(np.searchsorted(self.shard_starts, index, side="right")) - 1
+        row: int = index - int(self.shard_starts[shard])
+        start, end = self.offsets[shard][row : row + 2]
+        return self.tokens[shard][start:end]
+
+    @property
+    def num_tokens(self) -> int:
+        """Return the total number of tokens."""
+        return int(self.meta["num_tokens"])
+
+
+def write_token_shards(
+    rows: Iterable[Sequence[int] | np.ndarray],
+    directory: str | Path,
+    *,
+    dtype: str = "uint32",
+    rows_per_shard: int = 50_000,
+    metadata: dict[str, Any] | None = None,
+) -> TokenShards:
+    """Write already tokenised *rows* as memory-mappable token shards.
+
+    Streams *rows*, holding one shard in memory at a time.  For text, use
+    ``pretokenize``, which also parallelises and caches the tokenisation.
+
+    Args:
+        rows: Token id sequences, e.g. from a generator.
+        directory: New or empty directory to write the shards to.
+        dtype: Numpy dtype of the token ids; ``uint16`` halves the size of
+            vocabularies up to 65536 tokens.
+        rows_per_shard: Rows per shard file.
+        metadata: Extra entries for ``meta.json``.
+
+    Returns:
+        The written shards, memory-mapped.
+
+    Raises:
+        ValueError: If *rows_per_shard* is not positive.
+
+    """
+    if rows_per_shard <= 0:
+        msg = f"rows_per_shard must be positive, got {rows_per_shard}"
+        raise ValueError(msg)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    num_shards: int = 0
+    pending: list[Sequence[int] | np.ndarray] = []
+    for row in rows:
+        pending.append(row)
+        if len(pending) == rows_per_shard:
+            save_shard(directory, num_shards, pending, dtype)
+            num_shards += 1
+            pending = []
+    if pending or not num_shards:
+        save_shard(directory, num_shards, pending, dtype)
+        num_shards += 1
+    write_meta(directory, num_shards, {**(metadata or {}), "dtype": dtype})
+    return TokenShards(directory)
@@ -0,0 +1,305 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tensors shared in POSIX shared memory by the ranks of a node.
+
+With several processes per node, every rank otherwise loads its own copy of
+the same embedding tables, vocabularies or evaluation sets.  ``share_tensors``
+lets the local main process load named tensors once into files under
+``/dev/shm``; after a barrier every local rank maps them as zero-copy
+tensors, so a node holds one copy however many ranks it runs.
+
+Every handle using a segment leaves a marker with its pid in it.  The last
+live user to leave removes the segment, and a segment whose processes all died
+without leaving, for instance when killed by the OOM killer, is removed by
+the next ``share_tensors`` call on the node.
+"""
+
+import atexit
+import getpass
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Mapping  # noqa: TC003
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Generator
+
+import torch
+from accelerate import Accelerator
+from filelock import FileLock
+
+from hydraxcel.run.compile_cache import pid_alive
+
+__all__ = ["SharedTensors", "share_tensors"]
+
+META_FILE_NAME: str = "meta.json"  # Written last, marks a complete segment
+USERS_DIR_NAME: str = ".users"
+LOCKS_DIR_NAME: str = ".locks"
+
+logger = logging.getLogger("shared_memory")
+
+
+def _default_root() -> Path:
+    """Return ``/dev/shm/hydraxcel-<user>``, or a temporary directory without it."""
+    shm = Path("/dev/shm")  # noqa: S108
+    base: Path = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return base / f"hydraxcel-{getpass.getuser()}"
+
+
+def _has_live_users(segment: Path) -> bool:
+    """Whether a live process still uses *segment*; drop markers of dead ones."""
+    alive: bool = False
+    for marker in (segment / USERS_DIR_NAME).glob("*"):
+        pid: str = marker.name.partition("-")[0]
+        if pid.isdigit() and pid_alive(int(pid)):
+            alive = True
+        else:
+            marker.unlink(missing_ok=True)
+    return alive
+
+
+class SharedTensors:
+    """One named segment of tensors in shared memory, reference counted by pid."""
+
+    def __init__(self, name: str, root: Path | None = None) -> None:
+        """Initialise the segment handle; nothing is mapped until ``attach``.
+
+        Args:
+            name: Segment name, shared by every process that uses the tensors.
+            root: Directory on a shared memory filesystem holding the segments.
+                Defaults to ``/dev/shm/hydraxcel-<user>``.
+
+        Raises:
+            ValueError: If *name* is not a plain file name.
+
+        """
+        if not name or name != Path(name).name or name.startswith("."):
+            msg = f"Shared tensor name {name!r} must be a plain file name"
+            raise ValueError(msg)
+        self.name: str = name
+        self.root: Path = root if root is not None else _default_root()
+        self.directory: Path = self.root / name
+        self._marker: str = f"{os.getpid()}-{id(self):x}"  # One reference per handle
+        self._attached: bool = False
+
+    def _lock(self) -> FileLock:
+        (self.root / LOCKS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        return FileLock(self.root / LOCKS_DIR_NAME / f"{self.name}.lock")
+
+    def _mark_used(self) -> None:
+        """Count this process as a user of the segment until ``release``."""
+        if not self._attached:
+            (self.directory / USERS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+            (self.directory / USERS_DIR_NAME / self._marker).touch()
+            self._attached = True
+            atexit.register(self.release)
+
+    def create(self, load: Callable[[], Mapping[str, torch.Tensor]]) -> None:
+        """Write the tensors returned by *load* unless the segment already exists.
+
+        *load* only runs when no live process holds a complete segment of this
+        name, so other jobs on the node reuse the tensors while any of them
+        runs.  Stale segments of dead processes are removed first.
+
+        Args:
+            load: Returns the named tensors to share.
+
+        Raises:
+            OSError: If the shared memory filesystem is too small for them.
+
+        """
+        self.sweep(self.root)
+        with self._lock():
+            if (self.directory / META_FILE_NAME).is_file():
+                self._mark_used()
+                logger.info("Reusing shared tensors %s", self.directory)
+                return
+            tensors: Mapping[str, torch.Tensor] = load()
+            size: int = sum(
+                tensor.numel() * tensor.element_size() for tensor in tensors.values()
+            )
+            self.root.mkdir(parents=True, exist_ok=True)
+            free: int = shutil.disk_usage(self.root).free
+            if size > free:
+                msg = (
+                    f"Shared tensors {self.name!r} need {size / 1e9:.2f} GB but "
+                    f"{self.root} has {free / 1e9:.2f} GB free; in a container, "
+                    "raise its shared memory size (e.g. docker --shm-size)"
+                )
+                raise OSError(msg)
+            partial: Path = self.root / f".{self.name}.partial"
+            shutil.rmtree(partial, ignore_errors=True)
+            partial.mkdir()
+            entries: list[dict[str, Any]] = []
+            for index, (key, tensor) in enumerate(tensors.items()):
+                file_name: str = f"{index:05d}.bin"
+                if tensor.numel():
+                    target: torch.Tensor = torch.from_file(
+                        str(partial / file_name),
+                        shared=True,
+                        size=tensor.numel(),
+                        dtype=tensor.dtype,
+                    )
+                    target.copy_(tensor.detach().reshape(-1))
+                entries.append(
+                    {
+                        "name": key,
+                        "file": file_name,
+                        "dtype": str(tensor.dtype).removeprefix("torch."),
+                        "shape": list(tensor.shape),
+                    },
+                )
+            (partial / META_FILE_NAME).write_text(json.dumps(entries, indent=2))
+            self.directory.parent.mkdir(parents=True, exist_ok=True)
+            partial.replace(self.directory)
+            self._mark_used()
+        logger.info(
+            "Shared %d tensors (%.1f MB) in %s",
+            len(entries),
+            size / 1e6,
+            self.directory,
+        )
+
+    def attach(self) -> dict[str, torch.Tensor]:
+        """Map the tensors of the complete segment without copying them.
+
+        The views are copy-on-write: writing to one gives this process a
+        private copy of the touched pages and leaves the other ranks' intact.
+
+        Returns:
+            The named tensors, in the order they were created.
+
+        Raises:
+            FileNotFoundError: If the segment does not exist.
+
+        """
+        with self._lock():
+            meta: Path = self.directory / META_FILE_NAME
+            if not meta.is_file():
+                msg = f"No shared tensors named {self.name!r} in {self.root}"
+                raise FileNotFoundError(msg)
+            self._mark_used()
+            entries: list[dict[str, Any]] = json.loads(meta.read_text())
+        tensors: dict[str, torch.Tensor] = {}
+        for entry in entries:
+            dtype: torch.dtype = getattr(torch, entry["dtype"])
+            numel: int = 1
+            for dim in entry["shape"]:
+                numel *= dim
+            tensors[entry["name"]] = (
+                torch.from_file(
+                    str(self.directory / entry["file"]),
+                    shared=False,
+                    size=numel,
+                    dtype=dtype,
+                ).view(entry["shape"])
+                if numel
+                else torch.empty(entry["shape"], dtype=dtype)
+            )
+        return tensors
+
+    def release(self) -> None:
+        """Stop using the segment, removing it if no live process uses it.
+
+        Tensors already attached stay valid; their memory is freed once the
+        last of them is gone.
+        """
+        if not self._attached:
+            return
+        self._attached = False
+        atexit.unregister(self.release)
+        with self._lock():
+            (self.directory / USERS_DIR_NAME / self._marker).unlink(missing_ok=True)
+            if self.directory.is_dir() and not _has_live_users(self.directory):
+                shutil.rmtree(self.directory, ignore_errors=True)
+                logger.info("Removed shared tensors %s", self.directory)
+
+    @staticmethod
+    def sweep(root: Path) -> list[Path]:
+        """Remove the segments under *root* that no live process uses.
+
+        Args:
+            root: Directory holding the segments.
+
+        Returns:
+            The removed segment directories.
+
+        """
+        removed: list[Path] = []
+        if not root.is_dir():
+            return removed
+        (root / LOCKS_DIR_NAME).mkdir(exist_ok=True)
+        for segment in root.iterdir():
+            if not segment.is_dir() or segment.name.startswith("."):
+                continue
+            with FileLock(root / LOCKS_DIR_NAME / f"{segment.name}.lock"):
+                if segment.is_dir() and not _has_live_users(segment):
+                    shutil.rmtree(segment, ignore_errors=True)
+                    removed.append(segment)
+                    logger.warning("Removed stale shared tensors %s", segment)
+        return removed
+
+
+@contextmanager
+def share_tensors(
+    name: str,
+    load: Callable[[], Mapping[str, torch.Tensor]],
+    accelerator: Accelerator | None = None,
+    *,
+    root_dir: str | Path | None = None,
+) -> Generator[dict[str, torch.Tensor]]:
+    """Load named tensors once per node and map them on every local rank.
+
+    The local main process calls *load* and writes the tensors to shared
+    memory while the other ranks wait; then every rank maps them and waits
+    for the others to do so, so no rank can remove the segment early.  Use a
+    name that changes with the data, since live segments are reused by name.
+
+    Args:
+        name: Segment name, e.g. ``"embeddings-v2"``.
+        load: Returns the named tensors; only called on the local main process.
+        accelerator: The run's ``Accelerator``; ``None`` for a single process.
+        root_dir: Shared memory directory; defaults to
+            ``/dev/shm/hydraxcel-<user>``.
+
+    Yields:
+        The named tensors as zero-copy, copy-on-write views.
+
+    """
+    segment = SharedTensors(
+        name,
+        Path(root_dir).expanduser().absolute() if root_dir else None,
+    )
+    try:
+        if accelerator is None or accelerator.is_local_main_process:
+            segment.create(load)
+        if accelerator is not None:
+            accelerator.wait_for_everyone()
+        tensors: dict[str, torch.Tensor] = segment.attach()
+        if accelerator is not None:
+            # Until every rank holds a reference, leaving would remove the segment
+            accelerator.wait_for_everyone()
+        yield tensors
+    finally:
+        segment.release()
@@ -23,7 +23,7 @@
 
 from hydra.core.config_store import ConfigStore
 
-from hydraxcel.hydra.configuration import flatten_config, hydra_config
+from hydraxcel.hydra.configuration import flatten_config, get_run_dir, hydra_config
 from hydraxcel.hydra.registration import register_plugin
 from hydraxcel.hydra.registry import BaseRegistry, load_methods
 
@@ -31,6 +31,7 @@ __all__ = [
     "BaseRegistry",
     "config_store",
     "flatten_config",
+    "get_run_dir",
     "hydra_config",
     "load_methods",
     "register_plugin",
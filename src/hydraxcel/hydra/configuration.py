@@ -22,12 +22,15 @@
 """Utilities for building and flattening Hydra configuration dataclasses."""
 
 from dataclasses import field, make_dataclass
+from pathlib import Path
 from typing import Any
 
+from hydra.core.hydra_config import HydraConfig
 from omegaconf import DictConfig, OmegaConf
 
 __all__ = [
     "flatten_config",
+    "get_run_dir",
     "hydra_config",
 ]
 
@@ -120,3 +123,18 @@ def hydra_config(
         values.append(("training_script_args", list[str], field(default_factory=list)))
 
     return make_dataclass(name, values)
+
+
+def get_run_dir() -> Path:
+    """Return the output directory of the active Hydra run.
+
+    Falls back to the current working directory when called outside of a Hydra
+    application (e.g. from a plain script or a unit test).
+
+    Returns:
+        The Hydra ``runtime.output_dir`` of the current job.
+
+    """
+    if HydraConfig.initialized():
+        return Path(HydraConfig.get().runtime.output_dir)
+    return Path.cwd()
@@ -27,7 +27,10 @@ Hydra logging configuration, and the MLflow server entry-point.
 """
 
 from hydraxcel.logging.environment_logging import log_accelerator_info, log_system_info
-from hydraxcel.logging.exception_logging import setup_exception_logging
+from hydraxcel.logging.exception_logging import (
+    register_exception_handler,
+    setup_exception_logging,
+)
 from hydraxcel.logging.init_logging import (
     LoggingPlatform,
     get_logger,
@@ -43,6 +46,7 @@ __all__ = [
     "init_logging_platform",
     "log_accelerator_info",
     "log_system_info",
+    "register_exception_handler",
     "run_mlflow_server",
     "setup_exception_logging",
 ]
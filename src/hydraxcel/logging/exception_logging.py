@@ -25,10 +25,56 @@ import logging
 import os
 import sys
 import warnings
+from typing import Callable
 
 logger = logging.getLogger("__main__")
 
-__all__ = ["setup_exception_logging"]
+__all__ = ["register_exception_handler", "setup_exception_logging"]
+
+type ExceptionHandler = Callable[[BaseException], None]
+
+_exception_handlers: list[tuple[tuple[type[BaseException], ...], ExceptionHandler]] = []
+
+
+def register_exception_handler(
+    exception_types: type[BaseException] | tuple[type[BaseException], ...],
+    handler: ExceptionHandler,
+) -> Callable[[], None]:
+    """Call *handler* when an uncaught exception of *exception_types* is logged.
+
+    Handlers run inside the hook installed by ``setup_exception_logging``,
+    before the exception itself is logged, so diagnostics services can capture
+    state (e.g. memory snapshots) while the failing frames are still alive.
+
+    Args:
+        exception_types: Exception class or tuple of classes to react to.
+        handler: Callable receiving the uncaught exception instance.
+
+    Returns:
+        A callable that unregisters *handler* again.
+
+    """
+    if not isinstance(exception_types, tuple):
+        exception_types = (exception_types,)
+    entry = (exception_types, handler)
+    _exception_handlers.append(entry)
+
+    def remove() -> None:
+        if entry in _exception_handlers:
+            _exception_handlers.remove(entry)
+
+    return remove
+
+
+def _run_exception_handlers(exception: BaseException) -> None:
+    """Run every registered handler matching *exception*, logging their failures."""
+    for exception_types, handler in list(_exception_handlers):  # noqa: PERF101 # Handlers may unregister themselves
+        if not isinstance(exception, exception_types):
+            continue
+        try:
+            handler(exception)
+        except Exception:
+            logger.exception("Exception handler %r failed", handler)
 
 
 def setup_exception_logging(
@@ -39,7 +85,8 @@ def setup_exception_logging(
     Enables full Hydra tracebacks (``HYDRA_FULL_ERROR=1``), replaces
     ``sys.excepthook`` with a handler that logs critical-level messages for
     unhandled exceptions (except ``KeyboardInterrupt``), and redirects Python
-    warnings through the same logger.
+    warnings through the same logger.  Handlers added with
+    ``register_exception_handler`` run before the exception is logged.
 
     Args:
         logger: Logger instance to which uncaught exceptions and warnings are
@@ -79,6 +126,7 @@ def setup_exception_logging(
             )
             return
 
+        _run_exception_handlers(exc_value)
         logger.critical(
             "Uncaught exception",
             exc_info=(
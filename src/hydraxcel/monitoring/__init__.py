@@ -0,0 +1,62 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run-time monitoring package for HydraXcel.
+
+Exposes ``load_monitoring_configs`` for registering the monitoring config
+groups, ``monitor_resources`` which ``hydraxcel_main`` uses to sample system
+resources in the background for the duration of a run, ``watch_progress``
+which reports hangs when no step progress is made, and ``detect_stragglers``
+which compares step times across ranks.
+"""
+
+from hydraxcel.monitoring.config_registry import (
+    ResourceMonitorConfig,
+    StragglerConfig,
+    WatchdogConfig,
+    load_monitoring_configs,
+)
+from hydraxcel.monitoring.resources import (
+    ResourceMonitor,
+    monitor_resources,
+    read_resource_counters,
+)
+from hydraxcel.monitoring.stragglers import (
+    StragglerDetector,
+    detect_stragglers,
+    summarise_step_times,
+)
+from hydraxcel.monitoring.watchdog import Watchdog, watch_progress
+
+__all__ = [
+    "ResourceMonitor",
+    "ResourceMonitorConfig",
+    "StragglerConfig",
+    "StragglerDetector",
+    "Watchdog",
+    "WatchdogConfig",
+    "detect_stragglers",
+    "load_monitoring_configs",
+    "monitor_resources",
+    "read_resource_counters",
+    "summarise_step_times",
+    "watch_progress",
+]
@@ -0,0 +1,130 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Monitoring configuration registry for Hydra config groups.
+
+Defines structured-config dataclasses for the run-time monitors started by
+``hydraxcel_main`` and registers named variants via ``load_monitoring_configs``.
+"""
+
+from dataclasses import dataclass
+
+from hydraxcel.hydra import config_store
+
+__all__ = [
+    "ResourceMonitorConfig",
+    "StragglerConfig",
+    "WatchdogConfig",
+    "load_monitoring_configs",
+]
+
+
+@dataclass
+class ResourceMonitorConfig:
+    """System Resource Monitor Configuration."""
+
+    enabled: bool = True
+    interval: float = 10.0  # Seconds between samples
+    log_to_trackers: bool = True  # Forward samples to the Accelerate trackers
+    output_subdir: str = "resources"  # Relative to the Hydra run dir
+
+
+@dataclass
+class WatchdogConfig:
+    """Hang and Stall Watchdog Configuration."""
+
+    enabled: bool = True
+    timeout: float = 1800.0  # Seconds without progress before a stall is reported
+    first_step_timeout: float | None = (
+        None  # Allow longer warm-up/compile (None: timeout)
+    )
+    check_interval: float = 10.0
+    pet_on_log: bool = True  # Count ``accelerator.log`` calls as progress
+    kill_process_group: bool = False  # Kill the job so the scheduler can reschedule
+    kill_signal: str = "SIGTERM"
+    kill_grace_period: float = 30.0  # Seconds before escalating to SIGKILL
+    output_subdir: str = "watchdog"  # Relative to the Hydra run dir
+
+
+@dataclass
+class StragglerConfig:
+    """Cross-Rank Straggler Detection Configuration."""
+
+    enabled: bool = True
+    interval: int = 100  # Steps between all-gathers of the per-rank step times
+    warn_threshold: float = 20.0  # Warn when the slowest rank exceeds the median by %
+    log_per_rank: bool = False  # Also send every rank's mean step time to trackers
+    log_to_trackers: bool = True
+
+
+def load_monitoring_configs() -> None:
+    """Register all built-in monitoring config variants into the Hydra config store.
+
+    Stores the ``resources``, ``watchdog`` and ``stragglers`` group variants so
+    they can be selected via Hydra's config composition (e.g.
+    ``+resources=default`` or ``+watchdog=default watchdog.timeout=600`` on the
+    command line).
+    """
+    config_store.store(
+        name="none",
+        group="resources",
+        node=ResourceMonitorConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="resources",
+        node=ResourceMonitorConfig(),
+    )
+    config_store.store(
+        name="fast",
+        group="resources",
+        node=ResourceMonitorConfig(interval=1.0),
+    )
+    config_store.store(
+        name="none",
+        group="watchdog",
+        node=WatchdogConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="watchdog",
+        node=WatchdogConfig(),
+    )
+    config_store.store(
+        name="kill",
+        group="watchdog",
+        node=WatchdogConfig(kill_process_group=True),
+    )
+    config_store.store(
+        name="none",
+        group="stragglers",
+        node=StragglerConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="stragglers",
+        node=StragglerConfig(),
+    )
+    config_store.store(
+        name="per-rank",
+        group="stragglers",
+        node=StragglerConfig(interval=20, log_per_rank=True),
+    )
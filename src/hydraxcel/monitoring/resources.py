@@ -0,0 +1,386 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Background sampling of process and system resource usage.
+
+Complements the one-shot ``log_system_info`` / ``log_accelerator_info``
+snapshots with a daemon thread that periodically reads ``/proc`` (CPU and
+I/O-wait utilisation, RSS and swap, page faults, disk and network I/O, open
+file descriptors) plus CUDA memory and utilisation.  Samples are appended to a
+per-rank JSONL file in the run directory, forwarded to the active trackers, and
+summarised as min/mean/max when the run ends.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Callable, Generator
+
+import torch
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.monitoring.config_registry import ResourceMonitorConfig  # noqa: TC001
+
+__all__ = [
+    "ResourceMonitor",
+    "monitor_resources",
+    "read_resource_counters",
+]
+
+METRIC_PREFIX: str = "system/"
+SAMPLES_FILE_PATTERN: str = "rank{rank}.jsonl"
+SUMMARY_FILE_PATTERN: str = "summary_rank{rank}.json"
+_PROC: Path = Path("/proc")
+_CLOCK_TICKS: int = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE: int = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+logger = logging.getLogger("resources")
+
+
+def _read_key_values(path: Path, *, separator: str | None = None) -> dict[str, int]:
+    """Parse ``key value`` / ``key: value`` lines of a ``/proc`` file into ints."""
+    values: dict[str, int] = {}
+    for line in path.read_text().splitlines():
+        parts: list[str] = line.split(separator) if separator else line.split()
+        if len(parts) < 2:  # noqa: PLR2004 # Need at least key and value
+            continue
+        value: list[str] = parts[1].split()
+        if value and value[0].isdigit():
+            values[parts[0].strip().rstrip(":")] = int(value[0])
+    return values
+
+
+def _process_counters() -> dict[str, float]:
+    """Read cumulative CPU time and page faults of this process."""
+    stat: str = (_PROC / "self" / "stat").read_text()
+    fields: list[str] = stat[stat.rindex(")") + 2 :].split()
+    return {
+        "process_cpu_seconds": (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS,
+        "minor_faults": float(fields[7]),
+        "major_faults": float(fields[9]),
+    }
+
+
+def _memory_gauges() -> dict[str, float]:
+    """Read resident and swapped memory of this process in MiB."""
+    status: dict[str, int] = _read_key_values(_PROC / "self" / "status", separator=":")
+    return {
+        "rss_mb": status.get("VmRSS", 0) / 1024,
+        "swap_mb": status.get("VmSwap", 0) / 1024,
+    }
+
+
+def _system_cpu_counters() -> dict[str, float]:
+    """Read cumulative system-wide CPU busy, I/O-wait and total ticks."""
+    fields: list[int] = [
+        int(value)
+        for value in (_PROC / "stat").read_text().split("\n", 1)[0].split()[1:]
+    ]
+    idle, iowait = fields[3], fields[4]
+    total: int = sum(fields[:8])  # user..steal; guest time is already in user
+    return {
+        "system_cpu_total_ticks": float(total),
+        "system_cpu_busy_ticks": float(total - idle - iowait),
+        "system_cpu_iowait_ticks": float(iowait),
+    }
+
+
+def _io_counters() -> dict[str, float]:
+    """Read cumulative disk, network and swap traffic counters in bytes."""
+    counters: dict[str, float] = {}
+    io: dict[str, int] = _read_key_values(_PROC / "self" / "io", separator=":")
+    counters["disk_read_bytes"] = float(io.get("read_bytes", 0))
+    counters["disk_write_bytes"] = float(io.get("write_bytes", 0))
+
+    received = transmitted = 0
+    for line in (_PROC / "net" / "dev").read_text().splitlines()[2:]:
+        interface, _, data = line.partition(":")
+        if interface.strip() == "lo":
+            continue
+        values: list[str] = data.split()
+        received += int(values[0])
+        transmitted += int(values[8])
+    counters["net_recv_bytes"] = float(received)
+    counters["net_sent_bytes"] = float(transmitted)
+
+    vmstat: dict[str, int] = _read_key_values(_PROC / "vmstat")
+    counters["swap_in_bytes"] = float(vmstat.get("pswpin", 0) * _PAGE_SIZE)
+    counters["swap_out_bytes"] = float(vmstat.get("pswpout", 0) * _PAGE_SIZE)
+    return counters
+
+
+def read_resource_counters() -> dict[str, float]:
+    """Read all available ``/proc`` counters and gauges for this process.
+
+    Readers that are unavailable (e.g. on non-Linux systems or restricted
+    containers) are skipped silently.
+
+    Returns:
+        A flat mapping of cumulative counters and instantaneous gauges.
+
+    """
+    readers: tuple[Callable[[], dict[str, float]], ...] = (
+        _process_counters,
+        _memory_gauges,
+        _system_cpu_counters,
+        _io_counters,
+    )
+    values: dict[str, float] = {}
+    for reader in readers:
+        with suppress(OSError, ValueError, IndexError):
+            values.update(reader())
+    with suppress(OSError):
+        values["open_fds"] = float(sum(1 for _ in (_PROC / "self" / "fd").iterdir()))
+    return values
+
+
+def _cuda_gauges(device: torch.device) -> dict[str, float]:
+    """Read CUDA memory usage (MiB) and utilisation (%) for *device*."""
+    mebibyte: int = 1024 * 1024
+    gauges: dict[str, float] = {
+        "gpu_memory_allocated_mb": torch.cuda.memory_allocated(device) / mebibyte,
+        "gpu_memory_reserved_mb": torch.cuda.memory_reserved(device) / mebibyte,
+        "gpu_max_memory_allocated_mb": torch.cuda.max_memory_allocated(device)
+        / mebibyte,
+    }
+    with suppress(Exception):  # Utilisation needs the optional pynvml/amdsmi
+        gauges["gpu_utilization_percent"] = float(torch.cuda.utilization(device))
+    return gauges
+
+
+class ResourceMonitor:
+    """Sample resource usage on a background thread and keep running statistics."""
+
+    _RATE_COUNTERS: tuple[str, ...] = (
+        "minor_faults",
+        "major_faults",
+        "disk_read_bytes",
+        "disk_write_bytes",
+        "net_recv_bytes",
+        "net_sent_bytes",
+        "swap_in_bytes",
+        "swap_out_bytes",
+    )
+
+    def __init__(
+        self,
+        *,
+        interval: float = 10.0,
+        device: torch.device | None = None,
+        on_sample: Callable[[dict[str, float]], None] | None = None,
+    ) -> None:
+        """Initialise the monitor.
+
+        Args:
+            interval: Seconds between two samples.
+            device: Device whose CUDA memory/utilisation is recorded; ignored
+                unless it is a CUDA device.
+            on_sample: Callback receiving every sample (``system/``-prefixed).
+
+        Raises:
+            ValueError: If *interval* is not positive.
+
+        """
+        if interval <= 0:
+            msg = "interval must be > 0"
+            raise ValueError(msg)
+        self.interval: float = interval
+        self.device: torch.device | None = (
+            device if device is not None and device.type == "cuda" else None
+        )
+        self.on_sample = on_sample
+        self._stats: dict[str, list[float]] = {}  # name -> [min, sum, max, count]
+        self._previous: dict[str, float] = read_resource_counters()
+        self._previous_time: float = time.monotonic()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the background sampling thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="hydraxcel-resource-monitor",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Take a final sample, stop the thread and wait for it to exit."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.sample()
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.sample()
+            except Exception:
+                logger.exception("Resource sampling failed")
+
+    def sample(self) -> dict[str, float]:
+        """Take one sample, update the running statistics and notify ``on_sample``.
+
+        Cumulative counters are converted into per-second rates (and CPU ticks
+        into utilisation percentages) relative to the previous sample.
+
+        Returns:
+            The ``system/``-prefixed sample.
+
+        """
+        now: float = time.monotonic()
+        current: dict[str, float] = read_resource_counters()
+        elapsed: float = max(now - self._previous_time, 1e-9)
+        previous: dict[str, float] = self._previous
+
+        def delta(name: str) -> float:
+            return current.get(name, 0.0) - previous.get(name, 0.0)
+
+        sample: dict[str, float] = {
+            name: current[name]
+            for name in ("rss_mb", "swap_mb", "open_fds")
+            if name in current
+        }
+        if "process_cpu_seconds" in current:
+            sample["cpu_percent"] = 100 * delta("process_cpu_seconds") / elapsed
+        total_ticks: float = delta("system_cpu_total_ticks")
+        if total_ticks > 0:
+            sample["system_cpu_percent"] = (
+                100 * delta("system_cpu_busy_ticks") / total_ticks
+            )
+            sample["system_iowait_percent"] = (
+                100 * delta("system_cpu_iowait_ticks") / total_ticks
+            )
+        for name in self._RATE_COUNTERS:
+            if name in current:
+                sample[f"{name}_per_s"] = delta(name) / elapsed
+        if self.device is not None:
+            sample.update(_cuda_gauges(self.device))
+
+        self._previous, self._previous_time = current, now
+        sample = {f"{METRIC_PREFIX}{name}": value for name, value in sample.items()}
+        for name, value in sample.items():
+            stats: list[float] | None = self._stats.get(name)
+            if stats is None:
+                self._stats[name] = [value, value, value, 1]
+                continue
+            stats[0] = min(stats[0], value)
+            stats[1] += value
+            stats[2] = max(stats[2], value)
+            stats[3] += 1
+        if self.on_sample is not None:
+            self.on_sample(sample)
+        return sample
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return ``{metric: {"min", "mean", "max", "count"}}`` over all samples."""
+        return {
+            name: {
+                "min": minimum,
+                "mean": total / count,
+                "max": maximum,
+                "count": count,
+            }
+            for name, (minimum, total, maximum, count) in self._stats.items()
+        }
+
+
+@contextmanager
+def monitor_resources(
+    config: ResourceMonitorConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[ResourceMonitor | None]:
+    """Sample system resources in the background while the block runs.
+
+    Every rank appends its samples to ``<run_dir>/<output_subdir>/rank<N>.jsonl``
+    and writes a min/mean/max summary on exit, which is also logged and, with
+    ``log_to_trackers``, sent to the Accelerate trackers of the main process.
+
+    Args:
+        config: The ``resources`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The running ``ResourceMonitor`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    output_dir: Path = get_run_dir() / config.output_subdir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rank: int = accelerator.process_index
+    start_time: float = time.monotonic()
+
+    with (output_dir / SAMPLES_FILE_PATTERN.format(rank=rank)).open("a") as samples:
+
+        def record(sample: dict[str, float]) -> None:
+            elapsed: float = time.monotonic() - start_time
+            samples.write(json.dumps({"elapsed_s": elapsed, **sample}) + "\n")
+            samples.flush()
+            if config.log_to_trackers and accelerator.trackers:
+                # Attach to the user's next W&B step instead of advancing it
+                accelerator.log(sample, log_kwargs={"wandb": {"commit": False}})
+
+        monitor = ResourceMonitor(
+            interval=config.interval,
+            device=accelerator.device,
+            on_sample=record,
+        )
+        monitor.start()
+        try:
+            yield monitor
+        finally:
+            monitor.stop()
+
+    summary: dict[str, dict[str, float]] = monitor.summary()
+    (output_dir / SUMMARY_FILE_PATTERN.format(rank=rank)).write_text(
+        json.dumps(summary, indent=2),
+    )
+    for name, stats in sorted(summary.items()):
+        logger.info(
+            "%s: min=%.2f mean=%.2f max=%.2f",
+            name,
+            stats["min"],
+            stats["mean"],
+            stats["max"],
+        )
+    if config.log_to_trackers and accelerator.trackers:
+        accelerator.log(
+            {
+                f"{name}/{statistic}": stats[statistic]
+                for name, stats in summary.items()
+                for statistic in ("min", "mean", "max")
+            },
+            log_kwargs={"wandb": {"commit": False}},
+        )
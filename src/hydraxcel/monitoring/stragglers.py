@@ -0,0 +1,259 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cross-rank straggler detection from per-rank step times.
+
+Every rank times its steps between ``hydraxcel.mark_step()`` calls.  Once every
+``interval`` steps the window mean and max are exchanged in a single small
+all-gather, and the main process computes the skew across ranks: which rank
+(and host) is slowest, by how much it exceeds the median, and the spread
+between the fastest and slowest rank.  Reports are logged, forwarded to the
+trackers, and escalated to a warning past a threshold.
+"""
+
+import logging
+import socket
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Callable, Generator
+
+import torch
+import torch.distributed as dist
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel.monitoring.config_registry import StragglerConfig  # noqa: TC001
+from hydraxcel.run.hooks import register_step_hook
+
+__all__ = [
+    "StragglerDetector",
+    "detect_stragglers",
+    "summarise_step_times",
+]
+
+METRIC_PREFIX: str = "stragglers/"
+
+logger = logging.getLogger("stragglers")
+
+
+def _distributed() -> bool:
+    return dist.is_available() and dist.is_initialized()
+
+
+def summarise_step_times(
+    step_times: list[float],
+    hosts: list[str],
+) -> dict[str, float | int | str]:
+    """Compute skew statistics from the mean step time of every rank.
+
+    Args:
+        step_times: Mean step time in seconds, indexed by rank.
+        hosts: Host name of every rank, indexed by rank.
+
+    Returns:
+        The slowest and fastest rank, the slowest host, their step times and
+        the median in milliseconds, the slowest-to-fastest spread, and the
+        percentage by which the slowest rank exceeds the median.
+
+    """
+    slowest_rank: int = max(range(len(step_times)), key=step_times.__getitem__)
+    fastest_rank: int = min(range(len(step_times)), key=step_times.__getitem__)
+    median: float = statistics.median(step_times)
+    return {
+        "slowest_rank": slowest_rank,
+        "slowest_host": hosts[slowest_rank],
+        "slowest_step_ms": step_times[slowest_rank] * 1000,
+        "fastest_rank": fastest_rank,
+        "fastest_step_ms": step_times[fastest_rank] * 1000,
+        "median_step_ms": median * 1000,
+        "spread_ms": (step_times[slowest_rank] - step_times[fastest_rank]) * 1000,
+        "skew_percent": (
+            (step_times[slowest_rank] - median) / median * 100 if median > 0 else 0.0
+        ),
+    }
+
+
+class StragglerDetector:
+    """Time steps locally and compare them across ranks every few steps."""
+
+    def __init__(
+        self,
+        *,
+        interval: int,
+        warn_threshold: float = 20.0,
+        device: torch.device | None = None,
+        on_report: Callable[[dict[str, float | int | str], list[float]], None]
+        | None = None,
+    ) -> None:
+        """Initialise the detector; the first step is timed from construction.
+
+        Args:
+            interval: Number of steps between exchanges of the step times.
+            warn_threshold: Percentage by which the slowest rank may exceed the
+                median step time before a warning is logged.
+            device: Device of the exchanged tensor; must suit the process group
+                backend (e.g. the CUDA device for NCCL).  Defaults to CPU.
+            on_report: Callback invoked on rank 0 with the skew summary and the
+                mean step time of every rank in seconds.
+
+        Raises:
+            ValueError: If *interval* is not positive.
+
+        """
+        if interval < 1:
+            msg = "interval must be >= 1"
+            raise ValueError(msg)
+        self.interval: int = interval
+        self.warn_threshold: float = warn_threshold
+        self.device: torch.device = device or torch.device("cpu")
+        self.on_report = on_report
+        self.rank: int = dist.get_rank() if _distributed() else 0
+        self.num_steps: int = 0
+        self.last_report: dict[str, float | int | str] | None = None
+
+        self._hosts: list[str] | None = None
+        self._window: list[float] = []
+        self._last_step: float = time.perf_counter()
+
+    def step(self) -> None:
+        """Record the time since the previous step; exchange every ``interval``."""
+        now: float = time.perf_counter()
+        self._window.append(now - self._last_step)
+        self.num_steps += 1
+        if len(self._window) >= self.interval:
+            self._exchange()
+            # Keep the exchange itself out of the next step's time
+            now = time.perf_counter()
+        self._last_step = now
+
+    def _gather_hosts(self) -> list[str]:
+        if not _distributed():
+            return [socket.gethostname()]
+        hosts: list[str | None] = [None] * dist.get_world_size()
+        dist.all_gather_object(hosts, socket.gethostname())
+        return [str(host) for host in hosts]
+
+    def _exchange(self) -> None:
+        """All-gather the window statistics and report on rank 0."""
+        local = torch.tensor(
+            [statistics.fmean(self._window), max(self._window)],
+            dtype=torch.float64,
+            device=self.device,
+        )
+        self._window.clear()
+        if _distributed():
+            gathered: list[torch.Tensor] = [
+                torch.empty_like(local) for _ in range(dist.get_world_size())
+            ]
+            dist.all_gather(gathered, local)
+        else:
+            gathered = [local]
+        if self._hosts is None:
+            self._hosts = self._gather_hosts()
+        if self.rank != 0:
+            return
+
+        step_times: list[float] = [float(times[0]) for times in gathered]
+        report: dict[str, float | int | str] = summarise_step_times(
+            step_times,
+            self._hosts,
+        )
+        report["max_step_ms"] = max(float(times[1]) for times in gathered) * 1000
+        self.last_report = report
+        log = (
+            logger.warning
+            if report["skew_percent"] > self.warn_threshold  # ty:ignore[unsupported-operator]
+            else logger.info
+        )
+        log(
+            "Steps %d-%d: rank %d on %s is slowest at %.1f ms/step, %.1f%% above "
+            "the median of %.1f ms (fastest: rank %d at %.1f ms)",
+            self.num_steps - self.interval + 1,
+            self.num_steps,
+            report["slowest_rank"],
+            report["slowest_host"],
+            report["slowest_step_ms"],
+            report["skew_percent"],
+            report["median_step_ms"],
+            report["fastest_rank"],
+            report["fastest_step_ms"],
+        )
+        if self.on_report is not None:
+            self.on_report(report, step_times)
+
+
+@contextmanager
+def detect_stragglers(
+    config: StragglerConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[StragglerDetector | None]:
+    """Compare step times across ranks for the duration of the enclosed block.
+
+    Steps are counted via ``hydraxcel.mark_step()``, which every rank must call
+    equally often since the exchange is a collective.  Numeric report fields
+    (and, with ``log_per_rank``, every rank's mean step time) are sent to the
+    Accelerate trackers under ``stragglers/``.
+
+    Args:
+        config: The ``stragglers`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The ``StragglerDetector`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    def log_report(
+        report: dict[str, float | int | str],
+        step_times: list[float],
+    ) -> None:
+        if not (config.log_to_trackers and accelerator.trackers):
+            return
+        metrics: dict[str, float] = {
+            f"{METRIC_PREFIX}{name}": value
+            for name, value in report.items()
+            if not isinstance(value, str)
+        }
+        if config.log_per_rank:
+            metrics.update(
+                {
+                    f"{METRIC_PREFIX}rank{rank}_step_ms": step_time * 1000
+                    for rank, step_time in enumerate(step_times)
+                },
+            )
+        # Attach to the user's next W&B step instead of advancing it
+        accelerator.log(metrics, log_kwargs={"wandb": {"commit": False}})
+
+    detector = StragglerDetector(
+        interval=config.interval,
+        warn_threshold=config.warn_threshold,
+        device=accelerator.device,
+        on_report=log_report,
+    )
+    remove_hook = register_step_hook(detector.step)
+    try:
+        yield detector
+    finally:
+        remove_hook()
@@ -0,0 +1,234 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Hang and stall watchdog with all-thread stack dumps.
+
+The training loop "pets" the watchdog on every step (via
+``hydraxcel.mark_step()`` or, optionally, every ``accelerator.log`` call).  If
+no progress is seen within the timeout, a daemon thread dumps ``faulthandler``
+tracebacks of every thread into the run directory, logs a CRITICAL record, and
+optionally kills the process group so the scheduler can reschedule the job.
+Every rank runs its own watchdog, so a stuck collective produces a dump per
+rank.
+"""
+
+import faulthandler
+import logging
+import os
+import signal
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path  # noqa: TC003
+from typing import Any, Callable, Generator
+
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.monitoring.config_registry import WatchdogConfig  # noqa: TC001
+from hydraxcel.run.hooks import register_step_hook
+
+__all__ = ["Watchdog", "watch_progress"]
+
+STALL_FILE_PATTERN: str = "stall_rank{rank}_{index:03d}.txt"
+
+logger = logging.getLogger("watchdog")
+
+
+class Watchdog:
+    """Report stalls when ``pet`` is not called within a timeout."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        output_dir: Path,
+        *,
+        timeout: float,
+        rank: int = 0,
+        first_step_timeout: float | None = None,
+        check_interval: float | None = None,
+        on_stall: Callable[[float], None] | None = None,
+    ) -> None:
+        """Initialise the watchdog; the timer starts with ``start``.
+
+        Args:
+            output_dir: Directory into which stack dumps are written.
+            timeout: Seconds without a ``pet`` before a stall is reported.
+            rank: Process rank used in file names and log records.
+            first_step_timeout: Timeout before the first ``pet`` (e.g. to allow
+                for compilation); defaults to *timeout*.
+            check_interval: Seconds between checks; defaults to a tenth of the
+                timeout, capped at ten seconds.
+            on_stall: Callback receiving the idle time after a stall is dumped.
+
+        Raises:
+            ValueError: If *timeout* is not positive.
+
+        """
+        if timeout <= 0:
+            msg = "timeout must be > 0"
+            raise ValueError(msg)
+        self.output_dir: Path = output_dir
+        self.timeout: float = timeout
+        self.first_step_timeout: float = first_step_timeout or timeout
+        self.check_interval: float = check_interval or min(timeout / 10, 10.0)
+        self.rank: int = rank
+        self.on_stall = on_stall
+        self.num_pets: int = 0
+        self.num_stalls: int = 0
+
+        self._last_pet: float = time.monotonic()
+        self._stall_reported: bool = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def pet(self) -> None:
+        """Record progress; cheap enough to call on every step."""
+        self._last_pet = time.monotonic()
+        self._stall_reported = False
+        self.num_pets += 1
+
+    def start(self) -> None:
+        """Start the monitoring thread and reset the timer."""
+        if self._thread is not None:
+            return
+        self._last_pet = time.monotonic()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="hydraxcel-watchdog",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the monitoring thread and wait for it to exit."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.check_interval):
+            idle: float = time.monotonic() - self._last_pet
+            limit: float = self.timeout if self.num_pets else self.first_step_timeout
+            if idle >= limit and not self._stall_reported:
+                self._stall_reported = True
+                self._report_stall(idle)
+
+    def _report_stall(self, idle: float) -> None:
+        """Dump all thread stacks, log a CRITICAL record and run ``on_stall``."""
+        self.num_stalls += 1
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        dump_path: Path = self.output_dir / STALL_FILE_PATTERN.format(
+            rank=self.rank,
+            index=self.num_stalls,
+        )
+        with dump_path.open("w") as dump_file:
+            dump_file.write(
+                f"Rank {self.rank} (pid {os.getpid()}) made no progress for "
+                f"{idle:.1f}s after {self.num_pets} steps.\n\n",
+            )
+            dump_file.flush()
+            faulthandler.dump_traceback(file=dump_file, all_threads=True)
+        logger.critical(
+            "Rank %d made no progress for %.1fs after %d steps; stack dump: %s",
+            self.rank,
+            idle,
+            self.num_pets,
+            dump_path,
+        )
+        if self.on_stall is not None:
+            self.on_stall(idle)
+
+
+@contextmanager
+def watch_progress(
+    config: WatchdogConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[Watchdog | None]:
+    """Run a stall watchdog for the duration of the enclosed block.
+
+    The watchdog is petted by ``hydraxcel.mark_step()`` and, with
+    ``pet_on_log``, by every ``accelerator.log`` call of the main thread.  With
+    ``kill_process_group`` the whole process group receives ``kill_signal``
+    after the stall has been dumped and logged, followed by ``SIGKILL`` if it
+    is still alive ``kill_grace_period`` seconds later.  A handler for
+    ``kill_signal`` (e.g. preemption handling, which defers ``SIGTERM`` to the
+    next step) cannot keep a hung job alive that way.
+
+    Args:
+        config: The ``watchdog`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The running ``Watchdog`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    def kill_process_group(_idle: float) -> None:
+        kill_signal: signal.Signals = signal.Signals[config.kill_signal]
+        group: int = os.getpgid(0)
+        logger.critical("Sending %s to process group", kill_signal.name)
+        os.killpg(group, kill_signal)
+        if kill_signal == signal.SIGKILL:
+            return
+        time.sleep(config.kill_grace_period)
+        logger.critical(
+            "Process group survived %s for %.0fs; sending SIGKILL",
+            kill_signal.name,
+            config.kill_grace_period,
+        )
+        os.killpg(group, signal.SIGKILL)
+
+    watchdog = Watchdog(
+        get_run_dir() / config.output_subdir,
+        timeout=config.timeout,
+        rank=accelerator.process_index,
+        first_step_timeout=config.first_step_timeout,
+        check_interval=config.check_interval,
+        on_stall=kill_process_group if config.kill_process_group else None,
+    )
+    remove_hook = register_step_hook(watchdog.pet)
+    if config.pet_on_log:
+        log = accelerator.log
+
+        def log_and_pet(*args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+            # Background services (e.g. the resource monitor) also log; only
+            # the training thread's logging counts as progress
+            if threading.current_thread() is threading.main_thread():
+                watchdog.pet()
+            log(*args, **kwargs)
+
+        accelerator.log = log_and_pet
+
+    watchdog.start()
+    try:
+        yield watchdog
+    finally:
+        watchdog.stop()
+        remove_hook()
+        if config.pet_on_log:
+            del accelerator.log  # Restore the class method
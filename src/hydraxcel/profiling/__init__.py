@@ -0,0 +1,64 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Profiling package for HydraXcel.
+
+Exposes ``load_profile_configs`` for registering the ``profile`` and
+``sampler`` and ``memory`` config groups, plus ``profile_run``, ``sample_run``
+and ``diagnose_memory`` which ``hydraxcel_main`` uses to wrap the user main
+function in the PyTorch profiler, the built-in stack sampler and the memory
+diagnostics respectively.
+"""
+
+from hydraxcel.profiling.config_registry import (
+    MemoryDiagnosticsConfig,
+    ProfileConfig,
+    SamplerConfig,
+    load_profile_configs,
+)
+from hydraxcel.profiling.memory import MemoryDiagnostics, diagnose_memory
+from hydraxcel.profiling.sampling import (
+    StackSampler,
+    merge_folded_stacks,
+    render_flamegraph,
+    sample_run,
+)
+from hydraxcel.profiling.torch_profiler import (
+    build_profile_kwargs,
+    merge_chrome_traces,
+    profile_run,
+)
+
+__all__ = [
+    "MemoryDiagnostics",
+    "MemoryDiagnosticsConfig",
+    "ProfileConfig",
+    "SamplerConfig",
+    "StackSampler",
+    "build_profile_kwargs",
+    "diagnose_memory",
+    "load_profile_configs",
+    "merge_chrome_traces",
+    "merge_folded_stacks",
+    "profile_run",
+    "render_flamegraph",
+    "sample_run",
+]
@@ -0,0 +1,156 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Profiling configuration registry for Hydra config groups.
+
+Defines the structured-config dataclass for the PyTorch profiler and registers
+named variants in the ``profile`` Hydra config group via
+``load_profile_configs``.
+"""
+
+from dataclasses import dataclass, field
+
+from hydraxcel.hydra import config_store
+
+__all__ = [
+    "MemoryDiagnosticsConfig",
+    "ProfileConfig",
+    "SamplerConfig",
+    "load_profile_configs",
+]
+
+
+@dataclass
+class ProfileConfig:
+    """Torch Profiler Configuration."""
+
+    enabled: bool = True
+    activities: list[str] = field(default_factory=lambda: ["cpu"])  # cpu|cuda
+    skip_first: int = 0
+    wait: int = 1
+    warmup: int = 1
+    active: int = 3  # Set to 0 to profile the whole run without a schedule
+    repeat: int = 1
+    record_shapes: bool = False
+    profile_memory: bool = False
+    with_stack: bool = False
+    with_flops: bool = False
+    with_modules: bool = False
+    trace_format: str = "chrome"  # chrome|tensorboard
+    merge_traces: bool = False  # Merge per-rank traces into a single timeline
+    output_subdir: str = "profile"  # Relative to the Hydra run dir
+
+
+@dataclass
+class SamplerConfig:
+    """Sampling Profiler Configuration."""
+
+    enabled: bool = True
+    rate_hz: float = 100.0  # Keeps overhead well below 2% of a Python-bound loop
+    max_stacks: int = 10_000  # Bound on distinct stacks held in memory
+    max_depth: int = 128
+    all_threads: bool = False  # Sample every Python thread, not only the main one
+    dump_signal: str | None = "SIGUSR1"  # Write outputs when this signal arrives
+    merge_ranks: bool = False  # Merge per-rank folded stacks on the main process
+    output_subdir: str = "sampling"  # Relative to the Hydra run dir
+
+
+@dataclass
+class MemoryDiagnosticsConfig:
+    """Memory Diagnostics Configuration."""
+
+    enabled: bool = True
+    interval: float = 600.0  # Seconds between periodic captures; 0 disables them
+    check_interval: float = 5.0  # Seconds between RSS threshold checks
+    rss_threshold_mb: float | None = None  # Capture once RSS exceeds this value
+    top_n: int = 25  # Allocation sites listed per tracemalloc diff
+    tracemalloc_frames: int = 1  # Deeper tracebacks cost more overhead
+    cuda_history: bool = True  # Record allocator stack traces for CUDA snapshots
+    cuda_max_entries: int = 100_000
+    capture_signal: str | None = "SIGUSR2"  # Capture when this signal arrives
+    max_total_mb: float = 512.0  # Per rank; oldest captures are deleted beyond it
+    output_subdir: str = "memory"  # Relative to the Hydra run dir
+
+
+def load_profile_configs() -> None:
+    """Register all built-in profiler config variants into the Hydra config store.
+
+    Stores the ``profile`` (torch profiler), ``sampler`` (stack sampling
+    profiler) and ``memory`` (memory diagnostics) group variants so they can be
+    selected via Hydra's config composition (e.g. ``+profile=cpu`` or
+    ``+memory=leak`` on the command line, or ``- profile: gpu`` in a defaults
+    list).
+    """
+    config_store.store(
+        name="none",
+        group="profile",
+        node=ProfileConfig(enabled=False),
+    )
+    config_store.store(
+        name="cpu",
+        group="profile",
+        node=ProfileConfig(),
+    )
+    config_store.store(
+        name="gpu",
+        group="profile",
+        node=ProfileConfig(activities=["cpu", "cuda"]),
+    )
+    config_store.store(
+        name="memory",
+        group="profile",
+        node=ProfileConfig(
+            activities=["cpu", "cuda"],
+            record_shapes=True,
+            profile_memory=True,
+            with_stack=True,
+        ),
+    )
+    config_store.store(
+        name="none",
+        group="sampler",
+        node=SamplerConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="sampler",
+        node=SamplerConfig(),
+    )
+    config_store.store(
+        name="all-threads",
+        group="sampler",
+        node=SamplerConfig(all_threads=True),
+    )
+    config_store.store(
+        name="none",
+        group="memory",
+        node=MemoryDiagnosticsConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="memory",
+        node=MemoryDiagnosticsConfig(),
+    )
+    config_store.store(
+        name="leak",
+        group="memory",
+        node=MemoryDiagnosticsConfig(interval=300.0, tracemalloc_frames=8),
+    )
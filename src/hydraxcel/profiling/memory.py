@@ -0,0 +1,308 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Memory diagnostics: tracemalloc diffs and CUDA allocator snapshots.
+
+``MemoryDiagnostics`` periodically writes the top-N ``tracemalloc`` allocation
+diffs and, when CUDA is available, ``torch.cuda.memory._snapshot()`` dumps
+(viewable at https://pytorch.org/memory_viz).  Captures are also triggered
+when the process RSS crosses a threshold, when ``SIGUSR2`` arrives, and from
+the ``setup_exception_logging`` hook on out-of-memory errors.  Snapshot files
+are rotated so the output directory stays below a size cap.
+"""
+
+import logging
+import pickle
+import signal
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path  # noqa: TC003
+from typing import Generator
+
+import torch
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.logging import register_exception_handler
+from hydraxcel.monitoring import read_resource_counters
+from hydraxcel.profiling.config_registry import MemoryDiagnosticsConfig  # noqa: TC001
+
+__all__ = [
+    "MemoryDiagnostics",
+    "diagnose_memory",
+]
+
+_OUT_OF_MEMORY_ERRORS: tuple[type[BaseException], ...] = (
+    MemoryError,
+    torch.OutOfMemoryError,
+)
+
+logger = logging.getLogger("memory")
+
+
+class MemoryDiagnostics:
+    """Capture tracemalloc diffs and CUDA memory snapshots into a directory."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        output_dir: Path,
+        *,
+        rank: int = 0,
+        top_n: int = 25,
+        tracemalloc_frames: int = 1,
+        cuda_history: bool = True,
+        cuda_max_entries: int = 100_000,
+        max_total_mb: float = 512.0,
+    ) -> None:
+        """Initialise the diagnostics; nothing is traced until ``start``.
+
+        Args:
+            output_dir: Directory into which captures are written.
+            rank: Process rank used in the file names.
+            top_n: Number of allocation sites listed per tracemalloc diff.
+            tracemalloc_frames: Traceback depth stored per allocation; deeper
+                tracebacks are more informative but slower.
+            cuda_history: Record CUDA allocator history (with stack traces) so
+                that CUDA snapshots show where memory was allocated.
+            cuda_max_entries: Number of allocator events kept in the history.
+            max_total_mb: Size cap for this rank's captures; the oldest are
+                deleted.
+
+        """
+        self.output_dir: Path = output_dir
+        self.rank: int = rank
+        self.top_n: int = top_n
+        self.tracemalloc_frames: int = tracemalloc_frames
+        self.cuda_history: bool = cuda_history and torch.cuda.is_available()
+        self.cuda_max_entries: int = cuda_max_entries
+        self.max_total_bytes: int = int(max_total_mb * 1024 * 1024)
+        self.num_captures: int = 0
+
+        self._lock = threading.RLock()  # Re-entrant for signal-triggered captures
+        self._previous_snapshot: tracemalloc.Snapshot | None = None
+        self._started_tracemalloc: bool = False
+
+    def start(self) -> None:
+        """Start tracemalloc (and CUDA history recording) and take a baseline."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+            self._started_tracemalloc = True
+        self._previous_snapshot = tracemalloc.take_snapshot()
+        if self.cuda_history:
+            torch.cuda.memory._record_memory_history(  # noqa: SLF001 # Documented snapshot API
+                max_entries=self.cuda_max_entries,
+            )
+
+    def stop(self) -> None:
+        """Stop tracing started by this instance."""
+        if self.cuda_history:
+            torch.cuda.memory._record_memory_history(enabled=None)  # noqa: SLF001 # Documented snapshot API
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._previous_snapshot = None
+
+    def capture(self, reason: str) -> list[Path]:
+        """Write a tracemalloc diff and a CUDA snapshot (if available) now.
+
+        Args:
+            reason: Short label included in the file names (e.g. ``"periodic"``).
+
+        Returns:
+            The paths of the files written by this capture.
+
+        """
+        with self._lock:
+            self.num_captures += 1
+            stem: str = f"rank{self.rank}_{self.num_captures:04d}_{reason}"
+            written: list[Path] = []
+            if tracemalloc.is_tracing():
+                written.append(self._write_tracemalloc_diff(stem, reason))
+            if torch.cuda.is_available():
+                written.append(self._write_cuda_snapshot(stem))
+            self._rotate(keep=stem)
+        logger.info("Captured memory diagnostics (%s): %s", reason, written)
+        return written
+
+    def _write_tracemalloc_diff(self, stem: str, reason: str) -> Path:
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(
+                    inclusive=False,
+                    filename_pattern=tracemalloc.__file__,
+                ),
+            ),
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        lines: list[str] = [
+            f"reason: {reason}",
+            f"traced: {current / 2**20:.1f} MiB (peak {peak / 2**20:.1f} MiB)",
+            f"top {self.top_n} allocation sites by size change since last capture:",
+        ]
+        if self._previous_snapshot is not None:
+            statistics = snapshot.compare_to(self._previous_snapshot, "lineno")
+        else:
+            statistics = snapshot.statistics("lineno")
+        lines.extend(str(statistic) for statistic in statistics[: self.top_n])
+        self._previous_snapshot = snapshot
+
+        path: Path = self.output_dir / f"{stem}_tracemalloc.txt"
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    def _write_cuda_snapshot(self, stem: str) -> Path:
+        path: Path = self.output_dir / f"{stem}_cuda.pickle"
+        with path.open("wb") as snapshot_file:
+            pickle.dump(torch.cuda.memory._snapshot(), snapshot_file)  # noqa: SLF001 # Documented snapshot API
+        return path
+
+    def _rotate(self, keep: str) -> None:
+        """Delete this rank's oldest captures until they are below the size cap.
+
+        Every rank writes into the same directory, so only files of this rank
+        are counted and deleted.  Files of the capture named *keep* (the
+        latest one) are never deleted.
+        """
+        files: list[tuple[float, Path, int]] = []
+        for path in self.output_dir.glob(f"rank{self.rank}_*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # Removed since the listing
+                continue
+            files.append((stat.st_mtime, path, stat.st_size))
+        total: int = sum(size for _mtime, _path, size in files)
+        captures: list[tuple[float, Path, int]] = sorted(
+            (file for file in files if not file[1].name.startswith(keep)),
+        )
+        while captures and total > self.max_total_bytes:
+            _mtime, oldest, size = captures.pop(0)
+            total -= size
+            oldest.unlink(missing_ok=True)
+
+
+def _watch_memory(
+    diagnostics: MemoryDiagnostics,
+    config: MemoryDiagnosticsConfig | DictConfig,
+    stop_event: threading.Event,
+) -> None:
+    """Trigger periodic and RSS-threshold captures until *stop_event* is set."""
+    armed: bool = True
+    last_periodic: float = time.monotonic()
+    while not stop_event.wait(config.check_interval):
+        elapsed: float = time.monotonic() - last_periodic
+        if config.interval > 0 and elapsed >= config.interval:
+            last_periodic = time.monotonic()
+            diagnostics.capture("periodic")
+        if config.rss_threshold_mb is None:
+            continue
+        rss_mb: float = read_resource_counters().get("rss_mb", 0.0)
+        if armed and rss_mb >= config.rss_threshold_mb:
+            logger.warning("RSS %.0f MiB exceeded the threshold", rss_mb)
+            diagnostics.capture("rss-threshold")
+        armed = rss_mb < config.rss_threshold_mb
+
+
+@contextmanager
+def diagnose_memory(
+    config: MemoryDiagnosticsConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[MemoryDiagnostics | None]:
+    """Run memory diagnostics for the duration of the enclosed block.
+
+    A background thread writes a capture every ``interval`` seconds and
+    whenever RSS exceeds ``rss_threshold_mb`` (re-arming once it drops below).
+    ``capture_signal`` triggers an on-demand capture.  If the block raises an
+    out-of-memory error, tracing stays active so the ``setup_exception_logging``
+    hook can capture the failing state before the error is logged.
+
+    Args:
+        config: The ``memory`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The active ``MemoryDiagnostics`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    diagnostics = MemoryDiagnostics(
+        get_run_dir() / config.output_subdir,
+        rank=accelerator.process_index,
+        top_n=config.top_n,
+        tracemalloc_frames=config.tracemalloc_frames,
+        cuda_history=config.cuda_history,
+        cuda_max_entries=config.cuda_max_entries,
+        max_total_mb=config.max_total_mb,
+    )
+    stop_event = threading.Event()
+
+    def handle_out_of_memory(_exception: BaseException) -> None:
+        remove_exception_handler()
+        diagnostics.capture("out-of-memory")
+        diagnostics.stop()
+
+    capture_signal: signal.Signals | None = (
+        signal.Signals[config.capture_signal] if config.capture_signal else None
+    )
+    # Signal handlers can only be installed from the main thread
+    install_handler: bool = (
+        capture_signal is not None
+        and threading.current_thread() is threading.main_thread()
+    )
+    previous_handler = (
+        signal.signal(capture_signal, lambda *_: diagnostics.capture("signal"))
+        if install_handler
+        else None
+    )
+
+    diagnostics.start()
+    remove_exception_handler = register_exception_handler(
+        _OUT_OF_MEMORY_ERRORS,
+        handle_out_of_memory,
+    )
+    watcher = threading.Thread(
+        target=_watch_memory,
+        args=(diagnostics, config, stop_event),
+        name="hydraxcel-memory",
+        daemon=True,
+    )
+    watcher.start()
+    out_of_memory: bool = False
+    try:
+        yield diagnostics
+    except _OUT_OF_MEMORY_ERRORS:
+        # Keep tracing so the exception hook captures the failing state
+        out_of_memory = True
+        raise
+    finally:
+        stop_event.set()
+        watcher.join()
+        if install_handler:
+            signal.signal(capture_signal, previous_handler)
+        if not out_of_memory:
+            remove_exception_handler()
+            diagnostics.stop()
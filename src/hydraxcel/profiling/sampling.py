@@ -0,0 +1,401 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Low-overhead sampling profiler producing folded stacks and flamegraphs.
+
+A daemon thread periodically samples Python stacks via ``sys._current_frames``
+and aggregates them as collapsed (folded) stacks in a bounded in-memory table.
+Results are written per rank into the run directory as a ``.folded`` file
+(compatible with ``flamegraph.pl`` and speedscope) and a self-contained SVG
+flamegraph, either on exit or whenever the dump signal is received.
+"""
+
+import hashlib
+import html
+import logging
+import signal
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType  # noqa: TC003
+from typing import Generator, Mapping
+
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.profiling.config_registry import SamplerConfig  # noqa: TC001
+
+__all__ = [
+    "StackSampler",
+    "merge_folded_stacks",
+    "read_folded_stacks",
+    "render_flamegraph",
+    "sample_run",
+    "write_folded_stacks",
+]
+
+TRUNCATED_STACK: str = "[truncated]"
+FOLDED_FILE_PATTERN: str = "stacks_rank{rank}.folded"
+FLAMEGRAPH_FILE_PATTERN: str = "flamegraph_rank{rank}.svg"
+MERGED_STEM: str = "merged"
+
+logger = logging.getLogger("profiler")
+
+
+class StackSampler:
+    """Sample Python stacks on a timer thread and aggregate them as folded stacks."""
+
+    def __init__(
+        self,
+        *,
+        rate_hz: float = 100.0,
+        max_stacks: int = 10_000,
+        max_depth: int = 128,
+        all_threads: bool = False,
+    ) -> None:
+        """Initialise the sampler.
+
+        Args:
+            rate_hz: Sampling frequency in samples per second.
+            max_stacks: Maximum number of distinct stacks kept in memory; any
+                further new stack is counted under ``[truncated]``.
+            max_depth: Maximum number of frames recorded per stack (innermost
+                frames are kept).
+            all_threads: Sample every Python thread instead of only the main
+                thread.
+
+        Raises:
+            ValueError: If *rate_hz*, *max_stacks* or *max_depth* are not positive.
+
+        """
+        if rate_hz <= 0 or max_stacks < 1 or max_depth < 1:
+            msg = "rate_hz, max_stacks and max_depth must be positive"
+            raise ValueError(msg)
+        self.interval: float = 1.0 / rate_hz
+        self.max_stacks: int = max_stacks
+        self.max_depth: int = max_depth
+        self.all_threads: bool = all_threads
+        self.num_samples: int = 0
+
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_names: dict[int, str] = {}
+        self._frame_labels: dict[object, str] = {}
+
+    def start(self) -> None:
+        """Start the background sampling thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="hydraxcel-stack-sampler",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background sampling thread and wait for it to exit."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record one sample of the monitored threads' current stacks."""
+        frames: dict[int, FrameType] = sys._current_frames()  # noqa: SLF001 # Only public API for other threads' frames
+        own_id: int = threading.get_ident()
+        main_id: int | None = threading.main_thread().ident
+        stacks: list[str] = []
+        for thread_id, frame in frames.items():
+            if thread_id == own_id:
+                continue
+            if not self.all_threads and thread_id != main_id:
+                continue
+            stacks.append(self._collapse(thread_id, frame))
+
+        with self._lock:
+            for stack in stacks:
+                if stack not in self._counts and len(self._counts) >= self.max_stacks:
+                    stack = TRUNCATED_STACK  # noqa: PLW2901
+                self._counts[stack] += 1
+            self.num_samples += 1
+
+    def _collapse(self, thread_id: int, frame: FrameType | None) -> str:
+        labels: list[str] = []
+        while frame is not None and len(labels) < self.max_depth:
+            code = frame.f_code
+            label: str | None = self._frame_labels.get(code)
+            if label is None:
+                file_name: str = Path(code.co_filename).name
+                label = f"{code.co_name} ({file_name}:{code.co_firstlineno})"
+                label = label.replace(";", ":")  # ';' separates folded frames
+                self._frame_labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        labels.append(self._thread_name(thread_id))
+        return ";".join(reversed(labels))
+
+    def _thread_name(self, thread_id: int) -> str:
+        name: str | None = self._thread_names.get(thread_id)
+        if name is None:
+            self._thread_names = {
+                thread.ident: thread.name
+                for thread in threading.enumerate()
+                if thread.ident is not None
+            }
+            name = self._thread_names.get(thread_id, f"thread-{thread_id}")
+        return name
+
+    def snapshot(self) -> dict[str, int]:
+        """Return a copy of the aggregated folded stacks and their sample counts."""
+        with self._lock:
+            return dict(self._counts)
+
+    def write(self, output_dir: Path, rank: int = 0) -> tuple[Path, Path]:
+        """Write the folded stacks and an SVG flamegraph for *rank*.
+
+        Args:
+            output_dir: Directory into which the files are written.
+            rank: Process rank used in the file names.
+
+        Returns:
+            The paths of the folded-stack file and the SVG flamegraph.
+
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stacks: dict[str, int] = self.snapshot()
+        folded_path: Path = output_dir / FOLDED_FILE_PATTERN.format(rank=rank)
+        svg_path: Path = output_dir / FLAMEGRAPH_FILE_PATTERN.format(rank=rank)
+        write_folded_stacks(stacks, folded_path)
+        svg_path.write_text(render_flamegraph(stacks, title=f"Rank {rank}"))
+        return folded_path, svg_path
+
+
+def write_folded_stacks(stacks: Mapping[str, int], path: Path) -> Path:
+    """Write *stacks* to *path* in the ``frame;frame;frame count`` format."""
+    lines: list[str] = [
+        f"{stack} {count}"
+        for stack, count in sorted(stacks.items(), key=lambda item: -item[1])
+    ]
+    path.write_text("\n".join(lines) + ("\n" if lines else ""))
+    return path
+
+
+def read_folded_stacks(path: Path) -> dict[str, int]:
+    """Read a folded-stack file back into a ``{stack: count}`` mapping."""
+    stacks: Counter[str] = Counter()
+    for line in path.read_text().splitlines():
+        stack, _, count = line.rpartition(" ")
+        if stack and count.isdigit():
+            stacks[stack] += int(count)
+    return dict(stacks)
+
+
+def merge_folded_stacks(
+    paths: list[Path],
+    *,
+    prefix_with_file: bool = False,
+) -> dict[str, int]:
+    """Merge several folded-stack files (e.g. one per rank) by summing counts.
+
+    Args:
+        paths: Folded-stack files to merge.
+        prefix_with_file: When ``True`` each stack gets its file stem as root
+            frame so that ranks stay distinguishable in the merged flamegraph.
+
+    Returns:
+        The merged ``{stack: count}`` mapping.
+
+    """
+    merged: Counter[str] = Counter()
+    for path in sorted(paths):
+        for stack, count in read_folded_stacks(path).items():
+            merged[f"{path.stem};{stack}" if prefix_with_file else stack] += count
+    return dict(merged)
+
+
+def _frame_colour(name: str) -> str:
+    """Return a deterministic warm colour for a frame name."""
+    digest: bytes = hashlib.md5(name.encode(), usedforsecurity=False).digest()
+    return f"rgb({205 + digest[0] % 50},{digest[1] % 180},{digest[2] % 55})"
+
+
+def render_flamegraph(
+    stacks: Mapping[str, int],
+    *,
+    title: str = "Flamegraph",
+    width: int = 1200,
+    frame_height: int = 16,
+) -> str:
+    """Render folded stacks as a self-contained SVG flamegraph.
+
+    Args:
+        stacks: ``{folded_stack: count}`` mapping.
+        title: Title drawn at the top of the image.
+        width: Image width in pixels.
+        frame_height: Height of one stack frame in pixels.
+
+    Returns:
+        The SVG document as a string.
+
+    """
+    tree: dict = {"count": 0, "children": {}}
+    max_depth: int = 0
+    for stack, count in stacks.items():
+        frames: list[str] = stack.split(";")
+        max_depth = max(max_depth, len(frames))
+        node = tree
+        node["count"] += count
+        for frame_name in frames:
+            node = node["children"].setdefault(
+                frame_name,
+                {"count": 0, "children": {}},
+            )
+            node["count"] += count
+
+    header_height: int = 2 * frame_height
+    height: int = header_height + (max_depth + 1) * frame_height
+    total: int = max(tree["count"], 1)
+    char_width: float = 0.6 * (frame_height - 4)
+    elements: list[str] = [
+        (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+            f'height="{height}" font-family="monospace" font-size="{frame_height - 4}">'
+        ),
+        f'<rect width="{width}" height="{height}" fill="#fafafa"/>',
+        (
+            f'<text x="{width / 2}" y="{frame_height}" text-anchor="middle">'
+            f"{html.escape(title)} ({tree['count']} samples)</text>"
+        ),
+    ]
+
+    pending: list[tuple[str, dict, float, int]] = [
+        (name, child, 0.0, 0) for name, child in tree["children"].items()
+    ]
+    while pending:
+        name, node, x, depth = pending.pop()
+        frame_width: float = width * node["count"] / total
+        if frame_width < 0.1:  # noqa: PLR2004 # Sub-pixel frames are invisible
+            continue
+        y: int = height - (depth + 1) * frame_height
+        label: str = html.escape(name)
+        percentage: float = 100 * node["count"] / total
+        elements.append(
+            f"<g><title>{label} ({node['count']} samples, {percentage:.2f}%)</title>"
+            f'<rect x="{x:.2f}" y="{y}" width="{frame_width:.2f}" '
+            f'height="{frame_height - 1}" fill="{_frame_colour(name)}" rx="2"/>',
+        )
+        max_chars: int = int(frame_width / char_width) - 1
+        if max_chars >= 3:  # noqa: PLR2004 # Too narrow for a readable label
+            text: str = name if len(name) <= max_chars else f"{name[: max_chars - 2]}.."
+            elements.append(
+                f'<text x="{x + 3:.2f}" y="{y + frame_height - 4}">'
+                f"{html.escape(text)}</text>",
+            )
+        elements.append("</g>")
+        child_x: float = x
+        for child_name, child in node["children"].items():
+            pending.append((child_name, child, child_x, depth + 1))
+            child_x += width * child["count"] / total
+
+    elements.append("</svg>")
+    return "\n".join(elements)
+
+
+@contextmanager
+def sample_run(
+    config: SamplerConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[StackSampler | None]:
+    """Run the stack sampler around the enclosed block when enabled.
+
+    Outputs are written to ``<run_dir>/<output_subdir>`` on exit and each time
+    the configured dump signal (``SIGUSR1`` by default) is received.  With
+    ``merge_ranks`` the main process also writes a merged folded file and
+    flamegraph once every rank has finished.
+
+    Args:
+        config: The ``sampler`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The running ``StackSampler`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    output_dir: Path = get_run_dir() / config.output_subdir
+    rank: int = accelerator.process_index
+    sampler = StackSampler(
+        rate_hz=config.rate_hz,
+        max_stacks=config.max_stacks,
+        max_depth=config.max_depth,
+        all_threads=config.all_threads,
+    )
+
+    def dump(*_: object) -> None:
+        folded_path, _svg_path = sampler.write(output_dir, rank)
+        logger.info("Wrote %d stack samples to %s", sampler.num_samples, folded_path)
+
+    dump_signal: signal.Signals | None = (
+        signal.Signals[config.dump_signal] if config.dump_signal else None
+    )
+    # Signal handlers can only be installed from the main thread
+    install_handler: bool = (
+        dump_signal is not None
+        and threading.current_thread() is threading.main_thread()
+    )
+    previous_handler = signal.signal(dump_signal, dump) if install_handler else None
+
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        if install_handler:
+            signal.signal(dump_signal, previous_handler)
+        dump()
+
+    if not config.merge_ranks:
+        return
+    accelerator.wait_for_everyone()
+    if accelerator.is_main_process:
+        rank_files: list[Path] = list(
+            output_dir.glob(FOLDED_FILE_PATTERN.format(rank="*")),
+        )
+        merged: dict[str, int] = merge_folded_stacks(rank_files, prefix_with_file=True)
+        write_folded_stacks(merged, output_dir / f"stacks_{MERGED_STEM}.folded")
+        (output_dir / f"flamegraph_{MERGED_STEM}.svg").write_text(
+            render_flamegraph(merged, title="All ranks"),
+        )
@@ -0,0 +1,230 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""PyTorch profiler capture driven by the ``profile`` config group.
+
+Builds an Accelerate ``ProfileKwargs`` handler from a ``ProfileConfig``, wraps
+the user main function in ``Accelerator.profile`` and writes one trace file per
+rank into the Hydra run directory, optionally merging them into one timeline.
+"""
+
+import json
+import logging
+from contextlib import contextmanager
+from pathlib import Path  # noqa: TC003
+from typing import Any, Callable, Generator
+
+import torch
+from accelerate import Accelerator
+from accelerate.utils import ProfileKwargs
+from omegaconf import DictConfig
+from torch.profiler import profile, tensorboard_trace_handler
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.profiling.config_registry import ProfileConfig  # noqa: TC001
+from hydraxcel.run.hooks import register_step_hook
+
+__all__ = [
+    "MERGED_TRACE_NAME",
+    "build_profile_kwargs",
+    "merge_chrome_traces",
+    "profile_run",
+]
+
+TRACE_FILE_PATTERN: str = "trace_rank{rank}_step{step}.json"
+MERGED_TRACE_NAME: str = "merged_trace.json"
+_TRACE_FORMATS: set[str] = {"chrome", "tensorboard"}
+_RANK_PID_OFFSET: int = 1_000_000
+
+logger = logging.getLogger("profiler")
+
+
+def _available_activities(activities: list[str]) -> list[str]:
+    """Drop accelerator activities that cannot be profiled on this machine."""
+    available: list[str] = []
+    for activity in activities:
+        if activity == "cuda" and not torch.cuda.is_available():
+            logger.warning("CUDA profiling requested but CUDA is unavailable.")
+            continue
+        available.append(activity)
+    return available or ["cpu"]
+
+
+def _trace_handler(
+    trace_format: str,
+    output_dir: Path,
+    process_index: int,
+) -> Callable[[profile], None]:
+    """Return the ``on_trace_ready`` callback writing one trace per rank."""
+    if trace_format not in _TRACE_FORMATS:
+        msg = f"trace_format must be one of {_TRACE_FORMATS}, got {trace_format!r}"
+        raise ValueError(msg)
+
+    if trace_format == "tensorboard":
+        return tensorboard_trace_handler(
+            output_dir.as_posix(),
+            worker_name=f"rank{process_index}",
+        )
+
+    def export_chrome_trace(profiler: profile) -> None:
+        trace_path: Path = output_dir / TRACE_FILE_PATTERN.format(
+            rank=process_index,
+            step=profiler.step_num,
+        )
+        profiler.export_chrome_trace(trace_path.as_posix())
+        logger.info("Wrote profiler trace to %s", trace_path)
+
+    return export_chrome_trace
+
+
+def build_profile_kwargs(
+    config: ProfileConfig | DictConfig,
+    output_dir: Path,
+    process_index: int = 0,
+) -> ProfileKwargs:
+    """Translate a ``ProfileConfig`` into an Accelerate ``ProfileKwargs`` handler.
+
+    A positive ``active`` step count enables the wait/warmup/active schedule,
+    in which case the profiler only advances on ``mark_step``.  With
+    ``active=0`` the whole run is recorded and exported once at exit.
+
+    Args:
+        config: The ``profile`` node of the run configuration.
+        output_dir: Directory into which trace files are written.
+        process_index: Global rank used to name the trace files.
+
+    Returns:
+        A ``ProfileKwargs`` ready to pass to ``Accelerator.profile``.
+
+    Raises:
+        ValueError: If ``trace_format`` is not a supported format.
+
+    """
+    schedule_option: dict[str, int] | None = None
+    if config.active > 0:
+        schedule_option = {
+            "skip_first": config.skip_first,
+            "wait": config.wait,
+            "warmup": config.warmup,
+            "active": config.active,
+            "repeat": config.repeat,
+        }
+
+    return ProfileKwargs(
+        activities=_available_activities(list(config.activities)),  # ty:ignore[invalid-argument-type]
+        schedule_option=schedule_option,
+        on_trace_ready=_trace_handler(
+            config.trace_format,
+            output_dir,
+            process_index,
+        ),
+        record_shapes=config.record_shapes,
+        profile_memory=config.profile_memory,
+        with_stack=config.with_stack,
+        with_flops=config.with_flops,
+        with_modules=config.with_modules,
+    )
+
+
+def merge_chrome_traces(trace_files: list[Path], output_path: Path) -> Path:
+    """Merge several Chrome traces into a single timeline.
+
+    Every input file gets its own block of process ids so that ranks appear as
+    separate lanes, and process-name metadata is prefixed with the file stem.
+
+    Args:
+        trace_files: Chrome-trace JSON files (one per rank and profiling cycle).
+        output_path: Destination of the merged trace.
+
+    Returns:
+        The path of the merged trace file.
+
+    """
+    merged_events: list[dict[str, Any]] = []
+    for index, trace_file in enumerate(sorted(trace_files)):
+        trace: dict[str, Any] | list[dict[str, Any]] = json.loads(
+            trace_file.read_text(),
+        )
+        events = trace.get("traceEvents", []) if isinstance(trace, dict) else trace
+        pid_offset: int = (index + 1) * _RANK_PID_OFFSET
+        for event in events:
+            pid = event.get("pid")
+            if isinstance(pid, int):
+                event["pid"] = pid_offset + pid
+            elif pid is not None:
+                event["pid"] = f"{trace_file.stem}:{pid}"
+            if event.get("ph") == "M" and event.get("name") == "process_name":
+                args: dict[str, Any] = event.setdefault("args", {})
+                args["name"] = f"{trace_file.stem}: {args.get('name', pid)}"
+            merged_events.append(event)
+
+    output_path.write_text(json.dumps({"traceEvents": merged_events}))
+    return output_path
+
+
+@contextmanager
+def profile_run(
+    config: ProfileConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[profile | None]:
+    """Profile the enclosed block when the ``profile`` config is enabled.
+
+    While active, the profiler is registered as a step hook so that
+    ``hydraxcel.mark_step()`` advances its schedule.  Traces are written to
+    ``<run_dir>/<output_subdir>``; with ``merge_traces`` the main process
+    combines all rank traces once every rank has finished.
+
+    Args:
+        config: The ``profile`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The running ``torch.profiler.profile`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    output_dir: Path = get_run_dir() / config.output_subdir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    profile_kwargs: ProfileKwargs = build_profile_kwargs(
+        config,
+        output_dir,
+        accelerator.process_index,
+    )
+
+    with accelerator.profile(profile_kwargs) as profiler:
+        remove_hook = register_step_hook(profiler.step)
+        try:
+            yield profiler
+        finally:
+            remove_hook()
+
+    if not config.merge_traces:
+        return
+    accelerator.wait_for_everyone()
+    if accelerator.is_main_process:
+        trace_files: list[Path] = [
+            path for path in output_dir.glob("*.json") if path.name != MERGED_TRACE_NAME
+        ]
+        merged_path = merge_chrome_traces(trace_files, output_dir / MERGED_TRACE_NAME)
+        logger.info("Merged %d traces into %s", len(trace_files), merged_path)
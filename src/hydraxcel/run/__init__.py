@@ -21,14 +21,61 @@
 # limitations under the License.
 """HydraXcel script running tools."""
 
+from hydraxcel.run.accelerator import build_accelerator
+from hydraxcel.run.checkpoint import CheckpointManager, checkpoint_manager
+from hydraxcel.run.compile_cache import CompileCache, compile_cache
+from hydraxcel.run.config_registry import AcceleratorConfig, load_run_configs
+from hydraxcel.run.elastic import elastic_run, latest_checkpoint
+from hydraxcel.run.hooks import mark_step, register_step_hook
+from hydraxcel.run.memoize import CacheStats, cache
+from hydraxcel.run.pipeline import Pipeline, Stage
+from hydraxcel.run.preemption import PreemptionHandler, handle_preemption
+from hydraxcel.run.resume import (
+    ResumeState,
+    config_fingerprint,
+    find_previous_run,
+    resume_run,
+)
 from hydraxcel.run.setup import (
     get_logger,
     hydraxcel_main,
     set_seed,
 )
+from hydraxcel.run.sharded_checkpoint import (
+    load_sharded_into,
+    load_sharded_state,
+    save_sharded_state,
+)
+from hydraxcel.run.staging import StagingCache, stage_data
 
 __all__ = [
+    "AcceleratorConfig",
+    "CacheStats",
+    "CheckpointManager",
+    "CompileCache",
+    "Pipeline",
+    "PreemptionHandler",
+    "ResumeState",
+    "Stage",
+    "StagingCache",
+    "build_accelerator",
+    "cache",
+    "checkpoint_manager",
+    "compile_cache",
+    "config_fingerprint",
+    "elastic_run",
+    "find_previous_run",
     "get_logger",
+    "handle_preemption",
     "hydraxcel_main",
+    "latest_checkpoint",
+    "load_run_configs",
+    "load_sharded_into",
+    "load_sharded_state",
+    "mark_step",
+    "register_step_hook",
+    "resume_run",
+    "save_sharded_state",
     "set_seed",
+    "stage_data",
 ]
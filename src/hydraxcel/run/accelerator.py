@@ -0,0 +1,183 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Construct the ``Accelerator`` from the ``accelerator`` run config group."""
+
+import logging
+import os
+from datetime import timedelta
+from typing import Any
+
+from accelerate import Accelerator
+from accelerate.utils import (
+    DataLoaderConfiguration,
+    DDPCommunicationHookType,
+    DistributedDataParallelKwargs,
+    GradientAccumulationPlugin,
+    GradScalerKwargs,
+    InitProcessGroupKwargs,
+    KwargsHandler,
+)
+from omegaconf import DictConfig, OmegaConf
+
+from hydraxcel.run.config_registry import (
+    AcceleratorConfig,
+    CommHookConfig,
+    DDPConfig,
+)
+
+__all__ = ["build_accelerator", "build_ddp_kwargs"]
+
+logger = logging.getLogger("accelerator")
+
+
+_POWER_SGD_HOOKS: set[DDPCommunicationHookType] = {
+    DDPCommunicationHookType.POWER_SGD,
+    DDPCommunicationHookType.BATCHED_POWER_SGD,
+}
+
+
+def _hook_type(name: str, field_name: str) -> DDPCommunicationHookType:
+    try:
+        return DDPCommunicationHookType(name)
+    except ValueError:
+        choices: list[str] = [hook.value for hook in DDPCommunicationHookType]
+        msg = f"comm_hook.{field_name} must be one of {choices}, got {name!r}"
+        raise ValueError(msg) from None
+
+
+def build_ddp_kwargs(
+    ddp: DDPConfig,
+    comm_hook: CommHookConfig,
+) -> DistributedDataParallelKwargs:
+    """Create the DDP kwargs handler including its gradient communication hook.
+
+    Accelerate registers the hook on the model returned by
+    ``accelerator.prepare`` when it is wrapped in DDP.
+
+    Args:
+        ddp: The DDP wrapper settings.
+        comm_hook: The communication hook and, for PowerSGD, its state options.
+
+    Returns:
+        The ``DistributedDataParallelKwargs`` handler.
+
+    Raises:
+        ValueError: If the hook or wrapper is unknown, or the wrapper is not a
+            compression wrapper around a PowerSGD hook.
+
+    """
+    hook: DDPCommunicationHookType = _hook_type(comm_hook.hook, "hook")
+    wrapper: DDPCommunicationHookType = _hook_type(comm_hook.wrapper, "wrapper")
+    if wrapper is not DDPCommunicationHookType.NO and (
+        hook not in _POWER_SGD_HOOKS or wrapper in _POWER_SGD_HOOKS
+    ):
+        msg = "comm_hook.wrapper must be fp16 or bf16 and requires a PowerSGD hook"
+        raise ValueError(msg)
+    state_options: dict[str, Any] = (
+        {
+            "matrix_approximation_rank": comm_hook.matrix_approximation_rank,
+            "start_powerSGD_iter": comm_hook.start_powerSGD_iter,
+            "min_compression_rate": comm_hook.min_compression_rate,
+            "use_error_feedback": comm_hook.use_error_feedback,
+            "warm_start": comm_hook.warm_start,
+        }
+        if hook in _POWER_SGD_HOOKS
+        else {}
+    )
+    return DistributedDataParallelKwargs(
+        **vars(ddp),
+        comm_hook=hook,
+        comm_wrapper=wrapper,  # ty:ignore[invalid-argument-type]
+        comm_state_option=state_options,
+    )
+
+
+def _build_kwargs_handlers(
+    config: AcceleratorConfig,
+) -> list[KwargsHandler]:
+    """Create the DDP, gradient scaler and process group kwargs handlers."""
+    handlers: list[KwargsHandler] = [build_ddp_kwargs(config.ddp, config.comm_hook)]
+    if config.grad_scaler is not None:
+        handlers.append(GradScalerKwargs(**vars(config.grad_scaler)))
+    process_group: dict[str, Any] = {}
+    if config.process_group.backend is not None:
+        process_group["backend"] = config.process_group.backend
+    if config.process_group.timeout_minutes is not None:
+        process_group["timeout"] = timedelta(
+            minutes=config.process_group.timeout_minutes,
+        )
+    if process_group:
+        handlers.append(InitProcessGroupKwargs(**process_group))
+    return handlers
+
+
+def build_accelerator(
+    config: AcceleratorConfig | DictConfig | None,
+) -> Accelerator:
+    """Construct the run's ``Accelerator`` from an ``accelerator`` config node.
+
+    Launch-time settings (hardware, mixed precision, dynamo, paradigm) keep
+    coming from ``accelerate launch``; this covers the arguments that can only
+    be passed to the ``Accelerator`` itself.
+
+    Args:
+        config: The ``accelerator`` node of the run configuration, or ``None``
+            for Accelerate's defaults.
+
+    Returns:
+        The constructed ``Accelerator``.
+
+    """
+    if config is None:
+        return Accelerator()
+    if isinstance(config, DictConfig):
+        # Validate plain YAML nodes against the schema as well
+        settings: AcceleratorConfig = OmegaConf.to_object(  # ty:ignore[invalid-assignment]
+            OmegaConf.merge(OmegaConf.structured(AcceleratorConfig), config),
+        )
+    else:
+        settings = config
+
+    if settings.distributed_debug is not None:
+        # Read by torch.distributed when the process group is created
+        os.environ["TORCH_DISTRIBUTED_DEBUG"] = settings.distributed_debug
+
+    accelerator = Accelerator(
+        device_placement=settings.device_placement,
+        gradient_accumulation_plugin=GradientAccumulationPlugin(
+            num_steps=settings.gradient_accumulation_steps,
+            adjust_scheduler=settings.adjust_scheduler,
+            sync_with_dataloader=settings.sync_with_dataloader,
+            sync_each_batch=settings.sync_each_batch,
+        ),
+        step_scheduler_with_optimizer=settings.step_scheduler_with_optimizer,
+        rng_types=settings.rng_types,  # ty:ignore[invalid-argument-type]
+        dataloader_config=DataLoaderConfiguration(**vars(settings.dataloader)),
+        kwargs_handlers=_build_kwargs_handlers(settings),
+    )
+    logger.info(
+        "Accelerator built with gradient_accumulation_steps=%d, ddp=%s, comm_hook=%s",
+        accelerator.gradient_accumulation_steps,
+        vars(settings.ddp),
+        settings.comm_hook.hook,
+    )
+    return accelerator
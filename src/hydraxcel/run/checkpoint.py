@@ -0,0 +1,628 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Asynchronous checkpointing with rotation.
+
+``CheckpointManager`` takes over what ``Accelerator.save_state`` does without
+blocking the training loop for the write: ``save`` copies the model,
+optimizer, scheduler, scaler, sampler, custom-object and RNG states into
+reusable (for GPU tensors page-locked) host buffers, and a background thread
+writes them to a temporary folder in the run directory that is renamed into
+place once every rank has finished.  The folders keep the ``save_state``
+layout, so ``Accelerator.load_state`` and elastic restarts resume from them.
+After each checkpoint the main process deletes all but the last
+``keep_last`` and the best ``keep_best`` checkpoints by a metric.  The time
+the training loop stalled and the write throughput are logged and sent to
+the trackers.
+
+``hydraxcel_main`` passes the manager of the ``checkpoint`` run config group
+to main functions that accept a ``checkpoints`` argument and drains pending
+writes before ``end_training``.
+"""
+
+import copy
+import json
+import logging
+import os
+import random
+import shutil
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path  # noqa: TC003
+from typing import Any, Generator
+
+import numpy as np
+import torch
+from accelerate import Accelerator
+from accelerate.data_loader import IterableDatasetShard, SeedableRandomSampler
+from accelerate.utils import (
+    OPTIMIZER_NAME,
+    RNG_STATE_NAME,
+    SAFE_WEIGHTS_NAME,
+    SAMPLER_NAME,
+    SCALER_NAME,
+    SCHEDULER_NAME,
+    WEIGHTS_NAME,
+    DistributedType,
+    save,
+)
+from omegaconf import DictConfig
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.run.config_registry import CheckpointConfig  # noqa: TC001
+from hydraxcel.run.elastic import RESTART_COUNT_ENV, latest_checkpoint
+
+__all__ = ["CheckpointManager", "checkpoint_manager"]
+
+METADATA_FILE_NAME: str = "checkpoint.json"
+METRIC_PREFIX: str = "checkpoint/"
+_MODES: tuple[str, ...] = ("min", "max")
+# These paradigms save through collectives, which cannot run in the background
+_SYNCHRONOUS_TYPES: set[DistributedType] = {
+    DistributedType.DEEPSPEED,
+    DistributedType.FSDP,
+    DistributedType.MEGATRON_LM,
+    DistributedType.XLA,
+}
+_POLL_SECONDS: float = 0.05
+
+logger = logging.getLogger("checkpoint")
+
+
+@dataclass
+class _Snapshot:
+    """Host copies of everything one rank writes for a checkpoint."""
+
+    step: int
+    metrics: dict[str, float]
+    models: list[dict[str, Any]] = field(default_factory=list)
+    optimizers: list[dict[str, Any]] = field(default_factory=list)
+    schedulers: list[dict[str, Any]] = field(default_factory=list)
+    samplers: dict[int, Any] = field(default_factory=dict)
+    dataloaders: dict[int, Any] = field(default_factory=dict)
+    scaler: dict[str, Any] | None = None
+    custom: list[Any] = field(default_factory=list)
+    rng: dict[str, Any] = field(default_factory=dict)
+
+
+def _checkpoint_name(step: int) -> str:
+    return f"checkpoint_{step}"
+
+
+def _indexed_name(name: str, index: int) -> str:
+    """``optimizer.bin`` -> ``optimizer_1.bin`` as in ``save_state``."""
+    stem, suffix = name.split(".", 1)
+    return name if index == 0 else f"{stem}_{index}.{suffix}"
+
+
+def _rng_states(step: int) -> dict[str, Any]:
+    """Capture the RNG states that ``Accelerator.load_state`` restores."""
+    states: dict[str, Any] = {
+        "step": step,
+        "random_state": random.getstate(),
+        "numpy_random_seed": np.random.get_state(),  # noqa: NPY002 # Legacy global RNG
+        "torch_manual_seed": torch.get_rng_state(),
+    }
+    if torch.cuda.is_available():
+        states["torch_cuda_manual_seed"] = torch.cuda.get_rng_state_all()
+    return states
+
+
+class CheckpointManager:
+    """Save, rotate and load the checkpoints of one run."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        accelerator: Accelerator,
+        directory: Path,
+        *,
+        keep_last: int | None = 3,
+        keep_best: int = 0,
+        metric: str | None = None,
+        mode: str = "min",
+        async_write: bool = True,
+        pin_memory: bool = True,
+        safe_serialization: bool = True,
+        log_to_trackers: bool = True,
+        publish_timeout: float | None = 1800.0,
+    ) -> None:
+        """Initialise the manager; nothing is written until ``save``.
+
+        Args:
+            accelerator: The run's ``Accelerator``, whose prepared and registered
+                objects are checkpointed.
+            directory: Folder receiving the ``checkpoint_<step>`` folders.
+            keep_last: Number of most recent checkpoints kept (``None``: all).
+            keep_best: Number of best checkpoints by *metric* kept in addition.
+            metric: Key of the ``save`` metrics that ranks the checkpoints.
+            mode: ``"min"`` or ``"max"``, the direction in which *metric* improves.
+            async_write: Write on a background thread; otherwise ``save`` blocks.
+            pin_memory: Stage GPU tensors in page-locked host buffers.
+            safe_serialization: Save models as safetensors.
+            log_to_trackers: Send the stall and throughput metrics to the trackers.
+            publish_timeout: Seconds the main process waits for the other ranks'
+                files before failing the save (``None``: no limit).
+
+        Raises:
+            ValueError: If a rotation setting is invalid.
+
+        """
+        if keep_last is not None and keep_last < 1:
+            msg = f"keep_last must be >= 1 or None, got {keep_last}"
+            raise ValueError(msg)
+        if keep_best < 0 or (keep_best and metric is None):
+            msg = f"keep_best must be >= 0 and needs a metric, got {keep_best}"
+            raise ValueError(msg)
+        if mode not in _MODES:
+            msg = f"mode must be one of {_MODES}, got {mode!r}"
+            raise ValueError(msg)
+        self.accelerator: Accelerator = accelerator
+        self.directory: Path = directory
+        self.keep_last: int | None = keep_last
+        self.keep_best: int = keep_best
+        self.metric: str | None = metric
+        self.mode: str = mode
+        self.pin_memory: bool = pin_memory and torch.cuda.is_available()
+        self.safe_serialization: bool = safe_serialization
+        self.log_to_trackers: bool = log_to_trackers
+        self.publish_timeout: float | None = publish_timeout
+        self.asynchronous: bool = (
+            async_write and accelerator.distributed_type not in _SYNCHRONOUS_TYPES
+        )
+        # Temporary folders are unique per elastic attempt
+        self._attempt: str = os.environ.get(RESTART_COUNT_ENV, "0")
+        self._buffers: dict[tuple, torch.Tensor] = {}
+        self._executor: ThreadPoolExecutor | None = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+            if self.asynchronous
+            else None
+        )
+        self._pending: Future | None = None
+        self._completed: list[dict[str, float]] = []
+        self._cleaned: bool = False
+
+    # Saving
+    def _stage(self, key: tuple, value: Any, staged: dict) -> Any:  # noqa: ANN401
+        """Copy *value* to host memory, reusing the buffer of the last save."""
+        if isinstance(value, torch.Tensor):
+            storage_key = (value.data_ptr(), value.shape, value.stride(), value.dtype)
+            if storage_key in staged:  # Tied weights stay tied
+                return staged[storage_key]
+            buffer: torch.Tensor | None = self._buffers.get(key)
+            if (
+                buffer is None
+                or buffer.shape != value.shape
+                or buffer.dtype != value.dtype
+            ):
+                buffer = torch.empty(
+                    value.shape,
+                    dtype=value.dtype,
+                    pin_memory=self.pin_memory and value.is_cuda,
+                )
+                self._buffers[key] = buffer
+            buffer.copy_(value.detach(), non_blocking=buffer.is_pinned())
+            staged[storage_key] = buffer
+            return buffer
+        if isinstance(value, dict):
+            items: dict = {
+                name: self._stage((*key, name), item, staged)
+                for name, item in value.items()
+            }
+            return OrderedDict(items) if isinstance(value, OrderedDict) else items
+        if isinstance(value, list):
+            return [
+                self._stage((*key, index), item, staged)
+                for index, item in enumerate(value)
+            ]
+        if isinstance(value, tuple):
+            return tuple(
+                self._stage((*key, index), item, staged)
+                for index, item in enumerate(value)
+            )
+        return copy.deepcopy(value)
+
+    def _snapshot(self, step: int, metrics: dict[str, float]) -> _Snapshot:
+        """Copy this rank's part of the checkpoint off the training state."""
+        accelerator: Accelerator = self.accelerator
+        staged: dict = {}
+        snapshot = _Snapshot(step=step, metrics=metrics, rng=_rng_states(step))
+        snapshot.models = [
+            self._stage(
+                ("model", index),
+                accelerator.get_state_dict(model, unwrap=False),
+                staged,
+            )
+            for index, model in enumerate(accelerator._models)  # noqa: SLF001
+        ]
+        snapshot.optimizers = [
+            self._stage(("optimizer", index), optimizer.state_dict(), staged)
+            for index, optimizer in enumerate(accelerator._optimizers)  # noqa: SLF001
+        ]
+        snapshot.schedulers = [
+            self._stage(("scheduler", index), scheduler.state_dict(), staged)
+            for index, scheduler in enumerate(accelerator._schedulers)  # noqa: SLF001
+        ]
+        for index, dataloader in enumerate(accelerator._dataloaders):  # noqa: SLF001
+            if isinstance(dataloader.dataset, IterableDatasetShard) and isinstance(
+                dataloader.get_sampler(),
+                SeedableRandomSampler,
+            ):
+                snapshot.samplers[index] = copy.deepcopy(dataloader.get_sampler())
+            if getattr(dataloader, "use_stateful_dataloader", False):
+                snapshot.dataloaders[index] = copy.deepcopy(dataloader.state_dict())
+        if accelerator.scaler is not None:
+            snapshot.scaler = copy.deepcopy(accelerator.scaler.state_dict())
+        snapshot.custom = [
+            self._stage(("custom", index), obj.state_dict(), staged)
+            for index, obj in enumerate(accelerator._custom_objects)  # noqa: SLF001
+        ]
+        if self.pin_memory:
+            torch.cuda.synchronize()  # Finish the non-blocking copies
+        return snapshot
+
+    def _write_files(self, snapshot: _Snapshot, folder: Path) -> list[Path]:
+        """Write *snapshot* in the ``save_state`` layout; return this rank's files."""
+        rank: int = self.accelerator.process_index
+        files: list[tuple[Path, Any, bool]] = [
+            (
+                folder
+                / _indexed_name(
+                    SAFE_WEIGHTS_NAME if self.safe_serialization else WEIGHTS_NAME,
+                    index,
+                ),
+                state,
+                self.safe_serialization,
+            )
+            for index, state in enumerate(snapshot.models)
+        ]
+        files.extend(
+            (folder / _indexed_name(f"{OPTIMIZER_NAME}.bin", index), state, False)
+            for index, state in enumerate(snapshot.optimizers)
+        )
+        files.extend(
+            (folder / _indexed_name(f"{SCHEDULER_NAME}.bin", index), state, False)
+            for index, state in enumerate(snapshot.schedulers)
+        )
+        files.extend(
+            (folder / _indexed_name(f"{SAMPLER_NAME}.bin", index), sampler, False)
+            for index, sampler in snapshot.samplers.items()
+        )
+        files.extend(
+            (folder / _indexed_name("dl_state_dict.bin", index), state, False)
+            for index, state in snapshot.dataloaders.items()
+        )
+        if snapshot.scaler is not None:
+            files.append((folder / SCALER_NAME, snapshot.scaler, False))
+        files.extend(
+            (folder / f"custom_checkpoint_{index}.pkl", state, False)
+            for index, state in enumerate(snapshot.custom)
+        )
+        for path, obj, safe in files:
+            save(obj, path, safe_serialization=safe)  # Global main process only
+        rng_path: Path = folder / f"{RNG_STATE_NAME}_{rank}.pkl"
+        torch.save(snapshot.rng, rng_path)
+        written: list[Path] = [rng_path]
+        if self.accelerator.is_main_process:
+            written += [path for path, _, _ in files]
+            metadata_path: Path = folder / METADATA_FILE_NAME
+            metadata_path.write_text(
+                json.dumps(
+                    {
+                        "step": snapshot.step,
+                        "metrics": snapshot.metrics,
+                        "time": time.time(),
+                    },
+                ),
+            )
+            written.append(metadata_path)
+        return written
+
+    def _write(self, snapshot: _Snapshot, stall: float) -> dict[str, float]:
+        """Write *snapshot*, publish it atomically and rotate (background thread)."""
+        start: float = time.perf_counter()
+        name: str = _checkpoint_name(snapshot.step)
+        folder: Path = self.directory / f".{name}.{self._attempt}.tmp"
+        folder.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = self._write_files(snapshot, folder)
+        (folder / f".done_rank{self.accelerator.process_index}").touch()
+        size: int = sum(path.stat().st_size for path in written)
+        if self.accelerator.is_main_process:
+            self._publish(folder, self.directory / name)
+            for path in self._rotate():
+                logger.info("Removed checkpoint %s", path)
+        elapsed: float = time.perf_counter() - start
+        stats: dict[str, float] = {
+            "step": snapshot.step,
+            "stall_s": stall,
+            "write_s": elapsed,
+            "size_mb": size / 1e6,
+            "write_mb_s": size / 1e6 / max(elapsed, 1e-9),
+        }
+        logger.info(
+            "Saved %s: %.1f MB in %.2fs (%.1f MB/s), training stalled %.3fs",
+            name,
+            stats["size_mb"],
+            elapsed,
+            stats["write_mb_s"],
+            stall,
+        )
+        return stats
+
+    def _publish(self, folder: Path, target: Path) -> None:
+        """Rename *folder* to *target* once every rank has written its files.
+
+        Raises:
+            TimeoutError: If a rank has not finished within ``publish_timeout``.
+
+        """
+        deadline: float | None = (
+            None
+            if self.publish_timeout is None
+            else time.monotonic() + self.publish_timeout
+        )
+        while len(list(folder.glob(".done_rank*"))) < self.accelerator.num_processes:
+            if deadline is not None and time.monotonic() > deadline:
+                missing: list[int] = [
+                    rank
+                    for rank in range(self.accelerator.num_processes)
+                    if not (folder / f".done_rank{rank}").exists()
+                ]
+                logger.error(
+                    "Ranks %s did not finish writing %s within %.0fs",
+                    missing,
+                    folder,
+                    self.publish_timeout,
+                )
+                msg = (
+                    f"Checkpoint {target.name} is missing the files of ranks {missing}"
+                )
+                raise TimeoutError(msg)
+            time.sleep(_POLL_SECONDS)
+        for marker in folder.glob(".done_rank*"):
+            marker.unlink()
+        if target.exists():  # The step was saved before, e.g. by a failed attempt
+            shutil.rmtree(target)
+        folder.replace(target)
+
+    def _remove_stale_folders(self) -> None:
+        """Delete temporary folders that earlier attempts left behind."""
+        for folder in self.directory.glob(".checkpoint_*.tmp"):
+            if folder.name.split(".")[-2] != self._attempt:
+                shutil.rmtree(folder, ignore_errors=True)
+
+    def _log(self, metrics: dict[str, float]) -> None:
+        if self.log_to_trackers and self.accelerator.trackers:
+            self.accelerator.log(
+                {f"{METRIC_PREFIX}{name}": value for name, value in metrics.items()},
+                log_kwargs={"wandb": {"commit": False}},
+            )
+
+    def _collect(self) -> None:
+        """Re-raise a failed write and log the writes finished since last time."""
+        if self._pending is not None and self._pending.done():
+            pending, self._pending = self._pending, None
+            try:
+                self._completed.append(pending.result())
+            except Exception as error:
+                msg = "Writing the previous checkpoint failed"
+                raise RuntimeError(msg) from error
+        for stats in self._completed:
+            self._log(
+                {
+                    name: value
+                    for name, value in stats.items()
+                    if name not in {"step", "stall_s"}
+                },
+            )
+        self._completed.clear()
+
+    def save(self, step: int, metrics: dict[str, float] | None = None) -> Path:
+        """Checkpoint the current training state as ``checkpoint_<step>``.
+
+        Waits for the previous checkpoint's write, takes the host snapshot
+        and, with ``async_write``, returns while the write continues in the
+        background.  All ranks must call ``save`` with the same *step*.
+
+        Args:
+            step: The training step, used to name the checkpoint.
+            metrics: Values stored with the checkpoint, e.g. the validation
+                loss ranking it for ``keep_best``.
+
+        Returns:
+            The folder the checkpoint will be published as.
+
+        Raises:
+            RuntimeError: If writing the previous checkpoint failed.
+
+        """
+        start: float = time.perf_counter()
+        if self._pending is not None:
+            self._pending.exception()  # Block until the write (and its rename) ends
+        self._collect()
+        if not self._cleaned:
+            if self.accelerator.is_main_process:
+                self._remove_stale_folders()
+            self._cleaned = True
+        metrics = dict(metrics or {})
+        if not self.asynchronous:
+            self._save_synchronously(step, metrics)
+            self._collect()
+            return self.directory / _checkpoint_name(step)
+
+        snapshot: _Snapshot = self._snapshot(step, metrics)
+        stall: float = time.perf_counter() - start
+        self._pending = self._executor.submit(self._write, snapshot, stall)  # ty:ignore[unresolved-attribute]
+        self._log({"stall_s": stall})
+        return self.directory / _checkpoint_name(step)
+
+    def _save_synchronously(self, step: int, metrics: dict[str, float]) -> None:
+        """Write in the training thread, through ``save_state`` where needed."""
+        start: float = time.perf_counter()
+        if self.accelerator.distributed_type not in _SYNCHRONOUS_TYPES:
+            stats: dict[str, float] = self._write(self._snapshot(step, metrics), 0.0)
+        else:
+            name: str = _checkpoint_name(step)
+            folder: Path = self.directory / f".{name}.{self._attempt}.tmp"
+            configuration = self.accelerator.project_configuration
+            automatic_naming: bool = configuration.automatic_checkpoint_naming
+            configuration.automatic_checkpoint_naming = False  # Honour the folder
+            try:
+                self.accelerator.save_state(
+                    str(folder),
+                    safe_serialization=self.safe_serialization,
+                )
+            finally:
+                configuration.automatic_checkpoint_naming = automatic_naming
+            if self.accelerator.is_main_process:
+                (folder / METADATA_FILE_NAME).write_text(
+                    json.dumps({"step": step, "metrics": metrics, "time": time.time()}),
+                )
+                folder.replace(self.directory / name)
+                self._rotate()
+            self.accelerator.wait_for_everyone()
+            stats = {"step": step, "write_s": time.perf_counter() - start}
+        stats["stall_s"] = time.perf_counter() - start
+        self._completed.append(stats)
+        self._log({"stall_s": stats["stall_s"]})
+
+    def wait(self) -> None:
+        """Block until the pending write is published (the drain barrier).
+
+        Raises:
+            RuntimeError: If the write failed.
+
+        """
+        if self._pending is not None:
+            self._pending.exception()
+        self._collect()
+
+    def close(self) -> None:
+        """Drain the pending write and stop the writer thread."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+
+    # Rotation and loading
+    def _metadata(self) -> dict[Path, dict[str, Any]]:
+        """Map the published checkpoints to their metadata."""
+        return {
+            path.parent: json.loads(path.read_text())
+            for path in self.directory.glob(f"checkpoint_*/{METADATA_FILE_NAME}")
+        }
+
+    def _ranked(self, checkpoints: dict[Path, dict[str, Any]]) -> list[Path]:
+        """Order the checkpoints carrying the metric, best first."""
+        scored: list[tuple[float, Path]] = [
+            (metadata["metrics"][self.metric], path)
+            for path, metadata in checkpoints.items()
+            if self.metric in metadata["metrics"]
+        ]
+        scored.sort(key=lambda item: item[0], reverse=self.mode == "max")
+        return [path for _, path in scored]
+
+    def _rotate(self) -> list[Path]:
+        """Delete the checkpoints that are neither among the last nor the best."""
+        if self.keep_last is None:
+            return []
+        checkpoints: dict[Path, dict[str, Any]] = self._metadata()
+        by_step: list[Path] = sorted(
+            checkpoints,
+            key=lambda path: checkpoints[path]["step"],
+        )
+        keep: set[Path] = set(by_step[-self.keep_last :])
+        if self.keep_best:
+            keep.update(self._ranked(checkpoints)[: self.keep_best])
+        removed: list[Path] = [path for path in by_step if path not in keep]
+        for path in removed:
+            shutil.rmtree(path, ignore_errors=True)
+        return removed
+
+    def latest(self) -> Path | None:
+        """Return the newest complete checkpoint, or ``None``."""
+        return latest_checkpoint(self.directory)
+
+    def best(self) -> Path | None:
+        """Return the best checkpoint by ``metric``, or ``None``."""
+        ranked: list[Path] = self._ranked(self._metadata()) if self.metric else []
+        return ranked[0] if ranked else None
+
+    def load(self, checkpoint: Path | None = None) -> dict[str, Any] | None:
+        """Restore *checkpoint* (default: the latest) into the prepared objects.
+
+        Args:
+            checkpoint: The checkpoint folder to load.
+
+        Returns:
+            The checkpoint's step and metrics (empty for folders written by
+            plain ``save_state``), or ``None`` if there is nothing to load.
+
+        """
+        checkpoint = checkpoint or self.latest()
+        if checkpoint is None:
+            return None
+        self.accelerator.load_state(str(checkpoint))
+        logger.info("Loaded checkpoint %s", checkpoint)
+        metadata_path: Path = checkpoint / METADATA_FILE_NAME
+        return json.loads(metadata_path.read_text()) if metadata_path.exists() else {}
+
+
+@contextmanager
+def checkpoint_manager(
+    config: CheckpointConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[CheckpointManager | None]:
+    """Provide the run's checkpoint manager and drain it on exit.
+
+    Args:
+        config: The ``checkpoint`` node of the run configuration; ``None``
+            disables checkpointing.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The ``CheckpointManager``, or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    manager = CheckpointManager(
+        accelerator,
+        get_run_dir() / config.output_subdir,
+        keep_last=config.keep_last,
+        keep_best=config.keep_best,
+        metric=config.metric,
+        mode=config.mode,
+        async_write=config.async_write,
+        pin_memory=config.pin_memory,
+        safe_serialization=config.safe_serialization,
+        log_to_trackers=config.log_to_trackers,
+        publish_timeout=config.publish_timeout_s,
+    )
+    try:
+        yield manager
+    finally:
+        manager.close()
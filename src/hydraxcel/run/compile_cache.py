@@ -0,0 +1,310 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent, project-level ``torch.compile`` cache.
+
+Inductor keeps its FX graph, AOTAutograd, autotuning and Triton caches in a
+per-user temp directory by default, so every sweep job recompiles from
+scratch.  ``compile_cache`` points those caches at a project directory with
+one entry per compile environment (torch/CUDA/Python version, device, and the
+dynamo and precision settings passed down by ``accelerate launch``).  Inductor
+writes its cache files atomically, so concurrent jobs can share an entry;
+HydraXcel adds a project-wide lock for LRU eviction, never evicting entries
+that a live job is using, and logs the cache hits and misses of every run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import socket
+import time
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Generator
+
+import torch
+from accelerate import Accelerator
+from filelock import FileLock
+from omegaconf import DictConfig
+from torch._dynamo.utils import counters  # Only source of cache stats
+
+from hydraxcel.run.config_registry import CompileCacheConfig  # noqa: TC001
+
+__all__ = [
+    "CompileCache",
+    "compile_cache",
+    "compile_cache_key",
+    "directory_size",
+    "pid_alive",
+]
+
+CACHE_ENV_VARS: dict[str, str] = {
+    "TORCHINDUCTOR_CACHE_DIR": "inductor",
+    "TRITON_CACHE_DIR": "triton",
+}
+# Environment set by ``accelerate launch`` that changes the compiled code
+LAUNCH_ENV_VARS: tuple[str, ...] = (
+    "ACCELERATE_DYNAMO_BACKEND",
+    "ACCELERATE_DYNAMO_MODE",
+    "ACCELERATE_DYNAMO_USE_DYNAMIC",
+    "ACCELERATE_DYNAMO_USE_FULLGRAPH",
+    "ACCELERATE_MIXED_PRECISION",
+)
+KEY_FILE_NAME: str = "key.json"
+LAST_USED_FILE_NAME: str = ".last_used"
+USERS_DIR_NAME: str = ".users"
+# Users on other hosts cannot be checked for liveness; trust them this long
+STALE_USER_SECONDS: float = 48 * 3600
+METRIC_PREFIX: str = "compile_cache/"
+# (counter group, counter prefix) pairs reported per run
+CACHE_COUNTERS: tuple[tuple[str, str], ...] = (
+    ("inductor", "fxgraph_cache"),
+    ("aot_autograd", "autograd_cache"),
+)
+
+logger = logging.getLogger("compile_cache")
+
+
+def compile_cache_key(extra: str = "") -> dict[str, str]:
+    """Describe the environment that determines compiled artefacts.
+
+    Args:
+        extra: Free-form text mixed into the key.
+
+    Returns:
+        The key components: torch, CUDA and Python versions, the machine and
+        GPU, the compile-related ``accelerate launch`` settings and *extra*.
+
+    """
+    key: dict[str, str] = {
+        "torch": torch.__version__,
+        "cuda": str(torch.version.cuda),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "device": (
+            torch.cuda.get_device_name() if torch.cuda.is_available() else "cpu"
+        ),
+        "extra": extra,
+    }
+    key.update({name: os.environ.get(name, "") for name in LAUNCH_ENV_VARS})
+    return key
+
+
+def directory_size(path: Path) -> int:
+    """Return the total size of the files under *path*, skipping removed ones."""
+    total: int = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            with suppress(OSError):  # Removed concurrently
+                total += (Path(root) / name).lstat().st_size
+    return total
+
+
+def pid_alive(pid: int) -> bool:
+    """Return whether a process *pid* exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class CompileCache:
+    """One keyed entry of a project compile cache plus LRU eviction of the rest."""
+
+    def __init__(self, root: Path, key: dict[str, str], max_size_bytes: int) -> None:
+        """Initialise the cache; nothing is touched until ``activate``.
+
+        Args:
+            root: Project cache directory holding one sub-directory per key.
+            key: Key components, see ``compile_cache_key``.
+            max_size_bytes: Total size above which old entries are evicted.
+
+        """
+        self.root: Path = root
+        self.key: dict[str, str] = key
+        self.max_size_bytes: int = max_size_bytes
+        digest: str = hashlib.sha256(
+            json.dumps(key, sort_keys=True).encode(),
+        ).hexdigest()[:16]
+        self.directory: Path = root / f"torch-{key['torch']}-{digest}"
+        self._user_marker: Path = (
+            self.directory / USERS_DIR_NAME / f"{socket.gethostname()}-{os.getpid()}"
+        )
+        self._previous_env: dict[str, str | None] = {}
+
+    def activate(self) -> None:
+        """Point the inductor and Triton caches at this entry and mark it in use."""
+        self._user_marker.parent.mkdir(parents=True, exist_ok=True)
+        self._user_marker.touch()
+        (self.directory / KEY_FILE_NAME).write_text(json.dumps(self.key, indent=2))
+        (self.directory / LAST_USED_FILE_NAME).touch()
+        for name, subdir in CACHE_ENV_VARS.items():
+            self._previous_env[name] = os.environ.get(name)
+            os.environ[name] = str(self.directory / subdir)
+
+    def deactivate(self) -> None:
+        """Restore the previous cache locations and release this entry."""
+        for name, value in self._previous_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        self._previous_env.clear()
+        (self.directory / LAST_USED_FILE_NAME).touch()
+        self._user_marker.unlink(missing_ok=True)
+
+    @staticmethod
+    def _in_use(entry: Path) -> bool:
+        """Whether a live job (other than stale markers) still uses *entry*."""
+        host: str = socket.gethostname()
+        for marker in (entry / USERS_DIR_NAME).glob("*"):
+            marker_host, _, pid = marker.name.rpartition("-")
+            if marker_host == host:
+                if pid.isdigit() and pid_alive(int(pid)):
+                    return True
+                marker.unlink(missing_ok=True)
+            elif time.time() - marker.stat().st_mtime < STALE_USER_SECONDS:
+                return True
+        return False
+
+    def evict(self) -> list[Path]:
+        """Remove least recently used entries until the cache fits its size cap.
+
+        The active entry and entries used by live jobs are never evicted.
+
+        Returns:
+            The removed entry directories.
+
+        """
+        removed: list[Path] = []
+        self.root.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.root / ".lock"):
+            entries: list[tuple[float, Path, int]] = []
+            for entry in self.root.iterdir():
+                if not entry.is_dir():
+                    continue
+                last_used: Path = entry / LAST_USED_FILE_NAME
+                mtime: float = (
+                    last_used.stat().st_mtime
+                    if last_used.exists()
+                    else entry.stat().st_mtime
+                )
+                entries.append((mtime, entry, directory_size(entry)))
+            total: int = sum(size for _mtime, _entry, size in entries)
+            for _mtime, entry, size in sorted(entries):
+                if total <= self.max_size_bytes:
+                    break
+                if entry == self.directory or self._in_use(entry):
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+                removed.append(entry)
+        if total > self.max_size_bytes:
+            logger.warning(
+                "Compile cache %s is %.2f GB, above its %.2f GB cap, "
+                "with only active entries left",
+                self.root,
+                total / 1e9,
+                self.max_size_bytes / 1e9,
+            )
+        return removed
+
+
+def _cache_counters() -> dict[str, int]:
+    """Read the cumulative compile cache hit/miss counters of this process."""
+    return {
+        f"{prefix}_{outcome}": counters[group][f"{prefix}_{outcome}"]
+        for group, prefix in CACHE_COUNTERS
+        for outcome in ("hit", "miss")
+    }
+
+
+@contextmanager
+def compile_cache(
+    config: CompileCacheConfig | DictConfig | None,
+    accelerator: Accelerator,
+    *,
+    project_name: str,
+) -> Generator[CompileCache | None]:
+    """Use the persistent project compile cache for the enclosed block.
+
+    On exit the run's FX graph and AOTAutograd cache hits and misses are
+    logged (and sent to the trackers), and the local main process evicts
+    least recently used entries beyond ``max_size_gb``.
+
+    Args:
+        config: The ``compile_cache`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+        project_name: Project whose cache directory is used by default.
+
+    Yields:
+        The active ``CompileCache`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+
+    root: Path = (
+        Path(config.root_dir).expanduser()
+        if config.root_dir
+        else Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        / "hydraxcel"
+        / project_name
+        / "compile"
+    )
+    cache = CompileCache(
+        root.absolute(),
+        compile_cache_key(config.key_extra),
+        max_size_bytes=int(config.max_size_gb * 1e9),
+    )
+    cache.activate()
+    logger.info("Using compile cache %s", cache.directory)
+    start: dict[str, int] = _cache_counters()
+    try:
+        yield cache
+    finally:
+        cache.deactivate()
+        stats: dict[str, int] = {
+            name: value - start[name] for name, value in _cache_counters().items()
+        }
+        logger.info(
+            "Compile cache: FX graph %d hits / %d misses, "
+            "AOTAutograd %d hits / %d misses",
+            stats["fxgraph_cache_hit"],
+            stats["fxgraph_cache_miss"],
+            stats["autograd_cache_hit"],
+            stats["autograd_cache_miss"],
+        )
+        if config.log_to_trackers and accelerator.trackers:
+            accelerator.log(
+                {f"{METRIC_PREFIX}{name}": value for name, value in stats.items()},
+                log_kwargs={"wandb": {"commit": False}},
+            )
+        if accelerator.is_local_main_process:
+            for entry in cache.evict():
+                logger.info("Evicted compile cache entry %s", entry)
@@ -0,0 +1,342 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Run configuration registry for Hydra config groups.
+
+Defines the structured config from which ``hydraxcel_main`` constructs the
+``Accelerator`` (DDP and its gradient communication hook, gradient scaler,
+process group and dataloader kwargs, gradient accumulation and scheduler
+stepping), the persistent ``torch.compile`` cache, the checkpoint manager, the
+automatic resume of relaunched runs, the preemption signal handling and the
+restart accounting of elastic launches, and registers their presets via
+``load_run_configs``.
+"""
+
+from dataclasses import dataclass, field
+
+from hydraxcel.hydra import config_store
+
+__all__ = [
+    "AcceleratorConfig",
+    "CheckpointConfig",
+    "CommHookConfig",
+    "CompileCacheConfig",
+    "DDPConfig",
+    "DataLoaderConfig",
+    "ElasticConfig",
+    "GradScalerConfig",
+    "PreemptionConfig",
+    "ProcessGroupConfig",
+    "ResumeConfig",
+    "load_run_configs",
+]
+
+
+@dataclass
+class DDPConfig:
+    """DistributedDataParallel Configuration."""
+
+    bucket_cap_mb: int = 25  # Larger buckets mean fewer, bigger all-reduces
+    gradient_as_bucket_view: bool = False  # Saves a gradient copy per bucket
+    static_graph: bool = False  # Only if the used parameters never change
+    find_unused_parameters: bool = False  # Costs an extra graph traversal per step
+    broadcast_buffers: bool = True
+
+
+@dataclass
+class CommHookConfig:
+    """DDP Gradient Communication Hook Configuration."""
+
+    hook: str = "no"  # no|fp16|bf16|power_sgd|batched_power_sgd
+    wrapper: str = "no"  # no|fp16|bf16, compresses the PowerSGD all-reduces
+    matrix_approximation_rank: int = 1  # PowerSGD rank: higher is more accurate
+    start_powerSGD_iter: int = 1_000  # noqa: N815 # Plain all-reduce warm-up steps
+    min_compression_rate: float = 2.0  # Skip compressing layers that barely shrink
+    use_error_feedback: bool = True
+    warm_start: bool = True  # Reuse the previous step's low-rank factors
+
+
+@dataclass
+class GradScalerConfig:
+    """Gradient Scaler Configuration (fp16 only)."""
+
+    init_scale: float = 65536.0
+    growth_factor: float = 2.0
+    backoff_factor: float = 0.5
+    growth_interval: int = 2000
+    enabled: bool = True
+
+
+@dataclass
+class ProcessGroupConfig:
+    """Process Group Initialisation Configuration."""
+
+    backend: str | None = None  # None: Accelerate's default for the device
+    timeout_minutes: float | None = None  # None: the torch.distributed default
+
+
+@dataclass
+class DataLoaderConfig:
+    """Accelerate DataLoader Configuration."""
+
+    split_batches: bool = False
+    dispatch_batches: bool | None = None
+    even_batches: bool = True
+    use_seedable_sampler: bool = False
+    data_seed: int | None = None
+    non_blocking: bool = False  # Needs pin_memory=True in the DataLoader
+    use_stateful_dataloader: bool = False
+
+
+@dataclass
+class AcceleratorConfig:
+    """Accelerator Construction Configuration."""
+
+    device_placement: bool = True
+    gradient_accumulation_steps: int = 1
+    sync_with_dataloader: bool = True  # Sync gradients at the end of the dataloader
+    sync_each_batch: bool = False  # Trade memory for speed under accumulation
+    adjust_scheduler: bool = True  # Scale scheduler steps by accumulation steps
+    step_scheduler_with_optimizer: bool = True
+    rng_types: list[str] | None = None  # None: Accelerate's default RNGs
+    distributed_debug: str | None = None  # TORCH_DISTRIBUTED_DEBUG (OFF|INFO|DETAIL)
+    ddp: DDPConfig = field(default_factory=DDPConfig)
+    comm_hook: CommHookConfig = field(default_factory=CommHookConfig)
+    grad_scaler: GradScalerConfig | None = None  # None: Accelerate's default
+    process_group: ProcessGroupConfig = field(default_factory=ProcessGroupConfig)
+    dataloader: DataLoaderConfig = field(default_factory=DataLoaderConfig)
+
+
+@dataclass
+class CompileCacheConfig:
+    """Persistent torch.compile Cache Configuration."""
+
+    enabled: bool = True
+    root_dir: str | None = None  # None: $XDG_CACHE_HOME/hydraxcel/<project>/compile
+    max_size_gb: float = 10.0  # Evict least recently used entries beyond this
+    key_extra: str = ""  # Mixed into the cache key, e.g. to separate model families
+    log_to_trackers: bool = True
+
+
+@dataclass
+class CheckpointConfig:
+    """Checkpoint Manager Configuration."""
+
+    enabled: bool = True
+    output_subdir: str = "checkpoints"  # In the run dir, where elastic restarts look
+    keep_last: int | None = 3  # None: keep every checkpoint
+    keep_best: int = 0  # Additionally keep the best N by ``metric``
+    metric: str | None = None  # Key of the metrics passed to ``save``
+    mode: str = "min"  # min|max, direction in which ``metric`` improves
+    async_write: bool = True  # Write on a background thread after a host snapshot
+    pin_memory: bool = True  # Page-locked snapshot buffers for GPU tensors
+    safe_serialization: bool = True  # Models as safetensors
+    log_to_trackers: bool = True
+    # Wait for the other ranks' files before failing the save; None: forever
+    publish_timeout_s: float | None = 1800.0
+
+
+@dataclass
+class ResumeConfig:
+    """Automatic Resume of Relaunched Runs Configuration."""
+
+    enabled: bool = True
+    # Searched for earlier runs; default: outputs/<job> and multirun/<job>
+    search_dirs: list[str] = field(default_factory=list)
+    # Dot-separated config keys left out of the fingerprint
+    ignore_keys: list[str] = field(default_factory=lambda: ["resume"])
+    checkpoint_subdir: str = "checkpoints"  # In the run dir, as for ``checkpoint``
+    link_trackers: bool = True  # Continue the W&B / MLflow run of the earlier run
+    # Send save_state() to <run dir>/checkpoints/checkpoint_<n>, ignoring its path
+    automatic_checkpoint_naming: bool = False
+
+
+@dataclass
+class PreemptionConfig:
+    """Preemption Signal Handling Configuration."""
+
+    enabled: bool = True
+    signals: list[str] = field(default_factory=lambda: ["SIGTERM", "SIGUSR1"])
+    sync_every: int = 10  # mark_step calls between cross-rank stop agreements
+    checkpoint: bool = True  # Save before exiting
+    exit_code: int = 143  # 128 + SIGTERM, reported as a terminated job
+
+
+@dataclass
+class StagingConfig:
+    """Node-Local Dataset Staging Configuration."""
+
+    enabled: bool = True
+    # Dot-separated config keys holding a path or a list of paths to stage
+    keys: list[str] = field(default_factory=list)
+    root_dir: str | None = None  # Node-local; None: $TMPDIR/hydraxcel-staging-<user>
+    max_size_gb: float = 100.0  # Evict least recently used copies beyond this
+    chunk_size_mb: float = 64.0  # Unit of the parallel copies
+    num_threads: int = 8  # Chunks copied concurrently
+    verify: bool = True  # Check new and reused copies against the source digests
+
+
+@dataclass
+class PipelineConfig:
+    """Stage Pipeline Caching and Scheduling Configuration."""
+
+    enabled: bool = True  # False: rerun every stage
+    root_dir: str | None = None  # None: $XDG_CACHE_HOME/hydraxcel/<project>/pipeline
+    rerun: list[str] = field(default_factory=list)  # Stages to recompute anyway
+    max_workers: int | None = None  # Process pool size; None: one per CPU
+    mp_context: str = "spawn"  # Pool start method; fork is unsafe once CUDA is in use
+
+
+@dataclass
+class ElasticConfig:
+    """Elastic Restart Accounting and Resume Configuration."""
+
+    enabled: bool = True
+    resume: bool = True  # Load the newest run-dir checkpoint after a restart
+    output_subdir: str = "elastic"  # Failure and restart records in the run dir
+    log_to_trackers: bool = True
+
+
+def load_run_configs() -> None:
+    """Register all built-in run config variants into the Hydra config store.
+
+    Stores the ``accelerator``, ``accelerator/comm_hook``, ``compile_cache``,
+    ``checkpoint``, ``resume``, ``preemption``, ``pipeline``, ``staging`` and
+    ``elastic`` group variants so they can be selected via Hydra's config
+    composition (e.g. ``+accelerator=ddp-fast +accelerator/comm_hook=powersgd``
+    or ``+compile_cache=default`` on the command line).
+    """
+    config_store.store(
+        name="default",
+        group="accelerator",
+        node=AcceleratorConfig(),
+    )
+    config_store.store(
+        name="ddp-fast",
+        group="accelerator",
+        node=AcceleratorConfig(
+            ddp=DDPConfig(
+                bucket_cap_mb=100,
+                gradient_as_bucket_view=True,
+                static_graph=True,
+            ),
+            dataloader=DataLoaderConfig(non_blocking=True),
+        ),
+    )
+    config_store.store(
+        name="ddp-debug",
+        group="accelerator",
+        node=AcceleratorConfig(
+            distributed_debug="DETAIL",
+            ddp=DDPConfig(find_unused_parameters=True),
+            process_group=ProcessGroupConfig(timeout_minutes=5),  # Fail fast on hangs
+        ),
+    )
+    config_store.store(
+        name="none",
+        group="accelerator/comm_hook",
+        node=CommHookConfig(),
+    )
+    config_store.store(
+        name="fp16",
+        group="accelerator/comm_hook",
+        node=CommHookConfig(hook="fp16"),
+    )
+    config_store.store(
+        name="bf16",
+        group="accelerator/comm_hook",
+        node=CommHookConfig(hook="bf16"),
+    )
+    config_store.store(
+        name="powersgd",
+        group="accelerator/comm_hook",
+        node=CommHookConfig(hook="power_sgd", matrix_approximation_rank=2),
+    )
+    config_store.store(
+        name="none",
+        group="compile_cache",
+        node=CompileCacheConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="compile_cache",
+        node=CompileCacheConfig(),
+    )
+    config_store.store(
+        name="none",
+        group="checkpoint",
+        node=CheckpointConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="checkpoint",
+        node=CheckpointConfig(),
+    )
+    config_store.store(
+        name="none",
+        group="resume",
+        node=ResumeConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="resume",
+        node=ResumeConfig(),
+    )
+    config_store.store(
+        name="none",
+        group="preemption",
+        node=PreemptionConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="preemption",
+        node=PreemptionConfig(),
+    )
+    config_store.store(
+        name="none",
+        group="pipeline",
+        node=PipelineConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="pipeline",
+        node=PipelineConfig(),
+    )
+    config_store.store(
+        name="none",
+        group="staging",
+        node=StagingConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="staging",
+        node=StagingConfig(),
+    )
+    config_store.store(
+        name="none",
+        group="elastic",
+        node=ElasticConfig(enabled=False),
+    )
+    config_store.store(
+        name="default",
+        group="elastic",
+        node=ElasticConfig(),
+    )
@@ -0,0 +1,331 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Restart accounting and automatic resume for elastic launches.
+
+With ``accelerate/elastic=default`` the workers run under torchrun's elastic
+agent with a c10d rendezvous, which restarts the whole worker group when a
+rank fails.  ``elastic_run`` makes those restarts observable and cheap: a rank
+that raises writes a failure record (host, exception and traceback) to the run
+directory, the main process of the next attempt logs which rank failed and why
+and reports the restart count and the downtime to the trackers, and the newest
+checkpoint under ``<run dir>/checkpoints`` is loaded as soon as the models,
+optimizers and schedulers it contains have been prepared.  The launcher pins
+the run timestamp and the W&B run id, so all attempts share one run directory
+and one tracker run.
+"""
+
+import json
+import logging
+import os
+import re
+import socket
+import time
+import traceback
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Generator
+
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.run.config_registry import ElasticConfig
+
+__all__ = [
+    "ELASTIC_ENV",
+    "RUN_TIME_ENV",
+    "checkpoint_contents",
+    "elastic_run",
+    "latest_checkpoint",
+    "resume_on_prepare",
+]
+
+# Exported by the launcher for ``accelerate/elastic`` launches
+ELASTIC_ENV: str = "HYDRAXCEL_ELASTIC"
+RUN_TIME_ENV: str = "HYDRAXCEL_RUN_TIME"
+# Set by torchrun in every worker
+RESTART_COUNT_ENV: str = "TORCHELASTIC_RESTART_COUNT"
+MAX_RESTARTS_ENV: str = "TORCHELASTIC_MAX_RESTARTS"
+CHECKPOINTS_DIR_NAME: str = "checkpoints"
+RESTARTS_FILE_NAME: str = "restarts.jsonl"
+METRIC_PREFIX: str = "elastic/"
+# ``Accelerator.save_state`` writes the RNG states last
+COMPLETE_CHECKPOINT_MARKER: str = "random_states_0.pkl"
+# Entries of a ``save_state`` folder, by the kind of object they restore
+_CHECKPOINT_ENTRY: re.Pattern = re.compile(
+    r"^(?:pytorch_)?(?P<kind>model|optimizer|scheduler)(?:_fsdp)?(?:_\d+)?"
+    r"(?:\.safetensors|\.bin)?$",
+)
+
+logger = logging.getLogger("elastic")
+
+
+def _checkpoint_iteration(checkpoint: Path) -> int:
+    return int(checkpoint.name.removeprefix("checkpoint_"))
+
+
+def latest_checkpoint(checkpoint_dir: Path) -> Path | None:
+    """Return the newest complete ``checkpoint_<n>`` folder in *checkpoint_dir*.
+
+    Folders without the RNG states written at the end of
+    ``Accelerator.save_state`` were interrupted mid-save and are skipped.
+
+    Args:
+        checkpoint_dir: The folder that automatic checkpoint naming saves into.
+
+    Returns:
+        The complete checkpoint with the highest iteration, or ``None``.
+
+    """
+    checkpoints: list[Path] = [
+        path
+        for path in checkpoint_dir.glob("checkpoint_*")
+        if path.name.removeprefix("checkpoint_").isdigit()
+        and (path / COMPLETE_CHECKPOINT_MARKER).is_file()
+    ]
+    return max(checkpoints, key=_checkpoint_iteration, default=None)
+
+
+def _failure_path(directory: Path, restart: int, rank: int) -> Path:
+    return directory / f"failure_{restart}_rank{rank}.json"
+
+
+def _record_failure(
+    directory: Path,
+    restart: int,
+    rank: int,
+    error: Exception,
+) -> None:
+    """Write why *rank* failed during attempt *restart* for the next attempt."""
+    record: dict[str, Any] = {
+        "restart": restart,
+        "rank": rank,
+        "host": socket.gethostname(),
+        "pid": os.getpid(),
+        "time": time.time(),
+        "error": type(error).__name__,
+        "message": str(error),
+        "traceback": "".join(traceback.format_exception(error)),
+    }
+    _failure_path(directory, restart, rank).write_text(json.dumps(record, indent=2))
+
+
+def _report_restart(
+    directory: Path,
+    restart: int,
+    accelerator: Accelerator,
+    *,
+    log_to_trackers: bool,
+) -> dict[str, Any]:
+    """Log the failures of the previous attempt and account for the downtime.
+
+    Args:
+        directory: The folder holding the failure and restart records.
+        restart: The current attempt (torchrun's restart count, >= 1).
+        accelerator: The run's ``Accelerator``, used to reach the trackers.
+        log_to_trackers: Whether to send the restart metrics to the trackers.
+
+    Returns:
+        The restart record appended to ``restarts.jsonl``.
+
+    """
+    max_restarts: str = os.environ.get(MAX_RESTARTS_ENV, "?")
+    failures: list[dict[str, Any]] = [
+        json.loads(path.read_text())
+        for path in sorted(directory.glob(f"failure_{restart - 1}_rank*.json"))
+    ]
+    for failure in failures:
+        logger.warning(
+            "Restart %d/%s: rank %d on %s failed with %s: %s",
+            restart,
+            max_restarts,
+            failure["rank"],
+            failure["host"],
+            failure["error"],
+            failure["message"],
+        )
+    if not failures:
+        logger.warning(
+            "Restart %d/%s: no rank recorded an exception; a worker was killed "
+            "(e.g. by a signal or the OOM killer) or its node was lost",
+            restart,
+            max_restarts,
+        )
+
+    restarts_path: Path = directory / RESTARTS_FILE_NAME
+    history: list[dict[str, Any]] = (
+        [json.loads(line) for line in restarts_path.read_text().splitlines()]
+        if restarts_path.exists()
+        else []
+    )
+    now: float = time.time()
+    downtime: float | None = (
+        now - min(failure["time"] for failure in failures) if failures else None
+    )
+    record: dict[str, Any] = {
+        "restart": restart,
+        "time": now,
+        "failed_ranks": [failure["rank"] for failure in failures],
+        "downtime_s": downtime,
+        "total_downtime_s": sum(
+            entry["downtime_s"] or 0.0 for entry in [*history, {"downtime_s": downtime}]
+        ),
+    }
+    with restarts_path.open("a") as file:
+        file.write(json.dumps(record) + "\n")
+    logger.info(
+        "Restart %d: %s downtime, %.1fs in total",
+        restart,
+        "unknown" if downtime is None else f"{downtime:.1f}s",
+        record["total_downtime_s"],
+    )
+
+    if log_to_trackers and accelerator.trackers:
+        metrics: dict[str, float] = {
+            f"{METRIC_PREFIX}restart_count": restart,
+            f"{METRIC_PREFIX}total_downtime_s": record["total_downtime_s"],
+        }
+        if downtime is not None:
+            metrics[f"{METRIC_PREFIX}downtime_s"] = downtime
+        accelerator.log(metrics, log_kwargs={"wandb": {"commit": False}})
+    return record
+
+
+def checkpoint_contents(checkpoint: Path) -> dict[str, int]:
+    """Count the models, optimizers and schedulers saved in *checkpoint*."""
+    counts: dict[str, int] = dict.fromkeys(("model", "optimizer", "scheduler"), 0)
+    for entry in checkpoint.iterdir():
+        match: re.Match | None = _CHECKPOINT_ENTRY.match(entry.name)
+        if match is not None:
+            counts[match["kind"]] += 1
+    return counts
+
+
+def resume_on_prepare(accelerator: Accelerator, checkpoint: Path) -> None:
+    """Load *checkpoint* once ``prepare`` has registered everything it holds.
+
+    ``Accelerator.load_state`` restores into the prepared objects, so the
+    training script keeps its usual ``prepare`` calls and finds the restored
+    weights, optimizer and scheduler states and RNGs afterwards.
+    """
+    expected: dict[str, int] = checkpoint_contents(checkpoint)
+    prepare = accelerator.prepare
+
+    @wraps(prepare)
+    def prepare_and_resume(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        prepared = prepare(*args, **kwargs)
+        registered: dict[str, int] = {
+            "model": len(accelerator._models),  # noqa: SLF001
+            "optimizer": len(accelerator._optimizers),  # noqa: SLF001
+            "scheduler": len(accelerator._schedulers),  # noqa: SLF001
+        }
+        if all(registered[kind] >= count for kind, count in expected.items()):
+            del accelerator.prepare  # Restore the class method
+            accelerator.load_state(str(checkpoint))
+            # Continue the automatic checkpoint numbering after the loaded one
+            accelerator.project_configuration.iteration = (
+                _checkpoint_iteration(checkpoint) + 1
+            )
+            logger.info("Resumed from %s", checkpoint)
+        return prepared
+
+    accelerator.prepare = prepare_and_resume  # ty:ignore[invalid-assignment]
+
+
+def _begin_restart(
+    config: ElasticConfig | DictConfig,
+    accelerator: Accelerator,
+    directory: Path,
+    restart: int,
+) -> Path | None:
+    """Report attempt *restart* and arrange to resume from the newest checkpoint."""
+    if accelerator.is_main_process:
+        _report_restart(
+            directory,
+            restart,
+            accelerator,
+            log_to_trackers=config.log_to_trackers,
+        )
+    if not config.resume:
+        return None
+    checkpoint: Path | None = latest_checkpoint(
+        Path(accelerator.project_dir) / CHECKPOINTS_DIR_NAME,
+    )
+    if checkpoint is None:
+        logger.warning("Restart %d: no checkpoint to resume from", restart)
+    else:
+        resume_on_prepare(accelerator, checkpoint)
+    return checkpoint
+
+
+@contextmanager
+def elastic_run(
+    config: ElasticConfig | DictConfig | None,
+    accelerator: Accelerator,
+) -> Generator[Path | None]:
+    """Account for elastic restarts and resume from the newest checkpoint.
+
+    Only active in launches with ``accelerate/elastic`` enabled; the config
+    group tunes the behaviour (``None`` uses the defaults).  Unless the run
+    configured its own ``project_dir``, the accelerator saves to the run
+    directory with automatic checkpoint naming, so a bare
+    ``accelerator.save_state()`` writes the checkpoints a restart resumes from.
+
+    Args:
+        config: The ``elastic`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The checkpoint this attempt resumes from, or ``None``.
+
+    """
+    if config is None:
+        config = ElasticConfig()
+    if ELASTIC_ENV not in os.environ or not config.enabled:
+        yield None
+        return
+
+    run_dir: Path = get_run_dir()
+    if accelerator.project_configuration.project_dir is None:
+        accelerator.project_configuration.set_directories(str(run_dir))
+        accelerator.project_configuration.automatic_checkpoint_naming = True
+    directory: Path = run_dir / config.output_subdir
+    directory.mkdir(parents=True, exist_ok=True)
+    restart: int = int(os.environ.get(RESTART_COUNT_ENV, "0"))
+
+    checkpoint: Path | None = (
+        _begin_restart(config, accelerator, directory, restart) if restart else None
+    )
+    try:
+        yield checkpoint
+    except Exception as error:
+        _record_failure(directory, restart, accelerator.process_index, error)
+        raise
+    finally:
+        if "prepare" in vars(accelerator):
+            del accelerator.prepare
+            logger.warning(
+                "%s was not loaded: prepare() never registered %s",
+                checkpoint,
+                checkpoint_contents(checkpoint),  # ty:ignore[invalid-argument-type]
+            )
@@ -0,0 +1,67 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Step hooks that let HydraXcel services follow the user training loop.
+
+Services started by ``hydraxcel_main`` (e.g. the torch profiler) register a
+callback here, and user code calls ``mark_step`` once per training step so all
+of them advance together without the training loop knowing about them.
+"""
+
+from typing import Callable
+
+__all__ = [
+    "clear_step_hooks",
+    "mark_step",
+    "register_step_hook",
+]
+
+_step_hooks: list[Callable[[], None]] = []
+
+
+def register_step_hook(hook: Callable[[], None]) -> Callable[[], None]:
+    """Register *hook* to be called on every ``mark_step``.
+
+    Args:
+        hook: Zero-argument callable invoked once per training step.
+
+    Returns:
+        A callable that removes *hook* again; safe to call more than once.
+
+    """
+    _step_hooks.append(hook)
+
+    def remove() -> None:
+        if hook in _step_hooks:
+            _step_hooks.remove(hook)
+
+    return remove
+
+
+def mark_step() -> None:
+    """Signal the end of a training step to every registered service."""
+    for hook in list(_step_hooks):  # noqa: PERF101 # Hooks may unregister themselves
+        hook()
+
+
+def clear_step_hooks() -> None:
+    """Remove all registered step hooks."""
+    _step_hooks.clear()
@@ -0,0 +1,272 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent, rank-aware memoization of expensive preprocessing.
+
+``@cache(keys=[...])`` stores a function's result in a project-level
+``diskcache`` store, keyed by the selected subtrees of the run configuration
+and a hash of the function's source, so sweep jobs and ranks that share the
+same preprocessing config compute it once.  A per-key file lock makes the
+first process (per host, or across hosts on a shared filesystem) compute the
+result while the others wait and then read it.  The store evicts the least
+recently used results beyond its size cap, and every call logs whether it hit
+and how many bytes and seconds of compute it saved.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+import diskcache
+from filelock import FileLock, Timeout
+from omegaconf import Container, DictConfig, OmegaConf
+
+from hydraxcel.logging.helpers import find_project_root
+
+__all__ = [
+    "CacheStats",
+    "acquire_lock",
+    "cache",
+    "cache_key",
+    "default_cache_root",
+    "source_hash",
+]
+
+LOCKS_DIR_NAME: str = "locks"
+_META_SUFFIX: str = ":meta"
+
+logger = logging.getLogger("cache")
+
+ReturnT = TypeVar("ReturnT")
+
+
+@dataclass
+class CacheStats:
+    """Hits and savings of one cached function in this process."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    seconds_saved: float = 0.0
+
+
+def source_hash(func: Callable[..., Any]) -> str:
+    """Hash the source of *func*, or its bytecode when the source is unavailable."""
+    try:
+        source: bytes = inspect.getsource(func).encode()
+    except OSError:
+        source = func.__code__.co_code  # ty:ignore[unresolved-attribute]
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def default_cache_root(func: Callable[..., Any], subdir: str = "memo") -> Path:
+    """Locate ``$XDG_CACHE_HOME/hydraxcel/<project>/<subdir>`` for *func*."""
+    try:
+        project: str = find_project_root(Path(inspect.getfile(func))).name
+    except FileNotFoundError:  # Not part of a project, e.g. defined in a notebook
+        project = func.__module__.split(".")[0]
+    return (
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        / "hydraxcel"
+        / project
+        / subdir
+    )
+
+
+def _find_config(args: tuple, kwargs: dict[str, Any]) -> DictConfig:
+    """Return the run configuration among the call arguments."""
+    candidates: list[Any] = [kwargs.get("cfg"), *args, *kwargs.values()]
+    for candidate in candidates:
+        if isinstance(candidate, DictConfig):
+            return candidate
+    msg = "A cached function needs the run configuration (a DictConfig) argument"
+    raise TypeError(msg)
+
+
+def _select(cfg: DictConfig, key: str) -> Any:  # noqa: ANN401
+    """Return the resolved value of the dot-separated *key* (``None`` if missing)."""
+    value: Any = OmegaConf.select(cfg, key)
+    if isinstance(value, Container):
+        return OmegaConf.to_container(value, resolve=True)
+    return value
+
+
+def cache_key(cfg: DictConfig, keys: list[str] | None, function_id: str) -> str:
+    """Hash the selected config subtrees together with the function identity."""
+    selected: Any = (
+        OmegaConf.to_container(cfg, resolve=True)
+        if keys is None
+        else {key: _select(cfg, key) for key in keys}
+    )
+    encoded: bytes = json.dumps(
+        {"function": function_id, "config": selected},
+        sort_keys=True,
+        default=str,
+    ).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def acquire_lock(lock: FileLock, name: str, log: logging.Logger = logger) -> None:
+    """Acquire *lock*, logging to *log* when another process holds it."""
+    try:
+        lock.acquire(timeout=0)
+    except Timeout:
+        log.info("Waiting for another process computing %s", name)
+        lock.acquire()
+
+
+class _CachedFunction:
+    """A function whose results are stored in a ``diskcache`` store."""
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        keys: list[str] | None,
+        directory: Path,
+        max_size_bytes: int,
+    ) -> None:
+        self.func: Callable[..., Any] = func
+        self.keys: list[str] | None = keys
+        self.directory: Path = directory
+        self.max_size_bytes: int = max_size_bytes
+        self.name: str = getattr(func, "__qualname__", repr(func))
+        self.function_id: str = f"{func.__module__}.{self.name}:{source_hash(func)}"
+        self.cache_stats = CacheStats()
+        # diskcache connections must not cross fork(), so open one per process
+        self._stores: dict[int, diskcache.Cache] = {}
+        functools.update_wrapper(self, func)
+
+    def _store(self) -> diskcache.Cache:
+        pid: int = os.getpid()
+        if pid not in self._stores:
+            self._stores[pid] = diskcache.Cache(
+                str(self.directory),
+                disk=diskcache.Disk,  # Store the pickled payloads as raw bytes
+                size_limit=self.max_size_bytes,
+                eviction_policy="least-recently-used",
+            )
+        return self._stores[pid]
+
+    def _read(self, key: str) -> tuple[bool, Any]:
+        """Return whether *key* is cached and its value, accounting for the hit."""
+        payload: bytes | None = self._store().get(key)
+        if payload is None:
+            return False, None
+        seconds: float = self._store().get(key + _META_SUFFIX, {}).get("seconds", 0.0)
+        self.cache_stats.hits += 1
+        self.cache_stats.bytes_saved += len(payload)
+        self.cache_stats.seconds_saved += seconds
+        logger.info(
+            "Cache hit for %s (%s): read %.1f MB, saved %.1fs of compute",
+            self.name,
+            key[:12],
+            len(payload) / 1e6,
+            seconds,
+        )
+        return True, pickle.loads(payload)  # noqa: S301 # Written by this class
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        """Return the cached result, computing it under the key's lock if absent."""
+        key: str = cache_key(_find_config(args, kwargs), self.keys, self.function_id)
+        hit, value = self._read(key)
+        if hit:
+            return value
+        (self.directory / LOCKS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        lock = FileLock(self.directory / LOCKS_DIR_NAME / f"{key}.lock")
+        acquire_lock(lock, self.name)
+        try:
+            hit, value = self._read(key)  # Computed while this process waited
+            if hit:
+                return value
+            start: float = time.perf_counter()
+            value = self.func(*args, **kwargs)
+            seconds: float = time.perf_counter() - start
+            payload: bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            self._store().set(key + _META_SUFFIX, {"seconds": seconds})
+            self._store().set(key, payload)
+        finally:
+            lock.release()
+        self.cache_stats.misses += 1
+        logger.info(
+            "Cache miss for %s (%s): computed in %.1fs, stored %.1f MB",
+            self.name,
+            key[:12],
+            seconds,
+            len(payload) / 1e6,
+        )
+        return value
+
+
+def cache(
+    keys: list[str] | None = None,
+    *,
+    root_dir: str | Path | None = None,
+    max_size_gb: float = 20.0,
+) -> Callable[[Callable[..., ReturnT]], Callable[..., ReturnT]]:
+    """Memoize a function on disk, keyed by parts of the run configuration.
+
+    The decorated function receives the run configuration (``cfg`` or the
+    first ``DictConfig`` argument); only the config subtrees in *keys* and the
+    function's source enter the key, so other arguments (e.g. the
+    accelerator) must not change the result.  Results are pickled.  The
+    decorated function gains a ``cache_stats`` attribute with this process's
+    ``CacheStats``.
+
+    Args:
+        keys: Dot-separated config keys whose values determine the result,
+            e.g. ``["data", "tokenizer.name"]``; ``None`` uses the whole
+            config.
+        root_dir: Cache directory; ``None`` uses
+            ``$XDG_CACHE_HOME/hydraxcel/<project>/memo``.
+        max_size_gb: Size above which the least recently used results are
+            evicted.
+
+    Returns:
+        The decorator.
+
+    Raises:
+        ValueError: If *max_size_gb* is not positive.
+
+    """
+    if max_size_gb <= 0:
+        msg = f"max_size_gb must be positive, got {max_size_gb}"
+        raise ValueError(msg)
+
+    def decorator(func: Callable[..., ReturnT]) -> Callable[..., ReturnT]:
+        directory: Path = (
+            Path(root_dir).expanduser() if root_dir else default_cache_root(func)
+        )
+        return _CachedFunction(
+            func,
+            keys,
+            directory.absolute(),
+            int(max_size_gb * 1e9),
+        )
+
+    return decorator
@@ -0,0 +1,458 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Stage-level pipelines whose stages are cached by their config dependencies.
+
+A ``Pipeline`` is a DAG of stages, e.g. preprocess → tokenize → train →
+evaluate.  Each stage declares the config subtrees and upstream stages it
+depends on, and its key hashes those subtrees of the resolved config, the
+stage's source and the keys of its upstream stages.  Changing the learning
+rate therefore only reruns the stages that read it and the stages downstream
+of them.  Completed stages are stored in a project-level directory shared by
+runs and sweep jobs, with a per-key file lock so that only one process
+computes a stage.  Independent stages run concurrently on a process pool;
+stages that need the accelerator (e.g. training) run on every rank in the
+calling process.
+"""
+
+import json
+import logging
+import os
+import pickle
+import shutil
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable
+
+from accelerate import Accelerator
+from accelerate.utils import broadcast_object_list
+from filelock import FileLock
+from omegaconf import DictConfig
+
+from hydraxcel.run.config_registry import PipelineConfig  # noqa: TC001
+from hydraxcel.run.memoize import (
+    LOCKS_DIR_NAME,
+    acquire_lock,
+    cache_key,
+    default_cache_root,
+    source_hash,
+)
+from hydraxcel.run.setup import accepted_kwargs
+
+__all__ = ["Pipeline", "Stage"]
+
+RESULT_FILE_NAME: str = "result.pkl"
+MARKER_FILE_NAME: str = "stage.json"  # Written last, marks a complete entry
+ARTIFACTS_DIR_NAME: str = "artifacts"
+
+logger = logging.getLogger("pipeline")
+
+
+@dataclass
+class Stage:
+    """A pipeline stage and the dependencies that determine its output."""
+
+    name: str
+    func: Callable[..., Any]
+    keys: list[str] | None  # None: the whole config except ``pipeline``
+    inputs: list[str]  # Upstream stages, passed by name as keyword arguments
+    artifacts: list[str]  # Files the stage writes to its ``output_dir``
+    cache: bool = True
+    distributed: bool = False  # Run on every rank in this process, with the accelerator
+
+
+@dataclass
+class _Entry:
+    """Where a stage stores its output for one key."""
+
+    key: str
+    directory: Path
+    force: bool  # Recompute even when complete
+
+    @property
+    def output_dir(self) -> Path:
+        return self.directory / ARTIFACTS_DIR_NAME
+
+
+def _is_complete(entry: _Entry, stage: Stage) -> bool:
+    """Return whether *entry* holds a reusable output of *stage*."""
+    return (
+        not entry.force
+        and (entry.directory / MARKER_FILE_NAME).is_file()
+        and all((entry.output_dir / name).exists() for name in stage.artifacts)
+    )
+
+
+def _load(entry: _Entry) -> Any:  # noqa: ANN401
+    """Read the stored output of *entry*."""
+    with (entry.directory / RESULT_FILE_NAME).open("rb") as file:
+        return pickle.load(file)  # noqa: S301 # Written by this module
+
+
+def _store(entry: _Entry, stage: Stage, value: Any, seconds: float) -> None:  # noqa: ANN401
+    """Write *value* to *entry* and mark it complete."""
+    missing: list[str] = [
+        name for name in stage.artifacts if not (entry.output_dir / name).exists()
+    ]
+    if missing:
+        msg = f"Stage {stage.name!r} did not write its artifacts {missing}"
+        raise FileNotFoundError(msg)
+    with (entry.directory / RESULT_FILE_NAME).open("wb") as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+    marker: Path = entry.directory / f".{MARKER_FILE_NAME}.{os.getpid()}.tmp"
+    marker.write_text(
+        json.dumps({"stage": stage.name, "key": entry.key, "seconds": seconds}),
+    )
+    marker.replace(entry.directory / MARKER_FILE_NAME)
+
+
+def _reset(entry: _Entry) -> None:
+    """Remove the earlier output of *entry*, leaving an empty ``output_dir``."""
+    (entry.directory / MARKER_FILE_NAME).unlink(missing_ok=True)
+    shutil.rmtree(entry.output_dir, ignore_errors=True)
+    entry.output_dir.mkdir(parents=True)
+
+
+def _call(
+    stage: Stage,
+    entry: _Entry,
+    cfg: DictConfig,
+    inputs: dict[str, Any],
+    accelerator: Accelerator | None,
+) -> tuple[Any, float]:
+    """Run *stage* into *entry*, returning its output and duration."""
+    start: float = time.perf_counter()
+    value: Any = stage.func(
+        cfg,
+        **inputs,
+        **accepted_kwargs(
+            stage.func,
+            {"output_dir": entry.output_dir, "accelerator": accelerator},
+        ),
+    )
+    return value, time.perf_counter() - start
+
+
+def _run_locked(
+    stage: Stage,
+    entry: _Entry,
+    cfg: DictConfig,
+    inputs: dict[str, Any],
+    lock_path: Path,
+) -> tuple[Any, float | None]:
+    """Compute *stage* under its key's lock unless another process already has.
+
+    Runs in the process pool.  Returns the output and the compute time, which
+    is ``None`` when the output was read from a concurrent process's entry.
+    """
+    lock = FileLock(lock_path)
+    acquire_lock(lock, stage.name, logger)
+    try:
+        if _is_complete(entry, stage):
+            return _load(entry), None
+        _reset(entry)
+        value, seconds = _call(stage, entry, cfg, inputs, None)
+        _store(entry, stage, value, seconds)
+        return value, seconds
+    finally:
+        lock.release()
+
+
+@dataclass
+class Pipeline:
+    """A DAG of cached stages, declared with the ``stage`` decorator.
+
+    Stages are called as ``func(cfg, **upstream_outputs)``, plus
+    ``output_dir`` and ``accelerator`` if they take those parameters.  Stage
+    functions must be defined at module level so that the process pool can
+    import them, and their outputs must be picklable; write large outputs as
+    artifacts to ``output_dir`` and return their paths.
+    """
+
+    stages: dict[str, Stage] = field(default_factory=dict)
+
+    def stage(  # noqa: PLR0913
+        self,
+        keys: list[str] | None = None,
+        *,
+        inputs: list[str] | None = None,
+        artifacts: list[str] | None = None,
+        cache: bool = True,
+        distributed: bool = False,
+        name: str | None = None,
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Register the decorated function as a stage of this pipeline.
+
+        Args:
+            keys: Dot-separated config keys whose values determine the
+                stage's output; ``None`` uses the whole config except the
+                ``pipeline`` group.
+            inputs: Names of earlier stages whose outputs the stage takes.
+            artifacts: File or directory names the stage writes to its
+                ``output_dir``; a stored entry is only reused while they exist.
+            cache: Reuse stored outputs; ``False`` always reruns the stage.
+            distributed: Run the stage on every rank in the calling process
+                with the accelerator, e.g. for training, instead of once on
+                the process pool.
+            name: Stage name; defaults to the function name.
+
+        Returns:
+            The decorator, which returns the function unchanged.
+
+        Raises:
+            ValueError: If the name is taken or an input is not an earlier
+                stage.
+
+        """
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            stage_name: str = name or func.__name__  # ty:ignore[unresolved-attribute]
+            if stage_name in self.stages:
+                msg = f"Pipeline already has a stage named {stage_name!r}"
+                raise ValueError(msg)
+            unknown: list[str] = [
+                upstream for upstream in inputs or [] if upstream not in self.stages
+            ]
+            if unknown:  # Requiring earlier stages also rules out cycles
+                msg = f"Stage {stage_name!r} depends on unknown stages {unknown}"
+                raise ValueError(msg)
+            self.stages[stage_name] = Stage(
+                name=stage_name,
+                func=func,
+                keys=keys,
+                inputs=list(inputs or []),
+                artifacts=list(artifacts or []),
+                cache=cache,
+                distributed=distributed,
+            )
+            return func
+
+        return decorator
+
+    def _entries(
+        self,
+        cfg: DictConfig,
+        config: PipelineConfig | None,
+        root: Path,
+    ) -> dict[str, _Entry]:
+        """Key every stage, chaining the keys of its upstream stages."""
+        rerun: set[str] = set(config.rerun) if config is not None else set()
+        unknown: set[str] = rerun - set(self.stages)
+        if unknown:
+            msg = f"Cannot rerun unknown stages {sorted(unknown)}"
+            raise ValueError(msg)
+        keys_of_all: list[str] = [str(key) for key in cfg if key != "pipeline"]
+        entries: dict[str, _Entry] = {}
+        for stage in self.stages.values():  # Registration order is topological
+            upstream: dict[str, str] = {
+                upstream: entries[upstream].key for upstream in stage.inputs
+            }
+            key: str = cache_key(
+                cfg,
+                stage.keys if stage.keys is not None else keys_of_all,
+                f"{stage.name}:{source_hash(stage.func)}:{json.dumps(upstream)}",
+            )
+            entries[stage.name] = _Entry(
+                key=key,
+                directory=root / stage.name / key,
+                force=(
+                    config is None
+                    or not config.enabled
+                    or not stage.cache
+                    or stage.name in rerun
+                ),
+            )
+        return entries
+
+    def run(
+        self,
+        cfg: DictConfig,
+        accelerator: Accelerator | None = None,
+    ) -> dict[str, Any]:
+        """Run the stages whose dependencies changed and return every output.
+
+        Settings come from the ``pipeline`` group of *cfg*; without it, every
+        stage reruns.  Stages whose inputs are ready run concurrently on a
+        process pool, while ``distributed`` stages run one at a time in this
+        process in declaration order, so that all ranks enter them together.
+
+        Args:
+            cfg: Resolved run configuration passed to every stage.
+            accelerator: Passed to stages that take an ``accelerator``
+                parameter; required by ``distributed`` stages.
+
+        Returns:
+            The output of every stage, by stage name.
+
+        Raises:
+            ValueError: If a ``distributed`` stage has no accelerator, or
+                ``pipeline.rerun`` names an unknown stage.
+
+        """
+        if not self.stages:
+            return {}
+        config: PipelineConfig | None = cfg.get("pipeline")
+        if accelerator is None and any(s.distributed for s in self.stages.values()):
+            msg = "Distributed pipeline stages need an accelerator"
+            raise ValueError(msg)
+        root: Path = (
+            Path(config.root_dir).expanduser()
+            if config is not None and config.root_dir
+            else default_cache_root(next(iter(self.stages.values())).func, "pipeline")
+        ).absolute()
+        runner = _Runner(
+            self,
+            cfg,
+            accelerator,
+            self._entries(cfg, config, root),
+            config,
+            root / LOCKS_DIR_NAME,
+        )
+        try:
+            return runner.run()
+        finally:
+            runner.close()
+
+
+class _Runner:
+    """Schedule the stages of one ``Pipeline.run`` call."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        pipeline: Pipeline,
+        cfg: DictConfig,
+        accelerator: Accelerator | None,
+        entries: dict[str, _Entry],
+        config: PipelineConfig | None,
+        lock_dir: Path,
+    ) -> None:
+        """Initialise the schedule; the process pool starts with the first stage."""
+        self.pipeline: Pipeline = pipeline
+        self.cfg: DictConfig = cfg
+        self.accelerator: Accelerator | None = accelerator
+        self.entries: dict[str, _Entry] = entries
+        self.max_workers: int | None = config.max_workers if config else None
+        self.mp_context: str = config.mp_context if config else "spawn"
+        self.lock_dir: Path = lock_dir
+        self.outputs: dict[str, Any] = {}
+        self.running: dict[Future, Stage] = {}
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _ready(self, stage: Stage) -> bool:
+        return stage.name not in self.outputs and all(
+            upstream in self.outputs for upstream in stage.inputs
+        )
+
+    def _pool_for(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=get_context(self.mp_context),
+            )
+        return self._pool
+
+    def _finish(self, stage: Stage, value: Any, seconds: float | None) -> None:  # noqa: ANN401
+        self.outputs[stage.name] = value
+        entry: _Entry = self.entries[stage.name]
+        if seconds is None:
+            logger.info("Stage %s: reused %s", stage.name, entry.key[:12])
+        else:
+            logger.info(
+                "Stage %s: computed %s in %.1fs",
+                stage.name,
+                entry.key[:12],
+                seconds,
+            )
+
+    def _submit(self, stage: Stage) -> None:
+        """Reuse a complete entry of *stage* or start computing it on the pool."""
+        entry: _Entry = self.entries[stage.name]
+        if _is_complete(entry, stage):
+            self._finish(stage, _load(entry), None)
+            return
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        future: Future = self._pool_for().submit(
+            _run_locked,
+            stage,
+            entry,
+            self.cfg,
+            {upstream: self.outputs[upstream] for upstream in stage.inputs},
+            self.lock_dir / f"{entry.key}.lock",
+        )
+        self.running[future] = stage
+
+    def _run_distributed(self, stage: Stage) -> None:
+        """Run *stage* on every rank, storing its output from the main process."""
+        accelerator: Accelerator | None = self.accelerator
+        if accelerator is None:  # Rejected by Pipeline.run already
+            msg = "Distributed pipeline stages need an accelerator"
+            raise ValueError(msg)
+        entry: _Entry = self.entries[stage.name]
+        # Every rank must take the same branch, so the main process decides
+        complete: list[bool] = broadcast_object_list([_is_complete(entry, stage)])
+        if complete[0]:
+            self._finish(stage, _load(entry), None)
+            return
+        if accelerator.is_main_process:
+            _reset(entry)
+        accelerator.wait_for_everyone()
+        value, seconds = _call(
+            stage,
+            entry,
+            self.cfg,
+            {upstream: self.outputs[upstream] for upstream in stage.inputs},
+            accelerator,
+        )
+        accelerator.wait_for_everyone()
+        if accelerator.is_main_process:
+            _store(entry, stage, value, seconds)
+        self._finish(stage, value, seconds)
+
+    def run(self) -> dict[str, Any]:
+        """Run every stage as soon as its inputs are ready."""
+        stages: list[Stage] = list(self.pipeline.stages.values())
+        distributed: list[Stage] = [stage for stage in stages if stage.distributed]
+        while len(self.outputs) < len(stages):
+            for stage in stages:
+                if (
+                    not stage.distributed
+                    and stage not in self.running.values()
+                    and self._ready(stage)
+                ):
+                    self._submit(stage)
+            if distributed and self._ready(distributed[0]):
+                self._run_distributed(distributed.pop(0))
+                continue
+            if not self.running:
+                continue  # Reused entries made more stages ready
+            done, _ = wait(self.running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage: Stage = self.running.pop(future)
+                self._finish(stage, *future.result())
+        return self.outputs
+
+    def close(self) -> None:
+        """Shut down the process pool, cancelling stages that have not started."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
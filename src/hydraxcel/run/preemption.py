@@ -0,0 +1,223 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Checkpoint and exit cleanly when the scheduler preempts the job.
+
+Schedulers send ``SIGTERM`` (Slurm, Kubernetes) or ``SIGUSR1`` (Slurm's
+``--signal``) some time before they kill a job.  ``handle_preemption`` turns
+these signals into a stop request on every rank: the handler only sets a flag
+(and calls the handler it replaced, e.g. the stack sampler's dump), and at a
+``mark_step`` boundary the ranks agree with a one-element all-reduce whether
+any of them was signalled.  All ranks then stop at the same step, write a
+checkpoint, and exit with a status code the requeue logic recognises; the
+trackers are flushed by ``end_training`` on the way out.
+"""
+
+import logging
+import signal
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType  # noqa: TC003
+from typing import Any, Generator
+
+import torch
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.run.checkpoint import CheckpointManager  # noqa: TC001
+from hydraxcel.run.config_registry import PreemptionConfig  # noqa: TC001
+from hydraxcel.run.elastic import CHECKPOINTS_DIR_NAME
+from hydraxcel.run.hooks import register_step_hook
+from hydraxcel.run.resume import ResumeState  # noqa: TC001
+
+__all__ = ["PreemptionHandler", "handle_preemption"]
+
+logger = logging.getLogger("preemption")
+
+
+class PreemptionHandler:
+    """Stop all ranks at a common step once any of them is signalled."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        accelerator: Accelerator,
+        *,
+        checkpoints: CheckpointManager | None = None,
+        signals: tuple[signal.Signals, ...] = (signal.SIGTERM, signal.SIGUSR1),
+        sync_every: int = 10,
+        save_checkpoint: bool = True,
+        exit_code: int = 143,
+        step: int = 0,
+    ) -> None:
+        """Initialise the handler; nothing is installed until ``install``.
+
+        Args:
+            accelerator: The run's ``Accelerator``.
+            checkpoints: The run's checkpoint manager; without one the
+                checkpoint is written with ``Accelerator.save_state``.
+            signals: The signals that request a stop.
+            sync_every: Number of ``mark_step`` calls between the cross-rank
+                agreements; each costs an all-reduce and a device sync.
+            save_checkpoint: Whether to checkpoint before exiting.
+            exit_code: The status the processes exit with.
+            step: The step the run starts from, e.g. a resumed checkpoint's.
+
+        Raises:
+            ValueError: If *sync_every* is not positive.
+
+        """
+        if sync_every < 1:
+            msg = f"sync_every must be >= 1, got {sync_every}"
+            raise ValueError(msg)
+        self.accelerator: Accelerator = accelerator
+        self.checkpoints: CheckpointManager | None = checkpoints
+        self.signals: tuple[signal.Signals, ...] = signals
+        self.sync_every: int = sync_every
+        self.save_checkpoint: bool = save_checkpoint
+        self.exit_code: int = exit_code
+        self.step: int = step
+        self.received: signal.Signals | None = None
+        self._steps_seen: int = 0
+        self._previous: dict[signal.Signals, Any] = {}
+
+    @property
+    def stop_requested(self) -> bool:
+        """Whether this rank received one of the signals."""
+        return self.received is not None
+
+    def install(self) -> None:
+        """Install the signal handlers (from the main thread only)."""
+        for signum in self.signals:
+            self._previous[signum] = signal.signal(signum, self._handle)
+
+    def uninstall(self) -> None:
+        """Restore the handlers that ``install`` replaced."""
+        for signum, previous in self._previous.items():
+            signal.signal(signum, previous)
+        self._previous.clear()
+
+    def _handle(self, signum: int, frame: FrameType | None) -> None:
+        self.received = signal.Signals(signum)
+        previous = self._previous.get(self.received)
+        if callable(previous):
+            previous(signum, frame)
+        elif self._steps_seen == 0 and previous == signal.SIG_DFL:
+            # The loop does not call mark_step, so nobody would act on the flag
+            self.uninstall()
+            signal.raise_signal(signum)
+
+    def on_step(self) -> None:
+        """Count a step and, every ``sync_every`` steps, agree on stopping."""
+        self.step += 1
+        self._steps_seen += 1
+        if self._steps_seen % self.sync_every:
+            return
+        flag = torch.tensor(float(self.stop_requested), device=self.accelerator.device)
+        if self.accelerator.reduce(flag, reduction="max").item():
+            self.stop()
+
+    def _save(self) -> Path | None:
+        """Write the preemption checkpoint and wait until it is complete."""
+        if self.checkpoints is not None:
+            path: Path = self.checkpoints.save(self.step, {})
+            self.checkpoints.wait()
+            return path
+        configuration = self.accelerator.project_configuration
+        if configuration.automatic_checkpoint_naming:
+            return Path(self.accelerator.save_state())
+        return Path(
+            self.accelerator.save_state(
+                str(get_run_dir() / CHECKPOINTS_DIR_NAME / f"checkpoint_{self.step}"),
+            ),
+        )
+
+    def stop(self) -> None:
+        """Checkpoint and exit all ranks at the current step.
+
+        Raises:
+            SystemExit: Always, with ``exit_code``.
+
+        """
+        logger.warning(
+            "Preempted (%s on this rank): stopping at step %d",
+            "no signal" if self.received is None else self.received.name,
+            self.step,
+        )
+        if self.save_checkpoint:
+            path: Path | None = self._save()
+            logger.warning("Saved preemption checkpoint %s", path)
+        self.accelerator.wait_for_everyone()
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+        raise SystemExit(self.exit_code)
+
+
+@contextmanager
+def handle_preemption(
+    config: PreemptionConfig | DictConfig | None,
+    accelerator: Accelerator,
+    *,
+    checkpoints: CheckpointManager | None = None,
+    resume: ResumeState | None = None,
+) -> Generator[PreemptionHandler | None]:
+    """Stop, checkpoint and exit on the configured preemption signals.
+
+    The training loop must call ``mark_step`` once per step; the handler
+    counts the steps from the resumed checkpoint's step (or 0).  Install it
+    after services that use the same signals so that it chains to them.
+
+    Args:
+        config: The ``preemption`` node of the run configuration, or ``None``.
+        accelerator: The run's ``Accelerator``.
+        checkpoints: The run's checkpoint manager, if any.
+        resume: The resume state of a relaunched run, if any.
+
+    Yields:
+        The installed ``PreemptionHandler`` or ``None`` when disabled.
+
+    """
+    # Signal handlers can only be installed from the main thread
+    if (
+        config is None
+        or not config.enabled
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield None
+        return
+
+    handler = PreemptionHandler(
+        accelerator,
+        checkpoints=checkpoints,
+        signals=tuple(signal.Signals[name] for name in config.signals),
+        sync_every=config.sync_every,
+        save_checkpoint=config.checkpoint,
+        exit_code=config.exit_code,
+        step=resume.step if resume is not None and resume.step is not None else 0,
+    )
+    handler.install()
+    remove_hook = register_step_hook(handler.on_step)
+    try:
+        yield handler
+    finally:
+        remove_hook()
+        handler.uninstall()
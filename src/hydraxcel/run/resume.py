@@ -0,0 +1,291 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Automatic resume of relaunched runs.
+
+Every run directory gets a small record with the fingerprint of the resolved
+run configuration and the ids of its tracker runs.  When a configuration is
+launched again (e.g. after its job was preempted), ``find_previous_run``
+looks up the earlier runs with the same fingerprint and their newest complete
+checkpoint, and points W&B and MLflow at the earlier tracker run.
+``resume_run`` then loads that checkpoint as soon as ``accelerator.prepare``
+has registered what it holds, which also restores the Python, numpy and torch
+RNG states, and links the new run directory to the old one.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Generator
+
+from accelerate import Accelerator
+from hydra.core.hydra_config import HydraConfig
+from hydra.utils import to_absolute_path
+from omegaconf import DictConfig, OmegaConf
+
+from hydraxcel.hydra import get_run_dir
+from hydraxcel.run.checkpoint import METADATA_FILE_NAME
+from hydraxcel.run.config_registry import ResumeConfig  # noqa: TC001
+from hydraxcel.run.elastic import (
+    COMPLETE_CHECKPOINT_MARKER,
+    checkpoint_contents,
+    latest_checkpoint,
+    resume_on_prepare,
+)
+
+__all__ = [
+    "ResumeState",
+    "config_fingerprint",
+    "find_previous_run",
+    "resume_run",
+]
+
+RUN_RECORD_FILE_NAME: str = "run_record.json"
+LINK_NAME: str = "resumed_from"
+# Read by ``wandb.init`` and ``mlflow.start_run`` when no run id is passed
+_TRACKER_RUN_ENV: dict[str, str] = {
+    "wandb": "WANDB_RUN_ID",
+    "mlflow": "MLFLOW_RUN_ID",
+}
+
+logger = logging.getLogger("resume")
+
+
+@dataclass
+class ResumeState:
+    """What a relaunched run resumes from.
+
+    ``checkpoint`` is ``None`` when no earlier run with the same fingerprint
+    left a complete checkpoint; the run then starts from scratch.  ``step``
+    and ``metrics`` are those saved by the ``CheckpointManager`` (``None`` and
+    empty for checkpoints written by ``Accelerator.save_state``).
+    """
+
+    fingerprint: str
+    previous_run: Path | None = None
+    checkpoint: Path | None = None
+    step: int | None = None
+    metrics: dict[str, float] = field(default_factory=dict)
+    tracker_runs: dict[str, str] = field(default_factory=dict)
+
+
+def _drop_key(container: dict, key: str) -> None:
+    """Remove the dot-separated *key* from the nested *container*, if present."""
+    *parents, name = key.split(".")
+    node: Any = container
+    for parent in parents:
+        node = node.get(parent)
+        if not isinstance(node, dict):
+            return
+    node.pop(name, None)
+
+
+def config_fingerprint(cfg: DictConfig, ignore_keys: list[str] | None = None) -> str:
+    """Hash the resolved run configuration.
+
+    Args:
+        cfg: The run configuration.
+        ignore_keys: Dot-separated keys that do not affect the fingerprint.
+
+    Returns:
+        A hex digest that is equal for configurations with equal values.
+
+    """
+    container: dict = OmegaConf.to_container(cfg, resolve=True)  # ty:ignore[invalid-assignment]
+    for key in ignore_keys or []:
+        _drop_key(container, key)
+    encoded: bytes = json.dumps(container, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _search_dirs(config: ResumeConfig | DictConfig) -> list[Path]:
+    """Folders holding the earlier run directories of this job."""
+    if config.search_dirs:
+        return [Path(to_absolute_path(directory)) for directory in config.search_dirs]
+    if not HydraConfig.initialized():
+        return []
+    hydra_config = HydraConfig.get()
+    launch_dir = Path(hydra_config.runtime.cwd)
+    return [
+        launch_dir / root / hydra_config.job.name for root in ("outputs", "multirun")
+    ]
+
+
+def _matching_runs(
+    directories: list[Path],
+    fingerprint: str,
+) -> Generator[tuple[Path, dict[str, Any]]]:
+    """Yield the run directories below *directories* with *fingerprint*."""
+    for directory in directories:
+        for record_path in directory.rglob(RUN_RECORD_FILE_NAME):
+            try:
+                record: dict[str, Any] = json.loads(record_path.read_text())
+            except OSError:  # Removed concurrently
+                continue
+            except json.JSONDecodeError:
+                logger.warning("Skipping unreadable run record %s", record_path)
+                continue
+            if record.get("fingerprint") == fingerprint:
+                yield record_path.parent, record
+
+
+def find_previous_run(
+    config: ResumeConfig | DictConfig | None,
+    cfg: DictConfig,
+) -> ResumeState | None:
+    """Find the newest checkpoint of earlier runs of the same configuration.
+
+    Call before the trackers are initialised: with ``link_trackers`` the ids
+    of the earlier tracker runs are exported, so the new run continues them.
+
+    Args:
+        config: The ``resume`` node of the run configuration; ``None``
+            disables resuming.
+        cfg: The run configuration, which is fingerprinted.
+
+    Returns:
+        The resume state, or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        return None
+
+    state = ResumeState(
+        fingerprint=config_fingerprint(cfg, list(config.ignore_keys)),
+    )
+    newest: float = -1.0
+    for run_dir, record in _matching_runs(_search_dirs(config), state.fingerprint):
+        checkpoint: Path | None = latest_checkpoint(run_dir / config.checkpoint_subdir)
+        if checkpoint is None:
+            continue
+        saved: float = (checkpoint / COMPLETE_CHECKPOINT_MARKER).stat().st_mtime
+        if saved > newest:
+            newest = saved
+            state.previous_run, state.checkpoint = run_dir, checkpoint
+            state.tracker_runs = record.get("trackers", {})
+    if state.checkpoint is None:
+        logger.info("No earlier run with fingerprint %s to resume", state.fingerprint)
+        return state
+
+    metadata_path: Path = state.checkpoint / METADATA_FILE_NAME
+    if metadata_path.exists():
+        metadata: dict[str, Any] = json.loads(metadata_path.read_text())
+        state.step, state.metrics = metadata["step"], metadata["metrics"]
+    if config.link_trackers:
+        for name, run_id in state.tracker_runs.items():
+            if name in _TRACKER_RUN_ENV:
+                os.environ[_TRACKER_RUN_ENV[name]] = run_id
+        os.environ["WANDB_RESUME"] = "allow"
+    else:
+        state.tracker_runs = {}
+    logger.info("Resuming from %s of %s", state.checkpoint, state.previous_run)
+    return state
+
+
+def _tracker_runs(accelerator: Accelerator) -> dict[str, str]:
+    """Collect the run ids of the accelerator's trackers."""
+    runs: dict[str, str] = {}
+    for tracker in accelerator.trackers:
+        run = tracker.tracker
+        run_id: str | None = getattr(run, "id", None) or getattr(
+            getattr(run, "info", None),
+            "run_id",
+            None,
+        )
+        if run_id:
+            runs[tracker.name] = run_id
+    return runs
+
+
+def _write_record(run_dir: Path, state: ResumeState, accelerator: Accelerator) -> None:
+    """Record the fingerprint and tracker runs that later launches look up."""
+    record: dict[str, Any] = {
+        "fingerprint": state.fingerprint,
+        "time": time.time(),
+        "resumed_from": str(state.checkpoint) if state.checkpoint else None,
+        "trackers": _tracker_runs(accelerator) or state.tracker_runs,
+    }
+    temporary: Path = run_dir / f".{RUN_RECORD_FILE_NAME}.tmp"
+    temporary.write_text(json.dumps(record, indent=2))
+    temporary.replace(run_dir / RUN_RECORD_FILE_NAME)
+
+
+@contextmanager
+def resume_run(
+    state: ResumeState | None,
+    accelerator: Accelerator,
+    *,
+    automatic_checkpoint_naming: bool = False,
+) -> Generator[ResumeState | None]:
+    """Resume the run from the checkpoint *state* found and record the run.
+
+    An elastic restart that already resumes from the run's own checkpoint is
+    left alone.
+
+    Args:
+        state: The result of ``find_previous_run``.
+        accelerator: The run's ``Accelerator``, with its trackers initialised.
+        automatic_checkpoint_naming: Unless the run configured its own
+            ``project_dir``, save to the run directory with Accelerate's
+            automatic checkpoint naming, so that a bare
+            ``accelerator.save_state()`` writes checkpoints a later launch
+            resumes from.  Accelerate then ignores the path passed to
+            ``save_state``.
+
+    Yields:
+        *state* if it has a checkpoint to resume from, otherwise ``None``.
+
+    """
+    if state is None:
+        yield None
+        return
+
+    run_dir: Path = get_run_dir()
+    if (
+        automatic_checkpoint_naming
+        and accelerator.project_configuration.project_dir is None
+    ):
+        accelerator.project_configuration.set_directories(str(run_dir))
+        accelerator.project_configuration.automatic_checkpoint_naming = True
+    resuming: bool = state.checkpoint is not None and "prepare" not in vars(accelerator)
+    if resuming:
+        resume_on_prepare(accelerator, state.checkpoint)
+    if accelerator.is_main_process:
+        _write_record(run_dir, state, accelerator)
+        link: Path = run_dir / LINK_NAME
+        if state.previous_run not in {None, run_dir} and not link.exists():
+            with suppress(OSError):  # Filesystems without symlinks
+                link.symlink_to(state.previous_run, target_is_directory=True)
+    try:
+        yield state if state.checkpoint is not None else None
+    finally:
+        if resuming and "prepare" in vars(accelerator):
+            del accelerator.prepare
+            logger.warning(
+                "%s was not loaded: prepare() never registered %s",
+                state.checkpoint,
+                checkpoint_contents(state.checkpoint),
+            )
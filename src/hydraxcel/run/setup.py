@@ -26,8 +26,9 @@ Provides seed initialisation, Hydra/logging setup helpers, and the
 Accelerate, Hydra config management, and an experiment-tracking platform.
 """
 
+import inspect
 import random
-from dataclasses import is_dataclass
+from dataclasses import field, fields, is_dataclass, make_dataclass
 from functools import wraps
 from pathlib import Path
 from typing import Callable
@@ -40,6 +41,7 @@ from hydra.conf import HydraConf, JobConf, RunDir, SweepDir
 from hydra.core.config_store import ConfigStore
 from omegaconf import DictConfig
 
+from hydraxcel.accelerate.topology import apply_launch_cpu_affinity
 from hydraxcel.logging import (
     LoggingPlatform,
     create_logging_config,
@@ -49,14 +51,71 @@ from hydraxcel.logging import (
     log_system_info,
     setup_exception_logging,
 )
+from hydraxcel.monitoring import (
+    ResourceMonitorConfig,
+    StragglerConfig,
+    WatchdogConfig,
+    detect_stragglers,
+    load_monitoring_configs,
+    monitor_resources,
+    watch_progress,
+)
+from hydraxcel.profiling import (
+    MemoryDiagnosticsConfig,
+    ProfileConfig,
+    SamplerConfig,
+    diagnose_memory,
+    load_profile_configs,
+    profile_run,
+    sample_run,
+)
+from hydraxcel.run.accelerator import build_accelerator
+from hydraxcel.run.checkpoint import checkpoint_manager
+from hydraxcel.run.compile_cache import compile_cache
+from hydraxcel.run.config_registry import (
+    AcceleratorConfig,
+    CheckpointConfig,
+    CompileCacheConfig,
+    ElasticConfig,
+    PipelineConfig,
+    PreemptionConfig,
+    ResumeConfig,
+    StagingConfig,
+    load_run_configs,
+)
+from hydraxcel.run.elastic import RUN_TIME_ENV, elastic_run
+from hydraxcel.run.preemption import handle_preemption
+from hydraxcel.run.resume import ResumeState, find_previous_run, resume_run
+from hydraxcel.run.staging import stage_data
 
 __all__ = [
     "_setup_hydra_config_and_logging",
+    "accepted_kwargs",
     "hydraxcel_main",
     "set_seed",
 ]
 logger = get_logger("__main__")
 
+# Optional config groups that ``hydraxcel_main`` consumes from the run config.
+_RUN_CONFIG_GROUPS: dict[str, type] = {
+    "accelerator": AcceleratorConfig,
+    "checkpoint": CheckpointConfig,
+    "compile_cache": CompileCacheConfig,
+    "elastic": ElasticConfig,
+    "resume": ResumeConfig,
+    "preemption": PreemptionConfig,
+    "pipeline": PipelineConfig,
+    "staging": StagingConfig,
+    "profile": ProfileConfig,
+    "sampler": SamplerConfig,
+    "resources": ResourceMonitorConfig,
+    "watchdog": WatchdogConfig,
+    "stragglers": StragglerConfig,
+    "memory": MemoryDiagnosticsConfig,
+}
+# Elastic launches pin the timestamp so that restarts reuse the run directory
+_RUN_TIME: str = "${oc.env:" + RUN_TIME_ENV + ",${now:%Y-%m-%d_%H-%M-%S}}"
+
 
 def _create_run_dir(
     root_dir: Path,
@@ -68,7 +127,8 @@ def _create_run_dir(
 
     Constructs a ``RunDir`` or ``SweepDir`` whose path components are Hydra
     interpolation placeholders derived from the supplied config keys, followed
-    by a timestamp segment.
+    by a timestamp segment (``HYDRAXCEL_RUN_TIME`` when set, e.g. by elastic
+    launches, otherwise the current time).
 
     Args:
         root_dir: Base directory under which outputs are written (e.g.
@@ -94,11 +154,7 @@ def _create_run_dir(
             _key = "${" + key + "}"
             sub_dir = sub_dir / _key  # ty:ignore[unsupported-operator]
 
-        sub_dir = (
-            sub_dir / "${now:%Y-%m-%d_%H-%M-%S}"
-            if sub_dir
-            else Path("${now:%Y-%m-%d_%H-%M-%S}")
-        )
+        sub_dir = sub_dir / _RUN_TIME if sub_dir else Path(_RUN_TIME)
 
         return SweepDir(
             dir=str(run_dir),
@@ -109,7 +165,7 @@ def _create_run_dir(
         _key = "${" + key + "}"
         run_dir = run_dir / _key
 
-    run_dir = run_dir / "${now:%Y-%m-%d_%H-%M-%S}"
+    run_dir = run_dir / _RUN_TIME
 
     return RunDir(str(run_dir))
 
@@ -196,6 +252,35 @@ def _setup_hydra_config_and_logging(
     return job_name
 
 
+def _add_run_config_groups(config_class: type) -> type:
+    """Extend a structured config with optional HydraXcel config-group fields.
+
+    Structured configs are in struct mode, so groups such as ``profile`` can
+    only be selected from the command line (``+profile=cpu``) if the schema
+    has a matching field.  Missing fields are added as ``None`` defaults on a
+    subclass carrying the same name as *config_class*.
+
+    Args:
+        config_class: The user's structured-config dataclass.
+
+    Returns:
+        *config_class* itself when nothing is missing, otherwise the subclass.
+
+    """
+    existing: set[str] = {
+        config_field.name
+        for config_field in fields(config_class)  # ty:ignore[invalid-argument-type]
+    }
+    missing: list[tuple[str, object, object]] = [
+        (name, group_class | None, field(default=None))
+        for name, group_class in _RUN_CONFIG_GROUPS.items()
+        if name not in existing
+    ]
+    if not missing:
+        return config_class
+    return make_dataclass(config_class.__name__, missing, bases=(config_class,))
+
+
 def _get_cfg_attr(cfg: DictConfig, attr: str) -> str | float | bool:
     if "." in attr:
         main_key, sub_key = attr.split(".", 1)
@@ -217,6 +302,18 @@ def set_seed(seed: int) -> None:
     np.random.default_rng(seed)
 
 
+def accepted_kwargs(
+    main_func: Callable[..., None],
+    candidates: dict[str, object],
+) -> dict[str, object]:
+    """Select the *candidates* that *main_func* takes as keyword arguments."""
+    parameters = inspect.signature(main_func).parameters.values()
+    if any(parameter.kind == parameter.VAR_KEYWORD for parameter in parameters):
+        return candidates
+    names: set[str] = {parameter.name for parameter in parameters}
+    return {name: value for name, value in candidates.items() if name in names}
+
+
 def hydraxcel_main(  # noqa: PLR0913
     project_name: str,
     *,
@@ -233,7 +330,11 @@ def hydraxcel_main(  # noqa: PLR0913
     Wraps a user-defined ``main(cfg, accelerator)`` function so that it is
     invoked through ``hydra.main``, receives an ``Accelerator`` instance, and
     initialises the chosen experiment-tracking platform before calling into
-    user code.
+    user code.  A main function with a ``checkpoints`` parameter also receives
+    the run's ``CheckpointManager`` (``None`` when checkpointing is disabled),
+    one with a ``resume`` parameter the ``ResumeState`` of a relaunched run
+    (``None`` when there is nothing to resume) and one with a ``preemption``
+    parameter the ``PreemptionHandler`` (``None`` when disabled).
 
     Args:
         project_name: Top-level project/experiment name passed to the logging
@@ -284,10 +385,14 @@ def hydraxcel_main(  # noqa: PLR0913
             add_submission_launcher=add_hydra_submission_launcher,
         )
 
+        load_run_configs()
+        load_profile_configs()
+        load_monitoring_configs()
+
         if config_class is not None:
             hydra_store = ConfigStore.instance().store
             hydra_store(
-                node=config_class,
+                node=_add_run_config_groups(config_class),
                 name=task_name,
             )
 
@@ -299,7 +404,8 @@ def hydraxcel_main(  # noqa: PLR0913
         )
         def acc_main_func(cfg: DictConfig) -> None:
             log_system_info()
-            accelerator: Accelerator = Accelerator()
+            apply_launch_cpu_affinity()
+            accelerator: Accelerator = build_accelerator(cfg.get("accelerator"))
             log_accelerator_info(accelerator)
             job_name: str | None = (
                 get_job_name(
@@ -309,6 +415,8 @@ def hydraxcel_main(  # noqa: PLR0913
                 if job_name_keys
                 else None
             )
+            # Before the trackers start, so that they continue the earlier run
+            resume: ResumeState | None = find_previous_run(cfg.get("resume"), cfg)
             init_logging_platform(
                 platform=logging_platform,
                 config=cfg,
@@ -318,7 +426,51 @@ def hydraxcel_main(  # noqa: PLR0913
                 accelerator=accelerator,
             )
             try:
-                main_func(cfg, accelerator)
+                with (
+                    elastic_run(cfg.get("elastic"), accelerator),
+                    resume_run(
+                        resume,
+                        accelerator,
+                        automatic_checkpoint_naming=resume is not None
+                        and cfg.resume.automatic_checkpoint_naming,
+                    ) as resumed,
+                    checkpoint_manager(
+                        cfg.get("checkpoint"),
+                        accelerator,
+                    ) as checkpoints,
+                    # Rewrites the staged paths in cfg before main_func reads them
+                    stage_data(cfg.get("staging"), cfg, accelerator),
+                    compile_cache(
+                        cfg.get("compile_cache"),
+                        accelerator,
+                        project_name=project_name,
+                    ),
+                    monitor_resources(cfg.get("resources"), accelerator),
+                    watch_progress(cfg.get("watchdog"), accelerator),
+                    detect_stragglers(cfg.get("stragglers"), accelerator),
+                    sample_run(cfg.get("sampler"), accelerator),
+                    diagnose_memory(cfg.get("memory"), accelerator),
+                    profile_run(cfg.get("profile"), accelerator),
+                    # Last, so that it chains to the other signal handlers
+                    handle_preemption(
+                        cfg.get("preemption"),
+                        accelerator,
+                        checkpoints=checkpoints,
+                        resume=resumed,
+                    ) as preemption,
+                ):
+                    main_func(
+                        cfg,
+                        accelerator,
+                        **accepted_kwargs(
+                            main_func,
+                            {
+                                "checkpoints": checkpoints,
+                                "resume": resumed,
+                                "preemption": preemption,
+                            },
+                        ),
+                    )
             finally:
                 # Do not manually end WANDB run
                 accelerator.trackers = (
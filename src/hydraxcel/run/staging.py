@@ -0,0 +1,421 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Node-local staging of datasets that live on slow shared filesystems.
+
+``stage_data`` copies the files and directories named by selected config
+keys to node-local scratch before the main function runs, and rewrites those
+config values to the local copies.  The local main process of every node
+copies each file in parallel chunks, recording a digest of every source
+chunk; the other ranks wait for it.  Once the copy is flushed to disk it is
+read back and checked against those digests, and so is every reused copy.
+Staged copies live in a cache shared by all jobs on the node: a copy is
+reused while its source is unchanged, a per-entry lock makes concurrent jobs
+wait for one copy instead of making their own, and the least recently used
+copies that no live job is using are evicted beyond the size cap.
+"""
+
+import getpass
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Generator
+
+from accelerate import Accelerator
+from filelock import FileLock
+from omegaconf import DictConfig, ListConfig, OmegaConf
+
+from hydraxcel.run.compile_cache import directory_size, pid_alive
+from hydraxcel.run.config_registry import StagingConfig  # noqa: TC001
+
+__all__ = ["StagingCache", "stage_data"]
+
+DATA_DIR_NAME: str = "data"
+SOURCE_FILE_NAME: str = "source.json"  # Written last, marks a complete copy
+LAST_USED_FILE_NAME: str = ".last_used"
+USERS_DIR_NAME: str = ".users"
+LOCKS_DIR_NAME: str = ".locks"
+
+logger = logging.getLogger("staging")
+
+
+def _signature(source: Path) -> list[list[Any]]:
+    """List the relative path, size and mtime of every file under *source*."""
+    files: list[Path] = (
+        sorted(path for path in source.rglob("*") if path.is_file())
+        if source.is_dir()
+        else [source]
+    )
+    signature: list[list[Any]] = []
+    for path in files:
+        stat: os.stat_result = path.stat()
+        relative: str = str(path.relative_to(source)) if source.is_dir() else ""
+        signature.append([relative, stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def _copy_chunk(source: Path, target: Path, offset: int, length: int) -> str:
+    """Copy one chunk of *source* into *target* and return the chunk's digest."""
+    with source.open("rb") as src, target.open("r+b") as dst:
+        data: bytes = os.pread(src.fileno(), length, offset)
+        os.pwrite(dst.fileno(), data, offset)
+    return hashlib.sha256(data).hexdigest()
+
+
+def _chunks(file_size: int, chunk_size: int) -> list[tuple[int, int]]:
+    """Split a file of *file_size* bytes into ``(offset, length)`` chunks."""
+    return [
+        (offset, min(chunk_size, file_size - offset))
+        for offset in range(0, file_size, chunk_size)
+    ]
+
+
+def _chunk_digest(path: Path, offset: int, length: int) -> str:
+    """Return the digest of one chunk of *path*."""
+    with path.open("rb") as file:
+        return hashlib.sha256(os.pread(file.fileno(), length, offset)).hexdigest()
+
+
+def _flush(path: Path) -> None:
+    """Write *path* to disk and drop it from the page cache.
+
+    Reading the file again then checks what the disk holds rather than the
+    pages that were just written.
+    """
+    fd: int = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+class StagingCache:
+    """Node-local copies of shared files, with LRU eviction beyond a size cap."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_size_bytes: int,
+        *,
+        chunk_size_bytes: int = 64 * 2**20,
+        num_threads: int = 8,
+        verify: bool = True,
+    ) -> None:
+        """Initialise the cache; nothing is copied until ``stage``.
+
+        Args:
+            root: Node-local directory holding one entry per staged source.
+            max_size_bytes: Total size above which old entries are evicted.
+            chunk_size_bytes: Size of the chunks copied in parallel.
+            num_threads: Chunks copied concurrently.
+            verify: Read every copy back from disk, after copying it and
+                whenever it is reused, and compare it with the digests of
+                the source chunks.
+
+        """
+        self.root: Path = root
+        self.max_size_bytes: int = max_size_bytes
+        self.chunk_size_bytes: int = chunk_size_bytes
+        self.num_threads: int = num_threads
+        self.verify: bool = verify
+        self._used: list[Path] = []
+
+    def local_path(self, source: str | Path) -> Path:
+        """Return where *source* is staged, on every rank without coordination."""
+        source = Path(source).expanduser().absolute()
+        digest: str = hashlib.sha256(str(source).encode()).hexdigest()[:16]
+        return self.root / digest / DATA_DIR_NAME / source.name
+
+    def stage(self, source: str | Path) -> Path:
+        """Copy *source*, a file or directory, unless an up-to-date copy exists.
+
+        The entry is marked as in use by this process until ``release``.
+
+        Args:
+            source: Path on the shared filesystem.
+
+        Returns:
+            The local copy.
+
+        Raises:
+            FileNotFoundError: If *source* does not exist.
+
+        """
+        source = Path(source).expanduser().absolute()
+        if not source.exists():
+            msg = f"Cannot stage {source}: no such file or directory"
+            raise FileNotFoundError(msg)
+        local: Path = self.local_path(source)
+        entry: Path = local.parents[1]
+        (entry / USERS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+        (entry / USERS_DIR_NAME / str(os.getpid())).touch()  # Before any eviction
+        self._used.append(entry)
+        (self.root / LOCKS_DIR_NAME).mkdir(exist_ok=True)
+        with FileLock(self.root / LOCKS_DIR_NAME / f"{entry.name}.lock"):
+            signature: list[list[Any]] = _signature(source)
+            marker: Path = entry / SOURCE_FILE_NAME
+            record: dict[str, Any] = (
+                json.loads(marker.read_text()) if marker.is_file() else {}
+            )
+            if record.get("signature") != signature:
+                self._copy(source, local, signature)
+            elif self.verify and (damaged := self._mismatches(local, record)):
+                logger.warning(
+                    "Staged copy %s differs from %s in %s; copying it again",
+                    local,
+                    source,
+                    ", ".join(damaged),
+                )
+                self._copy(source, local, signature)
+            else:
+                logger.info("Reusing staged copy %s of %s", local, source)
+            (entry / LAST_USED_FILE_NAME).touch()
+        return local
+
+    def _mismatches(self, local: Path, record: dict[str, Any]) -> list[str]:
+        """Return the files of *local* that differ from the recorded digests.
+
+        Copies recorded without chunk digests count as differing entirely.
+        """
+        digests: dict[str, list[str]] | None = record.get("digests")
+        if digests is None:
+            return [str(local)]
+        chunk_size: int = record["chunk_size_bytes"]
+        damaged: list[str] = []
+        with ThreadPoolExecutor(self.num_threads) as pool:
+            for relative, file_size, _mtime in record["signature"]:
+                path: Path = local / relative if relative else local
+                if not path.is_file() or path.stat().st_size != file_size:
+                    damaged.append(str(path))
+                    continue
+                chunks: list[Future] = [
+                    pool.submit(_chunk_digest, path, offset, length)
+                    for offset, length in _chunks(file_size, chunk_size)
+                ]
+                if [future.result() for future in chunks] != digests[relative]:
+                    damaged.append(str(path))
+        return damaged
+
+    def _copy(self, source: Path, local: Path, signature: list[list[Any]]) -> None:
+        """Copy *source* to *local* in chunks and mark the entry complete.
+
+        Raises:
+            OSError: If ``verify`` is set and the copy does not read back from
+                disk as the source.
+
+        """
+        entry: Path = local.parents[1]
+        (entry / SOURCE_FILE_NAME).unlink(missing_ok=True)
+        shutil.rmtree(local.parent, ignore_errors=True)
+        size: int = sum(file_size for _path, file_size, _mtime in signature)
+        self.make_room(size)
+        partial: Path = entry / f".{DATA_DIR_NAME}.partial"
+        shutil.rmtree(partial, ignore_errors=True)
+        # Also for directories without files, which have no chunks to copy
+        (partial / source.name if source.is_dir() else partial).mkdir(parents=True)
+        start: float = time.perf_counter()
+        futures: dict[str, list[Future]] = {}
+        with ThreadPoolExecutor(self.num_threads) as pool:
+            for relative, file_size, _mtime in signature:
+                src: Path = source / relative if relative else source
+                dst: Path = partial / source.name / relative
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                with dst.open("wb") as file:
+                    file.truncate(file_size)
+                futures[relative] = [
+                    pool.submit(_copy_chunk, src, dst, offset, length)
+                    for offset, length in _chunks(file_size, self.chunk_size_bytes)
+                ]
+            digests: dict[str, list[str]] = {
+                relative: [future.result() for future in chunks]
+                for relative, chunks in futures.items()
+            }
+            list(pool.map(_flush, [partial / source.name / r for r in digests]))
+        record: dict[str, Any] = {
+            "source": str(source),
+            "signature": signature,
+            "chunk_size_bytes": self.chunk_size_bytes,
+            "digests": digests,
+            "checksum": hashlib.sha256(
+                "".join(d for chunks in digests.values() for d in chunks).encode(),
+            ).hexdigest(),
+        }
+        if self.verify and (damaged := self._mismatches(partial / source.name, record)):
+            msg = f"Copy of {source} differs from the source in {', '.join(damaged)}"
+            raise OSError(msg)
+        partial.replace(local.parent)
+        (entry / SOURCE_FILE_NAME).write_text(json.dumps(record, indent=2))
+        elapsed: float = time.perf_counter() - start
+        logger.info(
+            "Staged %s to %s: %.1f MB in %.1fs (%.0f MB/s)",
+            source,
+            local,
+            size / 1e6,
+            elapsed,
+            size / 1e6 / max(elapsed, 1e-9),
+        )
+
+    @staticmethod
+    def _in_use(entry: Path) -> bool:
+        """Whether a live process on this node still uses *entry*."""
+        for marker in (entry / USERS_DIR_NAME).glob("*"):
+            if marker.name.isdigit() and pid_alive(int(marker.name)):
+                return True
+            marker.unlink(missing_ok=True)
+        return False
+
+    def make_room(self, needed: int) -> list[Path]:
+        """Evict least recently used entries until *needed* more bytes fit the cap.
+
+        Entries used by live processes are never evicted.
+
+        Args:
+            needed: Bytes about to be added.
+
+        Returns:
+            The removed entry directories.
+
+        """
+        removed: list[Path] = []
+        self.root.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.root / ".lock"):
+            entries: list[tuple[float, Path, int]] = []
+            for entry in self.root.iterdir():
+                if not entry.is_dir() or entry.name == LOCKS_DIR_NAME:
+                    continue
+                last_used: Path = entry / LAST_USED_FILE_NAME
+                mtime: float = (
+                    last_used.stat().st_mtime
+                    if last_used.exists()
+                    else entry.stat().st_mtime
+                )
+                entries.append((mtime, entry, directory_size(entry)))
+            total: int = sum(size for _mtime, _entry, size in entries) + needed
+            for _mtime, entry, size in sorted(entries):
+                if total <= self.max_size_bytes:
+                    break
+                if self._in_use(entry):
+                    continue
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+                removed.append(entry)
+                logger.info("Evicted staged copy %s", entry)
+        if total > self.max_size_bytes:
+            logger.warning(
+                "Staging cache %s needs %.2f GB, above its %.2f GB cap, "
+                "with only copies in use left",
+                self.root,
+                total / 1e9,
+                self.max_size_bytes / 1e9,
+            )
+        return removed
+
+    def release(self) -> None:
+        """Mark the entries staged by this process as no longer in use."""
+        for entry in self._used:
+            if entry.is_dir():
+                (entry / LAST_USED_FILE_NAME).touch()
+            (entry / USERS_DIR_NAME / str(os.getpid())).unlink(missing_ok=True)
+        self._used.clear()
+
+
+def _default_root() -> Path:
+    """Return ``$TMPDIR/hydraxcel-staging-<user>``, usually node-local scratch."""
+    return Path(tempfile.gettempdir()) / f"hydraxcel-staging-{getpass.getuser()}"
+
+
+def _paths(cfg: DictConfig, key: str) -> list[str]:
+    """Return the path or paths stored under the dot-separated *key*."""
+    value: Any = OmegaConf.select(cfg, key)
+    if value is None:
+        msg = f"staging.keys names {key!r}, which is not set in the config"
+        raise ValueError(msg)
+    return [str(path) for path in value] if isinstance(value, ListConfig) else [value]
+
+
+@contextmanager
+def stage_data(
+    config: StagingConfig | DictConfig | None,
+    cfg: DictConfig,
+    accelerator: Accelerator,
+) -> Generator[StagingCache | None]:
+    """Stage the paths under ``config.keys`` and point *cfg* at the copies.
+
+    The local main process of every node copies the data while the other
+    ranks wait; then every rank rewrites the keys of its *cfg* in place.
+
+    Args:
+        config: The ``staging`` node of the run configuration, or ``None``.
+        cfg: The run configuration, whose path values are rewritten.
+        accelerator: The run's ``Accelerator``.
+
+    Yields:
+        The node's ``StagingCache`` or ``None`` when disabled.
+
+    """
+    if config is None or not config.enabled:
+        yield None
+        return
+    # On a DictConfig, ``config.keys`` is the mapping method, not the field
+    keys: list[str] = (
+        list(config["keys"]) if isinstance(config, DictConfig) else config.keys
+    )
+    if not keys:
+        yield None
+        return
+
+    cache = StagingCache(
+        (
+            Path(config.root_dir).expanduser() if config.root_dir else _default_root()
+        ).absolute(),
+        int(config.max_size_gb * 1e9),
+        chunk_size_bytes=max(1, int(config.chunk_size_mb * 2**20)),
+        num_threads=config.num_threads,
+        verify=config.verify,
+    )
+    sources: dict[str, list[str]] = {key: _paths(cfg, key) for key in keys}
+    try:
+        if accelerator.is_local_main_process:
+            for paths in sources.values():
+                for path in paths:
+                    cache.stage(path)
+        accelerator.wait_for_everyone()
+        for key, paths in sources.items():
+            local: list[str] = [str(cache.local_path(path)) for path in paths]
+            value: Any = OmegaConf.select(cfg, key)
+            OmegaConf.update(
+                cfg,
+                key,
+                local if isinstance(value, ListConfig) else local[0],
+                merge=False,
+            )
+        yield cache
+    finally:
+        cache.release()
@@ -0,0 +1,141 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the launch-time compile and mixed-precision autotuner."""
+
+import json
+import sys
+from argparse import Namespace  # noqa: TC003
+from pathlib import Path  # noqa: TC003
+from typing import Callable
+
+import pytest
+import torch
+from accelerate import Accelerator
+from torch import nn
+
+from hydraxcel import launch
+from hydraxcel.accelerate import AutotuneTask, autotune
+from hydraxcel.accelerate.autotune import autotune_launch
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def build_model() -> nn.Module:
+    """Small MLP benchmarked by the autotuner."""
+    return nn.Sequential(nn.Linear(32, 64), nn.ReLU(), nn.Linear(64, 1))
+
+
+def make_step(accelerator: Accelerator, model: nn.Module) -> Callable[[], None]:
+    """Return one optimiser step on a fixed batch."""
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.01)
+    model, optimizer = accelerator.prepare(model, optimizer)
+    batch: torch.Tensor = torch.randn(16, 32, device=accelerator.device)
+
+    def step() -> None:
+        optimizer.zero_grad()
+        with accelerator.autocast():
+            loss = model(batch).float().pow(2).mean()
+        accelerator.backward(loss)
+        optimizer.step()
+
+    return step
+
+
+def test_autotune_measures_candidates_and_caches_winner(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Real subprocess trials pick a winner that a second launch reads from cache."""
+    task = AutotuneTask(build_model=build_model, make_step=make_step)
+    cfg: dict = {"cpu": True, "mixed_precision": "no", "dynamo_backend": "inductor"}
+
+    record = autotune_launch(
+        task,
+        cfg,
+        cache_dir=tmp_path,
+        warmup_steps=1,
+        steps=3,
+        timeout=120,
+        candidates=[("none", "no"), ("none", "bf16")],
+    )
+
+    ensure(set(record["results"]) == {"none/no", "none/bf16"}, "Candidates missing")
+    ensure(
+        all(isinstance(value, float) for value in record["results"].values()),
+        f"A CPU candidate failed: {record['results']}",
+    )
+    ensure(cfg["dynamo_backend"] == "no", "Winning compile variant not applied")
+    ensure(cfg["mixed_precision"] == record["mixed_precision"], "Precision not applied")
+    (cache_file,) = tmp_path.glob("*.json")
+    ensure(json.loads(cache_file.read_text()) == record, "Winner not cached")
+
+    def fail(*_args: object, **_kwargs: object) -> float:
+        msg = "Trials must not run on a cache hit"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(autotune, "_measure", fail)
+    cached = autotune_launch(task, {"cpu": True}, cache_dir=tmp_path)
+    ensure(cached == record, "Cached record not reused")
+
+
+def test_launch_autotune_applies_fastest_variants(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    accelerate_config_dir: Path,
+    dummy_script: Path,
+) -> None:
+    """``autotune=true`` overrides the compile and precision flags with the winner."""
+    monkeypatch.setattr(sys, "argv", ["prog", "--", "cpu=true", "autotune=true"])
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    speeds: dict[tuple[str, str], float] = {("INDUCTOR", "bf16"): 3.0}
+    monkeypatch.setattr(
+        autotune,
+        "_measure",
+        lambda _task, env, **_kwargs: speeds.get(
+            (env["ACCELERATE_DYNAMO_BACKEND"], env["ACCELERATE_MIXED_PRECISION"]),
+            1.0,
+        ),
+    )
+    captured: dict[str, Namespace] = {}
+    monkeypatch.setattr(
+        "hydraxcel.accelerate.launch_tools.launch_command",
+        lambda args: captured.setdefault("args", args),
+    )
+
+    launch(
+        script_path=dummy_script,
+        hydra_configs_dir=str(accelerate_config_dir),
+        autotune_task=AutotuneTask(build_model=build_model, make_step=make_step),
+    )()  # ty:ignore[missing-argument]
+
+    args = captured["args"]
+    ensure(args.dynamo_backend == "inductor", "Winning compile variant not applied")
+    ensure(args.mixed_precision == "bf16", "Winning precision not applied")
+    ensure(not hasattr(args, "autotune_steps"), "Autotune settings leaked")
+    ensure(
+        len(list((tmp_path / "hydraxcel" / "autotune").glob("*.json"))) == 1,
+        "Winner not cached under XDG_CACHE_HOME",
+    )
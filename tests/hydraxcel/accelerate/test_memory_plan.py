@@ -0,0 +1,141 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the launch-time memory planner."""
+
+import sys
+from argparse import Namespace  # noqa: TC003
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from torch import nn
+
+from hydraxcel import launch
+from hydraxcel.accelerate import format_memory_plan, plan_memory
+from hydraxcel.accelerate.memory_plan import ModelStats, estimate_memory
+
+NUMEL: int = 4 * (1024 * 1024 + 1024)  # Four 1024x1024 linear layers with bias
+MIB: int = 2**20
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def build_model() -> nn.Module:
+    """Return a 16 MiB fp32 MLP."""
+    return nn.Sequential(*(nn.Linear(1024, 1024) for _ in range(4)))
+
+
+def test_estimates_follow_zero_and_fsdp_accounting() -> None:
+    """Per-rank components match the ZeRO/FSDP formulas for 4 ranks in bf16."""
+    stats = ModelStats.from_module(build_model())
+    ensure(stats.numel == NUMEL, f"Wrong parameter count {stats.numel}")
+    ensure(stats.bytes_by_dtype == {"float32": 4 * NUMEL}, "Wrong dtype breakdown")
+
+    ddp = estimate_memory(stats, "torch-ddp", num_processes=4, mixed_precision="bf16")
+    ensure(ddp.device_bytes == 5 * 4 * NUMEL, f"DDP: {ddp.device}")  # p+g+b+2 moments
+
+    zero2 = estimate_memory(stats, "deepspeed", num_processes=4, mixed_precision="bf16")
+    ensure(
+        zero2.device
+        == {
+            "params": 2 * NUMEL,
+            "grads": 2 * NUMEL // 4,
+            "master": 4 * NUMEL // 4,
+            "optimizer": 8 * NUMEL // 4,
+        },
+        f"ZeRO-2: {zero2.device}",
+    )
+
+    zero3 = estimate_memory(
+        stats,
+        "deepspeed-zero3",
+        num_processes=4,
+        mixed_precision="bf16",
+    )
+    ensure(zero3.host_bytes == (2 + 2 + 4 + 8) * NUMEL // 4, f"ZeRO-3: {zero3.host}")
+    ensure(zero3.device == {"gathered": 2 * 2 * NUMEL // 4}, "ZeRO-3 working set")
+
+    fsdp = estimate_memory(stats, "torch-fsdp", num_processes=4, optimizer="sgd")
+    ensure(fsdp.device["params"] == 4 * NUMEL // 4, f"FSDP: {fsdp.device}")
+    ensure(fsdp.device["optimizer"] == 0, "SGD keeps no state")
+
+
+def test_plan_picks_cheapest_fitting_variant() -> None:
+    """The least sharded variant that fits is chosen; nothing fitting gives None."""
+    roomy = plan_memory(build_model, num_processes=4, budget_gb=1.0)
+    ensure(roomy.chosen == "torch-ddp", f"Expected DDP, got {roomy.chosen}")
+
+    tight = plan_memory(
+        build_model,
+        num_processes=4,
+        mixed_precision="bf16",
+        budget_gb=60 * MIB / 2**30,
+    )
+    ensure(tight.chosen == "deepspeed", f"Expected ZeRO-2, got {tight.chosen}")
+    ensure("<- chosen" in format_memory_plan(tight), "Choice not marked in report")
+
+    none = plan_memory(build_model, num_processes=1, cpu=True, budget_gb=0.01)
+    ensure(none.chosen is None, "A variant cannot fit 10 MiB")
+    ensure(
+        not any(
+            estimate.paradigm.startswith("deepspeed") for estimate in none.estimates
+        ),
+        "DeepSpeed variants must be skipped on CPU",
+    )
+
+
+def test_launch_memory_plan_switches_paradigm(
+    monkeypatch: pytest.MonkeyPatch,
+    accelerate_config_dir: Path,
+    dummy_script: Path,
+) -> None:
+    """``memory_plan=true`` replaces the paradigm flags with the chosen variant."""
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "prog",
+            "--",
+            "num_processes=4",
+            "mixed_precision=bf16",
+            "memory_plan=true",
+            "memory_budget_gb=0.06",
+        ],
+    )
+    captured: dict[str, Namespace] = {}
+    monkeypatch.setattr(
+        "hydraxcel.accelerate.launch_tools.launch_command",
+        lambda args: captured.setdefault("args", args),
+    )
+
+    launch(
+        script_path=dummy_script,
+        hydra_configs_dir=str(accelerate_config_dir),
+        memory_plan_model=build_model,
+    )()  # ty:ignore[missing-argument]
+
+    args = captured["args"]
+    ensure(args.use_deepspeed and args.zero_stage == 2, "ZeRO-2 not applied")  # noqa: PLR2004
+    ensure(not hasattr(args, "memory_budget_gb"), "Memory-plan settings leaked")
@@ -0,0 +1,191 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for CPU topology discovery and affinity planning."""
+
+import os
+import sys
+from argparse import Namespace  # noqa: TC003
+from pathlib import Path  # noqa: TC003
+
+import pytest
+
+from hydraxcel import launch
+from hydraxcel.accelerate import topology
+from hydraxcel.accelerate.topology import (
+    CPU_AFFINITY_ENV,
+    LAUNCH_CPUS_ENV,
+    CpuTopology,
+    apply_launch_cpu_affinity,
+    plan_cpu_affinity,
+    read_cpu_topology,
+)
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+@pytest.fixture
+def fake_sysfs(tmp_path: Path) -> Path:
+    """Two NUMA nodes with four 2-way SMT cores each (CPU n and n + 8 are siblings)."""
+    root: Path = tmp_path / "system"
+    (root / "cpu").mkdir(parents=True)
+    (root / "cpu" / "online").write_text("0-15\n")
+    for node in range(2):
+        node_dir: Path = root / "node" / f"node{node}"
+        node_dir.mkdir(parents=True)
+        first: int = node * 4
+        node_dir.joinpath("cpulist").write_text(
+            f"{first}-{first + 3},{first + 8}-{first + 11}\n",
+        )
+    for cpu in range(16):
+        topology_dir: Path = root / "cpu" / f"cpu{cpu}" / "topology"
+        topology_dir.mkdir(parents=True)
+        topology_dir.joinpath("physical_package_id").write_text(f"{(cpu % 8) // 4}\n")
+        topology_dir.joinpath("core_id").write_text(f"{cpu % 4}\n")
+    return root
+
+
+def test_read_cpu_topology_groups_smt_siblings_by_node(fake_sysfs: Path) -> None:
+    """SMT siblings form one core and cores are grouped by NUMA node."""
+    found: CpuTopology = read_cpu_topology(fake_sysfs, allowed_cpus=set(range(16)))
+
+    ensure(sorted(found.nodes) == [0, 1], f"Unexpected nodes: {found.nodes}")
+    ensure(found.nodes[0][0] == [0, 8], f"Siblings not grouped: {found.nodes[0]}")
+    ensure(found.num_cores == 8 and found.num_cpus == 16, "Wrong core counts")  # noqa: PLR2004
+
+    restricted = read_cpu_topology(fake_sysfs, allowed_cpus={0, 1, 8})
+    ensure(restricted.nodes == {0: [[0, 8], [1]]}, "Affinity mask not respected")
+
+
+def test_plan_cpu_affinity_pins_ranks_to_numa_local_cores(fake_sysfs: Path) -> None:
+    """Ranks get disjoint, NUMA-local core sets with one thread per core."""
+    plans = plan_cpu_affinity(
+        read_cpu_topology(fake_sysfs, allowed_cpus=set(range(16))),
+        num_processes=4,
+    )
+
+    ensure([plan.numa_node for plan in plans] == [0, 0, 1, 1], "Ranks not NUMA-local")
+    ensure(plans[0].cpus == [0, 1, 8, 9], f"Unexpected CPUs: {plans[0].cpus}")
+    ensure(all(plan.num_threads == 2 for plan in plans), "Expected 2 threads per rank")  # noqa: PLR2004
+    all_cpus = [cpu for plan in plans for cpu in plan.cpus]
+    ensure(len(all_cpus) == len(set(all_cpus)) == 16, "CPU sets overlap")  # noqa: PLR2004
+
+
+def test_plan_cpu_affinity_shares_logical_cpus_when_oversubscribed(
+    fake_sysfs: Path,
+) -> None:
+    """More ranks than cores fall back to single-threaded logical CPUs."""
+    plans = plan_cpu_affinity(
+        read_cpu_topology(fake_sysfs, allowed_cpus=set(range(16))),
+        num_processes=12,
+    )
+
+    ensure(len(plans) == 12, "Expected one plan per rank")  # noqa: PLR2004
+    ensure(
+        all(plan.num_threads == len(plan.cpus) for plan in plans),
+        "Expected one thread per logical CPU",
+    )
+    all_cpus = [cpu for plan in plans for cpu in plan.cpus]
+    ensure(len(all_cpus) == len(set(all_cpus)) == 16, "CPU sets overlap")  # noqa: PLR2004
+
+
+def test_launch_auto_cpu_affinity_sizes_threads(
+    monkeypatch: pytest.MonkeyPatch,
+    accelerate_config_dir: Path,
+    dummy_script: Path,
+    fake_sysfs: Path,
+) -> None:
+    """``cpu_affinity=auto`` sets the thread count and the launched rank pins itself."""
+    monkeypatch.setattr(sys, "argv", ["prog", "--", "cpu_affinity=auto"])
+    monkeypatch.setattr(
+        "hydraxcel.accelerate.launch_tools.read_cpu_topology",
+        lambda: read_cpu_topology(fake_sysfs, allowed_cpus=set(range(16))),
+    )
+    for name in (
+        CPU_AFFINITY_ENV,
+        LAUNCH_CPUS_ENV,
+        "OMP_NUM_THREADS",
+        "MKL_NUM_THREADS",
+    ):
+        monkeypatch.setenv(name, "")  # Restored after the test
+    captured: dict[str, Namespace] = {}
+    monkeypatch.setattr(
+        "hydraxcel.accelerate.launch_tools.launch_command",
+        lambda args: captured.setdefault("args", args),
+    )
+
+    launch(script_path=dummy_script, hydra_configs_dir=str(accelerate_config_dir))()  # ty:ignore[missing-argument]
+
+    args = captured["args"]
+    ensure(args.num_cpu_threads_per_process == 8, "Threads not sized to the cores")  # noqa: PLR2004
+    ensure(not hasattr(args, "cpu_affinity"), "cpu_affinity leaked to accelerate")
+    ensure(os.environ[CPU_AFFINITY_ENV] == "auto", "Plan not exported to ranks")
+
+    applied: list[list[int]] = []
+    monkeypatch.setattr(
+        topology,
+        "read_cpu_topology",
+        lambda allowed_cpus: read_cpu_topology(fake_sysfs, allowed_cpus=allowed_cpus),
+    )
+    monkeypatch.setattr(
+        topology.os,
+        "sched_setaffinity",
+        lambda _pid, cpus: applied.append(cpus),
+    )
+    monkeypatch.setattr(topology.torch, "set_num_threads", lambda _threads: None)
+    plan = apply_launch_cpu_affinity()
+
+    ensure(plan is not None and applied == [plan.cpus], "Rank did not pin itself")
+    ensure(os.environ["OMP_NUM_THREADS"] == "8", "OMP threads not exported")
+
+    # A later job of an in-process sweep plans over the launcher's CPUs again
+    monkeypatch.setattr(topology.os, "sched_getaffinity", lambda _pid: set(applied[0]))
+    ensure(apply_launch_cpu_affinity() == plan, "Pinned rank narrowed its plan")
+
+
+def test_multirun_skips_auto_cpu_affinity(
+    monkeypatch: pytest.MonkeyPatch,
+    accelerate_config_dir: Path,
+    dummy_script: Path,
+) -> None:
+    """A ``-m`` sweep runs in the launcher's process, so no plan is exported."""
+    (accelerate_config_dir / "accelerate.yaml").write_text(
+        "defaults:\n  - launch_config\n  - _self_\n\n"
+        "training_script: ''\ncpu_affinity: auto\n",
+    )
+    monkeypatch.setattr(sys, "argv", ["prog", "-m", "seed=1,2"])
+    for name in (CPU_AFFINITY_ENV, LAUNCH_CPUS_ENV):
+        monkeypatch.delenv(name, raising=False)
+    commands: list[list[str]] = []
+    monkeypatch.setattr(
+        "hydraxcel.accelerate.launch_tools.subprocess.run",
+        lambda cmd, **_kwargs: commands.append(cmd),
+    )
+
+    with pytest.raises(SystemExit):
+        launch(script_path=dummy_script, hydra_configs_dir=str(accelerate_config_dir))()  # ty:ignore[missing-argument]
+
+    ensure(commands and "-m" in commands[0], "Sweep was not run directly")
+    ensure(CPU_AFFINITY_ENV not in os.environ, "Auto affinity exported to the sweep")
@@ -0,0 +1,73 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the ``hydraxcel-bench-comm`` collective benchmark."""
+
+import json
+from pathlib import Path  # noqa: TC003
+
+import pytest
+
+from hydraxcel.bench import message_sizes
+from hydraxcel.bench.comm import BUS_FACTORS, main
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def test_message_sizes_sweep() -> None:
+    """Sizes double from the minimum up to the maximum."""
+    ensure(message_sizes(1024, 8192) == [1024, 2048, 4096, 8192], "Wrong sweep")
+    ensure(message_sizes(1000, 1500) == [1000], "Sweep must not exceed the maximum")
+    with pytest.raises(ValueError, match="min_bytes <= max_bytes"):
+        message_sizes(4096, 1024)
+
+
+def test_bench_comm_launches_gloo_ranks_and_reports_bandwidth(tmp_path: Path) -> None:
+    """Two CPU ranks time every collective and report algbw and busbw."""
+    main(
+        [
+            "--num-processes=2",
+            "--min-bytes=4096",
+            "--max-bytes=16384",
+            "--warmup-iters=1",
+            "--iters=2",
+            f"--output-dir={tmp_path}",
+        ],
+    )
+
+    report: dict = json.loads((tmp_path / "results.json").read_text())
+    ensure(report["backend"] == "gloo", "CPU ranks must use gloo")
+    ensure(report["world_size"] == 2, "Wrong world size")  # noqa: PLR2004
+    rows: list[dict] = report["results"]
+    ensure(len(rows) == len(BUS_FACTORS) * 3, f"Expected 4 ops x 3 sizes: {rows}")
+    for row in rows:
+        ensure(row["time_us"] > 0, f"No time measured: {row}")
+        ensure(
+            row["busbw_gbps"]
+            == pytest.approx(row["algbw_gbps"] * BUS_FACTORS[row["op"]](2)),
+            f"Bus bandwidth factor not applied: {row}",
+        )
+    table: str = (tmp_path / "results.md").read_text()
+    ensure("| all_reduce | 4KiB |" in table, "Sweep missing from table")
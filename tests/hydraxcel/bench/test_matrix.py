@@ -0,0 +1,102 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the ``hydraxcel-bench`` config variant matrix."""
+
+import json
+from pathlib import Path  # noqa: TC003
+
+import pytest
+
+from hydraxcel.bench import BenchCell, main, plan_cells
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def test_plan_cells_restricts_cpu_only_hosts_to_valid_variants() -> None:
+    """Without GPUs only CPU hardware with torch-ddp and no/bf16 precision runs."""
+    cells, skipped = plan_cells(
+        {
+            "hardware": ["cpu", "gpu"],
+            "compile": ["none"],
+            "paradigm": ["torch-ddp", "torch-fsdp"],
+            "mixed_precision": ["no", "bf16", "fp16"],
+        },
+        ["mlp"],
+        cuda_devices=0,
+    )
+
+    ensure(
+        cells
+        == [
+            BenchCell("cpu", "none", "torch-ddp", "no", "mlp"),
+            BenchCell("cpu", "none", "torch-ddp", "bf16", "mlp"),
+        ],
+        f"Unexpected runnable cells: {cells}",
+    )
+    ensure(len(skipped) == 10, "Every other combination must be skipped")  # noqa: PLR2004
+    ensure(
+        skipped[BenchCell("gpu", "none", "torch-ddp", "no", "mlp")].startswith(
+            "needs 1",
+        ),
+        "GPU cell skipped for the wrong reason",
+    )
+    with pytest.raises(ValueError, match="Unknown compile"):
+        plan_cells(
+            {
+                "hardware": ["cpu"],
+                "compile": ["jit"],
+                "paradigm": ["torch-ddp"],
+                "mixed_precision": ["no"],
+            },
+            ["mlp"],
+        )
+
+
+def test_bench_main_launches_cells_and_writes_table(tmp_path: Path) -> None:
+    """A CPU cell is launched through accelerate and its metrics are tabulated."""
+    main(
+        [
+            "--hardware=cpu",
+            "--compile=none",
+            "--mixed-precision",
+            "no",
+            "fp16",
+            "--workload=mlp",
+            "--batch-size=4",
+            "--warmup-steps=1",
+            "--steps=2",
+            f"--output-dir={tmp_path}",
+            "--show-skipped",
+        ],
+    )
+
+    rows: list[dict] = json.loads((tmp_path / "results.json").read_text())
+    ensure(len(rows) == 2, f"Expected one run and one skipped row: {rows}")  # noqa: PLR2004
+    ensure(rows[0]["samples_per_s"] > 0, f"No throughput measured: {rows[0]}")
+    ensure(rows[0]["time_to_first_step_s"] > 0, "No time-to-first-step measured")
+    ensure("skipped" in rows[1], "fp16 must be skipped on CPU")
+    table: str = (tmp_path / "results.md").read_text()
+    ensure("| cpu | none | torch-ddp | no | mlp |" in table, "Cell missing in table")
@@ -0,0 +1,106 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the memory-mapped token shard format and packed batching."""
+
+from pathlib import Path  # noqa: TC003
+
+import numpy as np
+import pytest
+
+from hydraxcel.data import (
+    TokenBatchSampler,
+    TokenBlockDataset,
+    token_dataloader,
+    write_token_shards,
+)
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def make_dataset(tmp_path: Path, block_size: int = 4) -> TokenBlockDataset:
+    """Write 30 rows of 1-5 tokens in shards of 10 rows, numbering the tokens."""
+    lengths: list[int] = [1 + i % 5 for i in range(30)]
+    stream = iter(range(sum(lengths)))
+    rows = ([next(stream) for _ in range(length)] for length in lengths)
+    shards = write_token_shards(rows, tmp_path, dtype="uint16", rows_per_shard=10)
+    return TokenBlockDataset(shards, block_size)
+
+
+def test_shards_round_trip_and_batches_are_views(tmp_path: Path) -> None:
+    """Rows read back unchanged and packed batches share the mapped memory."""
+    dataset = make_dataset(tmp_path)
+    shards = dataset.shards
+    ensure(len(shards) == 30 and shards.num_tokens == 90, "Wrong shard sizes")  # noqa: PLR2004
+    ensure(list(shards[6]) == [16, 17], f"Wrong row: {shards[6]}")
+    ensure(
+        [list(row) for row in shards[9:11]] == [[25, 26, 27, 28, 29], [30]],
+        "Slice across shards differs from the rows",
+    )
+    ensure(len(dataset) == 21, f"Blocks crossed shard ends: {len(dataset)}")  # noqa: PLR2004
+    ensure(list(dataset[7]) == [30, 31, 32, 33], "Second shard starts anew")
+
+    batch: np.ndarray = dataset.__getitems__([1, 2, 3])
+    ensure(batch.shape == (3, 4), f"Wrong batch shape {batch.shape}")
+    ensure(np.shares_memory(batch, shards.tokens[0]), "Consecutive blocks copied")
+    ensure(
+        np.array_equal(dataset.__getitems__([3, 1]), [dataset[3], dataset[1]]),
+        "Scattered blocks differ",
+    )
+
+    loader = token_dataloader(dataset, 3, shuffle=False)
+    first = next(iter(loader))
+    ensure(first.shape == (3, 4), f"Wrong loader batch shape {first.shape}")
+    ensure(first.data_ptr() == dataset[0].ctypes.data, "Loader copied the batch")
+    with pytest.raises(ValueError, match="block_size"):
+        TokenBlockDataset(shards, 0)
+
+
+def test_sampler_splits_batches_evenly_and_deterministically(tmp_path: Path) -> None:
+    """Ranks get disjoint batches of equal count, reshuffled per epoch."""
+    dataset = make_dataset(tmp_path)
+    samplers = [
+        TokenBatchSampler(dataset, 2, num_replicas=2, rank=rank, seed=3)
+        for rank in range(2)
+    ]
+    batches = [list(sampler) for sampler in samplers]
+    ensure(len(batches[0]) == len(batches[1]) == len(samplers[0]), "Uneven split")
+    seen: list[int] = [index for rank in batches for batch in rank for index in batch]
+    ensure(len(seen) == len(set(seen)), "Ranks share blocks")
+    ensure(
+        all(
+            len({int(np.searchsorted(dataset.shard_starts, i, "right")) for i in b})
+            == 1
+            for rank in batches
+            for b in rank
+        ),
+        "A batch crosses a shard boundary",
+    )
+    ensure(batches[0] == list(samplers[0]), "Same epoch, different order")
+    samplers[0].set_epoch(1)
+    ensure(batches[0] != list(samplers[0]), "Epochs share one order")
+
+    padded = TokenBatchSampler(dataset, 2, num_replicas=4, rank=3, drop_last=False)
+    ensure(len(padded) == len(list(padded)) == 3, "Uneven batches not filled up")  # noqa: PLR2004
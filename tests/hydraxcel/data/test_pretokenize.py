@@ -0,0 +1,155 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the parallel pre-tokenisation cache."""
+
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path  # noqa: TC003
+
+import numpy as np
+import pytest
+from tokenizers import Tokenizer, models, pre_tokenizers
+from transformers import PreTrainedTokenizerFast
+
+from hydraxcel.data import TokenShards, pretokenize, tokenizer_fingerprint
+
+pytestmark = pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+
+HOLD_LOCK: str = """
+import pathlib, sys, time
+from filelock import FileLock
+with FileLock(sys.argv[1]):
+    pathlib.Path(sys.argv[2]).touch()
+    time.sleep(1.0)
+"""
+WORDS: list[str] = ["[UNK]", "the", "cat", "sat", "on", "mat"]
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def make_tokenizer(words: list[str] = WORDS) -> PreTrainedTokenizerFast:
+    """Build a word-level tokenizer without downloading one."""
+    backend = Tokenizer(
+        models.WordLevel({word: i for i, word in enumerate(words)}, unk_token="[UNK]"),  # noqa: S106,
+    )
+    backend.pre_tokenizer = pre_tokenizers.Whitespace()
+    return PreTrainedTokenizerFast(tokenizer_object=backend, unk_token="[UNK]")  # noqa: S106
+
+
+TEXTS: list[str] = [" ".join(["the cat sat on the mat"] * (i % 3)) for i in range(25)]
+
+
+def build(
+    tmp_path: Path,
+    dataset: str = "toy",
+    texts: list[str] = TEXTS,
+) -> TokenShards:
+    """Pre-tokenise *texts* into three shards with forked workers."""
+    return pretokenize(
+        texts,
+        make_tokenizer(),
+        tmp_path,
+        config={"dataset": dataset},
+        rows_per_shard=10,
+        num_workers=2,
+        mp_context="fork",  # Spawning would re-import torch per worker
+    )
+
+
+def test_shards_match_the_tokenizer_and_are_reused(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Rows round-trip, and a second build maps the cached shards."""
+    shards = build(tmp_path)
+    expected: list[list[int]] = make_tokenizer()(TEXTS)["input_ids"]
+    ensure(len(shards) == len(TEXTS), f"Wrong row count {len(shards)}")
+    ensure(
+        all(list(shards[i]) == ids for i, ids in enumerate(expected)),
+        "Rows differ from the tokenizer output",
+    )
+    ensure(shards[-1].dtype == np.uint16, "Small vocabularies should use uint16")
+    ensure(isinstance(shards.tokens[0], np.memmap), "Shards are not memory-mapped")
+    ensure(shards.num_tokens == sum(map(len, expected)), "Wrong token count")
+
+    with caplog.at_level(logging.INFO, logger="pretokenize"):
+        again = build(tmp_path)
+    ensure(again.directory == shards.directory, "Same inputs used another cache")
+    ensure("Token cache hit" in caplog.text, "Second build did not hit the cache")
+    other = build(tmp_path, dataset="other")
+    ensure(other.directory != shards.directory, "Config change reused the cache")
+    edited = build(tmp_path, texts=[*TEXTS[:-1], "the mat sat"])
+    ensure(edited.directory != shards.directory, "Edited texts reused the cache")
+    ensure(list(edited[-1]) == [1, 5, 3], "Edited row not tokenised")
+
+
+def test_interrupted_and_held_shards_are_completed(tmp_path: Path) -> None:
+    """A rebuild keeps finished shards and waits for shards held elsewhere."""
+    directory: Path = build(tmp_path).directory
+    (directory / "meta.json").unlink()  # As if the build had been interrupted
+    (directory / "offsets-00001.npy").unlink()
+    kept: int = (directory / "offsets-00000.npy").stat().st_mtime_ns
+    ready: Path = tmp_path / "ready"
+    # Another builder, which gives up after a second
+    holder = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            HOLD_LOCK,
+            str(directory / "locks" / "shard-00001.lock"),
+            str(ready),
+        ],
+    )
+    while not ready.exists() and holder.poll() is None:
+        time.sleep(0.05)
+
+    start: float = time.monotonic()
+    shards = build(tmp_path)
+    ensure(time.monotonic() - start >= 1.0, "Build did not wait for the held shard")
+    ensure(len(shards) == len(TEXTS), "Held shard missing after the build")
+    ensure(
+        (directory / "offsets-00000.npy").stat().st_mtime_ns == kept,
+        "A finished shard was rebuilt",
+    )
+    ensure(holder.wait() == 0, "Lock holder failed")
+
+
+def test_fingerprint_tracks_the_vocabulary() -> None:
+    """Equal tokenizers share a fingerprint; another vocabulary changes it."""
+    ensure(
+        tokenizer_fingerprint(make_tokenizer())
+        == tokenizer_fingerprint(make_tokenizer()),
+        "Fingerprint is not deterministic",
+    )
+    ensure(
+        tokenizer_fingerprint(make_tokenizer([*WORDS, "dog"]))
+        != tokenizer_fingerprint(make_tokenizer()),
+        "Fingerprint ignores the vocabulary",
+    )
+    with pytest.raises(ValueError, match="rows_per_shard"):
+        pretokenize(TEXTS, make_tokenizer(), "unused", rows_per_shard=0)
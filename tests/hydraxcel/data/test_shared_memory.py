@@ -0,0 +1,135 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for tensors shared in shared memory across local ranks."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path  # noqa: TC003
+
+import torch
+
+from hydraxcel.data import SharedTensors, share_tensors
+
+# A rank that maps the tensors and is killed without leaving
+CRASH: str = """
+import os, pathlib, signal, sys
+from hydraxcel.data import SharedTensors
+segment = SharedTensors("crashed", pathlib.Path(sys.argv[1]))
+segment.create(lambda: {"x": __import__("torch").ones(4)})
+segment.attach()
+os.kill(os.getpid(), signal.SIGKILL)
+"""
+
+# Two local ranks; rank 0 leaves at once while rank 1 is slow to attach
+TWO_RANKS: str = """
+import json, os, pathlib, sys, time
+import torch
+from accelerate import Accelerator
+from hydraxcel.data import SharedTensors, share_tensors
+root = pathlib.Path(sys.argv[1])
+accelerator = Accelerator(cpu=True)
+if accelerator.process_index == 1:
+    attach = SharedTensors.attach
+    def slow_attach(self):
+        time.sleep(2.0)
+        return attach(self)
+    SharedTensors.attach = slow_attach
+def load():
+    return {"x": torch.ones(4)}
+with share_tensors("ranks", load, accelerator, root_dir=root) as tensors:
+    total = float(tensors["x"].sum())
+(root / f"rank{accelerator.process_index}.json").write_text(json.dumps(total))
+"""
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def test_tensors_are_mapped_reused_and_removed(tmp_path: Path) -> None:
+    """Users of a segment share one copy, which the last user removes."""
+    loads: list[int] = []
+
+    def load() -> dict[str, torch.Tensor]:
+        loads.append(1)
+        return {
+            "table": torch.arange(12, dtype=torch.bfloat16).view(3, 4),
+            "ids": torch.tensor([7, 8, 9]),
+            "empty": torch.zeros(0, 5),
+        }
+
+    with share_tensors("tables", load, root_dir=tmp_path) as tensors:
+        ensure(list(tensors) == ["table", "ids", "empty"], "Names were reordered")
+        ensure(torch.equal(tensors["table"], load()["table"]), "Table differs")
+        ensure(tensors["ids"].tolist() == [7, 8, 9], "Ids differ")
+        ensure(tensors["empty"].shape == (0, 5), "Empty tensor lost its shape")
+        with share_tensors("tables", load, root_dir=tmp_path) as again:
+            ensure(len(loads) == 2, "A live segment was loaded again")  # noqa: PLR2004
+            again["ids"][0] = 0
+        ensure(tensors["ids"][0] == 7, "A write leaked into another user's view")  # noqa: PLR2004
+        ensure((tmp_path / "tables").is_dir(), "Segment removed while in use")
+    ensure(not (tmp_path / "tables").exists(), "Last user did not remove segment")
+    ensure(tensors["table"].sum() == 66, "Views died with the segment")  # noqa: PLR2004
+
+
+def test_segments_of_dead_processes_are_swept(tmp_path: Path) -> None:
+    """A segment left by a killed rank is removed by the next user."""
+    crashed = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", CRASH, str(tmp_path)],
+        check=False,
+    )
+    ensure(crashed.returncode < 0, "Crashing rank was not killed")
+    ensure((tmp_path / "crashed").is_dir(), "Crashing rank left no segment")
+    with share_tensors("live", lambda: {"x": torch.zeros(2)}, root_dir=tmp_path):
+        ensure(not (tmp_path / "crashed").exists(), "Stale segment was kept")
+    ensure(SharedTensors.sweep(tmp_path) == [], "Nothing should be left to sweep")
+
+
+def test_main_rank_cannot_remove_the_segment_before_others_attach(
+    tmp_path: Path,
+) -> None:
+    """A local main process that leaves at once waits for the slower ranks."""
+    script: Path = tmp_path / "two_ranks.py"
+    script.write_text(TWO_RANKS)
+    launched = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "accelerate.commands.launch",
+            "--multi_gpu",
+            "--num_processes=2",
+            str(script),
+            str(tmp_path),
+        ],
+        env={**os.environ, "ACCELERATE_USE_CPU": "true"},
+        check=False,
+        timeout=300,
+    )
+    ensure(launched.returncode == 0, "A rank failed to attach the shared tensors")
+    for rank in (0, 1):
+        total = json.loads((tmp_path / f"rank{rank}.json").read_text())
+        ensure(total == 4.0, f"Rank {rank} read {total}")  # noqa: PLR2004
+    ensure(not (tmp_path / "ranks").exists(), "Last rank did not remove segment")
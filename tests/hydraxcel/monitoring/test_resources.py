@@ -0,0 +1,99 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the background resource monitor."""
+
+import json
+import sys
+import time
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate import Accelerator
+
+from hydraxcel.monitoring import (
+    ResourceMonitor,
+    ResourceMonitorConfig,
+    monitor_resources,
+    read_resource_counters,
+)
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"),
+    reason="Resource counters are read from /proc",
+)
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def test_read_resource_counters_reports_process_usage() -> None:
+    """The /proc readers report CPU time, RSS and open descriptors."""
+    counters = read_resource_counters()
+    for key in ("process_cpu_seconds", "rss_mb", "minor_faults", "open_fds"):
+        ensure(key in counters, f"Missing counter {key!r} in {sorted(counters)}")
+    ensure(counters["rss_mb"] > 0, "RSS should be positive")
+
+
+def test_resource_monitor_samples_and_summarises() -> None:
+    """Samples are rates/gauges and the summary tracks min/mean/max."""
+    received: list[dict[str, float]] = []
+    monitor = ResourceMonitor(interval=0.05, on_sample=received.append)
+    monitor.start()
+    ballast = [bytearray(1024 * 1024) for _ in range(8)]
+    time.sleep(0.3)
+    monitor.stop()
+    del ballast
+
+    ensure(len(received) >= 2, f"Expected several samples, got {len(received)}")  # noqa: PLR2004
+    ensure("system/cpu_percent" in received[-1], "CPU utilisation missing")
+    summary = monitor.summary()["system/rss_mb"]
+    ensure(
+        summary["min"] <= summary["mean"] <= summary["max"],
+        f"Inconsistent summary: {summary}",
+    )
+    ensure(summary["count"] == len(received), "Summary count mismatch")
+
+
+def test_monitor_resources_writes_samples_and_summary(
+    isolated_cwd: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each rank writes a JSONL sample log and a JSON summary into the run dir."""
+    monkeypatch.setattr(
+        "hydraxcel.monitoring.resources.get_run_dir",
+        lambda: isolated_cwd,
+    )
+    config = ResourceMonitorConfig(interval=0.05)
+
+    with monitor_resources(config, Accelerator()):
+        time.sleep(0.2)
+
+    lines = (isolated_cwd / "resources" / "rank0.jsonl").read_text().splitlines()
+    ensure(len(lines) >= 2, "Expected several JSONL samples")  # noqa: PLR2004
+    ensure("elapsed_s" in json.loads(lines[0]), "Samples lack elapsed time")
+    summary = json.loads(
+        (isolated_cwd / "resources" / "summary_rank0.json").read_text(),
+    )
+    ensure("system/rss_mb" in summary, "Summary lacks RSS statistics")
@@ -0,0 +1,108 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for cross-rank straggler detection."""
+
+import json
+import time
+from pathlib import Path  # noqa: TC003
+
+import pytest
+import torch.distributed as dist
+import torch.multiprocessing as mp
+from accelerate import Accelerator
+
+from hydraxcel import mark_step
+from hydraxcel.monitoring import (
+    StragglerConfig,
+    StragglerDetector,
+    detect_stragglers,
+    summarise_step_times,
+)
+
+WORLD_SIZE: int = 3
+SLOW_RANK: int = 2
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def _straggler_worker(rank: int, init_file: Path, report_file: Path) -> None:
+    """Run a fake loop in which ``SLOW_RANK`` takes ten times longer per step."""
+    dist.init_process_group(
+        "gloo",
+        init_method=f"file://{init_file}",
+        rank=rank,
+        world_size=WORLD_SIZE,
+    )
+
+    def write_report(report: dict[str, float | str], _times: list[float]) -> None:
+        report_file.write_text(json.dumps(report))
+
+    try:
+        detector = StragglerDetector(interval=4, on_report=write_report)
+        for _ in range(8):
+            time.sleep(0.05 if rank == SLOW_RANK else 0.005)
+            detector.step()
+    finally:
+        dist.destroy_process_group()
+
+
+def test_summarise_step_times_identifies_slowest_rank() -> None:
+    """The summary names the slowest rank and host and its excess over the median."""
+    report = summarise_step_times([0.1, 0.1, 0.15, 0.1], ["a", "a", "b", "b"])
+    ensure(report["slowest_rank"] == 2, f"Wrong slowest rank: {report}")  # noqa: PLR2004
+    ensure(report["slowest_host"] == "b", f"Wrong slowest host: {report}")
+    ensure(report["skew_percent"] == pytest.approx(50.0), f"Wrong skew: {report}")
+    ensure(report["spread_ms"] == pytest.approx(50.0), f"Wrong spread: {report}")
+
+
+def test_straggler_detector_gathers_across_gloo_ranks(tmp_path: Path) -> None:
+    """Rank 0 reports the deliberately slow rank of a multi-process gloo group."""
+    report_file = tmp_path / "report.json"
+    mp.spawn(
+        _straggler_worker,
+        args=(tmp_path / "init", report_file),
+        nprocs=WORLD_SIZE,
+    )
+
+    report = json.loads(report_file.read_text())
+    ensure(report["slowest_rank"] == SLOW_RANK, f"Wrong slowest rank: {report}")
+    ensure(report["skew_percent"] > 100, f"Skew too small: {report}")  # noqa: PLR2004
+
+
+def test_detect_stragglers_follows_mark_step(caplog: pytest.LogCaptureFixture) -> None:
+    """``mark_step`` drives the detector and each exchange logs a report."""
+    config = StragglerConfig(interval=2)
+
+    with (
+        caplog.at_level("INFO", logger="stragglers"),
+        detect_stragglers(config, Accelerator()) as detector,
+    ):
+        for _ in range(4):
+            mark_step()
+
+    ensure(detector is not None and detector.num_steps == 4, "Steps were not seen")  # noqa: PLR2004
+    ensure(detector.last_report is not None, "No report after an interval")  # ty:ignore[unresolved-attribute]
+    ensure("is slowest" in caplog.text, "Report was not logged")
@@ -0,0 +1,132 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the hang and stall watchdog."""
+
+import os
+import signal
+import threading
+import time
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate import Accelerator
+
+from hydraxcel import mark_step
+from hydraxcel.monitoring import Watchdog, WatchdogConfig, watch_progress
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def fake_training_loop(num_steps: int, stall_seconds: float) -> None:
+    """Step a few times, then hang inside the loop."""
+    for _ in range(num_steps):
+        mark_step()
+    time.sleep(stall_seconds)
+
+
+def test_watchdog_dumps_all_threads_on_stall(tmp_path: Path) -> None:
+    """A stalled loop produces one stack dump naming the sleeping frame."""
+    stalls: list[float] = []
+    watchdog = Watchdog(
+        tmp_path,
+        timeout=0.2,
+        check_interval=0.02,
+        on_stall=stalls.append,
+    )
+    watchdog.start()
+    watchdog.pet()
+    time.sleep(0.6)
+    watchdog.stop()
+
+    ensure(len(stalls) == 1, f"Expected a single stall report, got {stalls}")
+    dump = (tmp_path / "stall_rank0_001.txt").read_text()
+    ensure("test_watchdog_dumps_all_threads_on_stall" in dump, "Main stack missing")
+    ensure("Thread" in dump, "Dump should cover all threads")
+
+
+def test_watchdog_stays_quiet_while_petted(tmp_path: Path) -> None:
+    """Regular progress never triggers a stall report."""
+    watchdog = Watchdog(tmp_path, timeout=0.2, check_interval=0.02)
+    watchdog.start()
+    for _ in range(20):
+        watchdog.pet()
+        time.sleep(0.02)
+    watchdog.stop()
+
+    ensure(watchdog.num_stalls == 0, "No stall expected while making progress")
+    ensure(not list(tmp_path.iterdir()), "No dump expected while making progress")
+
+
+def test_watch_progress_kills_process_group_after_stall(
+    isolated_cwd: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """``mark_step`` pets the watchdog and a hang kills the process group."""
+    monkeypatch.setattr(
+        "hydraxcel.monitoring.watchdog.get_run_dir",
+        lambda: isolated_cwd,
+    )
+    killed: list[tuple[int, int]] = []
+    monkeypatch.setattr(os, "killpg", lambda pgid, sig: killed.append((pgid, sig)))
+    config = WatchdogConfig(
+        timeout=0.2,
+        check_interval=0.02,
+        kill_process_group=True,
+        kill_grace_period=0.0,
+    )
+
+    with watch_progress(config, Accelerator()) as watchdog:
+        fake_training_loop(num_steps=3, stall_seconds=0.5)
+
+    ensure(watchdog is not None and watchdog.num_pets == 3, "Steps were not seen")  # noqa: PLR2004
+    dump = (isolated_cwd / "watchdog" / "stall_rank0_001.txt").read_text()
+    ensure("fake_training_loop" in dump, "Stall dump lacks the hung frame")
+    ensure(
+        [sig for _pgid, sig in killed] == [signal.SIGTERM, signal.SIGKILL],
+        f"Expected SIGTERM then SIGKILL, got {killed}",
+    )
+
+
+def test_watch_progress_ignores_background_tracker_logging(
+    isolated_cwd: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only the training thread's ``accelerator.log`` calls count as progress."""
+    monkeypatch.setattr(
+        "hydraxcel.monitoring.watchdog.get_run_dir",
+        lambda: isolated_cwd,
+    )
+    accelerator = Accelerator()
+    config = WatchdogConfig(timeout=60.0, check_interval=1.0)
+
+    with watch_progress(config, accelerator) as watchdog:
+        accelerator.log({"loss": 1.0})
+        background = threading.Thread(target=accelerator.log, args=({"cpu": 1.0},))
+        background.start()
+        background.join()
+
+    ensure(watchdog is not None and watchdog.num_pets == 1, "Background log petted")
+    ensure("log" not in vars(accelerator), "accelerator.log was not restored")
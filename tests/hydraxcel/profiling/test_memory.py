@@ -0,0 +1,125 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the memory diagnostics."""
+
+import os
+import signal
+import sys
+import warnings
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate import Accelerator
+
+from hydraxcel.logging import setup_exception_logging
+from hydraxcel.profiling import MemoryDiagnostics, MemoryDiagnosticsConfig
+from hydraxcel.profiling.memory import diagnose_memory
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+@pytest.fixture
+def memory_run_dir(isolated_cwd: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the memory diagnostics at the isolated working directory."""
+    monkeypatch.setattr("hydraxcel.profiling.memory.get_run_dir", lambda: isolated_cwd)
+    return isolated_cwd / "memory"
+
+
+def test_capture_writes_tracemalloc_diff(tmp_path: Path) -> None:
+    """A capture lists the allocation sites that grew since the baseline."""
+    diagnostics = MemoryDiagnostics(tmp_path, top_n=5)
+    diagnostics.start()
+    ballast = [bytearray(64 * 1024) for _ in range(64)]
+    (diff_path,) = diagnostics.capture("manual")
+    diagnostics.stop()
+    del ballast
+
+    content = diff_path.read_text()
+    ensure(diff_path.name == "rank0_0001_manual_tracemalloc.txt", diff_path.name)
+    ensure("test_memory.py" in content, f"Allocation site missing:\n{content}")
+
+
+def test_captures_are_rotated_under_size_cap(tmp_path: Path) -> None:
+    """Old captures are deleted once the directory exceeds ``max_total_mb``."""
+    diagnostics = MemoryDiagnostics(tmp_path, max_total_mb=0.002)
+    diagnostics.start()
+    for _ in range(5):
+        diagnostics.capture("manual")
+    diagnostics.stop()
+
+    remaining = sorted(path.name for path in tmp_path.iterdir())
+    ensure(len(remaining) < 5, f"No capture was rotated out: {remaining}")  # noqa: PLR2004
+    ensure(remaining[-1].startswith("rank0_0005"), f"Newest capture lost: {remaining}")
+
+
+def test_ranks_rotate_only_their_own_captures(tmp_path: Path) -> None:
+    """Ranks sharing the directory never delete each other's captures."""
+    first = MemoryDiagnostics(tmp_path, rank=0, max_total_mb=0.002)
+    second = MemoryDiagnostics(tmp_path, rank=1, max_total_mb=0.002)
+    first.start()
+    second.start()
+    (kept,) = first.capture("manual")
+    for _ in range(5):
+        second.capture("manual")
+    second.stop()
+    first.stop()
+
+    ensure(kept.exists(), "Another rank deleted this rank's capture")
+    remaining = sorted(path.name for path in tmp_path.glob("rank1_*"))
+    ensure(len(remaining) < 5, f"No capture was rotated out: {remaining}")  # noqa: PLR2004
+
+
+def test_signal_triggers_capture(memory_run_dir: Path) -> None:
+    """The capture signal writes an on-demand capture."""
+    with diagnose_memory(MemoryDiagnosticsConfig(interval=0), Accelerator()):
+        os.kill(os.getpid(), signal.SIGUSR2)
+        ensure(
+            list(memory_run_dir.glob("rank0_*_signal_tracemalloc.txt")),
+            "SIGUSR2 did not trigger a capture",
+        )
+
+
+def test_memory_error_is_captured_by_exception_hook(
+    memory_run_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An uncaught MemoryError is captured when the exception hook logs it."""
+    monkeypatch.setattr(sys, "excepthook", sys.excepthook)
+    monkeypatch.setattr(warnings, "showwarning", warnings.showwarning)
+    setup_exception_logging()
+
+    config = MemoryDiagnosticsConfig(interval=0, capture_signal=None)
+    with (
+        pytest.raises(MemoryError) as error,
+        diagnose_memory(config, Accelerator()),
+    ):
+        raise MemoryError
+    sys.excepthook(error.type, error.value, error.tb)
+
+    ensure(
+        list(memory_run_dir.glob("rank0_*_out-of-memory_tracemalloc.txt")),
+        "MemoryError was not captured by the exception hook",
+    )
@@ -0,0 +1,143 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the built-in sampling profiler."""
+
+import os
+import signal
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate import Accelerator
+
+from hydraxcel.profiling import SamplerConfig
+from hydraxcel.profiling.sampling import (
+    TRUNCATED_STACK,
+    StackSampler,
+    merge_folded_stacks,
+    read_folded_stacks,
+    render_flamegraph,
+    sample_run,
+    write_folded_stacks,
+)
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def busy_loop(duration: float) -> int:
+    """Burn CPU in pure Python for *duration* seconds."""
+    total = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        total += sum(range(100))
+    return total
+
+
+def test_sampler_records_hot_function() -> None:
+    """The busy function dominates the collected main-thread stacks."""
+    sampler = StackSampler(rate_hz=200)
+    sampler.start()
+    busy_loop(0.3)
+    sampler.stop()
+
+    stacks = sampler.snapshot()
+    hot = sum(count for stack, count in stacks.items() if "busy_loop" in stack)
+    ensure(sampler.num_samples > 0, "No samples were taken")
+    ensure(hot >= 0.5 * sum(stacks.values()), f"busy_loop not dominant: {stacks}")
+    ensure(
+        all(stack.startswith("MainThread;") for stack in stacks),
+        "Stacks should be rooted at the thread name",
+    )
+
+
+def test_sampler_bounds_distinct_stacks() -> None:
+    """New stacks beyond ``max_stacks`` are counted under the truncated bucket."""
+    sampler = StackSampler(max_stacks=1)
+
+    def sample_from_thread() -> None:
+        worker = threading.Thread(target=sampler.sample)
+        worker.start()
+        worker.join()
+
+    def nested() -> None:
+        sample_from_thread()
+
+    sample_from_thread()
+    nested()
+    stacks = sampler.snapshot()
+    ensure(len(stacks) == 2, f"Expected one stack plus truncated bucket: {stacks}")  # noqa: PLR2004
+    ensure(stacks[TRUNCATED_STACK] == 1, "Truncated bucket was not used")
+
+
+def test_merge_folded_stacks_and_flamegraph(tmp_path: Path) -> None:
+    """Per-rank folded files merge by summing counts and render as valid SVG."""
+    write_folded_stacks({"MainThread;a;b": 3}, tmp_path / "stacks_rank0.folded")
+    write_folded_stacks(
+        {"MainThread;a;b": 1, "MainThread;c": 2},
+        tmp_path / "stacks_rank1.folded",
+    )
+
+    merged = merge_folded_stacks(sorted(tmp_path.glob("*.folded")))
+    ensure(merged == {"MainThread;a;b": 4, "MainThread;c": 2}, f"Bad merge: {merged}")
+    ensure(
+        read_folded_stacks(tmp_path / "stacks_rank1.folded")["MainThread;c"] == 2,  # noqa: PLR2004
+        "Folded stacks did not round-trip",
+    )
+
+    svg = render_flamegraph(merged, title="<ranks>")
+    root = ET.fromstring(svg)  # noqa: S314 # Parsing our own output
+    ensure(root.tag.endswith("svg"), "Flamegraph is not an SVG document")
+    ensure("&lt;ranks&gt;" in svg, "Title was not escaped")
+
+
+def test_sample_run_writes_outputs_on_signal_and_exit(
+    isolated_cwd: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The dump signal writes outputs mid-run, and exiting writes them again."""
+    monkeypatch.setattr(
+        "hydraxcel.profiling.sampling.get_run_dir",
+        lambda: isolated_cwd,
+    )
+    config = SamplerConfig(rate_hz=200)
+    folded_path = isolated_cwd / "sampling" / "stacks_rank0.folded"
+
+    with sample_run(config, Accelerator()) as sampler:
+        busy_loop(0.1)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        ensure(folded_path.exists(), "SIGUSR1 did not trigger a dump")
+
+    ensure(sampler is not None, "Sampler should be running when enabled")
+    ensure(
+        (isolated_cwd / "sampling" / "flamegraph_rank0.svg").exists(),
+        "Flamegraph was not written on exit",
+    )
+    ensure(
+        signal.getsignal(signal.SIGUSR1) == signal.SIG_DFL,
+        "Previous SIGUSR1 handler was not restored",
+    )
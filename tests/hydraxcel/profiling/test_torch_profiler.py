@@ -0,0 +1,111 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the torch profiler integration."""
+
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+import torch
+from accelerate import Accelerator
+from omegaconf import DictConfig
+
+from hydraxcel import hydraxcel_main, mark_step
+from hydraxcel.profiling.torch_profiler import MERGED_TRACE_NAME, merge_chrome_traces
+
+
+@dataclass
+class ProfiledConfig:
+    """Minimal run configuration for profiled runs."""
+
+    steps: int = 6
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def test_merge_chrome_traces_separates_ranks(tmp_path: Path) -> None:
+    """Each input trace gets its own process lanes in the merged timeline."""
+    for rank in range(2):
+        (tmp_path / f"trace_rank{rank}_step5.json").write_text(
+            json.dumps(
+                {
+                    "traceEvents": [
+                        {"ph": "M", "name": "process_name", "pid": 7, "args": {}},
+                        {"ph": "X", "name": "aten::mm", "pid": 7, "ts": 1, "dur": 2},
+                    ],
+                },
+            ),
+        )
+
+    merged_path = merge_chrome_traces(
+        list(tmp_path.glob("*.json")),
+        tmp_path / MERGED_TRACE_NAME,
+    )
+    events = json.loads(merged_path.read_text())["traceEvents"]
+
+    ensure(len(events) == 4, f"Expected 4 events, got {len(events)}")  # noqa: PLR2004
+    ensure(len({event["pid"] for event in events}) == 2, "Ranks share a pid")  # noqa: PLR2004
+    ensure(
+        events[0]["args"]["name"].startswith("trace_rank0_step5"),
+        "Process name is not prefixed with the trace file stem",
+    )
+
+
+def test_hydraxcel_main_profile_group_writes_traces(
+    monkeypatch: pytest.MonkeyPatch,
+    isolated_cwd: Path,  # noqa: ARG001
+    logging_platform_init: dict[str, str],  # noqa: ARG001
+    disable_debug: None,  # noqa: ARG001
+) -> None:
+    """Selecting ``+profile=cpu`` writes per-rank and merged traces to the run dir."""
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["pytest_hydra_test", "+profile=cpu", "profile.merge_traces=true"],
+    )
+    received: dict[str, Path] = {}
+
+    def user_main(cfg: DictConfig, accelerator: Accelerator) -> None:  # noqa: ARG001
+        received["run_dir"] = Path.cwd()
+        for _ in range(cfg.steps):
+            torch.ones((8, 8)) @ torch.ones((8, 8))
+            mark_step()
+
+    wrapped = hydraxcel_main(
+        project_name="demo",
+        config_class=ProfiledConfig,
+        logging_platform="local",
+    )(user_main)
+    wrapped()
+
+    profile_dir: Path = received["run_dir"] / "profile"
+    ensure(
+        (profile_dir / "trace_rank0_step5.json").exists(),
+        f"Missing rank trace in {sorted(profile_dir.iterdir())}",
+    )
+    ensure((profile_dir / MERGED_TRACE_NAME).exists(), "Missing merged trace")
@@ -0,0 +1,162 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for config-driven Accelerator construction."""
+
+import os
+import sys
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate import Accelerator
+from accelerate.utils import (
+    DDPCommunicationHookType,
+    DistributedDataParallelKwargs,
+    InitProcessGroupKwargs,
+)
+from omegaconf import DictConfig, OmegaConf
+
+from hydraxcel import hydraxcel_main
+from hydraxcel.run import AcceleratorConfig, build_accelerator
+from hydraxcel.run.accelerator import build_ddp_kwargs
+from hydraxcel.run.config_registry import (
+    CommHookConfig,
+    DDPConfig,
+    ProcessGroupConfig,
+)
+
+
+@dataclass
+class AcceleratedConfig:
+    """Minimal run configuration for Accelerator construction."""
+
+    steps: int = 1
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def test_build_accelerator_applies_kwargs_handlers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """DDP, process group and dataloader settings reach the Accelerator."""
+    monkeypatch.setenv("TORCH_DISTRIBUTED_DEBUG", "OFF")  # Restored after the test
+    config = AcceleratorConfig(
+        gradient_accumulation_steps=4,
+        distributed_debug="DETAIL",
+        ddp=DDPConfig(bucket_cap_mb=100, find_unused_parameters=True),
+        process_group=ProcessGroupConfig(timeout_minutes=5),
+    )
+
+    accelerator = build_accelerator(OmegaConf.structured(config))
+    ddp: DistributedDataParallelKwargs = accelerator.ddp_handler  # ty:ignore[invalid-assignment]
+    init: InitProcessGroupKwargs = accelerator.init_handler  # ty:ignore[invalid-assignment]
+
+    ensure(accelerator.gradient_accumulation_steps == 4, "Accumulation not set")  # noqa: PLR2004
+    ensure(ddp.bucket_cap_mb == 100, "DDP bucket size not set")  # noqa: PLR2004
+    ensure(ddp.find_unused_parameters, "DDP flag not set")
+    ensure(init.timeout == timedelta(minutes=5), "Process group timeout not set")
+    ensure(
+        init.backend == "nccl",
+        "Unset backend should keep Accelerate's default",
+    )
+    ensure(
+        accelerator.dataloader_config.non_blocking is False,
+        "Dataloader default changed",
+    )
+    ensure(
+        os.environ["TORCH_DISTRIBUTED_DEBUG"] == "DETAIL",
+        "Distributed debug level not exported",
+    )
+    ensure(
+        accelerator.scaler_handler is None,
+        "No scaler kwargs expected without a grad_scaler node",
+    )
+
+
+def test_hydraxcel_main_builds_accelerator_from_preset(
+    monkeypatch: pytest.MonkeyPatch,
+    isolated_cwd: Path,  # noqa: ARG001
+    logging_platform_init: dict[str, str],  # noqa: ARG001
+    disable_debug: None,  # noqa: ARG001
+) -> None:
+    """Selecting ``+accelerator=ddp-fast`` configures the Accelerator of the run."""
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "pytest_hydra_test",
+            "+accelerator=ddp-fast",
+            "accelerator.gradient_accumulation_steps=2",
+            "+accelerator/comm_hook=fp16",
+        ],
+    )
+    received: dict[str, Accelerator] = {}
+
+    def user_main(cfg: DictConfig, accelerator: Accelerator) -> None:  # noqa: ARG001
+        received["accelerator"] = accelerator
+
+    hydraxcel_main(
+        project_name="demo",
+        config_class=AcceleratedConfig,
+        logging_platform="local",
+    )(user_main)()
+
+    accelerator = received["accelerator"]
+    ddp: DistributedDataParallelKwargs = accelerator.ddp_handler  # ty:ignore[invalid-assignment]
+    ensure(accelerator.gradient_accumulation_steps == 2, "Override not applied")  # noqa: PLR2004
+    ensure(ddp.gradient_as_bucket_view, "Preset not applied")
+    ensure(accelerator.dataloader_config.non_blocking, "Preset not applied")
+    ensure(
+        ddp.comm_hook == DDPCommunicationHookType.FP16,
+        "Comm hook group not applied",
+    )
+
+
+def test_comm_hook_preset_registers_powersgd_state() -> None:
+    """PowerSGD presets pass their rank and warm-up steps to the hook state."""
+    config = AcceleratorConfig(
+        comm_hook=CommHookConfig(
+            hook="power_sgd",
+            wrapper="bf16",
+            matrix_approximation_rank=4,
+            start_powerSGD_iter=10,
+        ),
+    )
+
+    handler: DistributedDataParallelKwargs = build_accelerator(  # ty:ignore[invalid-assignment]
+        OmegaConf.structured(config),
+    ).ddp_handler
+
+    ensure(handler.comm_hook == DDPCommunicationHookType.POWER_SGD, "Hook not set")
+    ensure(handler.comm_wrapper == DDPCommunicationHookType.BF16, "Wrapper not set")
+    ensure(
+        handler.comm_state_option["matrix_approximation_rank"] == 4  # noqa: PLR2004
+        and handler.comm_state_option["start_powerSGD_iter"] == 10,  # noqa: PLR2004
+        f"PowerSGD state options not set: {handler.comm_state_option}",
+    )
+    with pytest.raises(ValueError, match="requires a PowerSGD hook"):
+        build_ddp_kwargs(DDPConfig(), CommHookConfig(hook="fp16", wrapper="bf16"))
@@ -0,0 +1,140 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the asynchronous checkpoint manager."""
+
+from pathlib import Path  # noqa: TC003
+
+import pytest
+import torch
+from accelerate import Accelerator
+
+from hydraxcel.run import CheckpointManager
+from hydraxcel.run.setup import accepted_kwargs
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def test_async_saves_rotate_and_restore(tmp_path: Path) -> None:
+    """Saves are snapshotted, published atomically, rotated and loadable."""
+    accelerator = Accelerator(cpu=True)
+    model = torch.nn.Linear(4, 2)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    model, optimizer = accelerator.prepare(model, optimizer)
+    manager = CheckpointManager(
+        accelerator,
+        tmp_path,
+        keep_last=2,
+        keep_best=1,
+        metric="loss",
+        log_to_trackers=False,
+    )
+    losses: dict[int, float] = {0: 3.0, 1: 1.0, 2: 2.0, 3: 4.0, 4: 5.0}
+    for step, loss in losses.items():
+        with torch.no_grad():
+            model.weight.fill_(step)
+        manager.save(step, {"loss": loss})
+        with torch.no_grad():
+            model.weight.fill_(-1.0)  # Must not reach the pending write
+    manager.close()
+
+    kept: list[str] = sorted(path.name for path in tmp_path.iterdir())
+    ensure(
+        kept == ["checkpoint_1", "checkpoint_3", "checkpoint_4"],
+        f"Unexpected checkpoints after rotation: {kept}",
+    )
+    ensure(manager.best() == tmp_path / "checkpoint_1", "Wrong best checkpoint")
+    ensure(manager.latest() == tmp_path / "checkpoint_4", "Wrong latest checkpoint")
+
+    metadata = manager.load(manager.best())
+    ensure(metadata["metrics"] == {"loss": 1.0}, f"Unexpected metadata: {metadata}")  # ty:ignore[not-subscriptable]
+    ensure(
+        torch.equal(model.weight, torch.ones_like(model.weight)),
+        "Loaded weights are not the snapshot taken at step 1",
+    )
+
+
+def test_save_fails_when_a_rank_never_finishes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A rank that never writes its files fails the save instead of hanging."""
+    accelerator = Accelerator(cpu=True)
+    monkeypatch.setattr(Accelerator, "num_processes", property(lambda _self: 2))
+    manager = CheckpointManager(
+        accelerator,
+        tmp_path,
+        log_to_trackers=False,
+        publish_timeout=0.2,
+    )
+    manager.save(0)
+
+    with (
+        caplog.at_level("ERROR", logger="checkpoint"),
+        pytest.raises(RuntimeError, match="previous checkpoint"),
+    ):
+        manager.close()
+    ensure("Ranks [1] did not finish" in caplog.text, "Missing rank not logged")
+    ensure(not (tmp_path / "checkpoint_0").exists(), "Incomplete save was published")
+
+
+@pytest.mark.parametrize(
+    ("settings", "match"),
+    [
+        ({"keep_last": 0}, "keep_last"),
+        ({"keep_best": 1}, "keep_best"),
+        ({"mode": "best"}, "mode"),
+    ],
+)
+def test_manager_rejects_invalid_rotation(
+    tmp_path: Path,
+    settings: dict,
+    match: str,
+) -> None:
+    """Invalid rotation settings fail when the manager is created."""
+    with pytest.raises(ValueError, match=match):
+        CheckpointManager(Accelerator(cpu=True), tmp_path, **settings)
+
+
+def test_checkpoints_passed_only_to_accepting_main_functions() -> None:
+    """The manager is handed to main functions taking ``checkpoints``."""
+    candidates: dict[str, object] = {"checkpoints": object(), "resume": None}
+
+    def plain(cfg: object, accelerator: object) -> None: ...
+
+    def explicit(cfg: object, accelerator: object, checkpoints: object) -> None: ...
+
+    def variadic(cfg: object, accelerator: object, **kwargs: object) -> None: ...
+
+    ensure(not accepted_kwargs(plain, candidates), "Plain main function got kwargs")
+    ensure(
+        accepted_kwargs(explicit, candidates).keys() == {"checkpoints"},
+        "Explicit parameter not detected",
+    )
+    ensure(
+        accepted_kwargs(variadic, candidates) == candidates,
+        "Keyword arguments not detected",
+    )
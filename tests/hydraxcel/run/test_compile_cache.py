@@ -0,0 +1,100 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the persistent torch.compile cache."""
+
+import os
+import socket
+import time
+from pathlib import Path  # noqa: TC003
+
+import pytest
+import torch
+from accelerate import Accelerator
+
+from hydraxcel.run import CompileCache, compile_cache
+from hydraxcel.run.compile_cache import LAST_USED_FILE_NAME, USERS_DIR_NAME
+from hydraxcel.run.config_registry import CompileCacheConfig
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def make_entry(root: Path, name: str, size: int, age: float) -> Path:
+    """Create a fake cache entry of *size* bytes last used *age* seconds ago."""
+    entry: Path = root / name
+    entry.mkdir(parents=True)
+    (entry / "blob").write_bytes(b"x" * size)
+    last_used: Path = entry / LAST_USED_FILE_NAME
+    last_used.touch()
+    os.utime(last_used, (time.time() - age, time.time() - age))
+    return entry
+
+
+def test_evict_removes_least_recently_used_idle_entries(tmp_path: Path) -> None:
+    """Eviction drops the oldest idle entries but keeps active and in-use ones."""
+    cache = CompileCache(tmp_path, {"torch": "x", "extra": ""}, max_size_bytes=2500)
+    cache.activate()
+    cache.deactivate()
+    oldest = make_entry(tmp_path, "oldest", 1000, age=300)
+    in_use = make_entry(tmp_path, "in-use", 1000, age=200)
+    (in_use / USERS_DIR_NAME).mkdir()
+    (in_use / USERS_DIR_NAME / f"{socket.gethostname()}-{os.getpid()}").touch()
+    older = make_entry(tmp_path, "older", 1000, age=100)
+    recent = make_entry(tmp_path, "recent", 1000, age=0)
+
+    removed = cache.evict()
+
+    ensure(removed == [oldest, older], f"Unexpected evictions: {removed}")
+    ensure(in_use.exists() and recent.exists(), "Live or recent entry evicted")
+    ensure(cache.directory.exists(), "Active entry evicted")
+
+
+def test_compile_cache_reuses_inductor_artefacts_on_cpu(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A second run with the same key hits the FX graph cache of the first."""
+    config = CompileCacheConfig(root_dir=str(tmp_path), log_to_trackers=False)
+    inputs = torch.randn(16)
+
+    def step(values: torch.Tensor) -> torch.Tensor:
+        return torch.sin(values) * 2 + values
+
+    with caplog.at_level("INFO", logger="compile_cache"):
+        for _ in range(2):
+            torch._dynamo.reset()  # noqa: SLF001 # Drop in-memory compiled graphs
+            with compile_cache(config, Accelerator(), project_name="demo") as cache:
+                torch.compile(step)(inputs)
+
+    ensure(cache is not None, "Cache should be enabled")
+    ensure(any((cache.directory / "inductor").iterdir()), "Inductor cache is empty")  # ty:ignore[unresolved-attribute]
+    ensure(
+        "FX graph 1 hits / 0 misses" in caplog.text,
+        f"Second run did not hit the cache: {caplog.text}",
+    )
+    ensure(
+        os.environ.get("TORCHINDUCTOR_CACHE_DIR") != str(cache.directory / "inductor"),  # ty:ignore[unresolved-attribute]
+        "Cache location leaked out of the run",
+    )
@@ -0,0 +1,215 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for elastic launches: restart accounting and automatic resume."""
+
+import json
+import os
+import sys
+import textwrap
+from dataclasses import asdict
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate.commands.launch import launch_command
+
+from hydraxcel import launch
+from hydraxcel.accelerate.config_registry import HARDWARE_VARIANTS, ElasticLaunchConfig
+from hydraxcel.accelerate.launch_tools import build_launch_args
+from hydraxcel.run import latest_checkpoint
+from hydraxcel.run.elastic import COMPLETE_CHECKPOINT_MARKER, ELASTIC_ENV, RUN_TIME_ENV
+
+ELASTIC_CPU_LAUNCH: dict = {
+    **asdict(HARDWARE_VARIANTS["cpu"]),
+    **asdict(
+        ElasticLaunchConfig(
+            elastic=True,
+            rdzv_backend="c10d",
+            max_restarts=1,
+            monitor_interval=0.5,
+        ),
+    ),
+    "num_processes": 2,
+}
+
+# Rank 1 crashes after the first checkpoint; the restarted group resumes from it
+CRASHING_SCRIPT: str = """
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import torch
+
+from hydraxcel import hydraxcel_main
+
+
+@dataclass
+class Config:
+    fill: float = 7.0
+
+
+@hydraxcel_main("elastic-test", config_class=Config, logging_platform="local")
+def main(cfg, accelerator):
+    model = torch.nn.Linear(4, 1)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    model, optimizer = accelerator.prepare(model, optimizer)
+    weight = accelerator.unwrap_model(model).weight
+    if os.environ["TORCHELASTIC_RESTART_COUNT"] == "0":
+        with torch.no_grad():
+            weight.fill_(cfg.fill)
+        accelerator.save_state()
+        accelerator.wait_for_everyone()
+        if accelerator.process_index == 1:
+            raise RuntimeError("simulated crash")
+        accelerator.wait_for_everyone()
+    result = {"weight": weight.mean().item(), "iteration": accelerator.save_iteration}
+    Path(f"result_rank{accelerator.process_index}.json").write_text(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+@pytest.fixture
+def launcher_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restore the environment the elastic launcher exports."""
+    for name in (
+        ELASTIC_ENV,
+        "ACCELERATE_USE_CPU",
+        "TORCH_DISABLE_SHARE_RDZV_TCP_STORE",
+        "WANDB_RUN_ID",
+        "WANDB_RESUME",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv(RUN_TIME_ENV, "elastic-run")
+
+
+@pytest.mark.usefixtures("launcher_env")
+def test_elastic_launch_uses_torchrun_with_local_c10d_store() -> None:
+    """CPU launches switch to the torchrun launcher and pin the tracker run."""
+    args = build_launch_args({**ELASTIC_CPU_LAUNCH, "training_script": "train.py"})
+
+    ensure(args.multi_gpu and not args.cpu, "Elastic launches must use torchrun")
+    ensure(os.environ["ACCELERATE_USE_CPU"] == "true", "CPU must reach the workers")
+    ensure(args.standalone, "Single-node launches need a local c10d store")
+    ensure(args.rdzv_backend == "c10d", "Wrong rendezvous backend")
+    ensure(args.max_restarts == 1, "max_restarts not forwarded")
+    ensure(not hasattr(args, "elastic"), "Launcher-only key leaked into the args")
+    ensure(os.environ[RUN_TIME_ENV] == "elastic-run", "Pinned run time overwritten")
+    ensure(os.environ["WANDB_RESUME"] == "allow", "W&B run must be resumable")
+    ensure(os.environ["WANDB_RUN_ID"], "W&B run id not pinned")
+
+
+def test_elastic_launch_rejects_static_rendezvous() -> None:
+    """Restarts need a dynamic rendezvous backend."""
+    with pytest.raises(ValueError, match="dynamic rdzv_backend"):
+        build_launch_args(
+            {
+                **ELASTIC_CPU_LAUNCH,
+                "rdzv_backend": "static",
+                "training_script": "train.py",
+            },
+        )
+
+
+def test_multirun_does_not_pin_the_run(
+    monkeypatch: pytest.MonkeyPatch,
+    accelerate_config_dir: Path,
+    dummy_script: Path,
+) -> None:
+    """Jobs of a ``-m`` sweep keep their own run directories and tracker runs."""
+    (accelerate_config_dir / "accelerate.yaml").write_text(
+        "defaults:\n  - launch_config\n  - _self_\n\n"
+        "training_script: ''\nelastic: true\nrdzv_backend: c10d\n",
+    )
+    monkeypatch.setattr(sys, "argv", ["prog", "-m", "seed=1,2"])
+    for name in (ELASTIC_ENV, RUN_TIME_ENV, "WANDB_RUN_ID", "WANDB_RESUME"):
+        monkeypatch.delenv(name, raising=False)
+    commands: list[list[str]] = []
+    monkeypatch.setattr(
+        "hydraxcel.accelerate.launch_tools.subprocess.run",
+        lambda cmd, **_kwargs: commands.append(cmd),
+    )
+
+    with pytest.raises(SystemExit):
+        launch(script_path=dummy_script, hydra_configs_dir=str(accelerate_config_dir))()  # ty:ignore[missing-argument]
+
+    ensure(commands and "-m" in commands[0], "Sweep was not run directly")
+    for name in (ELASTIC_ENV, RUN_TIME_ENV, "WANDB_RUN_ID", "WANDB_RESUME"):
+        ensure(name not in os.environ, f"{name} was pinned for the whole sweep")
+
+
+def test_latest_checkpoint_skips_interrupted_saves(tmp_path: Path) -> None:
+    """The newest checkpoint with its RNG states written wins."""
+    for iteration in (2, 10, 11):
+        (tmp_path / f"checkpoint_{iteration}").mkdir()
+    for iteration in (2, 10):
+        (tmp_path / f"checkpoint_{iteration}" / COMPLETE_CHECKPOINT_MARKER).touch()
+
+    ensure(
+        latest_checkpoint(tmp_path) == tmp_path / "checkpoint_10",
+        "Wrong checkpoint picked",
+    )
+    ensure(latest_checkpoint(tmp_path / "missing") is None, "No checkpoint expected")
+
+
+@pytest.mark.usefixtures("launcher_env")
+def test_elastic_restart_after_rank_crash_resumes_and_records(
+    isolated_cwd: Path,
+) -> None:
+    """A crashing rank restarts the group, which resumes and accounts the restart."""
+    script: Path = isolated_cwd / "elastic_train.py"
+    script.write_text(textwrap.dedent(CRASHING_SCRIPT))
+
+    launch_command(
+        build_launch_args({**ELASTIC_CPU_LAUNCH, "training_script": str(script)}),
+    )
+
+    run_dir: Path = isolated_cwd / "outputs" / "elastic_train" / "elastic-run"
+    for rank in (0, 1):
+        result: dict = json.loads((run_dir / f"result_rank{rank}.json").read_text())
+        ensure(result["weight"] == pytest.approx(7.0), f"Rank {rank} not resumed")
+        ensure(
+            result["iteration"] == 1,
+            f"Checkpoint numbering not continued: {result}",
+        )
+    failure: dict = json.loads(
+        (run_dir / "elastic" / "failure_0_rank1.json").read_text(),
+    )
+    ensure(
+        failure["error"] == "RuntimeError" and failure["message"] == "simulated crash",
+        f"Wrong failure record: {failure}",
+    )
+    restarts: list[str] = (
+        (run_dir / "elastic" / "restarts.jsonl").read_text().splitlines()
+    )
+    record: dict = json.loads(restarts[0])
+    ensure(len(restarts) == 1 and record["restart"] == 1, f"Wrong restarts: {restarts}")
+    ensure(1 in record["failed_ranks"], f"Failed rank not recorded: {record}")
+    ensure(record["downtime_s"] > 0, f"No downtime measured: {record}")
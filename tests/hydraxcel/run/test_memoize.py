@@ -0,0 +1,91 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the persistent, rank-aware memoization decorator."""
+
+import multiprocessing
+import time
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+import hydraxcel
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def count_calls(cfg: DictConfig, log: Path) -> list[int]:
+    """Record the call in *log* and build a result from the data config."""
+    with log.open("a") as file:
+        file.write("call\n")
+    time.sleep(0.5)  # Long enough for the other processes to queue up
+    return list(range(cfg.data.size))
+
+
+def test_cache_keys_on_selected_subtrees(tmp_path: Path) -> None:
+    """Only changes to the keyed subtrees miss; hits report their savings."""
+    cached = hydraxcel.cache(keys=["data"], root_dir=tmp_path / "memo")(count_calls)
+    log: Path = tmp_path / "calls.log"
+    cfg = OmegaConf.create({"data": {"size": 4}, "lr": 0.1})
+
+    first = cached(cfg, log)
+    again = cached(OmegaConf.create({"data": {"size": 4}, "lr": 0.5}), log)
+    other = cached(OmegaConf.create({"data": {"size": 2}, "lr": 0.1}), log)
+
+    ensure(first == again == [0, 1, 2, 3] and other == [0, 1], "Wrong results")
+    ensure(len(log.read_text().splitlines()) == 2, "Unrelated key caused a miss")  # noqa: PLR2004
+    stats = cached.cache_stats  # ty:ignore[unresolved-attribute]
+    ensure((stats.hits, stats.misses) == (1, 2), f"Unexpected stats: {stats}")
+    ensure(stats.bytes_saved > 0 and stats.seconds_saved > 0, f"No savings: {stats}")
+    with pytest.raises(TypeError, match="DictConfig"):
+        cached({"data": {"size": 4}}, log)
+
+
+def call_cached(root: Path, log: Path) -> None:
+    """Call the cached function as one of several concurrent processes."""
+    cached = hydraxcel.cache(keys=["data"], root_dir=root)(count_calls)
+    cached(OmegaConf.create({"data": {"size": 3}}), log)
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_concurrent_processes_compute_once(tmp_path: Path) -> None:
+    """The first process computes while the others wait and read its result."""
+    log: Path = tmp_path / "calls.log"
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=call_cached, args=(tmp_path / "memo", log))
+        for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+
+    ensure(
+        all(process.exitcode == 0 for process in processes),
+        "A process failed",
+    )
+    ensure(log.read_text().splitlines() == ["call"], "Result computed more than once")
@@ -0,0 +1,179 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the stage pipeline and its per-stage caching."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from accelerate import Accelerator
+from omegaconf import DictConfig, OmegaConf
+
+from hydraxcel.run import Pipeline
+
+pipeline = Pipeline()
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def record(cfg: DictConfig, name: str, seconds: float = 0.0) -> None:
+    """Log that stage *name* ran in this process, sleeping *seconds* first."""
+    start: float = time.time()
+    time.sleep(seconds)
+    with Path(cfg.log).open("a") as file:
+        file.write(f"{name} {os.getpid()} {start} {time.time()}\n")
+
+
+def ran(cfg: DictConfig) -> list[list[str]]:
+    """Return the logged stage runs and clear the log."""
+    log = Path(cfg.log)
+    runs: list[list[str]] = [line.split() for line in log.read_text().splitlines()]
+    log.unlink()
+    return runs
+
+
+@pipeline.stage(keys=["data"], artifacts=["rows.txt"])
+def preprocess(cfg: DictConfig, output_dir: Path) -> str:
+    """Write the dataset rows as an artifact."""
+    record(cfg, "preprocess")
+    rows: Path = output_dir / "rows.txt"
+    rows.write_text("\n".join(["a b", "c d e"] * cfg.data.repeat))
+    return str(rows)
+
+
+@pipeline.stage(keys=["tokenizer"], inputs=["preprocess"])
+def tokenize(cfg: DictConfig, preprocess: str) -> list[int]:
+    """Count the tokens of every row."""
+    record(cfg, "tokenize", seconds=0.5)
+    lines: list[str] = Path(preprocess).read_text().splitlines()
+    return [len(line.split(cfg.tokenizer.separator)) for line in lines]
+
+
+@pipeline.stage(keys=[], inputs=["preprocess"])
+def statistics(cfg: DictConfig, preprocess: str) -> int:
+    """Measure the dataset, concurrently with ``tokenize``."""
+    record(cfg, "statistics", seconds=0.5)
+    return Path(preprocess).stat().st_size
+
+
+@pipeline.stage(keys=["train"], inputs=["tokenize"], distributed=True)
+def train(cfg: DictConfig, tokenize: list[int], accelerator: Accelerator) -> float:
+    """Train on every rank with the accelerator."""
+    record(cfg, "train")
+    return cfg.train.lr * sum(tokenize) * accelerator.num_processes
+
+
+@pipeline.stage(keys=[], inputs=["train", "statistics"])
+def evaluate(cfg: DictConfig, train: float, statistics: int) -> float:
+    """Score the trained model."""
+    record(cfg, "evaluate")
+    return train / statistics
+
+
+def forgetful(cfg: DictConfig, output_dir: Path) -> None:
+    """Forget to write the declared artifact."""
+
+
+def make_config(tmp_path: Path, **overrides: object) -> DictConfig:
+    """Build a run config whose pipeline entries live in *tmp_path*."""
+    cfg: DictConfig = OmegaConf.create(
+        {
+            "log": str(tmp_path / "stages.log"),
+            "data": {"repeat": 2},
+            "tokenizer": {"separator": " "},
+            "train": {"lr": 0.5},
+            "pipeline": {
+                "enabled": True,
+                "root_dir": str(tmp_path / "cache"),
+                "rerun": [],
+                "max_workers": 2,
+                "mp_context": "fork",  # Spawning would re-import torch per worker
+            },
+        },
+    )
+    for key, value in overrides.items():
+        OmegaConf.update(cfg, key, value)
+    return cfg
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_only_invalidated_stages_rerun(tmp_path: Path) -> None:
+    """A new learning rate reruns training and evaluation only."""
+    accelerator = Accelerator(cpu=True)
+    cfg: DictConfig = make_config(tmp_path)
+    outputs = pipeline.run(cfg, accelerator)
+    ensure(outputs["tokenize"] == [2, 3, 2, 3], f"Wrong tokens: {outputs}")
+    ensure(outputs["train"] == 5.0, f"Wrong training output: {outputs}")  # noqa: PLR2004
+    runs: list[list[str]] = ran(cfg)
+    ensure(len(runs) == 5, f"Not every stage ran: {runs}")  # noqa: PLR2004
+    by_name: dict[str, list[str]] = {run[0]: run for run in runs}
+    ensure(
+        float(by_name["tokenize"][2]) < float(by_name["statistics"][3])
+        and float(by_name["statistics"][2]) < float(by_name["tokenize"][3]),
+        f"Independent stages did not overlap: {runs}",
+    )
+    ensure(
+        by_name["preprocess"][1] != str(os.getpid())
+        and by_name["train"][1] == str(os.getpid()),
+        f"Stages ran in the wrong processes: {runs}",
+    )
+
+    pipeline.run(make_config(tmp_path, **{"train.lr": 0.25}), accelerator)
+    ensure(
+        [run[0] for run in ran(cfg)] == ["train", "evaluate"],
+        "Changing the learning rate reran the wrong stages",
+    )
+    reused = pipeline.run(cfg, accelerator)
+    ensure(not Path(cfg.log).exists(), "A cached stage reran")
+    ensure(reused == outputs, "Cached outputs differ")
+
+    pipeline.run(
+        make_config(tmp_path, **{"pipeline.rerun": ["statistics"]}),
+        accelerator,
+    )
+    ensure(
+        [run[0] for run in ran(cfg)] == ["statistics"],
+        "Forced rerun reran the wrong stages",
+    )
+    Path(outputs["preprocess"]).unlink()  # A lost artifact invalidates its entry
+    pipeline.run(cfg, accelerator)
+    ensure([run[0] for run in ran(cfg)] == ["preprocess"], "Lost artifact not rebuilt")
+
+
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_invalid_pipelines_are_rejected(tmp_path: Path) -> None:
+    """Unknown dependencies, duplicates and missing artifacts raise."""
+    broken = Pipeline()
+    with pytest.raises(ValueError, match="unknown stages"):
+        broken.stage(inputs=["missing"])(preprocess)
+    broken.stage(keys=["data"], artifacts=["rows.txt"])(forgetful)
+    with pytest.raises(ValueError, match="already has a stage"):
+        broken.stage()(forgetful)
+    with pytest.raises(ValueError, match="accelerator"):
+        pipeline.run(make_config(tmp_path))
+    with pytest.raises(FileNotFoundError, match="did not write its artifacts"):
+        broken.run(make_config(tmp_path))
@@ -0,0 +1,229 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the preemption signal handling."""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate import Accelerator
+
+from hydraxcel.run import CheckpointManager, handle_preemption, mark_step
+from hydraxcel.run.config_registry import PreemptionConfig
+from hydraxcel.run.elastic import RUN_TIME_ENV
+
+# Each rank publishes its pid once training runs and records how it exited
+PREEMPTED_SCRIPT: str = """
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import torch
+
+from hydraxcel import hydraxcel_main
+from hydraxcel.run import mark_step
+
+RESULTS = Path.cwd()
+
+
+@dataclass
+class Config:
+    steps: int = 100_000
+
+
+@hydraxcel_main("preemption-test", config_class=Config, logging_platform="local")
+def main(cfg, accelerator, preemption):
+    model = accelerator.prepare(torch.nn.Linear(4, 1))
+    rank = accelerator.process_index
+    try:
+        for step in range(cfg.steps):
+            time.sleep(0.01)
+            mark_step()
+            if step == 3:
+                (RESULTS / f"pid_rank{rank}").write_text(str(os.getpid()))
+    finally:
+        result = {"step": preemption.step, "signal": preemption.stop_requested}
+        (RESULTS / f"result_rank{rank}.json").write_text(json.dumps(result))
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except SystemExit as error:
+        (RESULTS / f"exit_rank{os.environ['RANK']}").write_text(str(error.code))
+        raise
+"""
+
+# Steps once so that preemption handling defers SIGTERM, then hangs
+HUNG_SCRIPT: str = """
+import time
+from dataclasses import dataclass
+
+from hydraxcel import hydraxcel_main
+from hydraxcel.run import mark_step
+
+
+@dataclass
+class Config:
+    hang_seconds: float = 600.0
+
+
+@hydraxcel_main("hung-test", config_class=Config, logging_platform="local")
+def main(cfg, accelerator, preemption):
+    mark_step()
+    time.sleep(cfg.hang_seconds)
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def train_until_preempted() -> None:
+    """Run steps, receiving SIGUSR1 during the first."""
+    mark_step()
+    os.kill(os.getpid(), signal.SIGUSR1)
+    mark_step()
+    mark_step()  # Only reached if the second step did not stop
+
+
+def test_signal_stops_at_step_boundary_and_chains(isolated_cwd: Path) -> None:
+    """A signal checkpoints at the next agreement and keeps earlier handlers."""
+    calls: list[int] = []
+    previous = signal.signal(
+        signal.SIGUSR1,
+        lambda signum, _frame: calls.append(signum),
+    )
+    accelerator = Accelerator(cpu=True)
+    manager = CheckpointManager(accelerator, isolated_cwd, log_to_trackers=False)
+    config = PreemptionConfig(signals=["SIGUSR1"], sync_every=2)
+    try:
+        with (
+            pytest.raises(SystemExit) as exit_info,
+            handle_preemption(config, accelerator, checkpoints=manager) as handler,
+        ):
+            train_until_preempted()
+        restored = signal.getsignal(signal.SIGUSR1)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+        manager.close()
+
+    ensure(exit_info.value.code == config.exit_code, "Wrong exit code")
+    ensure(handler.step == config.sync_every, f"Stopped at step {handler.step}")  # ty:ignore[unresolved-attribute]
+    ensure(calls == [signal.SIGUSR1], "Previous handler not chained")
+    ensure(restored is not handler._handle, "Handler not uninstalled")  # noqa: SLF001  # ty:ignore[unresolved-attribute]
+    ensure((isolated_cwd / "checkpoint_2").is_dir(), "No preemption checkpoint")
+
+
+def test_preempted_cpu_ranks_stop_together(isolated_cwd: Path) -> None:
+    """SIGTERM to one rank stops, checkpoints and exits both at the same step."""
+    script: Path = isolated_cwd / "preempt_train.py"
+    script.write_text(textwrap.dedent(PREEMPTED_SCRIPT))
+    process = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "accelerate.commands.launch",
+            "--multi_gpu",
+            "--num_processes=2",
+            str(script),
+            "+preemption=default",
+            "preemption.sync_every=1",
+            "+checkpoint=default",
+        ],
+        cwd=isolated_cwd,
+        env={**os.environ, "ACCELERATE_USE_CPU": "true", RUN_TIME_ENV: "preempted"},
+    )
+    pid_file: Path = isolated_cwd / "pid_rank1"
+    deadline: float = time.monotonic() + 120
+    while not pid_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.1)
+    ensure(pid_file.exists(), "Rank 1 never started training")
+    os.kill(int(pid_file.read_text()), signal.SIGTERM)
+    process.wait(timeout=120)
+
+    results: list[dict] = [
+        json.loads((isolated_cwd / f"result_rank{rank}.json").read_text())
+        for rank in (0, 1)
+    ]
+    ensure(results[0]["step"] == results[1]["step"], f"Ranks disagree: {results}")
+    ensure(
+        [result["signal"] for result in results] == [False, True],
+        f"Only rank 1 was signalled: {results}",
+    )
+    for rank in (0, 1):
+        code: str = (isolated_cwd / f"exit_rank{rank}").read_text()
+        ensure(code == "143", f"Rank {rank} exited with {code}")
+    checkpoint: Path = (
+        isolated_cwd
+        / "outputs"
+        / "preempt_train"
+        / "preempted"
+        / "checkpoints"
+        / f"checkpoint_{results[0]['step']}"
+    )
+    ensure(
+        {"random_states_0.pkl", "random_states_1.pkl"}
+        <= {path.name for path in checkpoint.iterdir()},
+        f"Incomplete preemption checkpoint {checkpoint}",
+    )
+
+
+def test_watchdog_kills_a_hung_job_despite_preemption(isolated_cwd: Path) -> None:
+    """The watchdog's SIGTERM is deferred by the handler, so it escalates."""
+    script: Path = isolated_cwd / "hung_train.py"
+    script.write_text(textwrap.dedent(HUNG_SCRIPT))
+    process = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            str(script),
+            "+preemption=default",
+            "+watchdog=kill",
+            "watchdog.timeout=2",
+            "watchdog.check_interval=0.1",
+            "watchdog.kill_grace_period=1",
+        ],
+        cwd=isolated_cwd,
+        env={**os.environ, RUN_TIME_ENV: "hung"},
+        start_new_session=True,  # The watchdog kills its whole process group
+    )
+    try:
+        code: int = process.wait(timeout=120)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+        code = 0
+    ensure(code == -signal.SIGKILL, f"Hung job was not killed (exit code {code})")
@@ -0,0 +1,211 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the automatic resume of relaunched runs."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path  # noqa: TC003
+
+import pytest
+from accelerate import Accelerator
+from omegaconf import OmegaConf
+
+from hydraxcel.run import ResumeState, config_fingerprint, find_previous_run, resume_run
+from hydraxcel.run.config_registry import ResumeConfig
+from hydraxcel.run.elastic import COMPLETE_CHECKPOINT_MARKER, RUN_TIME_ENV
+from hydraxcel.run.resume import LINK_NAME, RUN_RECORD_FILE_NAME
+
+# The first launch saves and records its next random draws; the relaunch
+# must resume the weights and continue with exactly those draws
+RESUMING_SCRIPT: str = """
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import torch
+
+from hydraxcel import hydraxcel_main
+
+
+@dataclass
+class Config:
+    fill: float = 7.0
+
+
+@hydraxcel_main("resume-test", config_class=Config, logging_platform="local")
+def main(cfg, accelerator, resume):
+    model = torch.nn.Linear(4, 1)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1)
+    model, optimizer = accelerator.prepare(model, optimizer)
+    if resume is None:
+        with torch.no_grad():
+            model.weight.fill_(cfg.fill)
+        accelerator.save_state()
+    result = {
+        "resumed": None if resume is None else resume.checkpoint.name,
+        "weight": model.weight.mean().item(),
+        "draws": [random.random(), np.random.rand(), torch.rand(1).item()],
+    }
+    Path("result.json").write_text(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
+"""
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def make_run(
+    root: Path,
+    name: str,
+    fingerprint: str,
+    checkpoints: dict[int, bool],
+) -> Path:
+    """Create a run directory with a record and (complete) checkpoints."""
+    run_dir: Path = root / name
+    for iteration, complete in checkpoints.items():
+        checkpoint: Path = run_dir / "checkpoints" / f"checkpoint_{iteration}"
+        checkpoint.mkdir(parents=True)
+        if complete:
+            (checkpoint / COMPLETE_CHECKPOINT_MARKER).touch()
+    (run_dir / RUN_RECORD_FILE_NAME).write_text(
+        json.dumps({"fingerprint": fingerprint, "trackers": {"wandb": name}}),
+    )
+    return run_dir
+
+
+def test_config_fingerprint_ignores_key_order_and_ignored_keys() -> None:
+    """Equal values give equal fingerprints, whatever the order or ignored keys."""
+    cfg = OmegaConf.create({"lr": 0.1, "model": {"depth": 2, "width": 8}})
+    reordered = OmegaConf.create(
+        {"model": {"width": 8, "depth": 2}, "lr": 0.1, "resume": {"enabled": True}},
+    )
+    changed = OmegaConf.create({"lr": 0.2, "model": {"depth": 2, "width": 8}})
+
+    ensure(
+        config_fingerprint(cfg, ["resume"])
+        == config_fingerprint(reordered, ["resume"]),
+        "Fingerprint depends on key order or ignored keys",
+    )
+    ensure(
+        config_fingerprint(cfg, ["model.width"])
+        == config_fingerprint(
+            OmegaConf.create({"lr": 0.1, "model": {"depth": 2, "width": 16}}),
+            ["model.width"],
+        ),
+        "Nested ignored key changed the fingerprint",
+    )
+    ensure(
+        config_fingerprint(cfg) != config_fingerprint(changed),
+        "Different values share a fingerprint",
+    )
+
+
+def test_find_previous_run_picks_newest_complete_checkpoint(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The newest complete checkpoint of a matching run wins and links its tracker."""
+    monkeypatch.delenv("WANDB_RUN_ID", raising=False)
+    monkeypatch.delenv("WANDB_RESUME", raising=False)
+    cfg = OmegaConf.create({"lr": 0.1})
+    fingerprint: str = config_fingerprint(cfg, ["resume"])
+    older = make_run(tmp_path, "older", fingerprint, {3: True})
+    newer = make_run(tmp_path, "newer", fingerprint, {1: True, 2: False})
+    other = make_run(tmp_path, "other", "0" * 16, {9: True})
+    for run_dir, age in ((older, 200), (newer, 100), (other, 0)):
+        for marker in run_dir.glob(f"checkpoints/*/{COMPLETE_CHECKPOINT_MARKER}"):
+            os.utime(marker, (1e9 - age, 1e9 - age))
+
+    state = find_previous_run(ResumeConfig(search_dirs=[str(tmp_path)]), cfg)
+
+    ensure(state is not None, "Resume should be enabled")
+    ensure(state.checkpoint == newer / "checkpoints" / "checkpoint_1", f"{state}")  # ty:ignore[unresolved-attribute]
+    ensure(os.environ.get("WANDB_RUN_ID") == "newer", "Tracker run not linked")
+    ensure(
+        find_previous_run(None, cfg) is None,
+        "Resuming must be opt-in",
+    )
+
+
+def test_resume_keeps_the_project_configuration(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Explicit ``save_state`` paths are honoured unless automatic naming is on."""
+    monkeypatch.setattr("hydraxcel.run.resume.get_run_dir", lambda: tmp_path)
+    state = ResumeState(fingerprint="0" * 16)
+    accelerator = Accelerator(cpu=True)
+    with resume_run(state, accelerator):
+        ensure(
+            accelerator.project_configuration.project_dir is None
+            and not accelerator.project_configuration.automatic_checkpoint_naming,
+            "Project configuration changed without opting in",
+        )
+
+    with resume_run(state, accelerator, automatic_checkpoint_naming=True):
+        ensure(
+            accelerator.project_configuration.project_dir == str(tmp_path)
+            and accelerator.project_configuration.automatic_checkpoint_naming,
+            "Automatic checkpoint naming not applied",
+        )
+
+
+def test_relaunch_resumes_weights_and_rng_states(isolated_cwd: Path) -> None:
+    """A relaunch of the same config continues the first launch's state."""
+    script: Path = isolated_cwd / "resume_train.py"
+    script.write_text(textwrap.dedent(RESUMING_SCRIPT))
+    results: list[dict] = []
+    for run_time in ("first", "second"):
+        subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                str(script),
+                "+resume=default",
+                "resume.automatic_checkpoint_naming=true",  # For the bare save_state()
+            ],
+            cwd=isolated_cwd,
+            env={**os.environ, RUN_TIME_ENV: run_time},
+            check=True,
+        )
+        run_dir: Path = isolated_cwd / "outputs" / "resume_train" / run_time
+        results.append(json.loads((run_dir / "result.json").read_text()))
+    first, second = results
+
+    ensure(first["resumed"] is None, f"Nothing to resume on the first launch: {first}")
+    ensure(second["resumed"] == "checkpoint_0", f"Relaunch did not resume: {second}")
+    ensure(second["weight"] == pytest.approx(7.0), "Weights not restored")
+    ensure(second["draws"] == first["draws"], "RNG states not restored")
+    ensure(
+        (run_dir / LINK_NAME).resolve() == (run_dir.parent / "first").resolve(),
+        "New run not linked to the earlier one",
+    )
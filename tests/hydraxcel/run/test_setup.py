@@ -62,7 +62,7 @@ def test_create_run_dir_standard(
         f"Prefix mismatch: {path_parts} vs {expected_segments}",
     )
     ensure(
-        path_parts[-1] == "${now:%Y-%m-%d_%H-%M-%S}",
+        path_parts[-1] == "${oc.env:HYDRAXCEL_RUN_TIME,${now:%Y-%m-%d_%H-%M-%S}}",
         "Missing/incorrect timestamp placeholder",
     )
 
@@ -89,7 +89,7 @@ def test_create_run_dir_sweep(
     ensure(result.dir == expected_root, "Sweep root dir mismatch")
     sub_parts = Path(result.subdir).parts  # ty:ignore[unresolved-attribute]
     ensure(
-        sub_parts[-1] == "${now:%Y-%m-%d_%H-%M-%S}",
+        sub_parts[-1] == "${oc.env:HYDRAXCEL_RUN_TIME,${now:%Y-%m-%d_%H-%M-%S}}",
         "Sweep subdir missing timestamp placeholder",
     )
     if expected_sub_segments:
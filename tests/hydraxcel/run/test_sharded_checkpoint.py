@@ -0,0 +1,87 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the memory-mapped sharded safetensors checkpoints."""
+
+import json
+from pathlib import Path  # noqa: TC003
+
+import pytest
+import torch
+from torch import nn
+
+from hydraxcel.run import load_sharded_into, load_sharded_state, save_sharded_state
+from hydraxcel.run.sharded_checkpoint import INDEX_FILE_NAME
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def tied_model() -> nn.Sequential:
+    """Return an embedding and an output layer sharing their weight."""
+    embedding = nn.Embedding(64, 32)
+    head = nn.Linear(32, 64)
+    head.weight = embedding.weight
+    return nn.Sequential(embedding, nn.LayerNorm(32), head)
+
+
+def test_sharded_round_trip_keeps_ties_and_converts(tmp_path: Path) -> None:
+    """Shards and index round-trip into live, meta and lower-precision targets."""
+    torch.manual_seed(0)
+    source = tied_model()
+    save_sharded_state(source.state_dict(), tmp_path, max_shard_size_mb=0.005)
+    index: dict = json.loads((tmp_path / INDEX_FILE_NAME).read_text())
+    ensure(len(set(index["weight_map"].values())) > 1, "Checkpoint not sharded")
+    ensure(index["aliases"] == {"2.weight": "0.weight"}, "Tied weight stored twice")
+
+    target = tied_model().to(torch.bfloat16)
+    ensure(load_sharded_into(target, tmp_path) == [], "Unexpected missing keys")
+    ensure(
+        torch.equal(
+            target.get_parameter("2.bias"),
+            source.get_parameter("2.bias").to(torch.bfloat16),
+        ),
+        "Not converted to the target dtype",
+    )
+    with torch.device("meta"):
+        meta = tied_model()
+    load_sharded_into(meta, tmp_path)
+    ensure(
+        torch.equal(meta.get_parameter("0.weight"), source.get_parameter("0.weight"))
+        and meta.get_parameter("0.weight").data_ptr()
+        == meta.get_parameter("2.weight").data_ptr(),
+        "Meta model not assigned with its tie",
+    )
+    selected = load_sharded_state(tmp_path, keys=lambda name: name.startswith("1."))
+    ensure(selected.keys() == {"1.weight", "1.bias"}, f"Wrong selection: {selected}")
+
+
+def test_strict_load_reports_missing_tensors(tmp_path: Path) -> None:
+    """Tensors the checkpoint lacks fail a strict load and are returned otherwise."""
+    save_sharded_state(nn.Linear(4, 4, bias=False).state_dict(), tmp_path)
+
+    with pytest.raises(ValueError, match="bias"):
+        load_sharded_into(nn.Linear(4, 4), tmp_path)
+    missing = load_sharded_into(nn.Linear(4, 4), tmp_path, strict=False)
+    ensure(missing == ["bias"], f"Unexpected missing keys: {missing}")
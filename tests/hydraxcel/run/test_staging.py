@@ -0,0 +1,154 @@
+# coding=utf-8
+# --------------------------------------------------------------------------------
+# Project: HydraXcel
+# Author: Carel van Niekerk
+# Year: 2026
+# --------------------------------------------------------------------------------
+#
+# This code was generated with the help of AI writing assistants
+# including GitHub Copilot, ChatGPT Codex, Claude Code, Gemini.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for node-local dataset staging."""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from accelerate import Accelerator
+from omegaconf import OmegaConf
+
+from hydraxcel.run import StagingCache, stage_data
+from hydraxcel.run.config_registry import StagingConfig
+
+
+def ensure(expr: object, message: str) -> None:
+    """Raise AssertionError with message if ``expr`` is falsy."""
+    if not expr:
+        raise AssertionError(message)
+
+
+def make_sources(tmp_path: Path) -> tuple[Path, Path]:
+    """Create a shared file and a shared directory of files."""
+    shared: Path = tmp_path / "shared"
+    (shared / "corpus" / "nested").mkdir(parents=True)
+    train: Path = shared / "train.bin"
+    train.write_bytes(bytes(range(256)) * 40)
+    (shared / "corpus" / "a.txt").write_text("first")
+    (shared / "corpus" / "nested" / "b.txt").write_text("second" * 500)
+    return train, shared / "corpus"
+
+
+def test_stage_data_copies_and_rewrites_paths(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Files and directories are copied in chunks and the config points at them."""
+    train, corpus = make_sources(tmp_path)
+    cfg = OmegaConf.create(
+        {"data": {"train": str(train), "extra": [str(corpus)]}, "lr": 0.1},
+    )
+    config = StagingConfig(
+        keys=["data.train", "data.extra"],
+        root_dir=str(tmp_path / "scratch"),
+        chunk_size_mb=0.001,  # About 1 kB, so the files span several chunks
+    )
+    with stage_data(config, cfg, Accelerator(cpu=True)) as cache:
+        local = Path(cfg.data.train)
+        ensure(local.is_relative_to(tmp_path / "scratch"), f"Not rewritten: {local}")
+        ensure(local.read_bytes() == train.read_bytes(), "Staged file differs")
+        staged_corpus = Path(cfg.data.extra[0])
+        ensure(
+            (staged_corpus / "nested" / "b.txt").read_text() == "second" * 500,
+            "Staged directory differs",
+        )
+        record = json.loads((local.parents[1] / "source.json").read_text())
+        ensure(record["source"] == str(train) and record["checksum"], "No record")
+        ensure(
+            cache is not None and cache.stage(train) == local,
+            "Restaging moved the copy",
+        )
+    ensure(cfg.lr == 0.1, "Unrelated key changed")  # noqa: PLR2004
+
+    kept: int = local.stat().st_mtime_ns
+    cfg.data.train = str(train)
+    with stage_data(OmegaConf.structured(config), cfg, Accelerator(cpu=True)):
+        ensure(local.stat().st_mtime_ns == kept, "Unchanged source copied again")
+    damaged = bytearray(train.read_bytes())
+    damaged[5000] ^= 1
+    local.write_bytes(damaged)
+    cfg.data.train = str(train)
+    with (
+        caplog.at_level(logging.WARNING, logger="staging"),
+        stage_data(config, cfg, Accelerator(cpu=True)),
+    ):
+        ensure(local.read_bytes() == train.read_bytes(), "Damaged copy reused")
+    ensure("copying it again" in caplog.text, "Damaged copy not reported")
+    train.write_bytes(b"updated")
+    cfg.data.train = str(train)
+    with stage_data(config, cfg, Accelerator(cpu=True)):
+        ensure(local.read_bytes() == b"updated", "Changed source not restaged")
+    empty: Path = tmp_path / "shared" / "empty"
+    empty.mkdir()
+    staged_empty: Path = StagingCache(tmp_path / "scratch", 10**6).stage(empty)
+    ensure(
+        staged_empty.is_dir() and not any(staged_empty.iterdir()),
+        "Empty directory not staged",
+    )
+    missing = StagingConfig(keys=["data.missing"], root_dir=config.root_dir)
+    with (
+        pytest.raises(ValueError, match="not set"),
+        stage_data(missing, cfg, Accelerator(cpu=True)),
+    ):
+        pass
+
+
+def test_concurrent_jobs_copy_once_and_lru_evicts(
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Concurrent stagers share one copy; idle copies are evicted by age."""
+    train, corpus = make_sources(tmp_path)
+    root: Path = tmp_path / "scratch"
+    caches = [StagingCache(root, 10**6, chunk_size_bytes=1024) for _ in range(4)]
+    barrier = threading.Barrier(len(caches))
+    results: list[Path] = []
+
+    def stage(cache: StagingCache) -> None:
+        barrier.wait()
+        results.append(cache.stage(train))
+
+    with caplog.at_level(logging.INFO, logger="staging"):
+        threads = [threading.Thread(target=stage, args=(c,)) for c in caches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    ensure(len(set(results)) == 1, f"Jobs used different copies: {results}")
+    ensure(caplog.text.count("Staged ") == 1, "The file was copied more than once")
+
+    small = StagingCache(root, 12_000)  # Fits the file or the corpus, not both
+    small.stage(corpus)
+    ensure(results[0].exists(), "A copy in use was evicted")
+    for cache in caches:
+        cache.release()
+    time.sleep(0.05)  # Beyond the filesystem's timestamp granularity
+    small.release()
+    valid: Path = tmp_path / "shared" / "valid.bin"
+    valid.write_bytes(bytes(5000))
+    small.stage(valid)
+    ensure(not results[0].exists(), "Least recently used copy kept")
+    ensure(small.local_path(corpus).exists(), "Recently used copy evicted")